@@ -0,0 +1,87 @@
+"""Durable background job queue.
+
+Revision ID: 20261016_0025
+Revises: 20260322_0024
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0025"
+down_revision = "20260322_0024"
+branch_labels = None
+depends_on = None
+
+_ACTIVE_DEDUPE_WHERE = "dedupe_key IS NOT NULL AND status IN ('queued', 'running')"
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if _table_exists("background_jobs"):
+        return
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("kind", sa.String(length=64), nullable=False),
+        sa.Column(
+            "lane", sa.String(length=16), nullable=False, server_default="default"
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "status", sa.String(length=32), nullable=False, server_default="queued"
+        ),
+        sa.Column("dedupe_key", sa.String(length=255), nullable=True),
+        sa.Column("payload_json", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("worker_id", sa.String(length=128), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("enqueued_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_background_jobs_claim",
+        "background_jobs",
+        ["status", "kind", "priority", "available_at"],
+    )
+    op.create_index(
+        "ix_background_jobs_kind_dedupe",
+        "background_jobs",
+        ["kind", "dedupe_key", "status"],
+    )
+    op.create_index(
+        "ux_background_jobs_active_dedupe",
+        "background_jobs",
+        ["kind", "dedupe_key"],
+        unique=True,
+        postgresql_where=sa.text(_ACTIVE_DEDUPE_WHERE),
+        sqlite_where=sa.text(_ACTIVE_DEDUPE_WHERE),
+    )
+    op.create_index(
+        "ix_background_jobs_status_lease",
+        "background_jobs",
+        ["status", "lease_expires_at"],
+    )
+    op.create_index(
+        "ix_background_jobs_finished_at",
+        "background_jobs",
+        ["finished_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("background_jobs")
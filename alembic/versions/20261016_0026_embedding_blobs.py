@@ -0,0 +1,98 @@
+"""Store work embeddings as float32 blobs.
+
+Revision ID: 20261016_0026
+Revises: 20261016_0025
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import json
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0026"
+down_revision = "20261016_0025"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH_SIZE = 500
+
+
+def _column_names(table_name: str) -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def _decode_vector(raw: object) -> list[float]:
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            return []
+    if not isinstance(raw, list):
+        return []
+    return [float(value) for value in raw]
+
+
+def upgrade() -> None:
+    existing_columns = _column_names("embeddings")
+    if "embedding_blob" not in existing_columns:
+        op.add_column(
+            "embeddings", sa.Column("embedding_blob", sa.LargeBinary(), nullable=True)
+        )
+    if "dimensions" not in existing_columns:
+        op.add_column(
+            "embeddings",
+            sa.Column("dimensions", sa.Integer(), nullable=True, server_default="0"),
+        )
+
+    bind = op.get_bind()
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, embedding_vector FROM embeddings "
+                "WHERE embedding_blob IS NULL LIMIT :limit"
+            ),
+            {"limit": _BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        for row_id, raw_vector in rows:
+            vector = np.asarray(_decode_vector(raw_vector), dtype=np.float32)
+            bind.execute(
+                sa.text(
+                    "UPDATE embeddings SET embedding_blob = :blob, "
+                    "dimensions = :dimensions, embedding_vector = :empty "
+                    "WHERE id = :id"
+                ),
+                {
+                    "blob": vector.tobytes(),
+                    "dimensions": int(vector.shape[0]),
+                    "empty": "[]",
+                    "id": row_id,
+                },
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, embedding_blob FROM embeddings WHERE embedding_blob IS NOT NULL"
+        )
+    ).all()
+    for row_id, blob in rows:
+        vector = np.frombuffer(bytes(blob), dtype=np.float32).tolist()
+        bind.execute(
+            sa.text("UPDATE embeddings SET embedding_vector = :vector WHERE id = :id"),
+            {"vector": json.dumps(vector), "id": row_id},
+        )
+    existing_columns = _column_names("embeddings")
+    if "dimensions" in existing_columns:
+        op.drop_column("embeddings", "dimensions")
+    if "embedding_blob" in existing_columns:
+        op.drop_column("embeddings", "embedding_blob")
@@ -0,0 +1,122 @@
+"""Hourly API provider usage rollups.
+
+Revision ID: 20261016_0027
+Revises: 20261016_0026
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0027"
+down_revision = "20261016_0026"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def _hour_start(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def upgrade() -> None:
+    if _table_exists("api_provider_usage_rollups"):
+        return
+    rollups = op.create_table(
+        "api_provider_usage_rollups",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("provider", sa.String(length=64), nullable=False),
+        sa.Column("operation", sa.String(length=128), nullable=False),
+        sa.Column("hour_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "duration_ms_total", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("tokens_input", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens_output", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("last_called_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("provider", "operation", "hour_start"),
+    )
+    op.create_index(
+        "ix_api_provider_usage_rollups_hour",
+        "api_provider_usage_rollups",
+        ["hour_start"],
+    )
+
+    if not _table_exists("api_provider_usage_events"):
+        return
+    bind = op.get_bind()
+    totals: dict[tuple[str, str, datetime], dict] = {}
+    result = bind.execution_options(stream_results=True).execute(
+        sa.text(
+            "SELECT provider, operation, success, duration_ms, tokens_input, "
+            "tokens_output, cost_usd, created_at FROM api_provider_usage_events"
+        )
+    )
+    for row in result:
+        created_at = row.created_at
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        if not isinstance(created_at, datetime):
+            continue
+        key = (
+            str(row.provider or ""),
+            str(row.operation or ""),
+            _hour_start(created_at),
+        )
+        bucket = totals.setdefault(
+            key,
+            {
+                "calls": 0,
+                "errors": 0,
+                "duration_ms_total": 0,
+                "tokens_input": 0,
+                "tokens_output": 0,
+                "cost_usd": 0.0,
+                "last_called_at": None,
+            },
+        )
+        bucket["calls"] += 1
+        bucket["errors"] += 0 if row.success else 1
+        bucket["duration_ms_total"] += max(0, int(row.duration_ms or 0))
+        bucket["tokens_input"] += max(0, int(row.tokens_input or 0))
+        bucket["tokens_output"] += max(0, int(row.tokens_output or 0))
+        bucket["cost_usd"] += max(0.0, float(row.cost_usd or 0.0))
+        if bucket["last_called_at"] is None or created_at > bucket["last_called_at"]:
+            bucket["last_called_at"] = created_at
+    if not totals:
+        return
+    now = datetime.now(timezone.utc)
+    op.bulk_insert(
+        rollups,
+        [
+            {
+                "id": str(uuid4()),
+                "provider": provider,
+                "operation": operation,
+                "hour_start": hour_start,
+                "updated_at": now,
+                **bucket,
+            }
+            for (provider, operation, hour_start), bucket in totals.items()
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("api_provider_usage_rollups")
@@ -0,0 +1,56 @@
+"""Relational index of data library asset shares, placements and archives.
+
+Rows are backfilled from the asset JSON columns by the data planner service
+the first time a library listing runs against the database.
+
+Revision ID: 20261016_0028
+Revises: 20261016_0027
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0028"
+down_revision = "20261016_0027"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if _table_exists("data_library_asset_access"):
+        return
+    op.create_table(
+        "data_library_asset_access",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("asset_id", sa.String(length=36), nullable=False),
+        sa.Column("relation", sa.String(length=16), nullable=False),
+        sa.Column("subject_id", sa.String(length=128), nullable=False),
+        sa.Column("role", sa.String(length=16), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["asset_id"], ["data_library_assets.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("asset_id", "relation", "subject_id"),
+    )
+    op.create_index(
+        "ix_data_library_asset_access_asset_id",
+        "data_library_asset_access",
+        ["asset_id"],
+    )
+    op.create_index(
+        "ix_data_library_asset_access_subject",
+        "data_library_asset_access",
+        ["relation", "subject_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_library_asset_access")
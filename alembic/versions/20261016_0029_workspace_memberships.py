@@ -0,0 +1,55 @@
+"""Normalised workspace membership index.
+
+Rows are derived from ``workspace_state_cache`` payloads by the workspace
+service, which backfills users without index rows on first lookup.
+
+Revision ID: 20261016_0029
+Revises: 20261016_0028
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0029"
+down_revision = "20261016_0028"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if _table_exists("workspace_memberships"):
+        return
+    op.create_table(
+        "workspace_memberships",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("workspace_id", sa.String(length=128), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("membership_role", sa.String(length=16), nullable=False),
+        sa.Column("collaborator_role", sa.String(length=16), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("workspace_id", "user_id"),
+    )
+    op.create_index(
+        "ix_workspace_memberships_workspace_id",
+        "workspace_memberships",
+        ["workspace_id"],
+    )
+    op.create_index(
+        "ix_workspace_memberships_user_id",
+        "workspace_memberships",
+        ["user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workspace_memberships")
@@ -0,0 +1,85 @@
+"""Append-only workspace inbox messages, visibility windows and read markers.
+
+Messages and read markers held in ``workspace_inbox_state_cache`` payloads are
+moved into these tables by the workspace service the first time an inbox is
+used against the database.
+
+Revision ID: 20261016_0030
+Revises: 20261016_0029
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0030"
+down_revision = "20261016_0029"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if not _table_exists("workspace_inbox_messages"):
+        op.create_table(
+            "workspace_inbox_messages",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("workspace_id", sa.String(length=128), nullable=False),
+            sa.Column("message_id", sa.String(length=128), nullable=False),
+            sa.Column("sender_user_id", sa.String(length=36), nullable=True),
+            sa.Column("sender_name", sa.String(length=255), nullable=False),
+            sa.Column("encrypted_body", sa.Text(), nullable=False),
+            sa.Column("iv", sa.String(length=255), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("posted_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["sender_user_id"], ["users.id"], ondelete="SET NULL"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("workspace_id", "message_id"),
+        )
+        op.create_index(
+            "ix_workspace_inbox_messages_workspace_created",
+            "workspace_inbox_messages",
+            ["workspace_id", "created_at", "message_id"],
+        )
+    if not _table_exists("workspace_inbox_visibility"):
+        op.create_table(
+            "workspace_inbox_visibility",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("user_id", sa.String(length=36), nullable=False),
+            sa.Column("workspace_id", sa.String(length=128), nullable=False),
+            sa.Column("visible_from", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("visible_until", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(
+            "ix_workspace_inbox_visibility_user_workspace",
+            "workspace_inbox_visibility",
+            ["user_id", "workspace_id"],
+        )
+    if not _table_exists("workspace_inbox_reads"):
+        op.create_table(
+            "workspace_inbox_reads",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("user_id", sa.String(length=36), nullable=False),
+            sa.Column("workspace_id", sa.String(length=128), nullable=False),
+            sa.Column("reader_key", sa.String(length=255), nullable=False),
+            sa.Column("read_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("user_id", "workspace_id", "reader_key"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("workspace_inbox_reads")
+    op.drop_table("workspace_inbox_visibility")
+    op.drop_table("workspace_inbox_messages")
@@ -0,0 +1,34 @@
+"""Record when each auth session was last used.
+
+Revision ID: 20261016_0031
+Revises: 20261016_0030
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0031"
+down_revision = "20261016_0030"
+branch_labels = None
+depends_on = None
+
+
+def _column_names(table_name: str) -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    if "last_seen_at" not in _column_names("auth_sessions"):
+        op.add_column(
+            "auth_sessions",
+            sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    if "last_seen_at" in _column_names("auth_sessions"):
+        op.drop_column("auth_sessions", "last_seen_at")
@@ -0,0 +1,48 @@
+"""Per-work snapshot aggregates reused by publication top-metrics rebuilds.
+
+Revision ID: 20261016_0032
+Revises: 20261016_0031
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0032"
+down_revision = "20261016_0031"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if _table_exists("publication_metric_work_aggregates"):
+        return
+    op.create_table(
+        "publication_metric_work_aggregates",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("work_id", sa.String(length=36), nullable=False),
+        sa.Column("snapshot_fingerprint", sa.String(length=128), nullable=False),
+        sa.Column("payload_json", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["work_id"], ["works.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("work_id"),
+    )
+    op.create_index(
+        "ix_publication_metric_work_aggregates_user_id",
+        "publication_metric_work_aggregates",
+        ["user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("publication_metric_work_aggregates")
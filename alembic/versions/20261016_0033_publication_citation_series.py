@@ -0,0 +1,78 @@
+"""Monthly per-work citation series and per-user rollups for analytics.
+
+Revision ID: 20261016_0033
+Revises: 20261016_0032
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0033"
+down_revision = "20261016_0032"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if not _table_exists("publication_citation_series"):
+        op.create_table(
+            "publication_citation_series",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("user_id", sa.String(length=36), nullable=False),
+            sa.Column("work_id", sa.String(length=36), nullable=False),
+            sa.Column("provider", sa.String(length=64), nullable=False),
+            sa.Column("month_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("citations_count", sa.Integer(), nullable=False),
+            sa.Column("captured_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("history_usable", sa.Boolean(), nullable=False),
+            sa.Column("yearly_counts", sa.JSON(), nullable=False),
+            sa.Column("snapshots_merged", sa.Integer(), nullable=False),
+            sa.Column(
+                "last_snapshot_created_at", sa.DateTime(timezone=True), nullable=True
+            ),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["work_id"], ["works.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("work_id", "provider", "month_start"),
+        )
+        op.create_index(
+            "ix_publication_citation_series_user_id",
+            "publication_citation_series",
+            ["user_id"],
+        )
+        op.create_index(
+            "ix_publication_citation_series_work_id",
+            "publication_citation_series",
+            ["work_id"],
+        )
+    if not _table_exists("publication_citation_rollups"):
+        op.create_table(
+            "publication_citation_rollups",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("user_id", sa.String(length=36), nullable=False),
+            sa.Column("works_count", sa.Integer(), nullable=False),
+            sa.Column("snapshots_count", sa.Integer(), nullable=False),
+            sa.Column("series_points_count", sa.Integer(), nullable=False),
+            sa.Column(
+                "last_snapshot_created_at", sa.DateTime(timezone=True), nullable=True
+            ),
+            sa.Column("latest_captured_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("user_id"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("publication_citation_rollups")
+    op.drop_table("publication_citation_series")
@@ -0,0 +1,54 @@
+"""Evidence-keyed cache for publication insights drafts.
+
+Revision ID: 20261016_0034
+Revises: 20261016_0033
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0034"
+down_revision = "20261016_0033"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if _table_exists("publication_insights_draft_cache"):
+        return
+    op.create_table(
+        "publication_insights_draft_cache",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("section_key", sa.String(length=64), nullable=False),
+        sa.Column("window_id", sa.String(length=16), nullable=False),
+        sa.Column("scope", sa.String(length=16), nullable=False),
+        sa.Column("prompt_version", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("evidence_hash", sa.String(length=64), nullable=False),
+        sa.Column("payload_json", sa.JSON(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_publication_insights_draft_cache_slot",
+        "publication_insights_draft_cache",
+        ["user_id", "section_key", "window_id", "scope"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("publication_insights_draft_cache")
@@ -0,0 +1,110 @@
+"""Indexed collaboration landing rows and per-collaborator shared works.
+
+Revision ID: 20261016_0035
+Revises: 20261016_0034
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0035"
+down_revision = "20261016_0034"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    if not _table_exists("collaboration_landing_rows"):
+        op.create_table(
+            "collaboration_landing_rows",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("owner_user_id", sa.String(length=36), nullable=False),
+            sa.Column("collaborator_id", sa.String(length=36), nullable=False),
+            sa.Column("member_ids", sa.JSON(), nullable=False),
+            sa.Column("is_listed", sa.Boolean(), nullable=False),
+            sa.Column("sort_name", sa.String(length=255), nullable=False),
+            sa.Column("coauthored_works_count", sa.Integer(), nullable=False),
+            sa.Column("collaboration_strength_score", sa.Float(), nullable=False),
+            sa.Column("last_collaboration_year", sa.Integer(), nullable=True),
+            sa.Column(
+                "collaborator_updated_at", sa.DateTime(timezone=True), nullable=True
+            ),
+            sa.Column("search_text", sa.Text(), nullable=False),
+            sa.Column("metrics_json", sa.JSON(), nullable=False),
+            sa.Column("payload_json", sa.JSON(), nullable=False),
+            sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["owner_user_id"], ["users.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["collaborator_id"], ["collaborators.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("owner_user_id", "collaborator_id"),
+        )
+        op.create_index(
+            "ix_collaboration_landing_rows_owner_user_id",
+            "collaboration_landing_rows",
+            ["owner_user_id"],
+        )
+        op.create_index(
+            "ix_collaboration_landing_rows_owner_name",
+            "collaboration_landing_rows",
+            ["owner_user_id", "is_listed", "sort_name"],
+        )
+        op.create_index(
+            "ix_collaboration_landing_rows_owner_works",
+            "collaboration_landing_rows",
+            ["owner_user_id", "is_listed", "coauthored_works_count"],
+        )
+        op.create_index(
+            "ix_collaboration_landing_rows_owner_strength",
+            "collaboration_landing_rows",
+            ["owner_user_id", "is_listed", "collaboration_strength_score"],
+        )
+    if not _table_exists("collaboration_landing_shared_works"):
+        op.create_table(
+            "collaboration_landing_shared_works",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("owner_user_id", sa.String(length=36), nullable=False),
+            sa.Column("collaborator_id", sa.String(length=36), nullable=False),
+            sa.Column("work_id", sa.String(length=36), nullable=False),
+            sa.Column("title", sa.Text(), nullable=False),
+            sa.Column("sort_title", sa.String(length=255), nullable=False),
+            sa.Column("year", sa.Integer(), nullable=True),
+            sa.Column("venue_name", sa.Text(), nullable=True),
+            sa.Column("publication_type", sa.String(length=128), nullable=True),
+            sa.Column("citations_total", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["owner_user_id"], ["users.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["collaborator_id"], ["collaborators.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(["work_id"], ["works.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("collaborator_id", "work_id"),
+        )
+        op.create_index(
+            "ix_collaboration_landing_shared_works_owner_collaborator",
+            "collaboration_landing_shared_works",
+            ["owner_user_id", "collaborator_id"],
+        )
+        op.create_index(
+            "ix_collaboration_landing_shared_works_work_id",
+            "collaboration_landing_shared_works",
+            ["work_id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("collaboration_landing_shared_works")
+    op.drop_table("collaboration_landing_rows")
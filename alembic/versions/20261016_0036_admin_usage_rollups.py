@@ -0,0 +1,116 @@
+"""Email-domain column, admin dashboard indexes and monthly usage rollups.
+
+Revision ID: 20261016_0036
+Revises: 20261016_0035
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0036"
+down_revision = "20261016_0035"
+branch_labels = None
+depends_on = None
+
+_CREATED_AT_INDEXES = (
+    ("ix_generation_jobs_created_at", "generation_jobs", "created_at"),
+    ("ix_manuscript_snapshots_created_at", "manuscript_snapshots", "created_at"),
+    ("ix_data_library_assets_uploaded_at", "data_library_assets", "uploaded_at"),
+)
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return table_name in set(inspector.get_table_names())
+
+
+def _column_names(table_name: str) -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def _index_names(table_name: str) -> set[str]:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def _email_domain(email: str | None) -> str:
+    clean = str(email or "").strip().lower()
+    if "@" not in clean:
+        return "unknown.local"
+    _, _, domain = clean.rpartition("@")
+    return domain[:255] or "unknown.local"
+
+
+def upgrade() -> None:
+    if "email_domain" not in _column_names("users"):
+        op.add_column(
+            "users",
+            sa.Column(
+                "email_domain",
+                sa.String(length=255),
+                nullable=False,
+                server_default="",
+            ),
+        )
+    if "ix_users_email_domain" not in _index_names("users"):
+        op.create_index("ix_users_email_domain", "users", ["email_domain"])
+
+    bind = op.get_bind()
+    users = sa.table(
+        "users",
+        sa.column("id", sa.String),
+        sa.column("email", sa.String),
+        sa.column("email_domain", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(users.c.id, users.c.email).where(users.c.email_domain == "")
+    ).all()
+    if rows:
+        bind.execute(
+            users.update()
+            .where(users.c.id == sa.bindparam("user_id"))
+            .values(email_domain=sa.bindparam("domain")),
+            [
+                {"user_id": user_id, "domain": _email_domain(email)}
+                for user_id, email in rows
+            ],
+        )
+
+    for index_name, table_name, column_name in _CREATED_AT_INDEXES:
+        if _table_exists(table_name) and index_name not in _index_names(table_name):
+            op.create_index(index_name, table_name, [column_name])
+
+    if not _table_exists("admin_usage_monthly_rollups"):
+        op.create_table(
+            "admin_usage_monthly_rollups",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("month_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("domain", sa.String(length=255), nullable=False),
+            sa.Column("tool_calls", sa.Integer(), nullable=False),
+            sa.Column("tokens", sa.Integer(), nullable=False),
+            sa.Column("cost_usd", sa.Float(), nullable=False),
+            sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("month_start", "domain"),
+        )
+        op.create_index(
+            "ix_admin_usage_monthly_rollups_month",
+            "admin_usage_monthly_rollups",
+            ["month_start"],
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("admin_usage_monthly_rollups"):
+        op.drop_table("admin_usage_monthly_rollups")
+    for index_name, table_name, _ in _CREATED_AT_INDEXES:
+        if _table_exists(table_name) and index_name in _index_names(table_name):
+            op.drop_index(index_name, table_name=table_name)
+    if "ix_users_email_domain" in _index_names("users"):
+        op.drop_index("ix_users_email_domain", table_name="users")
+    if "email_domain" in _column_names("users"):
+        op.drop_column("users", "email_domain")
@@ -166,6 +166,7 @@ export async function listLibraryAssets(input: {
   pageSize?: number
   sortBy?: LibraryAssetSortBy
   sortDirection?: LibraryAssetSortDirection
+  cursor?: string | null
 }): Promise<LibraryAssetListPayload> {
   const projectId = normalizeOptionalId(input.projectId)
   const workspaceId = normalizeOptionalId(input.workspaceId)
@@ -197,6 +198,9 @@ export async function listLibraryAssets(input: {
   if ((input.sortDirection || '').trim()) {
     search.set('sort_direction', input.sortDirection!)
   }
+  if ((input.cursor || '').trim()) {
+    search.set('cursor', input.cursor!.trim())
+  }
   const suffix = search.toString() ? `?${search.toString()}` : ''
   const response = await fetch(`${API_BASE_URL}/v1/library/assets${suffix}`, {
     headers: authHeaders(input.token || ''),
@@ -211,6 +215,7 @@ export async function listLibraryAssets(input: {
     page_size: Number(payload.page_size || 50),
     total: Number(payload.total || 0),
     has_more: Boolean(payload.has_more),
+    next_cursor: payload.next_cursor || null,
     sort_by: (payload.sort_by || 'uploaded_at') as LibraryAssetSortBy,
     sort_direction: (payload.sort_direction || 'desc') as LibraryAssetSortDirection,
     query: String(payload.query || ''),
@@ -239,6 +239,7 @@ type WorkspaceAccountSearchApiPayload = {
 
 type WorkspaceInboxMessagesApiPayload = {
   items: WorkspaceInboxMessageApiPayload[]
+  next_cursor?: string | null
 }
 
 type WorkspaceInboxReadsApiPayload = {
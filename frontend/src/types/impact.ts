@@ -47,6 +47,9 @@ export type AdminUserSummaryPayload = {
   last_sign_in_at: string | null
   created_at: string
   updated_at: string
+  works_count: number
+  citations_total: number
+  h_index: number
 }
 
 export type AdminUsersListPayload = {
@@ -446,6 +446,7 @@ export type LibraryAssetListPayload = {
   page_size: number
   total: number
   has_more: boolean
+  next_cursor?: string | null
   sort_by: LibraryAssetSortBy
   sort_direction: LibraryAssetSortDirection
   query: string
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Compare the NumPy bibliometric kernels with the list loops they replaced.
+
+Example:
+    python scripts/bibliometrics_benchmark.py --works 2000 --months 480 --users 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--works", type=int, default=1000)
+    parser.add_argument("--months", type=int, default=360)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _list_h_index(citations: list[int]) -> int:
+    values = sorted([max(0, int(v or 0)) for v in citations], reverse=True)
+    h_value = 0
+    for index, value in enumerate(values, start=1):
+        if value >= index:
+            h_value = index
+        else:
+            break
+    return h_value
+
+
+def _list_g_index(citations: list[int]) -> int:
+    values = sorted([max(0, int(v or 0)) for v in citations], reverse=True)
+    cumulative = 0
+    g_value = 0
+    for index, value in enumerate(values, start=1):
+        cumulative += value
+        if cumulative >= (index * index):
+            g_value = index
+        else:
+            break
+    return g_value
+
+
+def _list_gini(values: list[int]) -> float:
+    clean = sorted(max(0.0, float(item)) for item in values)
+    n = len(clean)
+    total = float(sum(clean))
+    if n <= 0 or total <= 0.0:
+        return 0.0
+    weighted_sum = 0.0
+    for index, value in enumerate(clean, start=1):
+        weighted_sum += ((2 * index) - n - 1) * value
+    return round(max(0.0, min(1.0, weighted_sum / (float(n) * total))), 4)
+
+
+def _list_rolling_sums(values: list[int], window: int) -> list[int]:
+    return [
+        int(sum(values[max(0, index - window + 1) : index + 1]))
+        for index in range(len(values))
+    ]
+
+
+def _list_estimate_window(
+    yearly_counts: dict[int, int], *, start: datetime, end: datetime, now: datetime
+) -> int:
+    estimated = 0.0
+    for year, count in yearly_counts.items():
+        if count <= 0:
+            continue
+        segment_start = datetime(year, 1, 1, tzinfo=timezone.utc)
+        segment_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+        if year == now.year:
+            segment_end = min(segment_end, now)
+        if segment_end <= segment_start:
+            continue
+        overlap_start = max(start, segment_start)
+        overlap_end = min(end, segment_end)
+        if overlap_end <= overlap_start:
+            continue
+        overlap = (overlap_end - overlap_start).total_seconds()
+        segment = (segment_end - segment_start).total_seconds()
+        estimated += count * max(0.0, min(1.0, overlap / segment))
+    return max(0, int(round(estimated)))
+
+
+def _shift_month(value: datetime, delta: int) -> datetime:
+    index = value.year * 12 + (value.month - 1) + delta
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    args = _parse_args()
+    from research_os.services import bibliometrics_service as kernels  # noqa: E402
+
+    rng = random.Random(args.seed)
+    works = max(1, args.works)
+    months = max(12, args.months)
+    now = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    current_month = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
+    month_points = [
+        _shift_month(current_month, index - months) for index in range(months)
+    ]
+    first_year = month_points[0].year
+    yearly_rows = [
+        {
+            year: rng.randint(0, 40)
+            for year in range(rng.randint(first_year, now.year), now.year + 1)
+        }
+        for _ in range(works)
+    ]
+    cumulative = [
+        sorted(rng.randint(0, 400) for _ in range(24)) for _ in range(works)
+    ]
+    portfolios = {
+        f"user-{index}": [
+            rng.randint(0, 300) for _ in range(rng.randint(0, works // 5 + 1))
+        ]
+        for index in range(max(1, args.users))
+    }
+    monthly_totals = [rng.randint(0, 100) for _ in range(months)]
+    lifetime = [rng.randint(0, 500) for _ in range(works)]
+
+    cases: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "h_g_gini_single_portfolio": (
+            lambda: (
+                _list_h_index(lifetime),
+                _list_g_index(lifetime),
+                _list_gini(lifetime),
+            ),
+            lambda: (
+                kernels.h_index(lifetime),
+                kernels.g_index(lifetime),
+                kernels.gini_coefficient(lifetime),
+            ),
+        ),
+        "h_index_series_24_months": (
+            lambda: [
+                _list_h_index([row[month] for row in cumulative]) for month in range(24)
+            ],
+            lambda: kernels.h_index_by_column(cumulative),
+        ),
+        "rolling_12_month_sums": (
+            lambda: _list_rolling_sums(monthly_totals, 12),
+            lambda: kernels.rolling_sums(monthly_totals, 12),
+        ),
+        "spread_yearly_counts_lifetime": (
+            lambda: [
+                [
+                    _list_estimate_window(
+                        counts,
+                        start=point,
+                        end=_shift_month(point, 1),
+                        now=current_month,
+                    )
+                    for point in month_points
+                ]
+                for counts in yearly_rows
+            ],
+            lambda: kernels.spread_yearly_counts(
+                yearly_rows, month_points, now=current_month
+            ),
+        ),
+        "portfolio_indices_all_users": (
+            lambda: {
+                key: (_list_h_index(values), _list_g_index(values), _list_gini(values))
+                for key, values in portfolios.items()
+            },
+            lambda: kernels.citation_indices_for_portfolios(portfolios),
+        ),
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for name, (list_fn, kernel_fn) in cases.items():
+        list_seconds = _time(list_fn, args.repeat)
+        kernel_seconds = _time(kernel_fn, args.repeat)
+        results[name] = {
+            "list_ms": round(list_seconds * 1000.0, 3),
+            "kernel_ms": round(kernel_seconds * 1000.0, 3),
+            "speedup": (
+                round(list_seconds / kernel_seconds, 2) if kernel_seconds > 0 else 0.0
+            ),
+        }
+    print(
+        json.dumps(
+            {
+                "works": works,
+                "months": months,
+                "users": len(portfolios),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
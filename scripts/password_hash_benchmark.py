@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Measure password verification throughput through the hashing pool.
+
+Example:
+    python scripts/password_hash_benchmark.py --workers 4 --logins 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Hashing processes (AUTH_PASSWORD_HASH_WORKERS); 0 verifies inline.",
+    )
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=0,
+        help="Concurrent login threads (default: twice the worker count).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    workers = max(0, args.workers)
+    concurrency = max(1, args.concurrency or max(1, workers) * 2)
+    os.environ["AUTH_PASSWORD_HASH_WORKERS"] = str(workers)
+    os.environ.setdefault("AUTH_PASSWORD_HASH_MAX_PENDING", str(concurrency))
+
+    from research_os.services.password_hashing_service import (  # noqa: E402
+        PasswordHashingOverloadedError,
+        hash_password_offloaded,
+        shutdown_password_hash_pool,
+        verify_password_offloaded,
+    )
+    from research_os.services.security_service import PBKDF2_ITERATIONS  # noqa: E402
+
+    password = "BenchmarkPassword123"
+    try:
+        stored_hash = hash_password_offloaded(password)
+        # Warm every worker so interpreter spawn time is not counted.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(
+                executor.map(
+                    lambda _: verify_password_offloaded(password, stored_hash),
+                    range(max(1, workers)),
+                )
+            )
+
+        rejected = 0
+
+        def _login(_: int) -> bool:
+            nonlocal rejected
+            try:
+                return verify_password_offloaded(password, stored_hash)
+            except PasswordHashingOverloadedError:
+                rejected += 1
+                return False
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(_login, range(max(1, args.logins))))
+        elapsed = time.perf_counter() - started
+    finally:
+        shutdown_password_hash_pool()
+
+    succeeded = sum(1 for item in results if item)
+    cores = max(1, min(workers or 1, os.cpu_count() or 1))
+    logins_per_second = succeeded / elapsed if elapsed > 0 else 0.0
+    print(
+        json.dumps(
+            {
+                "pbkdf2_iterations": PBKDF2_ITERATIONS,
+                "workers": workers,
+                "concurrency": concurrency,
+                "logins": len(results),
+                "succeeded": succeeded,
+                "rejected": rejected,
+                "elapsed_seconds": round(elapsed, 3),
+                "logins_per_second": round(logins_per_second, 2),
+                "logins_per_second_per_core": round(logins_per_second / cores, 2),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,13 +1,15 @@
 import base64
 import asyncio
+import json
 import logging
 import os
 import re
 import time
 from collections import defaultdict, deque
 from contextlib import asynccontextmanager
+from itertools import chain
 from threading import Lock
-from typing import Any, Literal
+from typing import Any, Callable, Iterator, Literal
 from urllib.parse import quote
 from urllib.parse import urlparse
 from uuid import uuid4
@@ -17,11 +19,14 @@ from fastapi import Query
 from fastapi import Request
 from fastapi import WebSocket
 from fastapi import WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
 from fastapi.responses import PlainTextResponse
 from fastapi.responses import RedirectResponse
 from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 
 from research_os.platform_compat import patch_windows_platform_machine
 
@@ -29,6 +34,8 @@ patch_windows_platform_machine()
 
 from sqlalchemy import text
 
+from research_os.clients.http_client import close_http_clients
+from research_os.clients.openai_client import close_openai_client
 from research_os.config import get_openai_api_key
 from research_os.db import User, session_scope
 from research_os.api.schemas import (
@@ -207,6 +214,7 @@ from research_os.api.schemas import (
     PersonaContextResponse,
     PersonaEmbeddingsGenerateRequest,
     PersonaEmbeddingsGenerateResponse,
+    PersonaSimilarWorksResponse,
     PersonaSyncJobMetricsRequest,
     PersonaSyncJobResponse,
     PersonaGrantsResponse,
@@ -363,6 +371,7 @@ from research_os.services.consistency_service import run_cross_section_consisten
 from research_os.services.grounded_draft_service import (
     GroundedDraftGenerationError,
     generate_grounded_section_draft,
+    stream_grounded_section_draft,
 )
 from research_os.services.insight_service import (
     SelectionInsightNotFoundError,
@@ -373,6 +382,7 @@ from research_os.services.paragraph_regeneration_service import (
     regenerate_paragraph_text,
     replace_paragraph,
     split_section_paragraphs,
+    stream_paragraph_regeneration,
 )
 from research_os.services.qc_service import run_qc_checks
 from research_os.services.section_planning_service import build_section_plan
@@ -412,6 +422,7 @@ from research_os.services.auth_service import (
     request_email_verification,
     request_password_reset,
     delete_current_user,
+    stop_auth_session_touch_writer,
     update_current_user,
 )
 from research_os.services.publication_insights_bootstrap_service import (
@@ -428,6 +439,7 @@ from research_os.services.persona_service import (
     PersonaNotFoundError,
     PersonaValidationError,
     dump_persona_state,
+    find_similar_works,
     generate_embeddings,
     get_persona_context,
     get_themes,
@@ -471,6 +483,10 @@ from research_os.services.publications_sync_scheduler_service import (
     start_publications_auto_sync_scheduler,
     stop_publications_auto_sync_scheduler,
 )
+from research_os.services.job_queue_service import (
+    start_job_workers,
+    stop_job_workers,
+)
 from research_os.services.open_access_sync_scheduler_service import (
     start_open_access_auto_sync_scheduler,
     stop_open_access_auto_sync_scheduler,
@@ -486,7 +502,14 @@ from research_os.services.publication_insights_agent_service import (
     PublicationInsightsAgentValidationError,
     generate_publication_insights_agent_draft,
     publication_insights_available,
+    stream_publication_insights_agent_draft,
+)
+from research_os.services.parse_worker_pool_service import shutdown_parse_process_pool
+from research_os.services.password_hashing_service import (
+    PasswordHashingOverloadedError,
+    shutdown_password_hash_pool,
 )
+from research_os.services.api_telemetry_service import stop_api_telemetry_writer
 from research_os.services.publication_console_service import (
     PublicationConsoleNotFoundError,
     PublicationConsoleValidationError,
@@ -524,6 +547,7 @@ from research_os.services.collaboration_service import (
     list_collaborators_for_user,
     normalize_affiliations_and_coi_draft,
     save_manuscript_authors,
+    stream_collaboration_ai_insights_draft,
     suggest_collaborators_for_manuscript_draft,
     start_collaboration_metrics_scheduler,
     stop_collaboration_metrics_scheduler,
@@ -556,6 +580,7 @@ from research_os.services.manuscript_service import (
 )
 from research_os.services.title_abstract_service import (
     TitleAbstractSynthesisError,
+    stream_title_and_abstract,
     synthesize_title_and_abstract,
 )
 from research_os.services.wizard_service import (
@@ -581,13 +606,13 @@ from research_os.services.workspace_service import (
     list_workspace_records,
     search_workspace_accounts,
     mark_workspace_inbox_read,
-    has_workspace_access,
     save_workspace_inbox_state,
     save_workspace_state,
     set_active_workspace,
     update_workspace_invitation_status,
     update_workspace_record,
 )
+from research_os.services.workspace_realtime_service import WorkspaceRealtimeHub
 from research_os.services.collection_service import (
     list_collections,
     create_collection,
@@ -725,6 +750,13 @@ async def app_lifespan(_: FastAPI):
             extra={"detail": str(exc)},
         )
     if _background_schedulers_enabled():
+        try:
+            start_job_workers()
+        except Exception as exc:
+            logger.warning(
+                "job_workers_start_failed",
+                extra={"detail": str(exc)},
+            )
         try:
             start_publications_analytics_scheduler()
         except Exception as exc:
@@ -753,9 +785,20 @@ async def app_lifespan(_: FastAPI):
                 "open_access_auto_sync_scheduler_start_failed",
                 extra={"detail": str(exc)},
             )
+    try:
+        await _workspace_inbox_realtime_hub.start()
+    except Exception as exc:
+        logger.warning(
+            "workspace_realtime_hub_start_failed",
+            extra={"detail": str(exc)},
+        )
     try:
         yield
     finally:
+        try:
+            await _workspace_inbox_realtime_hub.stop()
+        except Exception:
+            pass
         try:
             stop_publications_analytics_scheduler()
         except Exception:
@@ -772,78 +815,40 @@ async def app_lifespan(_: FastAPI):
             stop_open_access_auto_sync_scheduler()
         except Exception:
             pass
+        try:
+            stop_job_workers()
+        except Exception:
+            pass
+        try:
+            close_http_clients()
+        except Exception:
+            pass
+        try:
+            close_openai_client()
+        except Exception:
+            pass
+        try:
+            shutdown_parse_process_pool()
+        except Exception:
+            pass
+        try:
+            stop_api_telemetry_writer()
+        except Exception:
+            pass
+        try:
+            stop_auth_session_touch_writer()
+        except Exception:
+            pass
+        try:
+            shutdown_password_hash_pool()
+        except Exception:
+            pass
 
 
 app = FastAPI(title="Research OS API", version="0.1.0", lifespan=app_lifespan)
 
 
-class WorkspaceInboxRealtimeHub:
-    def __init__(self) -> None:
-        self._connections_by_workspace: dict[str, set[WebSocket]] = defaultdict(set)
-        self._workspace_by_connection: dict[WebSocket, str] = {}
-        self._user_id_by_connection: dict[WebSocket, str] = {}
-        self._lock = asyncio.Lock()
-
-    async def connect(
-        self, *, workspace_id: str, websocket: WebSocket, user_id: str
-    ) -> None:
-        await websocket.accept()
-        async with self._lock:
-            self._connections_by_workspace[workspace_id].add(websocket)
-            self._workspace_by_connection[websocket] = workspace_id
-            self._user_id_by_connection[websocket] = str(user_id or "").strip()
-
-    async def disconnect(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            workspace_id = self._workspace_by_connection.pop(websocket, "")
-            self._user_id_by_connection.pop(websocket, None)
-            if not workspace_id:
-                return
-            connections = self._connections_by_workspace.get(workspace_id)
-            if not connections:
-                return
-            connections.discard(websocket)
-            if not connections:
-                self._connections_by_workspace.pop(workspace_id, None)
-
-    async def broadcast(
-        self,
-        *,
-        workspace_id: str,
-        payload: dict[str, Any],
-        exclude: WebSocket | None = None,
-    ) -> None:
-        async with self._lock:
-            targets = list(self._connections_by_workspace.get(workspace_id) or [])
-            target_user_ids = {
-                target: str(self._user_id_by_connection.get(target, "")).strip()
-                for target in targets
-            }
-
-        stale_targets: list[WebSocket] = []
-        for target in targets:
-            if exclude is not None and target is exclude:
-                continue
-            target_user_id = target_user_ids.get(target, "")
-            if not target_user_id or not has_workspace_access(
-                user_id=target_user_id, workspace_id=workspace_id
-            ):
-                stale_targets.append(target)
-                try:
-                    await target.close(code=1008, reason="Workspace access denied.")
-                except Exception:
-                    pass
-                continue
-            try:
-                await target.send_json(payload)
-            except Exception:
-                stale_targets.append(target)
-
-        for target in stale_targets:
-            await self.disconnect(target)
-
-
-_workspace_inbox_realtime_hub = WorkspaceInboxRealtimeHub()
+_workspace_inbox_realtime_hub = WorkspaceRealtimeHub()
 
 default_allow_origins = [
     "http://localhost:5173",
@@ -947,6 +952,24 @@ async def add_request_context(request: Request, call_next):
     return response
 
 
+@app.exception_handler(PasswordHashingOverloadedError)
+async def handle_password_hashing_overloaded(
+    request: Request, exc: PasswordHashingOverloadedError
+) -> JSONResponse:
+    response = JSONResponse(
+        status_code=503,
+        content={
+            "error": {
+                "message": "Service busy",
+                "type": "overloaded",
+                "detail": str(exc),
+            }
+        },
+    )
+    response.headers["Retry-After"] = str(max(1, exc.retry_after_seconds))
+    return response
+
+
 @app.exception_handler(Exception)
 async def handle_unexpected_exception(request: Request, exc: Exception) -> JSONResponse:
     request_id = getattr(request.state, "request_id", None)
@@ -1085,6 +1108,97 @@ def _build_inline_content_disposition(filename: str) -> str:
     return f"inline; filename=\"{fallback}\"; filename*=UTF-8''{encoded}"
 
 
+def _if_none_match_satisfied(header_value: str | None, etag: str) -> bool:
+    if not header_value or not etag:
+        return False
+    candidates = [item.strip() for item in header_value.split(",") if item.strip()]
+    if "*" in candidates:
+        return True
+    # If-None-Match uses weak comparison (RFC 9110 section 13.1.2).
+    bare_etag = etag.removeprefix("W/")
+    return any(item.removeprefix("W/") == bare_etag for item in candidates)
+
+
+def _build_publication_file_response(
+    request: Request, payload: dict[str, object], *, headers: dict[str, str]
+) -> Response:
+    media_type = str(payload.get("content_type") or "application/octet-stream")
+    etag = str(payload.get("etag") or "").strip()
+    response_headers = dict(headers)
+    if etag:
+        response_headers["ETag"] = etag
+        if _if_none_match_satisfied(request.headers.get("if-none-match"), etag):
+            not_modified_headers = {"ETag": etag}
+            if "Cache-Control" in headers:
+                not_modified_headers["Cache-Control"] = headers["Cache-Control"]
+            return Response(status_code=304, headers=not_modified_headers)
+    path = str(payload.get("path") or "").strip()
+    if path and os.path.isfile(path):
+        # FileResponse streams in chunks, answers Range/If-Range requests, and
+        # uses the server's pathsend extension for zero-copy sends when offered.
+        return FileResponse(path, media_type=media_type, headers=response_headers)
+    content = payload.get("content") or b""
+    return Response(content=content, media_type=media_type, headers=response_headers)
+
+
+DraftStreamEvent = tuple[str, dict[str, Any]]
+
+
+def _format_sse_event(event: str, data: Any) -> str:
+    body = json.dumps(jsonable_encoder(data), separators=(",", ":"))
+    return f"event: {event}\ndata: {body}\n\n"
+
+
+def _build_draft_stream_response(
+    first_event: DraftStreamEvent,
+    events: Iterator[DraftStreamEvent],
+    *,
+    finalize: Callable[[dict[str, Any]], Any],
+    bad_request_errors: tuple[type[Exception], ...] = (),
+) -> StreamingResponse:
+    """Serve draft events as server-sent events.
+
+    Callers pull ``first_event`` before building the response so validation
+    and lookup errors still return ordinary JSON error responses. ``finalize``
+    turns the service's result payload into the endpoint's response model, so
+    the ``result`` event carries the same body as the non-streaming endpoint.
+    Errors after the stream has started are sent as an ``error`` event in the
+    usual error envelope.
+    """
+
+    def _body() -> Iterator[str]:
+        try:
+            for event, data in chain([first_event], events):
+                if event == "result":
+                    result = finalize(data)
+                    if isinstance(result, JSONResponse):
+                        yield f"event: error\ndata: {result.body.decode()}\n\n"
+                        return
+                    yield _format_sse_event(event, result)
+                else:
+                    yield _format_sse_event(event, data)
+        except Exception as exc:
+            logger.warning(
+                "draft_stream_failed", extra={"error_type": type(exc).__name__}
+            )
+            error_response = (
+                _build_bad_request_response(str(exc))
+                if isinstance(exc, bad_request_errors)
+                else _build_error_response(exc)
+            )
+            yield f"event: error\ndata: {error_response.body.decode()}\n\n"
+        finally:
+            close = getattr(events, "close", None)
+            if callable(close):
+                close()
+
+    return StreamingResponse(
+        _body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def _build_forbidden_response(detail: str) -> JSONResponse:
     return JSONResponse(
         status_code=403,
@@ -2705,6 +2819,32 @@ def v1_persona_list_works(request: Request) -> list[PersonaWorkResponse] | JSONR
         return _build_not_found_response(str(exc))
 
 
+@app.get(
+    "/v1/persona/works/{work_id}/similar",
+    response_model=PersonaSimilarWorksResponse,
+    responses=NOT_FOUND_RESPONSES | UNAUTHORIZED_RESPONSES,
+    tags=["v1"],
+)
+def v1_persona_similar_works(
+    work_id: str,
+    request: Request,
+    limit: int = Query(default=10, ge=1, le=100),
+) -> PersonaSimilarWorksResponse | JSONResponse:
+    token = _extract_session_token(request)
+    if not token:
+        return _build_unauthorized_response("Session token is required.")
+    try:
+        user = get_user_by_session_token(token)
+        payload = find_similar_works(
+            user_id=str(user["id"]), work_id=work_id, limit=limit
+        )
+        return PersonaSimilarWorksResponse(**payload)
+    except AuthNotFoundError as exc:
+        return _build_unauthorized_response(str(exc))
+    except PersonaNotFoundError as exc:
+        return _build_not_found_response(str(exc))
+
+
 @app.get(
     "/v1/persona/journals",
     response_model=list[PersonaJournalResponse],
@@ -2968,6 +3108,62 @@ def v1_publications_ai_insights(
         return _build_bad_request_response(str(exc))
 
 
+@app.get(
+    "/v1/publications/ai/insights/stream",
+    response_model=None,
+    responses=BAD_REQUEST_RESPONSES | NOT_FOUND_RESPONSES | UNAUTHORIZED_RESPONSES,
+    tags=["v1"],
+)
+def v1_publications_ai_insights_stream(
+    request: Request,
+    window_id: Literal["1y", "3y", "5y", "all"] = Query("1y"),
+    scope: Literal["window", "section"] = Query("window"),
+    section_key: Literal[
+        "uncited_works",
+        "citation_drivers",
+        "citation_activation",
+        "citation_activation_history",
+        "publication_output_pattern",
+        "publication_production_phase",
+        "publication_year_over_year_trajectory",
+        "publication_volume_over_time",
+        "publication_article_type_over_time",
+        "publication_type_over_time",
+    ]
+    | None = Query(None),
+    ui_context: str | None = Query(None),
+) -> StreamingResponse | JSONResponse:
+    token = _extract_session_token(request)
+    if not token:
+        return _build_unauthorized_response("Session token is required.")
+    try:
+        user = get_user_by_session_token(token)
+        events = stream_publication_insights_agent_draft(
+            user_id=str(user["id"]),
+            window_id=window_id,
+            section_key=section_key,
+            scope=scope,
+            ui_context=ui_context,
+        )
+        first_event = next(events)
+    except AuthNotFoundError as exc:
+        return _build_unauthorized_response(str(exc))
+    except PublicationMetricsNotFoundError as exc:
+        return _build_not_found_response(str(exc))
+    except (
+        PublicationInsightsAgentValidationError,
+        PublicationMetricsValidationError,
+        ValueError,
+    ) as exc:
+        return _build_bad_request_response(str(exc))
+    return _build_draft_stream_response(
+        first_event,
+        events,
+        finalize=lambda payload: PublicationInsightsAgentResponse(**payload),
+        bad_request_errors=(PublicationInsightsAgentValidationError, ValueError),
+    )
+
+
 @app.get(
     "/v1/publications/analytics",
     response_model=PublicationsAnalyticsResponse,
@@ -3481,12 +3677,10 @@ def v1_publication_files_download(
                 return _build_not_found_response("Download URL is unavailable.")
             return RedirectResponse(url=url)
         file_name = str(payload.get("file_name") or "file.bin")
-        media_type = str(payload.get("content_type") or "application/octet-stream")
-        content = payload.get("content") or b""
         headers = {
             "Content-Disposition": _build_attachment_content_disposition(file_name)
         }
-        return Response(content=content, media_type=media_type, headers=headers)
+        return _build_publication_file_response(request, payload, headers=headers)
     except AuthNotFoundError as exc:
         return _build_unauthorized_response(str(exc))
     except PublicationConsoleNotFoundError as exc:
@@ -3517,13 +3711,14 @@ def v1_publication_files_content(
             file_id=file_id,
         )
         file_name = str(payload.get("file_name") or "file.bin")
-        media_type = str(payload.get("content_type") or "application/octet-stream")
-        content = payload.get("content") or b""
         headers = {
             "Content-Disposition": _build_inline_content_disposition(file_name),
-            "Cache-Control": "no-store",
+            # Browsers may keep the file but must revalidate with the ETag, so
+            # the in-app reader can re-open a PDF with a 304 instead of a full
+            # transfer.
+            "Cache-Control": "private, no-cache",
         }
-        return Response(content=content, media_type=media_type, headers=headers)
+        return _build_publication_file_response(request, payload, headers=headers)
     except AuthNotFoundError as exc:
         return _build_unauthorized_response(str(exc))
     except PublicationConsoleNotFoundError as exc:
@@ -3898,6 +4093,34 @@ def v1_collaboration_ai_insights(
         return _build_bad_request_response(str(exc))
 
 
+@app.post(
+    "/v1/account/collaboration/ai/insights/stream",
+    response_model=None,
+    responses=BAD_REQUEST_RESPONSES | UNAUTHORIZED_RESPONSES,
+    tags=["v1"],
+)
+def v1_collaboration_ai_insights_stream(
+    request: Request,
+) -> StreamingResponse | JSONResponse:
+    token = _extract_session_token(request)
+    if not token:
+        return _build_unauthorized_response("Session token is required.")
+    try:
+        user = get_user_by_session_token(token)
+        events = stream_collaboration_ai_insights_draft(user_id=str(user["id"]))
+        first_event = next(events)
+    except AuthNotFoundError as exc:
+        return _build_unauthorized_response(str(exc))
+    except (CollaborationValidationError, ValueError) as exc:
+        return _build_bad_request_response(str(exc))
+    return _build_draft_stream_response(
+        first_event,
+        events,
+        finalize=lambda payload: CollaborationAiInsightsResponse(**payload),
+        bad_request_errors=(CollaborationValidationError, ValueError),
+    )
+
+
 @app.post(
     "/v1/account/collaboration/ai/author-suggestions",
     response_model=CollaborationAiAuthorSuggestionsResponse,
@@ -4421,6 +4644,8 @@ def v1_update_workspace_invitation(
 def v1_list_workspace_inbox_messages(
     request: Request,
     workspace_id: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=200),
 ) -> WorkspaceInboxMessagesResponse | JSONResponse:
     token = _extract_session_token(request)
     if not token:
@@ -4430,6 +4655,8 @@ def v1_list_workspace_inbox_messages(
         payload = list_workspace_inbox_messages(
             user_id=str(user["id"]),
             workspace_id=workspace_id,
+            cursor=cursor,
+            limit=limit,
         )
         return WorkspaceInboxMessagesResponse(**payload)
     except AuthNotFoundError as exc:
@@ -4550,7 +4777,9 @@ async def v1_workspace_inbox_ws(websocket: WebSocket) -> None:
 
     sender_user_id = str(user.get("id") or "").strip()
     sender_name = str(user.get("name") or "").strip() or "Unknown user"
-    if not has_workspace_access(user_id=sender_user_id, workspace_id=workspace_id):
+    if not await _workspace_inbox_realtime_hub.has_access(
+        user_id=sender_user_id, workspace_id=workspace_id
+    ):
         await websocket.close(code=1008, reason="Workspace access denied.")
         return
 
@@ -4576,7 +4805,7 @@ async def v1_workspace_inbox_ws(websocket: WebSocket) -> None:
             payload = await websocket.receive_json()
             if not isinstance(payload, dict):
                 continue
-            if not has_workspace_access(
+            if not await _workspace_inbox_realtime_hub.has_access(
                 user_id=sender_user_id, workspace_id=workspace_id
             ):
                 await websocket.close(code=1008, reason="Workspace access denied.")
@@ -4586,7 +4815,8 @@ async def v1_workspace_inbox_ws(websocket: WebSocket) -> None:
                 continue
 
             if event_type == "ping":
-                await websocket.send_json(
+                await _workspace_inbox_realtime_hub.send(
+                    websocket,
                     {
                         "type": "pong",
                         "workspace_id": workspace_id,
@@ -5077,6 +5307,7 @@ def v1_list_library_assets(
         "uploaded_at", "filename", "byte_size", "kind", "owner_name"
     ] = Query(default="uploaded_at"),
     sort_direction: Literal["asc", "desc"] = Query(default="desc"),
+    cursor: str | None = Query(default=None, max_length=1024),
 ) -> LibraryAssetListResponse | JSONResponse:
     requesting_user_id, auth_error = _resolve_request_user_required(request)
     if auth_error is not None:
@@ -5095,6 +5326,7 @@ def v1_list_library_assets(
             page_size=page_size,
             sort_by=sort_by,
             sort_direction=sort_direction,
+            cursor=cursor,
         )
         return LibraryAssetListResponse(
             items=[LibraryAssetResponse(**item) for item in payload.get("items", [])],
@@ -5102,6 +5334,7 @@ def v1_list_library_assets(
             page_size=int(payload.get("page_size") or page_size),
             total=int(payload.get("total") or 0),
             has_more=bool(payload.get("has_more")),
+            next_cursor=payload.get("next_cursor") or None,
             sort_by=str(payload.get("sort_by") or sort_by),
             sort_direction=str(payload.get("sort_direction") or sort_direction),
             query=str(payload.get("query") or ""),
@@ -5630,7 +5863,70 @@ def v1_generate_aawe_grounded_draft(
         locked_text=request.locked_text,
         model=request.model or "gpt-4.1-mini",
     )
+    return _finalize_grounded_draft_response(
+        request, payload, requesting_user_id=requesting_user_id
+    )
+
 
+@app.post(
+    "/v1/aawe/draft/grounded/stream",
+    response_model=None,
+    responses=ERROR_RESPONSES | NOT_FOUND_RESPONSES | BAD_REQUEST_RESPONSES,
+    tags=["v1"],
+)
+def v1_stream_aawe_grounded_draft(
+    request: GroundedDraftRequest,
+    http_request: Request,
+) -> StreamingResponse | JSONResponse:
+    requesting_user_id, auth_error = _resolve_request_user_required(http_request)
+    if auth_error is not None:
+        return auth_error
+    if (
+        request.generation_mode == "targeted"
+        and not (request.target_instruction or "").strip()
+    ):
+        return _build_bad_request_response(
+            "target_instruction is required when generation_mode is 'targeted'."
+        )
+    if request.persist_to_manuscript and not (
+        (request.project_id or "").strip() and (request.manuscript_id or "").strip()
+    ):
+        return _build_bad_request_response(
+            (
+                "project_id and manuscript_id are required when "
+                "persist_to_manuscript is true."
+            )
+        )
+
+    events = stream_grounded_section_draft(
+        section=request.section,
+        notes_context=request.notes_context,
+        style_profile=request.style_profile,
+        generation_mode=request.generation_mode,
+        plan_objective=request.plan_objective,
+        must_include=request.must_include,
+        evidence_links=[link.model_dump() for link in request.evidence_links],
+        citation_ids=request.citation_ids,
+        target_instruction=request.target_instruction,
+        locked_text=request.locked_text,
+        model=request.model or "gpt-4.1-mini",
+    )
+    first_event = next(events)
+    return _build_draft_stream_response(
+        first_event,
+        events,
+        finalize=lambda payload: _finalize_grounded_draft_response(
+            request, payload, requesting_user_id=requesting_user_id
+        ),
+    )
+
+
+def _finalize_grounded_draft_response(
+    request: GroundedDraftRequest,
+    payload: dict[str, Any],
+    *,
+    requesting_user_id: str,
+) -> GroundedDraftResponse | JSONResponse:
     persisted = False
     manuscript_payload: ManuscriptResponse | None = None
     if request.persist_to_manuscript:
@@ -5691,7 +5987,67 @@ def v1_synthesize_title_abstract(
         max_abstract_words=max(80, min(request.max_abstract_words, 450)),
         model=request.model or "gpt-4.1-mini",
     )
+    return _finalize_title_abstract_response(
+        project_id,
+        manuscript_id,
+        request,
+        payload,
+        requesting_user_id=requesting_user_id,
+    )
+
+
+@app.post(
+    "/v1/aawe/projects/{project_id}/manuscripts/{manuscript_id}/synthesize/title-abstract/stream",
+    response_model=None,
+    responses=ERROR_RESPONSES | NOT_FOUND_RESPONSES,
+    tags=["v1"],
+)
+def v1_stream_title_abstract(
+    project_id: str,
+    manuscript_id: str,
+    request: TitleAbstractSynthesisRequest,
+    http_request: Request,
+) -> StreamingResponse | JSONResponse:
+    requesting_user_id, auth_error = _resolve_request_user_required(http_request)
+    if auth_error is not None:
+        return auth_error
+    try:
+        manuscript = get_project_manuscript(
+            project_id,
+            manuscript_id,
+            requesting_user_id=requesting_user_id,
+        )
+    except (ProjectNotFoundError, ManuscriptNotFoundError) as exc:
+        return _build_not_found_response(str(exc))
+
+    events = stream_title_and_abstract(
+        sections=dict(manuscript.sections or {}),
+        style_profile=request.style_profile,
+        max_abstract_words=max(80, min(request.max_abstract_words, 450)),
+        model=request.model or "gpt-4.1-mini",
+    )
+    first_event = next(events)
+    return _build_draft_stream_response(
+        first_event,
+        events,
+        finalize=lambda payload: _finalize_title_abstract_response(
+            project_id,
+            manuscript_id,
+            request,
+            payload,
+            requesting_user_id=requesting_user_id,
+        ),
+    )
+
 
+def _finalize_title_abstract_response(
+    project_id: str,
+    manuscript_id: str,
+    request: TitleAbstractSynthesisRequest,
+    payload: dict[str, Any],
+    *,
+    requesting_user_id: str,
+) -> TitleAbstractSynthesisResponse:
     persisted = False
     manuscript_payload: ManuscriptResponse | None = None
     if request.persist_to_manuscript:
@@ -5775,6 +6131,101 @@ def v1_regenerate_section_paragraph(
     requesting_user_id, auth_error = _resolve_request_user_required(http_request)
     if auth_error is not None:
         return auth_error
+    target = _resolve_paragraph_regeneration_target(
+        project_id,
+        manuscript_id,
+        section,
+        request,
+        requesting_user_id=requesting_user_id,
+    )
+    if isinstance(target, JSONResponse):
+        return target
+    section_key, section_text, original_paragraph = target
+
+    regen_payload = regenerate_paragraph_text(
+        section=section_key,
+        paragraph_text=original_paragraph,
+        notes_context=request.notes_context,
+        constraints=request.constraints,
+        evidence_links=[link.model_dump() for link in request.evidence_links],
+        citation_ids=request.citation_ids,
+        freeform_instruction=request.freeform_instruction,
+        model=request.model or "gpt-4.1-mini",
+    )
+    return _finalize_paragraph_regeneration_response(
+        project_id,
+        manuscript_id,
+        request,
+        regen_payload,
+        section_key=section_key,
+        section_text=section_text,
+        original_paragraph=original_paragraph,
+        requesting_user_id=requesting_user_id,
+    )
+
+
+@app.post(
+    "/v1/aawe/projects/{project_id}/manuscripts/{manuscript_id}/sections/{section}/paragraphs/regenerate/stream",
+    response_model=None,
+    responses=ERROR_RESPONSES | NOT_FOUND_RESPONSES | BAD_REQUEST_RESPONSES,
+    tags=["v1"],
+)
+def v1_stream_section_paragraph_regeneration(
+    project_id: str,
+    manuscript_id: str,
+    section: str,
+    request: ParagraphRegenerationRequest,
+    http_request: Request,
+) -> StreamingResponse | JSONResponse:
+    requesting_user_id, auth_error = _resolve_request_user_required(http_request)
+    if auth_error is not None:
+        return auth_error
+    target = _resolve_paragraph_regeneration_target(
+        project_id,
+        manuscript_id,
+        section,
+        request,
+        requesting_user_id=requesting_user_id,
+    )
+    if isinstance(target, JSONResponse):
+        return target
+    section_key, section_text, original_paragraph = target
+
+    events = stream_paragraph_regeneration(
+        section=section_key,
+        paragraph_text=original_paragraph,
+        notes_context=request.notes_context,
+        constraints=request.constraints,
+        evidence_links=[link.model_dump() for link in request.evidence_links],
+        citation_ids=request.citation_ids,
+        freeform_instruction=request.freeform_instruction,
+        model=request.model or "gpt-4.1-mini",
+    )
+    first_event = next(events)
+    return _build_draft_stream_response(
+        first_event,
+        events,
+        finalize=lambda payload: _finalize_paragraph_regeneration_response(
+            project_id,
+            manuscript_id,
+            request,
+            payload,
+            section_key=section_key,
+            section_text=section_text,
+            original_paragraph=original_paragraph,
+            requesting_user_id=requesting_user_id,
+        ),
+    )
+
+
+def _resolve_paragraph_regeneration_target(
+    project_id: str,
+    manuscript_id: str,
+    section: str,
+    request: ParagraphRegenerationRequest,
+    *,
+    requesting_user_id: str,
+) -> tuple[str, str, str] | JSONResponse:
     try:
         manuscript = get_project_manuscript(
             project_id,
@@ -5804,18 +6255,20 @@ def v1_regenerate_section_paragraph(
                 f"(0-{len(paragraphs) - 1})."
             )
         )
+    return section_key, section_text, paragraphs[request.paragraph_index]
 
-    original_paragraph = paragraphs[request.paragraph_index]
-    regen_payload = regenerate_paragraph_text(
-        section=section_key,
-        paragraph_text=original_paragraph,
-        notes_context=request.notes_context,
-        constraints=request.constraints,
-        evidence_links=[link.model_dump() for link in request.evidence_links],
-        citation_ids=request.citation_ids,
-        freeform_instruction=request.freeform_instruction,
-        model=request.model or "gpt-4.1-mini",
-    )
+
+def _finalize_paragraph_regeneration_response(
+    project_id: str,
+    manuscript_id: str,
+    request: ParagraphRegenerationRequest,
+    regen_payload: dict[str, Any],
+    *,
+    section_key: str,
+    section_text: str,
+    original_paragraph: str,
+    requesting_user_id: str,
+) -> ParagraphRegenerationResponse:
     _, updated_section_text = replace_paragraph(
         section_text,
         request.paragraph_index,
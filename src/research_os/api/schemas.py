@@ -526,6 +526,7 @@ class LibraryAssetListResponse(BaseModel):
     page_size: int = 50
     total: int = 0
     has_more: bool = False
+    next_cursor: str | None = None
     sort_by: Literal["uploaded_at", "filename", "byte_size", "kind", "owner_name"] = (
         "uploaded_at"
     )
@@ -914,6 +915,9 @@ class AdminUserSummaryResponse(BaseModel):
     last_sign_in_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
+    works_count: int = 0
+    citations_total: int = 0
+    h_index: int = 0
 
 
 class AdminUsersListResponse(BaseModel):
@@ -1195,6 +1199,39 @@ class AdminApiMonitorMonthlyTrendPointResponse(BaseModel):
     cost_usd: float = 0.0
 
 
+class AdminApiMonitorHttpHostResponse(BaseModel):
+    provider: str
+    host: str
+    requests: int = 0
+    transport_errors: int = 0
+    http_errors: int = 0
+    retries: int = 0
+    throttled_ms: float = 0.0
+    avg_latency_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_status_code: int | None = None
+    last_request_at: datetime | None = None
+
+
+class AdminApiMonitorHttpClientsResponse(BaseModel):
+    http2_enabled: bool = False
+    max_connections: int = 0
+    max_keepalive_connections: int = 0
+    hosts: list[AdminApiMonitorHttpHostResponse] = Field(default_factory=list)
+
+
+class AdminApiMonitorDraftCacheResponse(BaseModel):
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    revalidations_enqueued: int = 0
+    hit_rate_pct: float = 0.0
+    entries: int = 0
+
+
 class AdminApiMonitorResponse(BaseModel):
     generated_at: datetime
     summary: AdminApiMonitorSummaryResponse = Field(
@@ -1204,6 +1241,12 @@ class AdminApiMonitorResponse(BaseModel):
     monthly_trend: list[AdminApiMonitorMonthlyTrendPointResponse] = Field(
         default_factory=list
     )
+    http_clients: AdminApiMonitorHttpClientsResponse = Field(
+        default_factory=AdminApiMonitorHttpClientsResponse
+    )
+    publication_insights_draft_cache: AdminApiMonitorDraftCacheResponse = Field(
+        default_factory=AdminApiMonitorDraftCacheResponse
+    )
 
 
 class AdminJournalProfileSummaryResponse(BaseModel):
@@ -1327,6 +1370,30 @@ class AdminJobsQueueHealthResponse(BaseModel):
     backlog_jobs: int = 0
 
 
+class AdminBackgroundJobKindStatsResponse(BaseModel):
+    kind: str
+    lane: str = "default"
+    max_concurrency: int = 0
+    queued: int = 0
+    running: int = 0
+    completed_recent: int = 0
+    failed_recent: int = 0
+    oldest_queued_age_seconds: float | None = None
+    avg_wait_seconds: float | None = None
+    p95_wait_seconds: float | None = None
+    avg_run_seconds: float | None = None
+    p95_run_seconds: float | None = None
+
+
+class AdminBackgroundJobQueueResponse(BaseModel):
+    generated_at: datetime | None = None
+    worker_mode: str = "embedded"
+    window_hours: int = 24
+    queued: int = 0
+    running: int = 0
+    kinds: list[AdminBackgroundJobKindStatsResponse] = Field(default_factory=list)
+
+
 class AdminJobsListResponse(BaseModel):
     items: list[AdminJobSummaryResponse] = Field(default_factory=list)
     total: int = 0
@@ -1336,6 +1403,9 @@ class AdminJobsListResponse(BaseModel):
     queue_health: AdminJobsQueueHealthResponse = Field(
         default_factory=AdminJobsQueueHealthResponse
     )
+    background_queue: AdminBackgroundJobQueueResponse = Field(
+        default_factory=AdminBackgroundJobQueueResponse
+    )
 
 
 class AdminAuditEventResponse(BaseModel):
@@ -3241,6 +3311,7 @@ class WorkspaceInboxMessageResponse(BaseModel):
 
 class WorkspaceInboxMessagesResponse(BaseModel):
     items: list[WorkspaceInboxMessageResponse] = Field(default_factory=list)
+    next_cursor: str | None = None
 
 
 class WorkspaceInboxMessageCreateRequest(BaseModel):
@@ -3286,6 +3357,21 @@ class PersonaEmbeddingsGenerateResponse(BaseModel):
     clusters: list[dict[str, Any]] = Field(default_factory=list)
 
 
+class PersonaSimilarWorkResponse(BaseModel):
+    work_id: str
+    title: str
+    year: int | None = None
+    venue_name: str = ""
+    doi: str | None = None
+    score: float
+
+
+class PersonaSimilarWorksResponse(BaseModel):
+    work_id: str
+    model_name: str | None = None
+    items: list[PersonaSimilarWorkResponse] = Field(default_factory=list)
+
+
 class ImpactCollaboratorsResponse(BaseModel):
     collaborators: list[dict[str, Any]] = Field(default_factory=list)
     new_collaborators_by_year: dict[int, int] = Field(default_factory=dict)
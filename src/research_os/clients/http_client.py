@@ -0,0 +1,388 @@
+"""Shared pooled HTTP client for external data providers."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    _H2_AVAILABLE = False
+else:
+    _H2_AVAILABLE = True
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+DEFAULT_TIMEOUT_SECONDS = 20.0
+DEFAULT_BACKOFF_SECONDS = 0.35
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+# Host suffix -> provider name used for rate limiting and metrics grouping.
+PROVIDER_HOST_SUFFIXES = (
+    ("openalex.org", "openalex"),
+    ("ncbi.nlm.nih.gov", "pubmed"),
+    ("crossref.org", "crossref"),
+    ("unpaywall.org", "unpaywall"),
+    ("semanticscholar.org", "semantic_scholar"),
+    ("ror.org", "ror"),
+    ("openstreetmap.org", "openstreetmap"),
+)
+
+# Requests per second when HTTP_RATE_LIMIT_<PROVIDER>_PER_SECOND is unset.
+# OpenAlex's polite pool allows 10 req/s; NCBI allows 3 req/s without an API
+# key and 10 req/s with one.
+DEFAULT_PROVIDER_RATE_LIMITS = {
+    "openalex": 10.0,
+    "crossref": 10.0,
+    "unpaywall": 10.0,
+    "openstreetmap": 1.0,
+}
+
+_LATENCY_SAMPLE_SIZE = 256
+
+_client_lock = threading.Lock()
+_shared_client: httpx.Client | None = None
+_limiters_lock = threading.Lock()
+_limiters: dict[str, "_RateLimiter | None"] = {}
+_metrics_lock = threading.Lock()
+_host_metrics: dict[str, "_HostMetrics"] = {}
+
+
+def _safe_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _safe_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _max_connections() -> int:
+    value = _safe_int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+    return max(4, value if value is not None else 100)
+
+
+def _max_keepalive_connections() -> int:
+    value = _safe_int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "40"))
+    return max(1, value if value is not None else 40)
+
+
+def _keepalive_expiry_seconds() -> float:
+    value = _safe_float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    return max(1.0, value if value is not None else 30.0)
+
+
+def http2_enabled() -> bool:
+    raw = str(os.getenv("HTTP_CLIENT_HTTP2", "true")).strip().lower()
+    return _H2_AVAILABLE and raw not in {"0", "false", "no", "off"}
+
+
+def _provider_rate_limit(provider: str) -> float:
+    env_key = f"HTTP_RATE_LIMIT_{provider.upper()}_PER_SECOND"
+    raw = os.getenv(env_key)
+    if raw is not None and str(raw).strip():
+        value = _safe_float(raw)
+        return max(0.0, value) if value is not None else 0.0
+    if provider == "pubmed":
+        return 10.0 if str(os.getenv("NCBI_API_KEY", "")).strip() else 3.0
+    return DEFAULT_PROVIDER_RATE_LIMITS.get(provider, 0.0)
+
+
+def resolve_provider(url: str) -> tuple[str, str]:
+    host = (urlparse(str(url or "")).hostname or "").lower()
+    for suffix, provider in PROVIDER_HOST_SUFFIXES:
+        if host == suffix or host.endswith(f".{suffix}"):
+            return provider, host
+    return host or "unknown", host or "unknown"
+
+
+class _RateLimiter:
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second
+        self._burst = max(1.0, rate_per_second)
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._updated_at = now
+                self._tokens = min(self._burst, self._tokens + elapsed / self._interval)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) * self._interval
+            time.sleep(delay)
+            waited += delay
+
+
+def _limiter_for(provider: str) -> _RateLimiter | None:
+    with _limiters_lock:
+        if provider not in _limiters:
+            rate = _provider_rate_limit(provider)
+            _limiters[provider] = _RateLimiter(rate) if rate > 0 else None
+        return _limiters[provider]
+
+
+@dataclass
+class _HostMetrics:
+    provider: str
+    host: str
+    requests: int = 0
+    transport_errors: int = 0
+    http_errors: int = 0
+    retries: int = 0
+    throttled_ms: float = 0.0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_status_code: int | None = None
+    last_request_at: datetime | None = None
+    samples: deque = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLE_SIZE))
+
+
+def _record(
+    *,
+    provider: str,
+    host: str,
+    latency_ms: float,
+    status_code: int | None = None,
+    throttled_ms: float = 0.0,
+    retried: bool = False,
+) -> None:
+    with _metrics_lock:
+        metrics = _host_metrics.get(host)
+        if metrics is None:
+            metrics = _HostMetrics(provider=provider, host=host)
+            _host_metrics[host] = metrics
+        metrics.requests += 1
+        if status_code is None:
+            metrics.transport_errors += 1
+        elif status_code >= 400:
+            metrics.http_errors += 1
+        if retried:
+            metrics.retries += 1
+        metrics.throttled_ms += throttled_ms
+        metrics.total_latency_ms += latency_ms
+        metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+        metrics.last_status_code = status_code
+        metrics.last_request_at = datetime.now(timezone.utc)
+        metrics.samples.append(latency_ms)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def get_http_client_stats() -> dict[str, Any]:
+    with _metrics_lock:
+        rows = [
+            {
+                "provider": metrics.provider,
+                "host": metrics.host,
+                "requests": metrics.requests,
+                "transport_errors": metrics.transport_errors,
+                "http_errors": metrics.http_errors,
+                "retries": metrics.retries,
+                "throttled_ms": round(metrics.throttled_ms, 2),
+                "avg_latency_ms": round(
+                    metrics.total_latency_ms / max(1, metrics.requests), 2
+                ),
+                "p50_latency_ms": round(_percentile(list(metrics.samples), 0.5), 2),
+                "p95_latency_ms": round(_percentile(list(metrics.samples), 0.95), 2),
+                "max_latency_ms": round(metrics.max_latency_ms, 2),
+                "last_status_code": metrics.last_status_code,
+                "last_request_at": metrics.last_request_at,
+            }
+            for metrics in _host_metrics.values()
+        ]
+    rows.sort(key=lambda row: (-int(row["requests"]), str(row["host"])))
+    return {
+        "http2_enabled": http2_enabled(),
+        "max_connections": _max_connections(),
+        "max_keepalive_connections": _max_keepalive_connections(),
+        "hosts": rows,
+    }
+
+
+def reset_http_client_stats() -> None:
+    with _metrics_lock:
+        _host_metrics.clear()
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def _get_shared_client() -> httpx.Client:
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                http2=http2_enabled(),
+                timeout=httpx.Timeout(DEFAULT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=_max_connections(),
+                    max_keepalive_connections=_max_keepalive_connections(),
+                    keepalive_expiry=_keepalive_expiry_seconds(),
+                ),
+            )
+        return _shared_client
+
+
+def close_http_clients() -> None:
+    global _shared_client
+    with _client_lock:
+        client = _shared_client
+        _shared_client = None
+    if client is not None:
+        client.close()
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    raw = str(response.headers.get("retry-after") or "").strip()
+    if not raw:
+        return None
+    value = _safe_float(raw)
+    if value is None:
+        try:
+            value = (
+                parsedate_to_datetime(raw) - datetime.now(timezone.utc)
+            ).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(MAX_RETRY_AFTER_SECONDS, max(0.0, value))
+
+
+class ProviderClient:
+    """Per-call view of the shared pooled client.
+
+    Carries the caller's timeout, headers and redirect policy so existing
+    ``with httpx.Client(...) as client`` blocks can switch over without
+    owning (and tearing down) a connection pool of their own.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: httpx.Timeout | float | None = None,
+        headers: dict[str, str] | None = None,
+        follow_redirects: bool = False,
+    ) -> None:
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT_SECONDS
+        self.timeout = (
+            timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        )
+        self.headers = dict(headers or {})
+        self.follow_redirects = follow_redirects
+
+    def __enter__(self) -> "ProviderClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        _retried: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        provider, host = resolve_provider(url)
+        limiter = _limiter_for(provider)
+        throttled_seconds = limiter.acquire() if limiter is not None else 0.0
+        merged_headers = {**self.headers, **(headers or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("follow_redirects", self.follow_redirects)
+        started = time.perf_counter()
+        try:
+            response = _get_shared_client().request(
+                method, url, headers=merged_headers or None, **kwargs
+            )
+        except Exception:
+            _record(
+                provider=provider,
+                host=host,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                throttled_ms=throttled_seconds * 1000,
+                retried=_retried,
+            )
+            raise
+        _record(
+            provider=provider,
+            host=host,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            status_code=response.status_code,
+            throttled_ms=throttled_seconds * 1000,
+            retried=_retried,
+        )
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        retries: int,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        retry_status_codes: set[int] | frozenset[int] = frozenset(
+            RETRYABLE_STATUS_CODES
+        ),
+        **kwargs: Any,
+    ) -> httpx.Response:
+        max_attempt = max(0, int(retries))
+        attempt = 0
+        while True:
+            try:
+                response = self.request(method, url, _retried=attempt > 0, **kwargs)
+            except httpx.HTTPError:
+                if attempt >= max_attempt:
+                    raise
+                time.sleep(backoff_seconds * (attempt + 1))
+                attempt += 1
+                continue
+            if response.status_code not in retry_status_codes or attempt >= max_attempt:
+                return response
+            delay = _retry_after_seconds(response)
+            time.sleep(delay if delay is not None else backoff_seconds * (attempt + 1))
+            attempt += 1
+
+
+def provider_client(
+    *,
+    timeout: httpx.Timeout | float | None = None,
+    headers: dict[str, str] | None = None,
+    follow_redirects: bool = False,
+) -> ProviderClient:
+    return ProviderClient(
+        timeout=timeout, headers=headers, follow_redirects=follow_redirects
+    )
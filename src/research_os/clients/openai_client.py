@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import threading
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Sequence, TypeVar
 
 from openai import OpenAI
 
@@ -11,9 +14,172 @@ from research_os.config import get_openai_api_key
 from research_os.services.api_telemetry_service import record_api_usage_event
 
 
+T = TypeVar("T")
+
+# Rough characters-per-token ratio used to reserve budget before a request;
+# the reservation is corrected from the response's reported usage.
+_CHARS_PER_TOKEN_ESTIMATE = 4
+_DEFAULT_OUTPUT_TOKEN_ESTIMATE = 1024
+# Stream events that carry the final response object (and its usage).
+_TERMINAL_STREAM_EVENT_TYPES = frozenset(
+    {"response.completed", "response.incomplete", "response.failed"}
+)
+
+_client_lock = threading.Lock()
+_shared_client: OpenAI | None = None
+_shared_client_key: str | None = None
+_concurrency_lock = threading.Lock()
+_concurrency_slots: threading.BoundedSemaphore | None = None
+_concurrency_limit: int | None = None
+_budgets_lock = threading.Lock()
+_token_budgets: dict[str, "_TokenBudget | None"] = {}
+
+
+class _TokenBudget:
+    """Token bucket refilled continuously at ``tokens_per_minute / 60`` per second."""
+
+    def __init__(self, tokens_per_minute: float) -> None:
+        self.capacity = float(tokens_per_minute)
+        self.tokens = float(tokens_per_minute)
+        self.rate = float(tokens_per_minute) / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: int) -> float:
+        # Requests larger than the whole budget are clamped so they can still run.
+        needed = min(float(max(0, tokens)), self.capacity)
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= needed:
+                    self.tokens -= needed
+                    return waited
+                delay = (needed - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def adjust(self, delta_tokens: int) -> None:
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens - float(delta_tokens))
+
+
+def _max_concurrent_requests() -> int:
+    try:
+        value = int(os.getenv("OPENAI_MAX_CONCURRENT_REQUESTS", "8"))
+    except ValueError:
+        value = 8
+    return max(1, min(256, value))
+
+
+def _model_budget_env_key(model: str) -> str:
+    normalized = "".join(ch if ch.isalnum() else "_" for ch in model.upper())
+    return f"OPENAI_TOKENS_PER_MINUTE_{normalized}"
+
+
+def _model_tokens_per_minute(model: str) -> float:
+    raw = os.getenv(_model_budget_env_key(model))
+    if raw is None:
+        raw = os.getenv("OPENAI_TOKENS_PER_MINUTE", "0")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return 0.0
+
+
+def _get_concurrency_slots() -> threading.BoundedSemaphore:
+    global _concurrency_slots, _concurrency_limit
+    limit = _max_concurrent_requests()
+    with _concurrency_lock:
+        if _concurrency_slots is None or _concurrency_limit != limit:
+            _concurrency_slots = threading.BoundedSemaphore(limit)
+            _concurrency_limit = limit
+        return _concurrency_slots
+
+
+def _get_token_budget(model: str) -> _TokenBudget | None:
+    clean_model = str(model or "").strip().lower()
+    if not clean_model:
+        return None
+    with _budgets_lock:
+        if clean_model not in _token_budgets:
+            tokens_per_minute = _model_tokens_per_minute(clean_model)
+            _token_budgets[clean_model] = (
+                _TokenBudget(tokens_per_minute) if tokens_per_minute > 0 else None
+            )
+        return _token_budgets[clean_model]
+
+
+def _estimate_request_tokens(input: Any, max_output_tokens: Any) -> int:
+    try:
+        output_tokens = int(max_output_tokens)
+    except (TypeError, ValueError):
+        output_tokens = _DEFAULT_OUTPUT_TOKEN_ESTIMATE
+    input_tokens = len(str(input or "")) // _CHARS_PER_TOKEN_ESTIMATE
+    return max(1, input_tokens + max(0, output_tokens))
+
+
 def get_client() -> OpenAI:
-    """Build an OpenAI client configured from environment variables."""
-    return OpenAI(api_key=get_openai_api_key())
+    """Return the process-wide OpenAI client, rebuilding it if the API key changes.
+
+    The client owns a pooled HTTP connection, so reusing it keeps TLS sessions
+    warm across requests. It is safe to share between threads.
+    """
+    global _shared_client, _shared_client_key
+    api_key = get_openai_api_key()
+    with _client_lock:
+        if _shared_client is None or _shared_client_key != api_key:
+            previous = _shared_client
+            _shared_client = OpenAI(api_key=api_key)
+            _shared_client_key = api_key
+            if previous is not None:
+                try:
+                    previous.close()
+                except Exception:
+                    pass
+        return _shared_client
+
+
+def close_openai_client() -> None:
+    global _shared_client, _shared_client_key
+    with _client_lock:
+        client = _shared_client
+        _shared_client = None
+        _shared_client_key = None
+    if client is not None:
+        client.close()
+
+
+def run_llm_calls_concurrently(
+    calls: Sequence[Callable[[], T]], *, max_concurrency: int | None = None
+) -> list[T]:
+    """Run independent LLM calls in parallel and return results in input order.
+
+    Every call still passes through ``create_response``'s process-wide
+    concurrency cap and per-model token budgets, so fan-out from several
+    requests cannot exceed ``OPENAI_MAX_CONCURRENT_REQUESTS``. The first
+    exception raised by any call is re-raised after all calls finish.
+    """
+    if not calls:
+        return []
+    if len(calls) == 1:
+        return [calls[0]()]
+    workers = min(len(calls), max_concurrency or _max_concurrent_requests())
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="llm-fanout"
+    ) as pool:
+        futures = [pool.submit(call) for call in calls]
+        errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+    return [future.result() for future in futures]
 
 
 def _usage_int(usage: Any, key: str) -> int:
@@ -37,12 +203,18 @@ def create_response(*, model: str, input: Any, **kwargs: Any) -> Any:
             timeout=request_timeout,
             max_retries=0 if request_max_retries is None else int(request_max_retries),
         )
+    budget = _get_token_budget(model)
+    reserved_tokens = _estimate_request_tokens(input, kwargs.get("max_output_tokens"))
+    if budget is not None:
+        budget.acquire(reserved_tokens)
+    slots = _get_concurrency_slots()
     started = time.perf_counter()
     response = None
     success = False
     error_code: str | None = None
     try:
-        response = client.responses.create(model=model, input=input, **kwargs)
+        with slots:
+            response = client.responses.create(model=model, input=input, **kwargs)
         success = True
         return response
     except Exception as exc:
@@ -56,6 +228,8 @@ def create_response(*, model: str, input: Any, **kwargs: Any) -> Any:
             usage = getattr(response, "usage", None)
             tokens_in = _usage_int(usage, "input_tokens")
             tokens_out = _usage_int(usage, "output_tokens")
+            if budget is not None and (tokens_in or tokens_out):
+                budget.adjust(tokens_in + tokens_out - reserved_tokens)
         record_api_usage_event(
             provider="openai",
             operation="responses.create",
@@ -69,7 +243,98 @@ def create_response(*, model: str, input: Any, **kwargs: Any) -> Any:
         )
 
 
+def stream_response(*, model: str, input: Any, **kwargs: Any) -> Iterator[Any]:
+    """Yield Responses API stream events as they arrive.
+
+    Shares ``create_response``'s concurrency cap and token budgets; the slot is
+    held until the stream ends or the consumer closes the generator. Usage is
+    recorded once the stream finishes, taken from the terminal event's
+    response, together with the time to the first text delta.
+    """
+    client = get_client()
+    request_timeout = kwargs.pop("timeout", None)
+    request_max_retries = kwargs.pop("max_retries", None)
+    if request_timeout is not None or request_max_retries is not None:
+        client = client.with_options(
+            timeout=request_timeout,
+            max_retries=0 if request_max_retries is None else int(request_max_retries),
+        )
+    budget = _get_token_budget(model)
+    reserved_tokens = _estimate_request_tokens(input, kwargs.get("max_output_tokens"))
+    if budget is not None:
+        budget.acquire(reserved_tokens)
+    slots = _get_concurrency_slots()
+    started = time.perf_counter()
+    first_token_ms: int | None = None
+    final_response = None
+    success = False
+    error_code: str | None = None
+    try:
+        with slots:
+            stream = client.responses.create(
+                model=model, input=input, stream=True, **kwargs
+            )
+            try:
+                for event in stream:
+                    event_type = str(getattr(event, "type", "") or "")
+                    if (
+                        first_token_ms is None
+                        and event_type == "response.output_text.delta"
+                    ):
+                        first_token_ms = int((time.perf_counter() - started) * 1000)
+                    elif event_type in _TERMINAL_STREAM_EVENT_TYPES:
+                        final_response = getattr(event, "response", None)
+                    yield event
+            finally:
+                close = getattr(stream, "close", None)
+                if callable(close):
+                    close()
+        success = True
+    except GeneratorExit:
+        error_code = "StreamClosed"
+        raise
+    except Exception as exc:
+        error_code = type(exc).__name__
+        raise
+    finally:
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        tokens_in = 0
+        tokens_out = 0
+        if final_response is not None:
+            usage = getattr(final_response, "usage", None)
+            tokens_in = _usage_int(usage, "input_tokens")
+            tokens_out = _usage_int(usage, "output_tokens")
+            if budget is not None and (tokens_in or tokens_out):
+                budget.adjust(tokens_in + tokens_out - reserved_tokens)
+        metadata: dict[str, Any] = {"model": str(model or "").strip()}
+        if first_token_ms is not None:
+            metadata["first_token_ms"] = first_token_ms
+        record_api_usage_event(
+            provider="openai",
+            operation="responses.stream",
+            endpoint="/v1/responses",
+            success=success,
+            duration_ms=duration_ms,
+            tokens_input=tokens_in,
+            tokens_output=tokens_out,
+            error_code=error_code,
+            metadata=metadata,
+        )
+
+
 def ask_gpt(prompt: str, model: str = "gpt-4.1-mini") -> str:
     """Send a prompt using the Responses API and return output text."""
     response = create_response(model=model, input=prompt)
     return response.output_text
+
+
+def ask_gpt_stream(prompt: str, model: str = "gpt-4.1-mini") -> Iterator[str]:
+    """Stream a prompt through the Responses API, yielding output text deltas."""
+    for event in stream_response(model=model, input=prompt):
+        event_type = str(getattr(event, "type", "") or "")
+        if event_type == "response.output_text.delta":
+            delta = str(getattr(event, "delta", "") or "")
+            if delta:
+                yield delta
+        elif event_type in {"response.failed", "error"}:
+            raise RuntimeError("OpenAI response stream failed.")
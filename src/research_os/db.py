@@ -27,11 +27,14 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    bindparam,
     create_engine,
     event,
     select,
     text,
 )
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -40,6 +43,7 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
     sessionmaker,
+    validates,
 )
 from sqlalchemy.pool import NullPool
 
@@ -275,6 +279,15 @@ class Project(Base):
     owner_user: Mapped["User | None"] = relationship(back_populates="owned_projects")
 
 
+def user_email_domain(email: str | None) -> str:
+    """Return the lower-cased domain admin dashboards group users by."""
+    clean = str(email or "").strip().lower()
+    if "@" not in clean:
+        return "unknown.local"
+    _, _, domain = clean.rpartition("@")
+    return domain[:255] or "unknown.local"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -285,6 +298,7 @@ class User(Base):
         String(36), unique=True, index=True, default=lambda: str(uuid4())
     )
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True)
+    email_domain: Mapped[str] = mapped_column(String(255), index=True, default="")
     password_hash: Mapped[str] = mapped_column(String(512))
     name: Mapped[str] = mapped_column(String(255), default="")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -349,12 +363,26 @@ class User(Base):
     publication_metrics_source_caches: Mapped[list["PublicationMetricsSourceCache"]] = (
         relationship(back_populates="user", cascade="all, delete-orphan")
     )
+    publication_metric_work_aggregates: Mapped[
+        list["PublicationMetricWorkAggregate"]
+    ] = relationship(back_populates="user", cascade="all, delete-orphan")
+    publication_citation_series_points: Mapped[
+        list["PublicationCitationSeriesPoint"]
+    ] = relationship(back_populates="user", cascade="all, delete-orphan")
+    publication_citation_rollup: Mapped["PublicationCitationRollup | None"] = (
+        relationship(
+            back_populates="user", cascade="all, delete-orphan", uselist=False
+        )
+    )
     publication_impact_caches: Mapped[list["PublicationImpactCache"]] = relationship(
         back_populates="owner_user", cascade="all, delete-orphan"
     )
     publication_ai_caches: Mapped[list["PublicationAiCache"]] = relationship(
         back_populates="owner_user", cascade="all, delete-orphan"
     )
+    publication_insights_draft_caches: Mapped[
+        list["PublicationInsightsDraftCache"]
+    ] = relationship(back_populates="user", cascade="all, delete-orphan")
     publication_structured_abstract_caches: Mapped[
         list["PublicationStructuredAbstractCache"]
     ] = relationship(back_populates="owner_user", cascade="all, delete-orphan")
@@ -373,6 +401,12 @@ class User(Base):
     collaboration_landing_caches: Mapped[list["CollaborationLandingCache"]] = (
         relationship(back_populates="owner_user", cascade="all, delete-orphan")
     )
+    collaboration_landing_rows: Mapped[list["CollaborationLandingRow"]] = (
+        relationship(back_populates="owner_user", cascade="all, delete-orphan")
+    )
+    collaboration_landing_shared_works: Mapped[
+        list["CollaborationLandingSharedWork"]
+    ] = relationship(back_populates="owner_user", cascade="all, delete-orphan")
     manuscript_authors: Mapped[list["ManuscriptAuthor"]] = relationship(
         back_populates="owner_user", cascade="all, delete-orphan"
     )
@@ -403,6 +437,15 @@ class User(Base):
     workspace_inbox_state_caches: Mapped[list["WorkspaceInboxStateCache"]] = (
         relationship(back_populates="user", cascade="all, delete-orphan")
     )
+    workspace_memberships: Mapped[list["WorkspaceMembership"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
+    workspace_inbox_visibility: Mapped[list["WorkspaceInboxVisibility"]] = (
+        relationship(back_populates="user", cascade="all, delete-orphan")
+    )
+    workspace_inbox_reads: Mapped[list["WorkspaceInboxRead"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
     persona_grant_records: Mapped[list["PersonaGrantRecord"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
     )
@@ -417,6 +460,11 @@ class User(Base):
         back_populates="actor_user", cascade="all, delete-orphan"
     )
 
+    @validates("email")
+    def _sync_email_domain(self, _key: str, value: str) -> str:
+        self.email_domain = user_email_domain(value)
+        return value
+
 
 class WorkspaceStateCache(Base):
     __tablename__ = "workspace_state_cache"
@@ -439,6 +487,28 @@ class WorkspaceStateCache(Base):
     user: Mapped[User] = relationship(back_populates="workspace_state_caches")
 
 
+# Indexed mirror of which workspaces appear (as owner or active collaborator)
+# in each user's workspace state, derived whenever that state is saved.
+class WorkspaceMembership(Base):
+    __tablename__ = "workspace_memberships"
+    __table_args__ = (UniqueConstraint("workspace_id", "user_id"),)
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    workspace_id: Mapped[str] = mapped_column(String(128), index=True)
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    membership_role: Mapped[str] = mapped_column(String(16))
+    collaborator_role: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship(back_populates="workspace_memberships")
+
+
 class PersonaGrantRecord(Base):
     __tablename__ = "persona_grant_records"
     __table_args__ = (
@@ -502,6 +572,79 @@ class WorkspaceInboxStateCache(Base):
     user: Mapped[User] = relationship(back_populates="workspace_inbox_state_caches")
 
 
+# Append-only workspace inbox. Each message is stored once per workspace;
+# which messages a user sees is decided by their visibility intervals.
+class WorkspaceInboxMessage(Base):
+    __tablename__ = "workspace_inbox_messages"
+    __table_args__ = (
+        UniqueConstraint("workspace_id", "message_id"),
+        Index(
+            "ix_workspace_inbox_messages_workspace_created",
+            "workspace_id",
+            "created_at",
+            "message_id",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    workspace_id: Mapped[str] = mapped_column(String(128))
+    message_id: Mapped[str] = mapped_column(String(128))
+    sender_user_id: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    sender_name: Mapped[str] = mapped_column(String(255))
+    encrypted_body: Mapped[str] = mapped_column(Text)
+    iv: Mapped[str] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    posted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+
+
+# Half-open [visible_from, visible_until) windows of message posted_at values
+# a user may read in a workspace; an open window means current membership.
+class WorkspaceInboxVisibility(Base):
+    __tablename__ = "workspace_inbox_visibility"
+    __table_args__ = (
+        Index(
+            "ix_workspace_inbox_visibility_user_workspace", "user_id", "workspace_id"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    workspace_id: Mapped[str] = mapped_column(String(128))
+    visible_from: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    visible_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    user: Mapped[User] = relationship(back_populates="workspace_inbox_visibility")
+
+
+class WorkspaceInboxRead(Base):
+    __tablename__ = "workspace_inbox_reads"
+    __table_args__ = (UniqueConstraint("user_id", "workspace_id", "reader_key"),)
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    workspace_id: Mapped[str] = mapped_column(String(128))
+    reader_key: Mapped[str] = mapped_column(String(255))
+    read_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    user: Mapped[User] = relationship(back_populates="workspace_inbox_reads")
+
+
 class AuthSession(Base):
     __tablename__ = "auth_sessions"
 
@@ -519,6 +662,9 @@ class AuthSession(Base):
     revoked_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    last_seen_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     user: Mapped[User] = relationship(back_populates="sessions")
 
@@ -680,6 +826,7 @@ class Manuscript(Base):
 
 class DataLibraryAsset(Base):
     __tablename__ = "data_library_assets"
+    __table_args__ = (Index("ix_data_library_assets_uploaded_at", "uploaded_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -731,6 +878,35 @@ class DataLibraryAsset(Base):
         cascade="all, delete-orphan",
         uselist=False,
     )
+    access_entries: Mapped[list["DataLibraryAssetAccess"]] = relationship(
+        back_populates="asset", cascade="all, delete-orphan"
+    )
+
+
+# Indexed mirror of the share/workspace/archive JSON columns on
+# DataLibraryAsset so library listings can filter by principal in SQL.
+class DataLibraryAssetAccess(Base):
+    __tablename__ = "data_library_asset_access"
+    __table_args__ = (
+        UniqueConstraint("asset_id", "relation", "subject_id"),
+        Index("ix_data_library_asset_access_subject", "relation", "subject_id"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    asset_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("data_library_assets.id", ondelete="CASCADE"),
+        index=True,
+    )
+    # "share" (subject is a user), "workspace" (subject is a workspace id) or
+    # "archive" (subject is a user who archived the asset).
+    relation: Mapped[str] = mapped_column(String(16))
+    subject_id: Mapped[str] = mapped_column(String(128))
+    role: Mapped[str | None] = mapped_column(String(16), nullable=True)
+
+    asset: Mapped[DataLibraryAsset] = relationship(back_populates="access_entries")
 
 
 class DataLibraryAssetBlob(Base):
@@ -835,6 +1011,15 @@ class Work(Base):
     files: Mapped[list["PublicationFile"]] = relationship(
         back_populates="publication", cascade="all, delete-orphan"
     )
+    metric_aggregate_rows: Mapped[list["PublicationMetricWorkAggregate"]] = (
+        relationship(back_populates="work", cascade="all, delete-orphan")
+    )
+    citation_series_points: Mapped[list["PublicationCitationSeriesPoint"]] = (
+        relationship(back_populates="work", cascade="all, delete-orphan")
+    )
+    collaboration_landing_shared_works: Mapped[
+        list["CollaborationLandingSharedWork"]
+    ] = relationship(back_populates="work", cascade="all, delete-orphan")
 
 
 class Author(Base):
@@ -912,6 +1097,8 @@ class Embedding(Base):
         String(36), ForeignKey("works.id", ondelete="CASCADE"), index=True
     )
     embedding_vector: Mapped[list[float]] = mapped_column(JSON, default=list)
+    embedding_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    dimensions: Mapped[int] = mapped_column(Integer, default=0)
     model_name: Mapped[str] = mapped_column(String(128), default="local-hash-1")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=_utcnow
@@ -1004,6 +1191,95 @@ class PublicationMetric(Base):
     user: Mapped[User] = relationship(back_populates="publications_metrics")
 
 
+class PublicationMetricWorkAggregate(Base):
+    """Compact per-work snapshot history reused across top-metrics rebuilds."""
+
+    __tablename__ = "publication_metric_work_aggregates"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    work_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("works.id", ondelete="CASCADE"), unique=True
+    )
+    snapshot_fingerprint: Mapped[str] = mapped_column(String(128), default="")
+    payload_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship(
+        back_populates="publication_metric_work_aggregates"
+    )
+    work: Mapped[Work] = relationship(back_populates="metric_aggregate_rows")
+
+
+class PublicationCitationSeriesPoint(Base):
+    """Latest metrics snapshot per work, provider, and capture month."""
+
+    __tablename__ = "publication_citation_series"
+    __table_args__ = (UniqueConstraint("work_id", "provider", "month_start"),)
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    work_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("works.id", ondelete="CASCADE"), index=True
+    )
+    provider: Mapped[str] = mapped_column(String(64), default="manual")
+    month_start: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    citations_count: Mapped[int] = mapped_column(Integer, default=0)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    history_usable: Mapped[bool] = mapped_column(Boolean, default=True)
+    yearly_counts: Mapped[dict] = mapped_column(JSON, default=dict)
+    snapshots_merged: Mapped[int] = mapped_column(Integer, default=0)
+    last_snapshot_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship(
+        back_populates="publication_citation_series_points"
+    )
+    work: Mapped[Work] = relationship(back_populates="citation_series_points")
+
+
+class PublicationCitationRollup(Base):
+    """Per-user totals over the citation series, used to skip unchanged syncs."""
+
+    __tablename__ = "publication_citation_rollups"
+    __table_args__ = (UniqueConstraint("user_id"),)
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    works_count: Mapped[int] = mapped_column(Integer, default=0)
+    snapshots_count: Mapped[int] = mapped_column(Integer, default=0)
+    series_points_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_snapshot_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    latest_captured_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship(back_populates="publication_citation_rollup")
+
+
 class PublicationMetricsSourceCache(Base):
     __tablename__ = "publication_metrics_source_cache"
     __table_args__ = (
@@ -1178,6 +1454,48 @@ class PublicationAiCache(Base):
     owner_user: Mapped[User] = relationship(back_populates="publication_ai_caches")
 
 
+class PublicationInsightsDraftCache(Base):
+    """Publication insights drafts keyed by the evidence they were generated from."""
+
+    __tablename__ = "publication_insights_draft_cache"
+    __table_args__ = (
+        UniqueConstraint("cache_key"),
+        Index(
+            "ix_publication_insights_draft_cache_slot",
+            "user_id",
+            "section_key",
+            "window_id",
+            "scope",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    cache_key: Mapped[str] = mapped_column(String(64))
+    section_key: Mapped[str] = mapped_column(String(64), default="")
+    window_id: Mapped[str] = mapped_column(String(16), default="1y")
+    scope: Mapped[str] = mapped_column(String(16), default="window")
+    prompt_version: Mapped[str] = mapped_column(String(64))
+    model: Mapped[str] = mapped_column(String(64))
+    evidence_hash: Mapped[str] = mapped_column(String(64))
+    payload_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    generated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+    last_hit_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    user: Mapped[User] = relationship(
+        back_populates="publication_insights_draft_caches"
+    )
+
+
 class PublicationStructuredAbstractCache(Base):
     __tablename__ = "publication_structured_abstract_cache"
     __table_args__ = (
@@ -1400,6 +1718,12 @@ class Collaborator(Base):
     metrics: Mapped[list["CollaborationMetric"]] = relationship(
         back_populates="collaborator", cascade="all, delete-orphan"
     )
+    landing_rows: Mapped[list["CollaborationLandingRow"]] = relationship(
+        back_populates="collaborator", cascade="all, delete-orphan"
+    )
+    landing_shared_works: Mapped[list["CollaborationLandingSharedWork"]] = (
+        relationship(back_populates="collaborator", cascade="all, delete-orphan")
+    )
     manuscript_authors: Mapped[list["ManuscriptAuthor"]] = relationship(
         back_populates="collaborator"
     )
@@ -1505,6 +1829,112 @@ class CollaborationLandingCache(Base):
     )
 
 
+class CollaborationLandingRow(Base):
+    """One canonical collaborator group on the collaboration landing page.
+
+    ``collaborator_id`` is the group's representative record; ``member_ids``
+    lists every collaborator merged into it.
+    """
+
+    __tablename__ = "collaboration_landing_rows"
+    __table_args__ = (
+        UniqueConstraint("owner_user_id", "collaborator_id"),
+        Index(
+            "ix_collaboration_landing_rows_owner_name",
+            "owner_user_id",
+            "is_listed",
+            "sort_name",
+        ),
+        Index(
+            "ix_collaboration_landing_rows_owner_works",
+            "owner_user_id",
+            "is_listed",
+            "coauthored_works_count",
+        ),
+        Index(
+            "ix_collaboration_landing_rows_owner_strength",
+            "owner_user_id",
+            "is_listed",
+            "collaboration_strength_score",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    owner_user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    collaborator_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("collaborators.id", ondelete="CASCADE")
+    )
+    member_ids: Mapped[list[str]] = mapped_column(JSON, default=list)
+    is_listed: Mapped[bool] = mapped_column(Boolean, default=True)
+    sort_name: Mapped[str] = mapped_column(String(255), default="")
+    coauthored_works_count: Mapped[int] = mapped_column(Integer, default=0)
+    collaboration_strength_score: Mapped[float] = mapped_column(Float, default=0.0)
+    last_collaboration_year: Mapped[int | None] = mapped_column(
+        Integer, nullable=True
+    )
+    collaborator_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    search_text: Mapped[str] = mapped_column(Text, default="")
+    metrics_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    payload_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+
+    owner_user: Mapped[User] = relationship(
+        back_populates="collaboration_landing_rows"
+    )
+    collaborator: Mapped[Collaborator] = relationship(back_populates="landing_rows")
+
+
+class CollaborationLandingSharedWork(Base):
+    """A work shared with a collaborator's group, stored per member collaborator."""
+
+    __tablename__ = "collaboration_landing_shared_works"
+    __table_args__ = (
+        UniqueConstraint("collaborator_id", "work_id"),
+        Index(
+            "ix_collaboration_landing_shared_works_owner_collaborator",
+            "owner_user_id",
+            "collaborator_id",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    owner_user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    collaborator_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("collaborators.id", ondelete="CASCADE")
+    )
+    work_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("works.id", ondelete="CASCADE"), index=True
+    )
+    title: Mapped[str] = mapped_column(Text, default="")
+    sort_title: Mapped[str] = mapped_column(String(255), default="")
+    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    venue_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    publication_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    citations_total: Mapped[int] = mapped_column(Integer, default=0)
+
+    owner_user: Mapped[User] = relationship(
+        back_populates="collaboration_landing_shared_works"
+    )
+    collaborator: Mapped[Collaborator] = relationship(
+        back_populates="landing_shared_works"
+    )
+    work: Mapped[Work] = relationship(
+        back_populates="collaboration_landing_shared_works"
+    )
+
+
 class ManuscriptAuthor(Base):
     __tablename__ = "manuscript_authors"
     __table_args__ = (
@@ -1629,6 +2059,73 @@ class AppRuntimeLock(Base):
     )
 
 
+class BackgroundJob(Base):
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        Index(
+            "ix_background_jobs_claim",
+            "status",
+            "kind",
+            "priority",
+            "available_at",
+        ),
+        Index("ix_background_jobs_kind_dedupe", "kind", "dedupe_key", "status"),
+        # At most one queued or running job per dedupe key, across processes.
+        Index(
+            "ux_background_jobs_active_dedupe",
+            "kind",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=text(
+                "dedupe_key IS NOT NULL AND status IN ('queued', 'running')"
+            ),
+            sqlite_where=text(
+                "dedupe_key IS NOT NULL AND status IN ('queued', 'running')"
+            ),
+        ),
+        Index("ix_background_jobs_status_lease", "status", "lease_expires_at"),
+        Index("ix_background_jobs_finished_at", "finished_at"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    kind: Mapped[str] = mapped_column(String(64))
+    lane: Mapped[str] = mapped_column(String(16), default="default")
+    priority: Mapped[int] = mapped_column(Integer, default=0)
+    status: Mapped[str] = mapped_column(String(32), default="queued")
+    dedupe_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    payload_json: Mapped[dict] = mapped_column(JSON, default=dict)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=1)
+    worker_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+    enqueued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+
 class ManuscriptAssetLink(Base):
     __tablename__ = "manuscript_asset_links"
     __table_args__ = (UniqueConstraint("manuscript_id", "asset_id", "section_context"),)
@@ -1728,6 +2225,7 @@ class ManuscriptPlan(Base):
 
 class ManuscriptSnapshot(Base):
     __tablename__ = "manuscript_snapshots"
+    __table_args__ = (Index("ix_manuscript_snapshots_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -1822,8 +2320,57 @@ class ApiProviderUsageEvent(Base):
     )
 
 
+class ApiProviderUsageRollup(Base):
+    __tablename__ = "api_provider_usage_rollups"
+    __table_args__ = (
+        UniqueConstraint("provider", "operation", "hour_start"),
+        Index("ix_api_provider_usage_rollups_hour", "hour_start"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    provider: Mapped[str] = mapped_column(String(64), default="")
+    operation: Mapped[str] = mapped_column(String(128), default="")
+    hour_start: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    calls: Mapped[int] = mapped_column(Integer, default=0)
+    errors: Mapped[int] = mapped_column(Integer, default=0)
+    duration_ms_total: Mapped[int] = mapped_column(Integer, default=0)
+    tokens_input: Mapped[int] = mapped_column(Integer, default=0)
+    tokens_output: Mapped[int] = mapped_column(Integer, default=0)
+    cost_usd: Mapped[float] = mapped_column(Float, default=0.0)
+    last_called_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+
+class AdminUsageMonthlyRollup(Base):
+    __tablename__ = "admin_usage_monthly_rollups"
+    __table_args__ = (
+        UniqueConstraint("month_start", "domain"),
+        Index("ix_admin_usage_monthly_rollups_month", "month_start"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid4())
+    )
+    month_start: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # An empty domain holds the month total across every organisation.
+    domain: Mapped[str] = mapped_column(String(255), default="")
+    tool_calls: Mapped[int] = mapped_column(Integer, default=0)
+    tokens: Mapped[int] = mapped_column(Integer, default=0)
+    cost_usd: Mapped[float] = mapped_column(Float, default=0.0)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+
+
 class GenerationJob(Base):
     __tablename__ = "generation_jobs"
+    __table_args__ = (Index("ix_generation_jobs_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid4())
@@ -2566,6 +3113,54 @@ def _ensure_sqlite_schema_compatibility(engine) -> None:
                             {"owner_user_id": only_user_id},
                         )
 
+        if _sqlite_table_exists(connection, "embeddings"):
+            _sqlite_add_column_if_missing(
+                connection,
+                table_name="embeddings",
+                column_name="embedding_blob",
+                column_sql="BLOB",
+            )
+            _sqlite_add_column_if_missing(
+                connection,
+                table_name="embeddings",
+                column_name="dimensions",
+                column_sql="INTEGER DEFAULT 0",
+            )
+
+        if _sqlite_table_exists(connection, "auth_sessions"):
+            _sqlite_add_column_if_missing(
+                connection,
+                table_name="auth_sessions",
+                column_name="last_seen_at",
+                column_sql="DATETIME",
+            )
+
+        if _sqlite_table_exists(connection, "users"):
+            _sqlite_add_column_if_missing(
+                connection,
+                table_name="users",
+                column_name="email_domain",
+                column_sql="VARCHAR(255) DEFAULT ''",
+            )
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_users_email_domain "
+                    "ON users (email_domain)"
+                )
+            )
+        for table_name, column_name in (
+            ("generation_jobs", "created_at"),
+            ("manuscript_snapshots", "created_at"),
+            ("data_library_assets", "uploaded_at"),
+        ):
+            if _sqlite_table_exists(connection, table_name):
+                connection.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{column_name} "
+                        f"ON {table_name} ({column_name})"
+                    )
+                )
+
 
 def _ensure_postgresql_schema_compatibility(engine) -> None:
     if engine.dialect.name != "postgresql":
@@ -2851,6 +3446,73 @@ def _ensure_postgresql_schema_compatibility(engine) -> None:
                 "WHERE editorial_raw_json IS NULL"
             )
         )
+        connection.execute(
+            text(
+                "ALTER TABLE IF EXISTS embeddings "
+                "ADD COLUMN IF NOT EXISTS embedding_blob BYTEA"
+            )
+        )
+        connection.execute(
+            text(
+                "ALTER TABLE IF EXISTS embeddings "
+                "ADD COLUMN IF NOT EXISTS dimensions INTEGER DEFAULT 0"
+            )
+        )
+        connection.execute(
+            text(
+                "ALTER TABLE IF EXISTS auth_sessions "
+                "ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP WITH TIME ZONE"
+            )
+        )
+        connection.execute(
+            text(
+                "ALTER TABLE IF EXISTS users "
+                "ADD COLUMN IF NOT EXISTS email_domain VARCHAR(255) DEFAULT ''"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_users_email_domain "
+                "ON users (email_domain)"
+            )
+        )
+        for table_name, column_name in (
+            ("generation_jobs", "created_at"),
+            ("manuscript_snapshots", "created_at"),
+            ("data_library_assets", "uploaded_at"),
+        ):
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{column_name} "
+                    f"ON {table_name} ({column_name})"
+                )
+            )
+
+
+def _backfill_user_email_domains(engine) -> None:
+    """Fill ``users.email_domain`` for rows written before the column existed."""
+    try:
+        with Session(engine) as session:
+            rows = session.execute(
+                select(User.id, User.email).where(
+                    (User.email_domain.is_(None)) | (User.email_domain == "")
+                )
+            ).all()
+            if not rows:
+                return
+            session.execute(
+                User.__table__.update()
+                .where(User.__table__.c.id == bindparam("user_id"))
+                .values(email_domain=bindparam("domain")),
+                [
+                    {"user_id": user_id, "domain": user_email_domain(email)}
+                    for user_id, email in rows
+                ],
+            )
+            session.commit()
+    except (OperationalError, ProgrammingError):
+        # The users table may not exist yet when schema creation is skipped.
+        pass
 
 
 def _backfill_journal_profile_jcr_columns(engine) -> None:
@@ -2932,6 +3594,7 @@ def create_all_tables() -> None:
             Base.metadata.create_all(bind=engine)
             _ensure_sqlite_schema_compatibility(engine)
             _ensure_postgresql_schema_compatibility(engine)
+            _backfill_user_email_domains(engine)
             _backfill_journal_profile_jcr_columns(engine)
         except (OperationalError, ProgrammingError) as exc:
             # Concurrent startup/scheduler table checks can race in SQLite tests.
@@ -2942,6 +3605,13 @@ def create_all_tables() -> None:
         _initialized_schema_engine_url = engine_url
 
 
+def dialect_insert(session: Session, model: Any):
+    """Return an ``INSERT`` for ``model`` that supports ``on_conflict_do_*``."""
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql_insert(model)
+    return sqlite_insert(model)
+
+
 @contextmanager
 def session_scope():
     session: Session = get_session_factory()()
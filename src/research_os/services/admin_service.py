@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+import logging
 import os
 from pathlib import Path
 import shutil
@@ -9,10 +10,15 @@ import traceback
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import case, delete, func, or_, select
 
+from research_os.clients.http_client import get_http_client_stats
+from research_os.services.bibliometrics_service import (
+    citation_indices_for_portfolios,
+)
 from research_os.db import (
     AdminAuditEvent,
+    AdminUsageMonthlyRollup,
     DataLibraryAsset,
     GenerationJob,
     JournalProfile,
@@ -23,6 +29,7 @@ from research_os.db import (
     User,
     Work,
     create_all_tables,
+    dialect_insert,
     session_scope,
 )
 from research_os.services.generation_job_service import (
@@ -30,6 +37,9 @@ from research_os.services.generation_job_service import (
     GenerationJobStateError,
     enqueue_generation_job,
 )
+from research_os.services.publication_insights_agent_service import (
+    get_publication_insights_draft_cache_stats,
+)
 from research_os.services.publication_metrics_service import (
     compute_publication_top_metrics,
     enqueue_publication_top_metrics_refresh,
@@ -50,6 +60,13 @@ from research_os.services.collaboration_service import (
     trigger_collaboration_metrics_recompute,
 )
 from research_os.services.api_telemetry_service import summarize_api_usage_for_admin
+from research_os.services.job_queue_service import (
+    enqueue_job,
+    get_job_queue_stats,
+    register_job_kind,
+)
+
+logger = logging.getLogger(__name__)
 
 PERSONAL_EMAIL_DOMAINS = {
     "gmail.com",
@@ -95,6 +112,12 @@ PLAN_LIMITS: dict[str, dict[str, float | int]] = {
     },
 }
 
+# Usage trends span six months; the current and previous month are always
+# aggregated live and older months are served from admin_usage_monthly_rollups.
+ADMIN_USAGE_TREND_MONTHS = 6
+ADMIN_USAGE_LIVE_MONTHS = 2
+ADMIN_USAGE_ROLLUP_JOB_KIND = "admin_usage_rollup_refresh"
+
 ADMIN_JOB_ACTIVE_STATUSES = {"queued", "running", "cancel_requested"}
 ADMIN_JOB_RETRYABLE_STATUSES = {"failed", "cancelled"}
 ADMIN_JOB_TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
@@ -146,6 +169,27 @@ def _serialize_admin_user(user: User) -> dict[str, object]:
     }
 
 
+def _admin_user_citation_summaries(
+    *, session, user_ids: list[str]
+) -> dict[str, dict[str, int]]:
+    if not user_ids:
+        return {}
+    portfolios: dict[str, list[int]] = {user_id: [] for user_id in user_ids}
+    rows = session.execute(
+        select(Work.user_id, Work.citations_total).where(Work.user_id.in_(user_ids))
+    ).all()
+    for user_id, citations_total in rows:
+        portfolios[str(user_id)].append(int(citations_total or 0))
+    return {
+        user_id: {
+            "works_count": indices.works,
+            "citations_total": indices.total_citations,
+            "h_index": indices.h_index,
+        }
+        for user_id, indices in citation_indices_for_portfolios(portfolios).items()
+    }
+
+
 def _count_owned_assets(*, session, user_id: str) -> int:
     clean_user_id = str(user_id or "").strip()
     if not clean_user_id:
@@ -202,14 +246,6 @@ def _coerce_utc(value: datetime | None) -> datetime | None:
     return value.astimezone(timezone.utc)
 
 
-def _extract_email_domain(email: str | None) -> str:
-    clean = str(email or "").strip().lower()
-    if "@" not in clean:
-        return "unknown.local"
-    _, _, domain = clean.rpartition("@")
-    return domain or "unknown.local"
-
-
 def _derive_org_name(domain: str) -> str:
     clean = str(domain or "").strip().lower()
     if not clean or clean == "unknown.local":
@@ -380,6 +416,230 @@ def _record_admin_audit_event(
     return payload
 
 
+def _next_month_start(month_start: datetime) -> datetime:
+    if month_start.month == 12:
+        return datetime(month_start.year + 1, 1, 1, tzinfo=timezone.utc)
+    return datetime(month_start.year, month_start.month + 1, 1, tzinfo=timezone.utc)
+
+
+def _month_key(month_start: datetime) -> str:
+    return f"{month_start.year:04d}-{month_start.month:02d}"
+
+
+def _admin_usage_rollup_ttl_seconds() -> int:
+    raw_value = str(os.getenv("ADMIN_USAGE_ROLLUP_TTL_SECONDS", "3600")).strip()
+    try:
+        return max(60, int(raw_value))
+    except ValueError:
+        return 3600
+
+
+def _rollup_month_starts(now: datetime) -> list[datetime]:
+    return [
+        _month_start(now, months_ago=index)
+        for index in range(
+            ADMIN_USAGE_TREND_MONTHS - 1, ADMIN_USAGE_LIVE_MONTHS - 1, -1
+        )
+    ]
+
+
+def _job_tokens_expr():
+    input_tokens = func.coalesce(GenerationJob.estimated_input_tokens, 0)
+    output_tokens = func.coalesce(GenerationJob.estimated_output_tokens_high, 0)
+    return case((input_tokens > 0, input_tokens), else_=0) + case(
+        (output_tokens > 0, output_tokens), else_=0
+    )
+
+
+def _job_cost_expr():
+    cost_usd = func.coalesce(GenerationJob.estimated_cost_usd_high, 0.0)
+    return case((cost_usd > 0, cost_usd), else_=0.0)
+
+
+def _asset_bytes_expr():
+    byte_size = func.coalesce(DataLibraryAsset.byte_size, 0)
+    return case((byte_size > 0, byte_size), else_=0)
+
+
+def _owner_domain_expr():
+    return func.coalesce(User.email_domain, "unknown.local")
+
+
+def _generation_usage_by_domain(
+    session,
+    *,
+    start: datetime,
+    end: datetime | None = None,
+    domains: list[str] | None = None,
+) -> dict[str, dict[str, float | int]]:
+    """Sum generation jobs created in ``[start, end)`` per owner email domain.
+
+    Jobs whose project has no owner fall into ``unknown.local`` unless the
+    query is restricted to ``domains``, which only matches real members.
+    """
+    domain_expr = _owner_domain_expr()
+    stmt = (
+        select(
+            domain_expr,
+            func.count(GenerationJob.id),
+            func.sum(_job_tokens_expr()),
+            func.sum(_job_cost_expr()),
+        )
+        .select_from(GenerationJob)
+        .join(Project, GenerationJob.project_id == Project.id)
+        .outerjoin(User, Project.owner_user_id == User.id)
+        .where(GenerationJob.created_at >= start)
+        .group_by(domain_expr)
+    )
+    if end is not None:
+        stmt = stmt.where(GenerationJob.created_at < end)
+    if domains is not None:
+        stmt = stmt.where(User.email_domain.in_(domains))
+    return {
+        str(domain): {
+            "tool_calls": int(tool_calls or 0),
+            "tokens": int(tokens or 0),
+            "cost_usd": _safe_float(cost_usd),
+        }
+        for domain, tool_calls, tokens, cost_usd in session.execute(stmt).all()
+    }
+
+
+def refresh_admin_usage_rollups(
+    *, month_starts: list[datetime] | None = None
+) -> dict[str, object]:
+    """Recompute closed-month usage rollups behind the admin trend charts."""
+    create_all_tables()
+    now = _utcnow()
+    targets = month_starts if month_starts is not None else _rollup_month_starts(now)
+    rows_written = 0
+    with session_scope() as session:
+        for month_start in targets:
+            usage = _generation_usage_by_domain(
+                session, start=month_start, end=_next_month_start(month_start)
+            )
+            usage[""] = {
+                "tool_calls": sum(int(item["tool_calls"]) for item in usage.values()),
+                "tokens": sum(int(item["tokens"]) for item in usage.values()),
+                "cost_usd": sum(_safe_float(item["cost_usd"]) for item in usage.values()),
+            }
+            # Upsert rather than delete-then-insert: two admin requests can both
+            # find a month missing and build it inline at the same time, and
+            # plain inserts would then collide on (month_start, domain).
+            # Domains are written in a fixed order so concurrent builds take
+            # row locks in the same sequence.
+            statement = dialect_insert(session, AdminUsageMonthlyRollup)
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["month_start", "domain"],
+                    set_={
+                        "tool_calls": statement.excluded.tool_calls,
+                        "tokens": statement.excluded.tokens,
+                        "cost_usd": statement.excluded.cost_usd,
+                        "computed_at": statement.excluded.computed_at,
+                    },
+                ),
+                [
+                    {
+                        "id": str(uuid4()),
+                        "month_start": month_start,
+                        "domain": domain,
+                        "tool_calls": int(usage[domain]["tool_calls"]),
+                        "tokens": int(usage[domain]["tokens"]),
+                        "cost_usd": round(_safe_float(usage[domain]["cost_usd"]), 6),
+                        "computed_at": now,
+                    }
+                    for domain in sorted(usage)
+                ],
+            )
+            session.execute(
+                delete(AdminUsageMonthlyRollup).where(
+                    AdminUsageMonthlyRollup.month_start == month_start,
+                    AdminUsageMonthlyRollup.domain.not_in(sorted(usage)),
+                )
+            )
+            rows_written += len(usage)
+    return {
+        "months": [_month_key(item) for item in targets],
+        "rows_written": rows_written,
+        "computed_at": now,
+    }
+
+
+def _enqueue_admin_usage_rollup_refresh() -> bool:
+    try:
+        return enqueue_job(
+            kind=ADMIN_USAGE_ROLLUP_JOB_KIND,
+            payload={},
+            dedupe_key=ADMIN_USAGE_ROLLUP_JOB_KIND,
+        )
+    except Exception:
+        logger.warning("Failed to enqueue admin usage rollup refresh", exc_info=True)
+        return False
+
+
+def _load_admin_usage_rollups(
+    *,
+    now: datetime,
+    domains: list[str],
+) -> dict[tuple[str, str], dict[str, float | int]]:
+    """Read closed-month rollups, building missing months and refreshing stale ones.
+
+    Months with no rollup yet are computed inline so the charts are never
+    blank; rows older than the TTL are served as-is while a background job
+    recomputes them.
+    """
+    month_starts = _rollup_month_starts(now)
+    with session_scope() as session:
+        computed_rows = session.execute(
+            select(
+                AdminUsageMonthlyRollup.month_start,
+                AdminUsageMonthlyRollup.computed_at,
+            ).where(
+                AdminUsageMonthlyRollup.domain == "",
+                AdminUsageMonthlyRollup.month_start.in_(month_starts),
+            )
+        ).all()
+    computed_at_by_month = {
+        _coerce_utc(month_start): _coerce_utc(computed_at)
+        for month_start, computed_at in computed_rows
+    }
+    missing = [item for item in month_starts if item not in computed_at_by_month]
+    if missing:
+        refresh_admin_usage_rollups(month_starts=missing)
+    stale_before = now - timedelta(seconds=_admin_usage_rollup_ttl_seconds())
+    if any(
+        computed_at is None or computed_at < stale_before
+        for computed_at in computed_at_by_month.values()
+    ):
+        _enqueue_admin_usage_rollup_refresh()
+
+    with session_scope() as session:
+        rows = session.execute(
+            select(
+                AdminUsageMonthlyRollup.month_start,
+                AdminUsageMonthlyRollup.domain,
+                AdminUsageMonthlyRollup.tool_calls,
+                AdminUsageMonthlyRollup.tokens,
+                AdminUsageMonthlyRollup.cost_usd,
+            ).where(
+                AdminUsageMonthlyRollup.month_start.in_(month_starts),
+                AdminUsageMonthlyRollup.domain.in_(domains),
+            )
+        ).all()
+    rollups: dict[tuple[str, str], dict[str, float | int]] = {}
+    for month_start, domain, tool_calls, tokens, cost_usd in rows:
+        month_utc = _coerce_utc(month_start)
+        if month_utc is None:
+            continue
+        rollups[(_month_key(month_utc), str(domain or ""))] = {
+            "tool_calls": int(tool_calls or 0),
+            "tokens": int(tokens or 0),
+            "cost_usd": _safe_float(cost_usd),
+        }
+    return rollups
+
+
 def get_admin_overview() -> dict[str, object]:
     create_all_tables()
     now = _utcnow()
@@ -463,9 +723,9 @@ def list_admin_organisations(
     month_older = _month_start(now, months_ago=2)
     active_30d_threshold = now - timedelta(days=30)
     month_keys = [
-        f"{month_older.year:04d}-{month_older.month:02d}",
-        f"{month_previous.year:04d}-{month_previous.month:02d}",
-        f"{month_current.year:04d}-{month_current.month:02d}",
+        _month_key(month_older),
+        _month_key(month_previous),
+        _month_key(month_current),
     ]
 
     normalized_query = str(query or "").strip().lower()
@@ -473,192 +733,178 @@ def list_admin_organisations(
     normalized_offset = max(0, int(offset))
 
     with session_scope() as session:
-        user_rows = session.execute(
-            select(
-                User.id,
-                User.email,
-                User.role,
-                User.last_sign_in_at,
-                User.orcid_id,
-                User.orcid_last_synced_at,
-            )
-        ).all()
-        projects = session.execute(
-            select(Project.owner_user_id, Project.workspace_id)
-        ).all()
-        generation_rows = session.execute(
+        member_rows = session.execute(
             select(
-                Project.owner_user_id,
-                GenerationJob.created_at,
-                GenerationJob.estimated_input_tokens,
-                GenerationJob.estimated_output_tokens_high,
-                GenerationJob.estimated_cost_usd_high,
-            ).join(Project, GenerationJob.project_id == Project.id)
-        ).all()
-        assets_rows = session.execute(
-            select(DataLibraryAsset.owner_user_id, DataLibraryAsset.byte_size)
-        ).all()
-        work_rows = session.execute(select(Work.user_id, Work.provenance)).all()
-        impersonation_rows = session.execute(
-            select(AdminAuditEvent.target_id, AdminAuditEvent.created_at).where(
-                AdminAuditEvent.action == "admin_org_impersonation_start",
-                AdminAuditEvent.target_type == "organisation",
-            )
+                User.email_domain,
+                func.count(User.id),
+                func.sum(
+                    case(
+                        (
+                            func.lower(func.trim(func.coalesce(User.role, "")))
+                            == "admin",
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ),
+                func.sum(
+                    case((User.last_sign_in_at >= active_30d_threshold, 1), else_=0)
+                ),
+                func.max(User.last_sign_in_at),
+                func.sum(
+                    case(
+                        (func.trim(func.coalesce(User.orcid_id, "")) != "", 1),
+                        else_=0,
+                    )
+                ),
+                func.max(User.orcid_last_synced_at),
+            ).group_by(User.email_domain)
         ).all()
+        project_counts = {
+            str(domain): int(count or 0)
+            for domain, count in session.execute(
+                select(User.email_domain, func.count(Project.id))
+                .join(User, Project.owner_user_id == User.id)
+                .group_by(User.email_domain)
+            ).all()
+        }
 
-    users_by_domain: dict[str, list[dict[str, object]]] = defaultdict(list)
-    domain_by_user_id: dict[str, str] = {}
+    # One row per domain from here on: the filter and ordering inputs are all
+    # in the aggregates, so only the requested page is expanded below.
+    domain_rows: list[dict[str, object]] = []
     for (
-        user_id,
-        email,
-        role,
-        last_sign_in_at,
-        orcid_id,
-        orcid_last_synced_at,
-    ) in user_rows:
-        user_data = {
-            "id": str(user_id or "").strip(),
-            "email": str(email or "").strip(),
-            "role": str(role or "").strip().lower(),
-            "last_sign_in_at": _coerce_utc(last_sign_in_at),
-            "orcid_id": str(orcid_id or "").strip(),
-            "orcid_last_synced_at": _coerce_utc(orcid_last_synced_at),
-        }
-        if not user_data["id"]:
-            continue
-        domain = _extract_email_domain(user_data["email"])
-        users_by_domain[domain].append(user_data)
-        domain_by_user_id[str(user_data["id"])] = domain
-
-    project_counts: dict[str, int] = defaultdict(int)
-    workspace_ids: dict[str, set[str]] = defaultdict(set)
-    for owner_user_id, workspace_id in projects:
-        owner = str(owner_user_id or "").strip()
-        if not owner or owner not in domain_by_user_id:
-            continue
-        domain = domain_by_user_id[owner]
-        project_counts[domain] += 1
-        workspace_token = _workspace_token(workspace_id)
-        if workspace_token:
-            workspace_ids[domain].add(workspace_token)
-
-    usage_current_tokens: dict[str, int] = defaultdict(int)
-    usage_previous_tokens: dict[str, int] = defaultdict(int)
-    usage_current_tool_calls: dict[str, int] = defaultdict(int)
-    cost_current_usd: dict[str, float] = defaultdict(float)
-    cost_previous_usd: dict[str, float] = defaultdict(float)
-    usage_by_month: dict[str, dict[str, dict[str, float | int]]] = defaultdict(
-        lambda: {
-            month_key: {"tokens": 0, "tool_calls": 0, "cost_usd": 0.0}
-            for month_key in month_keys
+        domain,
+        member_count,
+        admin_count,
+        active_members_30d,
+        last_active_at,
+        orcid_connected_members,
+        orcid_last_sync_at,
+    ) in member_rows:
+        clean_domain = str(domain or "").strip() or "unknown.local"
+        project_count = int(project_counts.get(clean_domain, 0))
+        plan = _resolve_plan(
+            domain=clean_domain,
+            member_count=int(member_count or 0),
+            project_count=project_count,
+        )
+        row = {
+            "domain": clean_domain,
+            "name": _derive_org_name(clean_domain),
+            "plan": plan,
+            "billing_status": "trial" if plan == "individual" else "active",
+            "member_count": int(member_count or 0),
+            "admin_count": int(admin_count or 0),
+            "active_members_30d": int(active_members_30d or 0),
+            "last_active_at": _coerce_utc(last_active_at),
+            "project_count": project_count,
+            "orcid_connected_members": int(orcid_connected_members or 0),
+            "orcid_last_sync_at": _coerce_utc(orcid_last_sync_at),
         }
-    )
-    for owner_user_id, created_at, input_tokens, output_tokens_high, cost_usd in generation_rows:
-        owner = str(owner_user_id or "").strip()
-        if not owner or owner not in domain_by_user_id:
-            continue
-        domain = domain_by_user_id[owner]
-        created = _coerce_utc(created_at)
-        if created is None:
-            continue
-
-        token_count = int(max(0, int(input_tokens or 0)) + max(0, int(output_tokens_high or 0)))
-        job_cost = max(0.0, float(cost_usd or 0.0))
-        month_key = f"{created.year:04d}-{created.month:02d}"
-        if month_key in usage_by_month[domain]:
-            month_bucket = usage_by_month[domain][month_key]
-            month_bucket["tokens"] = int(month_bucket["tokens"]) + token_count
-            month_bucket["tool_calls"] = int(month_bucket["tool_calls"]) + 1
-            month_bucket["cost_usd"] = float(month_bucket["cost_usd"]) + job_cost
-
-        if created >= month_current:
-            usage_current_tokens[domain] += token_count
-            usage_current_tool_calls[domain] += 1
-            cost_current_usd[domain] += job_cost
-        elif created >= month_previous:
-            usage_previous_tokens[domain] += token_count
-            cost_previous_usd[domain] += job_cost
-
-    storage_bytes: dict[str, int] = defaultdict(int)
-    for owner_user_id, byte_size in assets_rows:
-        owner = str(owner_user_id or "").strip()
-        if not owner or owner not in domain_by_user_id:
-            continue
-        domain = domain_by_user_id[owner]
-        storage_bytes[domain] += max(0, int(byte_size or 0))
+        if normalized_query:
+            searchable = " ".join(
+                [
+                    str(row["domain"]),
+                    str(row["name"]),
+                    str(row["plan"]),
+                    str(row["billing_status"]),
+                ]
+            ).lower()
+            if normalized_query not in searchable:
+                continue
+        domain_rows.append(row)
 
-    provenances_by_user: dict[str, set[str]] = defaultdict(set)
-    for user_id, provenance in work_rows:
-        clean_user_id = str(user_id or "").strip()
-        if not clean_user_id or clean_user_id not in domain_by_user_id:
-            continue
-        clean_provenance = str(provenance or "").strip().lower()
-        if clean_provenance:
-            provenances_by_user[clean_user_id].add(clean_provenance)
+    domain_rows.sort(
+        key=lambda row: (
+            -int(row["member_count"]),
+            -int(row["active_members_30d"]),
+            str(row["domain"]),
+        )
+    )
+    total = len(domain_rows)
+    paged_rows = domain_rows[normalized_offset : normalized_offset + normalized_limit]
+    page_domains = [str(row["domain"]) for row in paged_rows]
+    if not page_domains:
+        return {
+            "items": [],
+            "total": total,
+            "limit": normalized_limit,
+            "offset": normalized_offset,
+            "generated_at": now,
+        }
 
-    impersonation_last_event_by_org_id: dict[str, datetime] = {}
-    for target_id, created_at in impersonation_rows:
-        clean_target_id = str(target_id or "").strip()
-        created_utc = _coerce_utc(created_at)
-        if not clean_target_id or created_utc is None:
-            continue
-        current_last = impersonation_last_event_by_org_id.get(clean_target_id)
-        if current_last is None or created_utc > current_last:
-            impersonation_last_event_by_org_id[clean_target_id] = created_utc
+    rollups = _load_admin_usage_rollups(now=now, domains=page_domains)
+    with session_scope() as session:
+        workspace_ids: dict[str, set[str]] = defaultdict(set)
+        for domain, workspace_id in session.execute(
+            select(User.email_domain, Project.workspace_id)
+            .join(User, Project.owner_user_id == User.id)
+            .where(User.email_domain.in_(page_domains))
+            .distinct()
+        ).all():
+            workspace_token = _workspace_token(workspace_id)
+            if workspace_token:
+                workspace_ids[str(domain)].add(workspace_token)
+        usage_current = _generation_usage_by_domain(
+            session, start=month_current, domains=page_domains
+        )
+        usage_previous = _generation_usage_by_domain(
+            session, start=month_previous, end=month_current, domains=page_domains
+        )
+        storage_bytes = {
+            str(domain): int(total_bytes or 0)
+            for domain, total_bytes in session.execute(
+                select(User.email_domain, func.sum(_asset_bytes_expr()))
+                .join(User, DataLibraryAsset.owner_user_id == User.id)
+                .where(User.email_domain.in_(page_domains))
+                .group_by(User.email_domain)
+            ).all()
+        }
+        openalex_connected = {
+            str(domain): int(count or 0)
+            for domain, count in session.execute(
+                select(User.email_domain, func.count(func.distinct(Work.user_id)))
+                .join(User, Work.user_id == User.id)
+                .where(
+                    User.email_domain.in_(page_domains),
+                    func.lower(func.trim(Work.provenance)) == "openalex",
+                )
+                .group_by(User.email_domain)
+            ).all()
+        }
+        impersonation_last_event_by_org_id = {
+            str(target_id): _coerce_utc(created_at)
+            for target_id, created_at in session.execute(
+                select(AdminAuditEvent.target_id, func.max(AdminAuditEvent.created_at))
+                .where(
+                    AdminAuditEvent.action == "admin_org_impersonation_start",
+                    AdminAuditEvent.target_type == "organisation",
+                    AdminAuditEvent.target_id.in_(
+                        [f"org-{domain}" for domain in page_domains]
+                    ),
+                )
+                .group_by(AdminAuditEvent.target_id)
+            ).all()
+        }
 
+    empty_usage = {"tool_calls": 0, "tokens": 0, "cost_usd": 0.0}
     items: list[dict[str, object]] = []
-    for domain, domain_users in users_by_domain.items():
-        member_count = len(domain_users)
-        admin_count = sum(
-            1 for user in domain_users if str(user["role"]) == "admin"
-        )
-        active_members_30d = sum(
-            1
-            for user in domain_users
-            if (
-                user["last_sign_in_at"] is not None
-                and user["last_sign_in_at"] >= active_30d_threshold
-            )
-        )
-        last_active_at = max(
-            (
-                user["last_sign_in_at"]
-                for user in domain_users
-                if user["last_sign_in_at"] is not None
-            ),
-            default=None,
-        )
-
-        current_tokens = int(usage_current_tokens.get(domain, 0))
-        previous_tokens = int(usage_previous_tokens.get(domain, 0))
-        current_cost = round(float(cost_current_usd.get(domain, 0.0)), 4)
-        previous_cost = round(float(cost_previous_usd.get(domain, 0.0)), 4)
-        project_count = int(project_counts.get(domain, 0))
-        workspace_count = len(workspace_ids.get(domain, set()))
-        plan = _resolve_plan(
-            domain=domain,
-            member_count=member_count,
-            project_count=project_count,
-        )
+    for row in paged_rows:
+        domain = str(row["domain"])
+        current_usage = usage_current.get(domain, empty_usage)
+        previous_usage = usage_previous.get(domain, empty_usage)
+        current_tokens = int(current_usage["tokens"])
+        previous_tokens = int(previous_usage["tokens"])
+        current_cost = round(_safe_float(current_usage["cost_usd"]), 4)
+        previous_cost = round(_safe_float(previous_usage["cost_usd"]), 4)
+        plan = str(row["plan"])
         limits = PLAN_LIMITS.get(plan, PLAN_LIMITS["growth"])
-        openalex_connected_members = sum(
-            1
-            for user in domain_users
-            if "openalex" in provenances_by_user.get(str(user["id"]), set())
-        )
-        orcid_connected_members = sum(
-            1 for user in domain_users if str(user["orcid_id"])
-        )
-        orcid_last_sync_at = max(
-            (
-                user["orcid_last_synced_at"]
-                for user in domain_users
-                if user["orcid_last_synced_at"] is not None
-            ),
-            default=None,
-        )
+        admin_count = int(row["admin_count"])
+        orcid_connected_members = int(row["orcid_connected_members"])
+        openalex_connected_members = int(openalex_connected.get(domain, 0))
         has_orcid = orcid_connected_members > 0
         has_openalex = openalex_connected_members > 0
+        domain_storage_bytes = int(storage_bytes.get(domain, 0))
 
         feature_flags = [
             "admin_console_v2",
@@ -674,18 +920,23 @@ def list_admin_organisations(
             feature_flags.append("openalex_enrichment")
         if current_tokens > 0:
             feature_flags.append("usage_metering")
-        if storage_bytes.get(domain, 0) > 0:
+        if domain_storage_bytes > 0:
             feature_flags.append("data_library")
 
+        usage_by_month = {
+            month_keys[0]: rollups.get((month_keys[0], domain), empty_usage),
+            month_keys[1]: previous_usage,
+            month_keys[2]: current_usage,
+        }
         monthly_usage_trend: list[dict[str, object]] = []
         for month_key in month_keys:
-            month_usage = usage_by_month[domain][month_key]
+            month_usage = usage_by_month[month_key]
             monthly_usage_trend.append(
                 {
                     "month": month_key,
                     "tokens": int(month_usage["tokens"]),
                     "tool_calls": int(month_usage["tool_calls"]),
-                    "cost_usd": round(float(month_usage["cost_usd"]), 4),
+                    "cost_usd": round(_safe_float(month_usage["cost_usd"]), 4),
                 }
             )
 
@@ -700,92 +951,72 @@ def list_admin_organisations(
         elif current_cost <= 0:
             gross_margin_pct = float(limits["gross_margin_pct"])
 
-        item = {
-            "id": f"org-{domain}",
-            "name": _derive_org_name(domain),
-            "domain": domain,
-            "plan": plan,
-            "billing_status": "trial" if plan == "individual" else "active",
-            "member_count": member_count,
-            "admin_count": admin_count,
-            "active_members_30d": active_members_30d,
-            "last_active_at": last_active_at,
-            "workspace_count": workspace_count,
-            "project_count": project_count,
-            "usage_tokens_current_month": current_tokens,
-            "usage_tokens_previous_month": previous_tokens,
-            "usage_tokens_trend_pct": _percent_change(current_tokens, previous_tokens),
-            "usage_tool_calls_current_month": int(
-                usage_current_tool_calls.get(domain, 0)
-            ),
-            "storage_bytes_current": int(storage_bytes.get(domain, 0)),
-            "cost_usd_current_month": current_cost,
-            "cost_usd_previous_month": previous_cost,
-            "cost_trend_pct": _percent_change(current_cost, previous_cost),
-            "gross_margin_pct": gross_margin_pct,
-            "feature_flags_enabled": sorted(feature_flags),
-            "rate_limit_rpm": int(limits["rate_limit_rpm"]),
-            "monthly_token_quota": int(limits["monthly_token_quota"]),
-            "storage_quota_gb": int(limits["storage_quota_gb"]),
-            "data_retention_days": int(limits["data_retention_days"]),
-            "integrations": [
-                {
-                    "key": "orcid",
-                    "status": "connected" if has_orcid else "not_configured",
-                    "connected_members": orcid_connected_members,
-                    "last_sync_at": orcid_last_sync_at,
-                    "detail": "ORCID profile linkage and work import telemetry.",
-                },
-                {
-                    "key": "openalex",
-                    "status": "connected" if has_openalex else "degraded",
-                    "connected_members": openalex_connected_members,
-                    "last_sync_at": None,
-                    "detail": "OpenAlex enrichment observed from publication provenance.",
-                },
-                {
-                    "key": "zotero",
-                    "status": "not_configured",
-                    "connected_members": 0,
-                    "last_sync_at": None,
-                    "detail": "Zotero connector is scaffolded and pending rollout.",
-                },
-            ],
-            "monthly_usage_trend": monthly_usage_trend,
-            "impersonation": {
-                "available": True,
-                "audited": True,
-                "last_event_at": impersonation_last_event_by_org_id.get(
-                    f"org-{domain}"
+        items.append(
+            {
+                "id": f"org-{domain}",
+                "name": row["name"],
+                "domain": domain,
+                "plan": plan,
+                "billing_status": row["billing_status"],
+                "member_count": int(row["member_count"]),
+                "admin_count": admin_count,
+                "active_members_30d": int(row["active_members_30d"]),
+                "last_active_at": row["last_active_at"],
+                "workspace_count": len(workspace_ids.get(domain, set())),
+                "project_count": int(row["project_count"]),
+                "usage_tokens_current_month": current_tokens,
+                "usage_tokens_previous_month": previous_tokens,
+                "usage_tokens_trend_pct": _percent_change(
+                    current_tokens, previous_tokens
                 ),
-                "note": "Internal-only control. All impersonation events must be audited.",
-            },
-        }
-        if normalized_query:
-            searchable = " ".join(
-                [
-                    str(item["domain"]),
-                    str(item["name"]),
-                    str(item["plan"]),
-                    str(item["billing_status"]),
-                ]
-            ).lower()
-            if normalized_query not in searchable:
-                continue
-        items.append(item)
-
-    items.sort(
-        key=lambda item: (
-            -int(item["member_count"]),
-            -int(item["active_members_30d"]),
-            str(item["domain"]),
+                "usage_tool_calls_current_month": int(current_usage["tool_calls"]),
+                "storage_bytes_current": domain_storage_bytes,
+                "cost_usd_current_month": current_cost,
+                "cost_usd_previous_month": previous_cost,
+                "cost_trend_pct": _percent_change(current_cost, previous_cost),
+                "gross_margin_pct": gross_margin_pct,
+                "feature_flags_enabled": sorted(feature_flags),
+                "rate_limit_rpm": int(limits["rate_limit_rpm"]),
+                "monthly_token_quota": int(limits["monthly_token_quota"]),
+                "storage_quota_gb": int(limits["storage_quota_gb"]),
+                "data_retention_days": int(limits["data_retention_days"]),
+                "integrations": [
+                    {
+                        "key": "orcid",
+                        "status": "connected" if has_orcid else "not_configured",
+                        "connected_members": orcid_connected_members,
+                        "last_sync_at": row["orcid_last_sync_at"],
+                        "detail": "ORCID profile linkage and work import telemetry.",
+                    },
+                    {
+                        "key": "openalex",
+                        "status": "connected" if has_openalex else "degraded",
+                        "connected_members": openalex_connected_members,
+                        "last_sync_at": None,
+                        "detail": "OpenAlex enrichment observed from publication provenance.",
+                    },
+                    {
+                        "key": "zotero",
+                        "status": "not_configured",
+                        "connected_members": 0,
+                        "last_sync_at": None,
+                        "detail": "Zotero connector is scaffolded and pending rollout.",
+                    },
+                ],
+                "monthly_usage_trend": monthly_usage_trend,
+                "impersonation": {
+                    "available": True,
+                    "audited": True,
+                    "last_event_at": impersonation_last_event_by_org_id.get(
+                        f"org-{domain}"
+                    ),
+                    "note": "Internal-only control. All impersonation events must be audited.",
+                },
+            }
         )
-    )
-    total = len(items)
-    paged_items = items[normalized_offset : normalized_offset + normalized_limit]
 
     return {
-        "items": paged_items,
+        "items": items,
         "total": total,
         "limit": normalized_limit,
         "offset": normalized_offset,
@@ -807,16 +1038,13 @@ def list_admin_workspaces(
     normalized_limit = max(1, min(200, int(limit)))
     normalized_offset = max(0, int(offset))
 
+    job_status = func.lower(func.trim(func.coalesce(GenerationJob.status, "")))
+    job_is_recent = GenerationJob.created_at >= recent_7d_threshold
+    job_is_retry = or_(
+        func.coalesce(GenerationJob.run_count, 0) > 1,
+        func.trim(func.coalesce(GenerationJob.parent_job_id, "")) != "",
+    )
     with session_scope() as session:
-        user_rows = session.execute(
-            select(
-                User.id,
-                User.name,
-                User.email,
-                User.role,
-                User.last_sign_in_at,
-            )
-        ).all()
         project_rows = session.execute(
             select(
                 Project.id,
@@ -830,42 +1058,70 @@ def list_admin_workspaces(
         ).all()
         manuscript_rows = session.execute(
             select(
-                Manuscript.id,
                 Manuscript.project_id,
-                Manuscript.created_at,
-                Manuscript.updated_at,
-            )
+                func.count(Manuscript.id),
+                func.max(Manuscript.created_at),
+                func.max(Manuscript.updated_at),
+            ).group_by(Manuscript.project_id)
         ).all()
         asset_rows = session.execute(
             select(
-                DataLibraryAsset.id,
                 DataLibraryAsset.project_id,
-                DataLibraryAsset.byte_size,
-                DataLibraryAsset.uploaded_at,
+                func.count(DataLibraryAsset.id),
+                func.sum(_asset_bytes_expr()),
+                func.max(DataLibraryAsset.uploaded_at),
             )
+            .where(DataLibraryAsset.project_id.is_not(None))
+            .group_by(DataLibraryAsset.project_id)
         ).all()
         snapshot_rows = session.execute(
             select(
-                ManuscriptSnapshot.id,
                 ManuscriptSnapshot.project_id,
-                ManuscriptSnapshot.created_at,
-            )
+                func.count(ManuscriptSnapshot.id),
+                func.max(ManuscriptSnapshot.created_at),
+            ).group_by(ManuscriptSnapshot.project_id)
         ).all()
         job_rows = session.execute(
             select(
-                GenerationJob.id,
                 GenerationJob.project_id,
-                GenerationJob.status,
-                GenerationJob.run_count,
-                GenerationJob.parent_job_id,
-                GenerationJob.estimated_input_tokens,
-                GenerationJob.estimated_output_tokens_high,
-                GenerationJob.estimated_cost_usd_high,
-                GenerationJob.created_at,
-                GenerationJob.completed_at,
-                GenerationJob.updated_at,
-            )
+                job_status,
+                func.count(GenerationJob.id),
+                func.sum(case((job_is_recent, 1), else_=0)),
+                func.sum(case((job_is_recent & job_is_retry, 1), else_=0)),
+                func.sum(_job_tokens_expr()),
+                func.sum(_job_cost_expr()),
+                func.max(GenerationJob.created_at),
+                func.max(GenerationJob.completed_at),
+                func.max(GenerationJob.updated_at),
+            ).group_by(GenerationJob.project_id, job_status)
         ).all()
+        member_ids = sorted(
+            {
+                str(owner_user_id or "").strip()
+                for _, _, _, owner_user_id, _, _, _ in project_rows
+            }
+            | {
+                collaborator_id
+                for _, _, _, _, collaborator_user_ids, _, _ in project_rows
+                for collaborator_id in _normalize_user_ids(collaborator_user_ids)
+            }
+            - {""}
+        )
+        user_rows = []
+        for chunk_start in range(0, len(member_ids), 500):
+            user_rows.extend(
+                session.execute(
+                    select(
+                        User.id,
+                        User.name,
+                        User.email,
+                        User.role,
+                        User.last_sign_in_at,
+                    ).where(
+                        User.id.in_(member_ids[chunk_start : chunk_start + 500])
+                    )
+                ).all()
+            )
 
     users_by_id: dict[str, dict[str, object]] = {}
     for user_id, name, email, role, last_sign_in_at in user_rows:
@@ -973,14 +1229,16 @@ def list_admin_workspaces(
         }
         workspace_by_project_id[clean_project_id] = workspace_key
 
-    for _, project_id, created_at, updated_at in manuscript_rows:
+    for project_id, manuscript_count, created_at, updated_at in manuscript_rows:
         clean_project_id = str(project_id or "").strip()
         workspace_key = workspace_by_project_id.get(clean_project_id)
         if not workspace_key:
             continue
         workspace = ensure_workspace(workspace_key)
-        workspace["manuscript_count"] = int(workspace["manuscript_count"]) + 1
-        manuscript_counts_by_project[clean_project_id] += 1
+        workspace["manuscript_count"] = int(workspace["manuscript_count"]) + int(
+            manuscript_count or 0
+        )
+        manuscript_counts_by_project[clean_project_id] += int(manuscript_count or 0)
         manuscript_activity = _max_timestamp(_coerce_utc(updated_at), _coerce_utc(created_at))
         workspace["last_activity_at"] = _max_timestamp(
             workspace["last_activity_at"], manuscript_activity
@@ -989,18 +1247,20 @@ def list_admin_workspaces(
             project_last_activity[clean_project_id], manuscript_activity
         )
 
-    for _, project_id, byte_size, uploaded_at in asset_rows:
+    for project_id, asset_count, byte_total, uploaded_at in asset_rows:
         clean_project_id = str(project_id or "").strip()
         workspace_key = workspace_by_project_id.get(clean_project_id)
         if not workspace_key:
             continue
         workspace = ensure_workspace(workspace_key)
-        workspace["data_sources_count"] = int(workspace["data_sources_count"]) + 1
-        workspace["storage_bytes"] = int(workspace["storage_bytes"]) + max(
-            0, int(byte_size or 0)
+        workspace["data_sources_count"] = int(workspace["data_sources_count"]) + int(
+            asset_count or 0
         )
-        asset_counts_by_project[clean_project_id] += 1
-        asset_bytes_by_project[clean_project_id] += max(0, int(byte_size or 0))
+        workspace["storage_bytes"] = int(workspace["storage_bytes"]) + int(
+            byte_total or 0
+        )
+        asset_counts_by_project[clean_project_id] += int(asset_count or 0)
+        asset_bytes_by_project[clean_project_id] += int(byte_total or 0)
         uploaded_utc = _coerce_utc(uploaded_at)
         workspace["last_activity_at"] = _max_timestamp(
             workspace["last_activity_at"], uploaded_utc
@@ -1009,14 +1269,16 @@ def list_admin_workspaces(
             project_last_activity[clean_project_id], uploaded_utc
         )
 
-    for _, project_id, created_at in snapshot_rows:
+    for project_id, snapshot_count, created_at in snapshot_rows:
         clean_project_id = str(project_id or "").strip()
         workspace_key = workspace_by_project_id.get(clean_project_id)
         if not workspace_key:
             continue
         workspace = ensure_workspace(workspace_key)
-        workspace["export_history_count"] = int(workspace["export_history_count"]) + 1
-        snapshot_counts_by_project[clean_project_id] += 1
+        workspace["export_history_count"] = int(workspace["export_history_count"]) + int(
+            snapshot_count or 0
+        )
+        snapshot_counts_by_project[clean_project_id] += int(snapshot_count or 0)
         created_utc = _coerce_utc(created_at)
         workspace["last_activity_at"] = _max_timestamp(
             workspace["last_activity_at"], created_utc
@@ -1025,15 +1287,16 @@ def list_admin_workspaces(
             project_last_activity[clean_project_id], created_utc
         )
 
+    # Job rows arrive grouped by (project, status); the latest status of a
+    # project is the status group holding its most recent job event.
     for (
-        _,
         project_id,
         status,
-        run_count,
-        parent_job_id,
-        input_tokens,
-        output_tokens,
-        cost_usd,
+        run_total,
+        recent_runs,
+        recent_retry_runs,
+        token_total,
+        cost_total,
         created_at,
         completed_at,
         updated_at,
@@ -1044,16 +1307,14 @@ def list_admin_workspaces(
             continue
         workspace = ensure_workspace(workspace_key)
         normalized_status = str(status or "").strip().lower() or "unknown"
-        workspace["job_total_runs"] = int(workspace["job_total_runs"]) + 1
-        workspace["job_status_counts"][normalized_status] += 1
-        job_counts_by_project[clean_project_id] += 1
+        run_total = int(run_total or 0)
+        workspace["job_total_runs"] = int(workspace["job_total_runs"]) + run_total
+        workspace["job_status_counts"][normalized_status] += run_total
+        job_counts_by_project[clean_project_id] += run_total
 
-        created_utc = _coerce_utc(created_at)
-        completed_utc = _coerce_utc(completed_at)
-        updated_utc = _coerce_utc(updated_at)
         latest_job_event = _max_timestamp(
-            completed_utc,
-            _max_timestamp(updated_utc, created_utc),
+            _coerce_utc(completed_at),
+            _max_timestamp(_coerce_utc(updated_at), _coerce_utc(created_at)),
         )
         workspace["last_job_at"] = _max_timestamp(
             workspace["last_job_at"], latest_job_event
@@ -1065,21 +1326,19 @@ def list_admin_workspaces(
             project_last_activity[clean_project_id], latest_job_event
         )
 
-        if created_utc and created_utc >= recent_7d_threshold:
-            if normalized_status == "failed":
-                workspace["job_failed_runs_7d"] = int(
-                    workspace["job_failed_runs_7d"]
-                ) + 1
-            if int(run_count or 0) > 1 or str(parent_job_id or "").strip():
-                workspace["job_retry_runs_7d"] = int(
-                    workspace["job_retry_runs_7d"]
-                ) + 1
-
-        token_count = int(max(0, int(input_tokens or 0)) + max(0, int(output_tokens or 0)))
-        workspace["job_token_total"] = int(workspace["job_token_total"]) + token_count
-        workspace["job_cost_total_usd"] = float(workspace["job_cost_total_usd"]) + max(
-            0.0, float(cost_usd or 0.0)
+        if normalized_status == "failed":
+            workspace["job_failed_runs_7d"] = int(
+                workspace["job_failed_runs_7d"]
+            ) + int(recent_runs or 0)
+        workspace["job_retry_runs_7d"] = int(workspace["job_retry_runs_7d"]) + int(
+            recent_retry_runs or 0
         )
+        workspace["job_token_total"] = int(workspace["job_token_total"]) + int(
+            token_total or 0
+        )
+        workspace["job_cost_total_usd"] = float(
+            workspace["job_cost_total_usd"]
+        ) + _safe_float(cost_total)
 
         if latest_job_event is not None:
             previous_time = latest_status_time_by_project.get(clean_project_id)
@@ -1251,187 +1510,187 @@ def get_admin_usage_costs(*, query: str = "") -> dict[str, object]:
     now = _utcnow()
     month_current = _month_start(now, months_ago=0)
     month_previous = _month_start(now, months_ago=1)
-    trend_months = [_month_start(now, months_ago=index) for index in range(5, -1, -1)]
-    trend_keys = [f"{item.year:04d}-{item.month:02d}" for item in trend_months]
+    trend_months = [
+        _month_start(now, months_ago=index)
+        for index in range(ADMIN_USAGE_TREND_MONTHS - 1, -1, -1)
+    ]
+    trend_keys = [_month_key(item) for item in trend_months]
     normalized_query = str(query or "").strip().lower()
 
+    rollups = _load_admin_usage_rollups(now=now, domains=[""])
+    job_status = func.lower(func.trim(func.coalesce(GenerationJob.status, "")))
+    run_count = func.coalesce(GenerationJob.run_count, 1)
+    model_expr = func.coalesce(
+        func.nullif(func.trim(GenerationJob.pricing_model), ""), "unknown-model"
+    )
+    model_cost = func.sum(_job_cost_expr())
+    user_jobs = (
+        select(
+            Project.owner_user_id.label("user_id"),
+            func.count(GenerationJob.id).label("tool_calls"),
+            func.sum(_job_tokens_expr()).label("tokens"),
+            func.sum(_job_cost_expr()).label("cost_usd"),
+        )
+        .join(Project, GenerationJob.project_id == Project.id)
+        .where(GenerationJob.created_at >= month_current)
+        .group_by(Project.owner_user_id)
+        .subquery()
+    )
+    user_storage = (
+        select(
+            DataLibraryAsset.owner_user_id.label("user_id"),
+            func.sum(_asset_bytes_expr()).label("storage_bytes"),
+        )
+        .group_by(DataLibraryAsset.owner_user_id)
+        .subquery()
+    )
+    user_cost = func.coalesce(user_jobs.c.cost_usd, 0.0)
+
     with session_scope() as session:
-        user_rows = session.execute(select(User.id, User.name, User.email)).all()
-        project_rows = session.execute(select(Project.id, Project.owner_user_id)).all()
-        job_rows = session.execute(
+        (
+            month_jobs,
+            month_tokens,
+            month_cost,
+            month_chain_length,
+            month_cancel_requested,
+            month_failed,
+            month_running,
+        ) = session.execute(
             select(
-                GenerationJob.project_id,
-                GenerationJob.pricing_model,
-                GenerationJob.estimated_input_tokens,
-                GenerationJob.estimated_output_tokens_high,
-                GenerationJob.estimated_cost_usd_high,
-                GenerationJob.status,
-                GenerationJob.run_count,
-                GenerationJob.created_at,
-            )
-        ).all()
-        asset_rows = session.execute(
+                func.count(GenerationJob.id),
+                func.sum(_job_tokens_expr()),
+                func.sum(_job_cost_expr()),
+                func.sum(case((run_count > 1, run_count), else_=1)),
+                func.sum(case((job_status == "cancel_requested", 1), else_=0)),
+                func.sum(case((job_status == "failed", 1), else_=0)),
+                func.sum(case((job_status == "running", 1), else_=0)),
+            ).where(GenerationJob.created_at >= month_current)
+        ).one()
+        model_rows = session.execute(
             select(
-                DataLibraryAsset.owner_user_id,
-                DataLibraryAsset.byte_size,
-                DataLibraryAsset.uploaded_at,
+                model_expr,
+                func.count(GenerationJob.id),
+                func.sum(_job_tokens_expr()),
+                model_cost,
             )
+            .where(GenerationJob.created_at >= month_current)
+            .group_by(model_expr)
+            .order_by(model_cost.desc(), model_expr)
+            .limit(20)
         ).all()
-        snapshot_rows = session.execute(
-            select(ManuscriptSnapshot.project_id, ManuscriptSnapshot.created_at)
-        ).all()
-
-    domain_by_user_id: dict[str, str] = {}
-    user_by_id: dict[str, dict[str, str]] = {}
-    for user_id, name, email in user_rows:
-        clean_user_id = str(user_id or "").strip()
-        if not clean_user_id:
-            continue
-        clean_email = str(email or "").strip()
-        domain_by_user_id[clean_user_id] = _extract_email_domain(clean_email)
-        user_by_id[clean_user_id] = {
-            "name": str(name or "").strip() or clean_email or clean_user_id,
-            "email": clean_email,
+        org_current = _generation_usage_by_domain(session, start=month_current)
+        org_previous = _generation_usage_by_domain(
+            session, start=month_previous, end=month_current
+        )
+        storage_by_domain = {
+            str(domain): int(total_bytes or 0)
+            for domain, total_bytes in session.execute(
+                select(_owner_domain_expr(), func.sum(_asset_bytes_expr()))
+                .select_from(DataLibraryAsset)
+                .outerjoin(User, DataLibraryAsset.owner_user_id == User.id)
+                .group_by(_owner_domain_expr())
+            ).all()
         }
-
-    owner_by_project_id: dict[str, str] = {}
-    for project_id, owner_user_id in project_rows:
-        clean_project_id = str(project_id or "").strip()
-        if clean_project_id:
-            owner_by_project_id[clean_project_id] = str(owner_user_id or "").strip()
-
-    model_usage: dict[str, dict[str, float | int]] = defaultdict(
-        lambda: {"tokens": 0, "cost_usd": 0.0, "tool_calls": 0}
-    )
-    org_usage: dict[str, dict[str, float | int]] = defaultdict(
-        lambda: {
-            "tokens": 0,
-            "cost_usd": 0.0,
-            "tool_calls": 0,
-            "storage_bytes": 0,
-            "previous_tokens": 0,
-            "previous_cost_usd": 0.0,
+        org_domains = sorted(
+            set(org_current) | set(org_previous) | set(storage_by_domain)
+        )
+        member_counts = {
+            str(domain): int(count or 0)
+            for domain, count in session.execute(
+                select(User.email_domain, func.count(User.id))
+                .where(User.email_domain.in_(org_domains))
+                .group_by(User.email_domain)
+            ).all()
         }
-    )
-    user_usage: dict[str, dict[str, float | int]] = defaultdict(
-        lambda: {"tokens": 0, "cost_usd": 0.0, "tool_calls": 0, "storage_bytes": 0}
-    )
-    trend_usage: dict[str, dict[str, float | int]] = defaultdict(
-        lambda: {"tokens": 0, "cost_usd": 0.0, "tool_calls": 0}
-    )
-
-    month_jobs = 0
-    month_tokens = 0
-    month_cost = 0.0
-    month_calls = 0
-    month_chain_length = 0.0
-    month_cancel_requested = 0
-    month_failed = 0
-    month_running = 0
-
-    for (
-        project_id,
-        pricing_model,
-        estimated_input_tokens,
-        estimated_output_tokens_high,
-        estimated_cost_usd_high,
-        status,
-        run_count,
-        created_at,
-    ) in job_rows:
-        created_utc = _coerce_utc(created_at)
-        if created_utc is None:
-            continue
-        owner_user_id = owner_by_project_id.get(str(project_id or "").strip(), "")
-        domain = domain_by_user_id.get(owner_user_id, "unknown.local")
-        model_name = str(pricing_model or "").strip() or "unknown-model"
-        job_status = str(status or "").strip().lower()
-        tokens = int(max(0, int(estimated_input_tokens or 0)) + max(0, int(estimated_output_tokens_high or 0)))
-        cost_usd = max(0.0, _safe_float(estimated_cost_usd_high))
-        month_key = f"{created_utc.year:04d}-{created_utc.month:02d}"
-        if month_key in trend_keys:
-            trend_bucket = trend_usage[month_key]
-            trend_bucket["tokens"] = int(trend_bucket["tokens"]) + tokens
-            trend_bucket["tool_calls"] = int(trend_bucket["tool_calls"]) + 1
-            trend_bucket["cost_usd"] = _safe_float(trend_bucket["cost_usd"]) + cost_usd
-
-        if created_utc >= month_current:
-            month_jobs += 1
-            month_tokens += tokens
-            month_cost += cost_usd
-            month_calls += 1
-            month_chain_length += max(1.0, _safe_float(run_count))
-            if job_status == "cancel_requested":
-                month_cancel_requested += 1
-            if job_status == "failed":
-                month_failed += 1
-            if job_status == "running":
-                month_running += 1
-
-            model_bucket = model_usage[model_name]
-            model_bucket["tokens"] = int(model_bucket["tokens"]) + tokens
-            model_bucket["tool_calls"] = int(model_bucket["tool_calls"]) + 1
-            model_bucket["cost_usd"] = _safe_float(model_bucket["cost_usd"]) + cost_usd
-
-            org_bucket = org_usage[domain]
-            org_bucket["tokens"] = int(org_bucket["tokens"]) + tokens
-            org_bucket["tool_calls"] = int(org_bucket["tool_calls"]) + 1
-            org_bucket["cost_usd"] = _safe_float(org_bucket["cost_usd"]) + cost_usd
-            if owner_user_id:
-                user_bucket = user_usage[owner_user_id]
-                user_bucket["tokens"] = int(user_bucket["tokens"]) + tokens
-                user_bucket["tool_calls"] = int(user_bucket["tool_calls"]) + 1
-                user_bucket["cost_usd"] = _safe_float(user_bucket["cost_usd"]) + cost_usd
-        elif created_utc >= month_previous:
-            org_bucket = org_usage[domain]
-            org_bucket["previous_tokens"] = int(org_bucket["previous_tokens"]) + tokens
-            org_bucket["previous_cost_usd"] = _safe_float(org_bucket["previous_cost_usd"]) + cost_usd
-
-    storage_total = 0
-    current_month_uploads = 0
-    for owner_user_id, byte_size, uploaded_at in asset_rows:
-        owner_id = str(owner_user_id or "").strip()
-        domain = domain_by_user_id.get(owner_id, "unknown.local")
-        bytes_value = max(0, int(byte_size or 0))
-        storage_total += bytes_value
-        org_usage[domain]["storage_bytes"] = int(org_usage[domain]["storage_bytes"]) + bytes_value
-        if owner_id:
-            user_usage[owner_id]["storage_bytes"] = int(user_usage[owner_id]["storage_bytes"]) + bytes_value
-        uploaded_utc = _coerce_utc(uploaded_at)
-        if uploaded_utc and uploaded_utc >= month_current:
-            current_month_uploads += 1
+        user_stmt = (
+            select(
+                User.id,
+                User.name,
+                User.email,
+                user_jobs.c.tool_calls,
+                user_jobs.c.tokens,
+                user_cost,
+                user_storage.c.storage_bytes,
+            )
+            .outerjoin(user_jobs, user_jobs.c.user_id == User.id)
+            .outerjoin(user_storage, user_storage.c.user_id == User.id)
+            .where(
+                or_(
+                    user_jobs.c.user_id.is_not(None),
+                    user_storage.c.user_id.is_not(None),
+                )
+            )
+            .order_by(user_cost.desc(), User.email)
+            .limit(50)
+        )
+        if normalized_query:
+            user_stmt = user_stmt.where(
+                or_(
+                    func.lower(User.name).contains(normalized_query, autoescape=True),
+                    func.lower(User.email).contains(normalized_query, autoescape=True),
+                )
+            )
+        user_rows = session.execute(user_stmt).all()
+        storage_total = int(
+            session.scalar(
+                select(func.sum(_asset_bytes_expr())).select_from(DataLibraryAsset)
+            )
+            or 0
+        )
+        current_month_uploads = int(
+            session.scalar(
+                select(func.count(DataLibraryAsset.id)).where(
+                    DataLibraryAsset.uploaded_at >= month_current
+                )
+            )
+            or 0
+        )
+        current_month_exports = int(
+            session.scalar(
+                select(func.count(ManuscriptSnapshot.id)).where(
+                    ManuscriptSnapshot.created_at >= month_current
+                )
+            )
+            or 0
+        )
 
-    current_month_exports = 0
-    for _, created_at in snapshot_rows:
-        created_utc = _coerce_utc(created_at)
-        if created_utc and created_utc >= month_current:
-            current_month_exports += 1
+    month_jobs = int(month_jobs or 0)
+    month_tokens = int(month_tokens or 0)
+    month_cost = _safe_float(month_cost)
+    month_calls = month_jobs
 
     model_items = []
-    for model_name, bucket in model_usage.items():
-        tool_calls = int(bucket["tool_calls"])
-        total_cost = round(_safe_float(bucket["cost_usd"]), 4)
+    for model_name, tool_calls, tokens, cost_usd in model_rows:
+        total_cost = round(_safe_float(cost_usd), 4)
         model_items.append(
             {
-                "model": model_name,
-                "tokens_current_month": int(bucket["tokens"]),
-                "tool_calls_current_month": tool_calls,
+                "model": str(model_name),
+                "tokens_current_month": int(tokens or 0),
+                "tool_calls_current_month": int(tool_calls or 0),
                 "cost_usd_current_month": total_cost,
-                "avg_cost_usd_per_call": round(total_cost / max(1, tool_calls), 6),
+                "avg_cost_usd_per_call": round(
+                    total_cost / max(1, int(tool_calls or 0)), 6
+                ),
             }
         )
-    model_items.sort(key=lambda item: (-_safe_float(item["cost_usd_current_month"]), str(item["model"])))
 
+    empty_usage = {"tool_calls": 0, "tokens": 0, "cost_usd": 0.0}
     org_items = []
     quota_breaches = 0
     budget_alerts = 0
-    for domain, bucket in org_usage.items():
-        member_count = sum(1 for item in domain_by_user_id.values() if item == domain)
-        plan = _resolve_plan(domain=domain, member_count=member_count, project_count=0)
+    for domain in org_domains:
+        current_usage = org_current.get(domain, empty_usage)
+        previous_usage = org_previous.get(domain, empty_usage)
+        plan = _resolve_plan(
+            domain=domain,
+            member_count=int(member_counts.get(domain, 0)),
+            project_count=0,
+        )
         quota_tokens = int(PLAN_LIMITS.get(plan, PLAN_LIMITS["growth"])["monthly_token_quota"])
-        tokens_current = int(bucket["tokens"])
-        cost_current = round(_safe_float(bucket["cost_usd"]), 4)
-        cost_previous = round(_safe_float(bucket["previous_cost_usd"]), 4)
+        tokens_current = int(current_usage["tokens"])
+        tokens_previous = int(previous_usage["tokens"])
+        cost_current = round(_safe_float(current_usage["cost_usd"]), 4)
+        cost_previous = round(_safe_float(previous_usage["cost_usd"]), 4)
         if tokens_current > quota_tokens:
             quota_breaches += 1
         if cost_previous > 0 and cost_current > cost_previous * 1.35:
@@ -1442,13 +1701,13 @@ def get_admin_usage_costs(*, query: str = "") -> dict[str, object]:
             "domain": domain,
             "plan": plan,
             "tokens_current_month": tokens_current,
-            "tokens_previous_month": int(bucket["previous_tokens"]),
-            "tokens_trend_pct": _percent_change(tokens_current, int(bucket["previous_tokens"])),
-            "tool_calls_current_month": int(bucket["tool_calls"]),
+            "tokens_previous_month": tokens_previous,
+            "tokens_trend_pct": _percent_change(tokens_current, tokens_previous),
+            "tool_calls_current_month": int(current_usage["tool_calls"]),
             "cost_usd_current_month": cost_current,
             "cost_usd_previous_month": cost_previous,
             "cost_trend_pct": _percent_change(cost_current, cost_previous),
-            "storage_bytes": int(bucket["storage_bytes"]),
+            "storage_bytes": int(storage_by_domain.get(domain, 0)),
             "token_quota_monthly": quota_tokens,
             "quota_used_pct": round((tokens_current / max(1, quota_tokens)) * 100.0, 2),
         }
@@ -1460,29 +1719,36 @@ def get_admin_usage_costs(*, query: str = "") -> dict[str, object]:
     org_items.sort(key=lambda item: (-_safe_float(item["cost_usd_current_month"]), str(item["domain"])))
 
     user_items = []
-    for user_id, bucket in user_usage.items():
-        user_meta = user_by_id.get(user_id)
-        if not user_meta:
-            continue
-        item = {
-            "user_id": user_id,
-            "name": user_meta["name"],
-            "email": user_meta["email"],
-            "tokens_current_month": int(bucket["tokens"]),
-            "tool_calls_current_month": int(bucket["tool_calls"]),
-            "cost_usd_current_month": round(_safe_float(bucket["cost_usd"]), 4),
-            "storage_bytes": int(bucket["storage_bytes"]),
-        }
-        if normalized_query:
-            searchable = " ".join([item["name"], item["email"]]).lower()
-            if normalized_query not in searchable:
-                continue
-        user_items.append(item)
-    user_items.sort(key=lambda item: (-_safe_float(item["cost_usd_current_month"]), str(item["email"])))
+    for user_id, name, email, tool_calls, tokens, cost_usd, storage_bytes in user_rows:
+        clean_user_id = str(user_id or "").strip()
+        clean_email = str(email or "").strip()
+        user_items.append(
+            {
+                "user_id": clean_user_id,
+                "name": str(name or "").strip() or clean_email or clean_user_id,
+                "email": clean_email,
+                "tokens_current_month": int(tokens or 0),
+                "tool_calls_current_month": int(tool_calls or 0),
+                "cost_usd_current_month": round(_safe_float(cost_usd), 4),
+                "storage_bytes": int(storage_bytes or 0),
+            }
+        )
 
+    live_trend = {
+        _month_key(month_previous): {
+            "tool_calls": sum(int(item["tool_calls"]) for item in org_previous.values()),
+            "tokens": sum(int(item["tokens"]) for item in org_previous.values()),
+            "cost_usd": sum(_safe_float(item["cost_usd"]) for item in org_previous.values()),
+        },
+        _month_key(month_current): {
+            "tool_calls": month_calls,
+            "tokens": month_tokens,
+            "cost_usd": month_cost,
+        },
+    }
     trend_items = []
     for month_key in trend_keys:
-        bucket = trend_usage[month_key]
+        bucket = live_trend.get(month_key) or rollups.get((month_key, ""), empty_usage)
         trend_items.append(
             {
                 "month": month_key,
@@ -1499,15 +1765,17 @@ def get_admin_usage_costs(*, query: str = "") -> dict[str, object]:
             "tool_calls_current_month": month_calls,
             "cost_usd_current_month": round(month_cost, 4),
             "storage_bytes_total": storage_total,
-            "avg_chain_length": round(month_chain_length / max(1, month_jobs), 3),
+            "avg_chain_length": round(
+                _safe_float(month_chain_length) / max(1, month_jobs), 3
+            ),
             "cache_hit_rate_pct": 0.0,
-            "rate_limit_events_current_month": month_cancel_requested,
+            "rate_limit_events_current_month": int(month_cancel_requested or 0),
             "quota_breaches_current_month": quota_breaches,
             "budget_alerts_current_month": budget_alerts,
-            "failed_runs_current_month": month_failed,
-            "running_runs_current": month_running,
+            "failed_runs_current_month": int(month_failed or 0),
+            "running_runs_current": int(month_running or 0),
         },
-        "model_usage": model_items[:20],
+        "model_usage": model_items,
         "tool_usage": [
             {
                 "tool_type": "manuscript_generation",
@@ -1526,7 +1794,7 @@ def get_admin_usage_costs(*, query: str = "") -> dict[str, object]:
             },
         ],
         "organisation_usage": org_items[:50],
-        "user_usage": user_items[:50],
+        "user_usage": user_items,
         "monthly_trend": trend_items,
     }
 
@@ -1669,6 +1937,10 @@ def get_admin_api_monitor(*, query: str = "") -> dict[str, object]:
             if isinstance(telemetry.get("monthly_trend"), list)
             else []
         ),
+        "http_clients": get_http_client_stats(),
+        "publication_insights_draft_cache": (
+            get_publication_insights_draft_cache_stats()
+        ),
     }
 
 
@@ -2052,7 +2324,13 @@ def list_admin_users(
             .limit(normalized_limit)
         ).all()
         total = int(session.scalar(total_stmt) or 0)
-        items = [_serialize_admin_user(user) for user in users]
+        citation_summaries = _admin_user_citation_summaries(
+            session=session, user_ids=[user.id for user in users]
+        )
+        items = [
+            {**_serialize_admin_user(user), **citation_summaries.get(user.id, {})}
+            for user in users
+        ]
 
     return {
         "items": items,
@@ -3129,6 +3407,7 @@ def list_admin_jobs(
             + int(status_counts.get("cancelled", 0)),
             "backlog_jobs": queued_count + cancel_requested_count,
         },
+        "background_queue": get_job_queue_stats(),
     }
 
 
@@ -3595,3 +3874,14 @@ def list_admin_audit_events(
             "action_totals": action_totals[:12],
         },
     }
+
+
+def _run_admin_usage_rollup_job(payload: dict[str, Any]) -> None:
+    refresh_admin_usage_rollups()
+
+
+register_job_kind(
+    ADMIN_USAGE_ROLLUP_JOB_KIND,
+    _run_admin_usage_rollup_job,
+    max_concurrency=1,
+)
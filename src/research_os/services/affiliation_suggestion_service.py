@@ -14,6 +14,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 import httpx
+from research_os.clients.http_client import ProviderClient, provider_client
 from research_os.clients.openai_client import create_response
 from research_os.services.api_telemetry_service import record_api_usage_event
 
@@ -435,7 +436,7 @@ def _merge_items(primary: dict[str, Any], secondary: dict[str, Any]) -> dict[str
 
 def _request_json(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     url: str,
     params: dict[str, Any],
     headers: dict[str, str] | None = None,
@@ -489,7 +490,7 @@ def _request_json(
 
 def _request_json_list(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     url: str,
     params: dict[str, Any],
     headers: dict[str, str] | None = None,
@@ -545,7 +546,7 @@ def _request_json_list(
 
 def _fetch_openalex_autocomplete(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     query: str,
     limit: int,
     retry_count: int | None = None,
@@ -603,7 +604,7 @@ def _fetch_openalex_autocomplete(
 
 def _fetch_openalex(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     query: str,
     limit: int,
     retry_count: int | None = None,
@@ -708,7 +709,7 @@ def _extract_ror_name(raw: dict[str, Any]) -> str:
 
 def _fetch_ror(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     query: str,
     limit: int,
     retry_count: int | None = None,
@@ -838,7 +839,7 @@ def _should_keep_nominatim_suggestion(
 
 def _fetch_nominatim_suggestions(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     query: str,
     limit: int,
     retry_count: int | None = None,
@@ -908,7 +909,7 @@ def _fetch_nominatim_suggestions(
 
 def _fetch_clearbit(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     query: str,
     limit: int,
     retry_count: int | None = None,
@@ -955,7 +956,7 @@ def _fetch_clearbit(
 
 def _fetch_openalex_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
     timeout = httpx.Timeout(_fast_timeout_seconds())
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         return _fetch_openalex(
             client=client,
             query=query,
@@ -966,7 +967,7 @@ def _fetch_openalex_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
 
 def _fetch_ror_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
     timeout = httpx.Timeout(_fast_timeout_seconds())
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         return _fetch_ror(
             client=client,
             query=query,
@@ -977,7 +978,7 @@ def _fetch_ror_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
 
 def _fetch_openstreetmap_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
     timeout = httpx.Timeout(_fast_timeout_seconds())
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         return _fetch_nominatim_suggestions(
             client=client,
             query=query,
@@ -988,7 +989,7 @@ def _fetch_openstreetmap_provider(*, query: str, limit: int) -> list[dict[str, A
 
 def _fetch_clearbit_provider(*, query: str, limit: int) -> list[dict[str, Any]]:
     timeout = httpx.Timeout(_fast_timeout_seconds())
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         return _fetch_clearbit(
             client=client,
             query=query,
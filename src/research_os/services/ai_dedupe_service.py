@@ -3,12 +3,24 @@ AI-powered automatic collaborator deduplication service.
 
 This module provides automatic duplicate detection and merging using OpenAI.
 It runs automatically after imports and enrichments, and can run as a background job.
+
+Only a ranked shortlist of candidate pairs reaches the model. Candidates come
+from blocking keys (phonetic surname plus first initial, including swapped
+name order) and a normalised-name trigram index, and are ranked by a cheap
+similarity score. Pairs sharing an ORCID, OpenAlex ID, or email are already
+collapsed by the collaboration listing; pairs with conflicting ORCID or
+OpenAlex IDs are different people. Neither kind is sent to the model.
 """
 
 import json
 import logging
 import os
 import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import combinations
 from typing import Any
 
 from sqlalchemy import delete, func, select
@@ -19,6 +31,11 @@ from research_os.db import (
     CollaborationMetric,
     session_scope,
 )
+from research_os.services.collaboration_service import (
+    email_identity_key,
+    openalex_identity_key,
+    parse_name_parts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +47,60 @@ except ImportError:
 
 _ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-[\dX]{4}$")
 AI_DEDUPE_CONFIDENCE_THRESHOLD = 0.92  # Auto-merge if AI is 92%+ confident
+AI_DEDUPE_BATCH_SIZE = 10
+_NAME_TRIGRAM_MIN_SHARED_RATIO = 0.5
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+@dataclass(frozen=True)
+class _DedupeProfile:
+    id: str
+    summary: str
+    name_key: str
+    surname: str
+    given: tuple[str, ...]
+    orcid: str
+    openalex: str
+    emails: frozenset[str]
+    institutions: frozenset[str]
+    country: str
+    first_year: int | None
+    last_year: int | None
+
+
+def _env_int(name: str, default: int, *, minimum: int, maximum: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        value = default
+    return max(minimum, min(maximum, value))
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        value = default
+    return max(0.0, min(1.0, value))
+
+
+def _max_pairs_per_run() -> int:
+    return _env_int("AI_DEDUPE_MAX_PAIRS_PER_RUN", 200, minimum=0, maximum=5000)
+
+
+def _max_block_size() -> int:
+    return _env_int("AI_DEDUPE_MAX_BLOCK_SIZE", 100, minimum=2, maximum=5000)
+
+
+def _min_candidate_score() -> float:
+    return _env_float("AI_DEDUPE_MIN_CANDIDATE_SCORE", 0.55)
 
 
 def _normalize_orcid_id(value: str | None) -> str | None:
@@ -44,25 +115,54 @@ def _normalize_orcid_id(value: str | None) -> str | None:
     return formatted
 
 
-def _build_collaborator_summary(session, collaborator: Collaborator) -> str:
+def _fold_name(value: str | None) -> str:
+    decomposed = unicodedata.normalize("NFKD", str(value or ""))
+    ascii_text = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return re.sub(r"\s+", " ", re.sub(r"[^a-z,\s]", " ", ascii_text.lower())).strip()
+
+
+def _soundex(token: str) -> str:
+    letters = [ch for ch in token if "a" <= ch <= "z"]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for ch in letters[1:]:
+        digit = _SOUNDEX_CODES.get(ch, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if ch not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def _name_trigrams(name_key: str) -> set[str]:
+    padded = f"  {name_key.replace(',', '')} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _blocking_keys(profile: _DedupeProfile) -> set[str]:
+    """Phonetic surname + first-initial keys, covering swapped name order."""
+    keys: set[str] = set()
+    surname_tokens = profile.surname.split()
+    if surname_tokens and profile.given:
+        keys.add(f"{_soundex(surname_tokens[-1])}:{profile.given[0][0]}")
+    # "Mehmood Zia" parses with surname "zia"; keying the first token as the
+    # surname lets it meet "Zia Mehmood".
+    tokens = profile.name_key.replace(",", " ").split()
+    if len(tokens) >= 2:
+        keys.add(f"{_soundex(tokens[0])}:{tokens[-1][0]}")
+    return keys
+
+
+def _format_collaborator_summary(
+    collaborator: Collaborator,
+    metric: CollaborationMetric | None,
+    institutions: set[str],
+) -> str:
     """Build concise summary for AI analysis."""
-    metric = session.scalars(
-        select(CollaborationMetric).where(
-            CollaborationMetric.collaborator_id == collaborator.id
-        )
-    ).first()
-    
-    affiliations = session.scalars(
-        select(CollaboratorAffiliation).where(
-            CollaboratorAffiliation.collaborator_id == collaborator.id
-        )
-    ).all()
-    
-    institutions = {collaborator.primary_institution} if collaborator.primary_institution else set()
-    for aff in affiliations:
-        if aff.institution_name:
-            institutions.add(aff.institution_name)
-    
     parts = [f"Name: {collaborator.full_name}"]
     if collaborator.email:
         parts.append(f"Email: {collaborator.email}")
@@ -82,6 +182,205 @@ def _build_collaborator_summary(session, collaborator: Collaborator) -> str:
     return " | ".join(parts)
 
 
+def _load_dedupe_profiles(
+    session, collaborators: list[Collaborator]
+) -> list[_DedupeProfile]:
+    """Build profiles with one metrics and one affiliations query for all collaborators."""
+    collaborator_ids = [str(collab.id) for collab in collaborators]
+    metrics_by_id = {
+        str(metric.collaborator_id): metric
+        for metric in session.scalars(
+            select(CollaborationMetric).where(
+                CollaborationMetric.collaborator_id.in_(collaborator_ids)
+            )
+        ).all()
+    }
+    institutions_by_id: dict[str, set[str]] = defaultdict(set)
+    for collaborator_id, institution_name in session.execute(
+        select(
+            CollaboratorAffiliation.collaborator_id,
+            CollaboratorAffiliation.institution_name,
+        ).where(CollaboratorAffiliation.collaborator_id.in_(collaborator_ids))
+    ).all():
+        if institution_name:
+            institutions_by_id[str(collaborator_id)].add(institution_name)
+
+    profiles: list[_DedupeProfile] = []
+    for collab in collaborators:
+        collaborator_id = str(collab.id)
+        metric = metrics_by_id.get(collaborator_id)
+        institutions = set(institutions_by_id.get(collaborator_id, set()))
+        if collab.primary_institution:
+            institutions.add(collab.primary_institution)
+        name_key = _fold_name(collab.full_name)
+        surname, given = parse_name_parts(name_key)
+        profiles.append(
+            _DedupeProfile(
+                id=collaborator_id,
+                summary=_format_collaborator_summary(collab, metric, institutions),
+                name_key=name_key,
+                surname=surname,
+                given=tuple(part for part in given if part),
+                orcid=_normalize_orcid_id(collab.orcid_id) or "",
+                openalex=openalex_identity_key(collab.openalex_author_id),
+                emails=frozenset(
+                    key
+                    for key in (
+                        email_identity_key(collab.email),
+                        email_identity_key(collab.secondary_email),
+                    )
+                    if key
+                ),
+                institutions=frozenset(
+                    _fold_name(name) for name in institutions if _fold_name(name)
+                ),
+                country=str(collab.country or "").strip().lower(),
+                first_year=metric.first_collaboration_year if metric else None,
+                last_year=metric.last_collaboration_year if metric else None,
+            )
+        )
+    return profiles
+
+
+def _same_identity(a: _DedupeProfile, b: _DedupeProfile) -> bool:
+    return bool(
+        (a.orcid and a.orcid == b.orcid)
+        or (a.openalex and a.openalex == b.openalex)
+        or (a.emails & b.emails)
+    )
+
+
+def _conflicting_identity(a: _DedupeProfile, b: _DedupeProfile) -> bool:
+    return bool(
+        (a.orcid and b.orcid and a.orcid != b.orcid)
+        or (a.openalex and b.openalex and a.openalex != b.openalex)
+    )
+
+
+def _given_name_score(given_a: tuple[str, ...], given_b: tuple[str, ...]) -> float:
+    if given_a == given_b:
+        return 1.0
+    # "Z" against "Zia", or "Zia" against "Zia K": abbreviated or missing
+    # parts that agree where both sides have them.
+    if all(
+        left.startswith(right) or right.startswith(left)
+        for left, right in zip(given_a, given_b)
+    ):
+        return 0.8
+    return SequenceMatcher(None, " ".join(given_a), " ".join(given_b)).ratio()
+
+
+def _score_candidate_pair(a: _DedupeProfile, b: _DedupeProfile) -> float:
+    """Cheap 0-1 likelihood that two profiles are the same person.
+
+    Names dominate; institutions, country, and overlapping collaboration
+    periods break ties. Conflicting full first names score zero.
+    """
+    if not a.given or not b.given or a.given[0][0] != b.given[0][0]:
+        swapped = sorted(a.name_key.replace(",", " ").split()) == sorted(
+            b.name_key.replace(",", " ").split()
+        )
+        if not swapped:
+            return 0.0
+        name_score = 1.0
+    else:
+        first_a, first_b = a.given[0], b.given[0]
+        if (
+            len(first_a) > 1
+            and len(first_b) > 1
+            and not first_a.startswith(first_b)
+            and not first_b.startswith(first_a)
+            and SequenceMatcher(None, first_a, first_b).ratio() < 0.8
+        ):
+            return 0.0
+        surname_score = SequenceMatcher(None, a.surname, b.surname).ratio()
+        name_score = 0.7 * surname_score + 0.3 * _given_name_score(a.given, b.given)
+
+    institution_score = 0.0
+    if a.institutions and b.institutions:
+        tokens_a = {token for name in a.institutions for token in name.split()}
+        tokens_b = {token for name in b.institutions for token in name.split()}
+        institution_score = len(tokens_a & tokens_b) / max(1, len(tokens_a | tokens_b))
+    country_score = 1.0 if a.country and a.country == b.country else 0.0
+    period_score = 0.0
+    if None not in (a.first_year, a.last_year, b.first_year, b.last_year):
+        overlap = min(a.last_year, b.last_year) - max(a.first_year, b.first_year)
+        period_score = 1.0 if overlap >= -2 else 0.0
+    return round(
+        0.65 * name_score
+        + 0.2 * institution_score
+        + 0.1 * country_score
+        + 0.05 * period_score,
+        4,
+    )
+
+
+def _generate_candidate_pairs(
+    profiles: list[_DedupeProfile],
+) -> tuple[list[tuple[float, _DedupeProfile, _DedupeProfile]], dict[str, int]]:
+    """Return pairs worth asking the model about, best first, plus stage counts.
+
+    Candidates come from blocking-key buckets and from a trigram index over
+    normalised names. Buckets and postings above ``AI_DEDUPE_MAX_BLOCK_SIZE``
+    are skipped, so the work stays near-linear in the number of collaborators.
+    """
+    max_block = _max_block_size()
+    blocks: dict[str, list[int]] = defaultdict(list)
+    postings: dict[str, list[int]] = defaultdict(list)
+    trigrams: list[set[str]] = []
+    for index, profile in enumerate(profiles):
+        for key in _blocking_keys(profile):
+            blocks[key].append(index)
+        grams = _name_trigrams(profile.name_key)
+        trigrams.append(grams)
+        for gram in grams:
+            postings[gram].append(index)
+
+    candidates: set[tuple[int, int]] = set()
+    oversized_blocks = 0
+    for members in blocks.values():
+        if len(members) > max_block:
+            oversized_blocks += 1
+            continue
+        candidates.update(combinations(sorted(set(members)), 2))
+
+    shared_counts: dict[tuple[int, int], int] = defaultdict(int)
+    for members in postings.values():
+        if len(members) > max_block:
+            continue
+        for pair in combinations(members, 2):
+            shared_counts[pair] += 1
+    for (left, right), shared in shared_counts.items():
+        smaller = min(len(trigrams[left]), len(trigrams[right]))
+        if smaller and shared / smaller >= _NAME_TRIGRAM_MIN_SHARED_RATIO:
+            candidates.add((left, right))
+
+    min_score = _min_candidate_score()
+    identity_pairs = 0
+    conflicting_pairs = 0
+    scored: list[tuple[float, _DedupeProfile, _DedupeProfile]] = []
+    for left, right in candidates:
+        a, b = profiles[left], profiles[right]
+        if _same_identity(a, b):
+            identity_pairs += 1
+            continue
+        if _conflicting_identity(a, b):
+            conflicting_pairs += 1
+            continue
+        score = _score_candidate_pair(a, b)
+        if score >= min_score:
+            scored.append((score, a, b))
+    scored.sort(key=lambda row: (-row[0], row[1].id, row[2].id))
+    return scored, {
+        "possible_pairs": len(profiles) * (len(profiles) - 1) // 2,
+        "pairs_considered": len(candidates),
+        "identity_pairs": identity_pairs,
+        "conflicting_identity_pairs": conflicting_pairs,
+        "oversized_blocks": oversized_blocks,
+        "ambiguous_pairs": len(scored),
+    }
+
+
 def _ask_ai_batch_duplicates(client: OpenAI, summaries: list[tuple[str, str, str]]) -> list[dict[str, Any]]:
     """
     Ask AI to identify duplicates in a batch.
@@ -215,6 +514,18 @@ def _merge_collaborators(session, keep_id: str, merge_id: str) -> bool:
         return False
 
 
+def _empty_dedupe_result() -> dict[str, Any]:
+    return {
+        "checked_pairs": 0,
+        "duplicates_found": 0,
+        "merged_count": 0,
+        "skipped_low_confidence": 0,
+        "possible_pairs": 0,
+        "pairs_considered": 0,
+        "pairs_sent": 0,
+    }
+
+
 def auto_dedupe_collaborators(*, user_id: str) -> dict[str, Any]:
     """
     Automatically detect and merge duplicate collaborators using AI.
@@ -230,18 +541,24 @@ def auto_dedupe_collaborators(*, user_id: str) -> dict[str, Any]:
             "duplicates_found": int,
             "merged_count": int,
             "skipped_low_confidence": int,
+            "possible_pairs": int,
+            "pairs_considered": int,
+            "pairs_sent": int,
         }
+
+        ``possible_pairs`` is every pair of the user's collaborators,
+        ``pairs_considered`` the pairs produced by blocking, and
+        ``pairs_sent`` (also ``checked_pairs``) the ranked shortlist sent to
+        the model, capped by ``AI_DEDUPE_MAX_PAIRS_PER_RUN``.
     """
     if not OPENAI_AVAILABLE:
         logger.warning("OpenAI not available, skipping AI deduplication")
-        return {"checked_pairs": 0, "duplicates_found": 0, "merged_count": 0, "skipped_low_confidence": 0}
+        return _empty_dedupe_result()
     
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         logger.warning("OPENAI_API_KEY not set, skipping AI deduplication")
-        return {"checked_pairs": 0, "duplicates_found": 0, "merged_count": 0, "skipped_low_confidence": 0}
-    
-    client = OpenAI(api_key=api_key)
+        return _empty_dedupe_result()
     
     with session_scope() as session:
         collaborators = session.scalars(
@@ -249,73 +566,81 @@ def auto_dedupe_collaborators(*, user_id: str) -> dict[str, Any]:
         ).all()
         
         if len(collaborators) < 2:
-            return {"checked_pairs": 0, "duplicates_found": 0, "merged_count": 0, "skipped_low_confidence": 0}
+            return _empty_dedupe_result()
         
-        # Build summaries
-        summaries = {}
-        for collab in collaborators:
-            summaries[str(collab.id)] = _build_collaborator_summary(session, collab)
+        profiles = _load_dedupe_profiles(session, list(collaborators))
+        candidates, stage_counts = _generate_candidate_pairs(profiles)
+        shortlist = candidates[: _max_pairs_per_run()]
+        pairs_to_check = [
+            (a.id, b.id, f"A: {a.summary}\nB: {b.summary}")
+            for _, a, b in shortlist
+        ]
+        result = {
+            **_empty_dedupe_result(),
+            "checked_pairs": len(pairs_to_check),
+            "possible_pairs": stage_counts["possible_pairs"],
+            "pairs_considered": stage_counts["pairs_considered"],
+            "pairs_sent": len(pairs_to_check),
+        }
+        logger.info(
+            "ai_dedupe_candidates",
+            extra={"user_id": user_id, **stage_counts, "pairs_sent": len(pairs_to_check)},
+        )
         
-        # Check pairs (skip if they have matching identity markers)
-        pairs_to_check = []
-        checked_pairs = 0
+        if not pairs_to_check:
+            return result
         
-        for i, c1 in enumerate(collaborators):
-            for c2 in collaborators[i+1:]:
-                # Skip obvious non-duplicates
-                if c1.openalex_author_id and c2.openalex_author_id and c1.openalex_author_id == c2.openalex_author_id:
-                    continue
-                if c1.orcid_id and c2.orcid_id and c1.orcid_id == c2.orcid_id:
+        client = OpenAI(api_key=api_key)
+        
+        # Analyze in batches; results are matched back by their "pair" number
+        # so a short or failed batch cannot shift later verdicts onto other pairs.
+        verdicts: list[tuple[tuple[str, str, str], dict[str, Any]]] = []
+        for i in range(0, len(pairs_to_check), AI_DEDUPE_BATCH_SIZE):
+            batch = pairs_to_check[i:i+AI_DEDUPE_BATCH_SIZE]
+            for position, verdict in enumerate(_ask_ai_batch_duplicates(client, batch)):
+                if not isinstance(verdict, dict):
                     continue
-                if c1.email and c2.email and c1.email == c2.email:
+                try:
+                    pair_number = int(verdict.get("pair", position + 1))
+                except (TypeError, ValueError):
                     continue
-                
-                summary1 = summaries[str(c1.id)]
-                summary2 = summaries[str(c2.id)]
-                pair_summary = f"A: {summary1}\nB: {summary2}"
-                
-                pairs_to_check.append((str(c1.id), str(c2.id), pair_summary))
-                checked_pairs += 1
-        
-        if not pairs_to_check:
-            return {"checked_pairs": 0, "duplicates_found": 0, "merged_count": 0, "skipped_low_confidence": 0}
-        
-        # Analyze in batches
-        batch_size = 10
-        results = []
-        for i in range(0, len(pairs_to_check), batch_size):
-            batch = pairs_to_check[i:i+batch_size]
-            batch_results = _ask_ai_batch_duplicates(client, batch)
-            results.extend(batch_results)
+                if 1 <= pair_number <= len(batch):
+                    verdicts.append((batch[pair_number - 1], verdict))
         
         # Merge high-confidence duplicates
         duplicates_found = 0
         merged_count = 0
         skipped_low_confidence = 0
+        merged_ids: set[str] = set()
         
-        for i, result in enumerate(results):
-            if not result.get("is_duplicate"):
+        for (id1, id2, _), verdict in verdicts:
+            if not verdict.get("is_duplicate"):
                 continue
             
             duplicates_found += 1
-            confidence = float(result.get("confidence", 0.0))
+            try:
+                confidence = float(verdict.get("confidence", 0.0))
+            except (TypeError, ValueError):
+                confidence = 0.0
             
             if confidence >= AI_DEDUPE_CONFIDENCE_THRESHOLD:
-                id1, id2, _ = pairs_to_check[i]
+                if id1 in merged_ids or id2 in merged_ids:
+                    continue
                 if _merge_collaborators(session, id1, id2):
+                    merged_ids.add(id2)
                     merged_count += 1
                     logger.info(f"AI auto-merged collaborators {id1} and {id2} (confidence: {confidence:.0%})")
                 else:
                     logger.warning(f"Failed to merge {id1} and {id2}")
             else:
                 skipped_low_confidence += 1
-                logger.info(f"Skipped low-confidence match ({confidence:.0%}): {result.get('reasoning')}")
+                logger.info(f"Skipped low-confidence match ({confidence:.0%}): {verdict.get('reasoning')}")
         
         session.commit()
         
-        return {
-            "checked_pairs": checked_pairs,
-            "duplicates_found": duplicates_found,
-            "merged_count": merged_count,
-            "skipped_low_confidence": skipped_low_confidence,
-        }
+        result.update(
+            duplicates_found=duplicates_found,
+            merged_count=merged_count,
+            skipped_low_confidence=skipped_low_confidence,
+        )
+        return result
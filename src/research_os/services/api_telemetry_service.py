@@ -1,16 +1,59 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import atexit
+import logging
+import os
+import random
+import threading
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from uuid import uuid4
 
 from research_os.platform_compat import patch_windows_platform_machine
 
 patch_windows_platform_machine()
 
-from sqlalchemy import select
+from sqlalchemy import case, insert, or_, select
 
-from research_os.db import ApiProviderUsageEvent, create_all_tables, session_scope
+from research_os.db import (
+    ApiProviderUsageEvent,
+    ApiProviderUsageRollup,
+    create_all_tables,
+    dialect_insert,
+    session_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_SINK_MODE_ASYNC = "async"
+TELEMETRY_SINK_MODE_INLINE = "inline"
+
+_ROLLUP_COUNTER_FIELDS = (
+    "calls",
+    "errors",
+    "duration_ms_total",
+    "tokens_input",
+    "tokens_output",
+    "cost_usd",
+)
+
+_buffer_lock = threading.Lock()
+_event_buffer: deque[dict[str, Any]] = deque()
+_pending_rollups: dict[tuple[str, str, datetime], dict[str, Any]] = {}
+_flush_lock = threading.Lock()
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+_writer_stop = threading.Event()
+_writer_wake = threading.Event()
+_sink_stats = {
+    "recorded": 0,
+    "written": 0,
+    "sampled_out": 0,
+    "dropped": 0,
+    "failed": 0,
+}
+_last_flush_at: datetime | None = None
 
 
 def _utcnow() -> datetime:
@@ -40,6 +83,241 @@ def _month_start(anchor: datetime, *, months_ago: int = 0) -> datetime:
     return datetime(year, month, 1, tzinfo=timezone.utc)
 
 
+def _hour_start(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _as_utc(value: Any) -> datetime | None:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _telemetry_sink_mode() -> str:
+    value = (
+        str(os.getenv("API_TELEMETRY_SINK_MODE", TELEMETRY_SINK_MODE_ASYNC))
+        .strip()
+        .lower()
+    )
+    if value == TELEMETRY_SINK_MODE_INLINE:
+        return TELEMETRY_SINK_MODE_INLINE
+    return TELEMETRY_SINK_MODE_ASYNC
+
+
+def _telemetry_buffer_size() -> int:
+    try:
+        value = int(os.getenv("API_TELEMETRY_BUFFER_SIZE", "10000"))
+    except ValueError:
+        value = 10000
+    return max(10, min(1_000_000, value))
+
+
+def _telemetry_flush_batch_size() -> int:
+    try:
+        value = int(os.getenv("API_TELEMETRY_FLUSH_BATCH_SIZE", "500"))
+    except ValueError:
+        value = 500
+    return max(1, min(50_000, value))
+
+
+def _telemetry_flush_interval_seconds() -> float:
+    try:
+        value = float(os.getenv("API_TELEMETRY_FLUSH_INTERVAL_SECONDS", "2"))
+    except ValueError:
+        value = 2.0
+    return max(0.05, min(300.0, value))
+
+
+def _telemetry_pressure_sample_rate() -> float:
+    try:
+        value = float(os.getenv("API_TELEMETRY_PRESSURE_SAMPLE_RATE", "0.1"))
+    except ValueError:
+        value = 0.1
+    return max(0.0, min(1.0, value))
+
+
+def _accumulate_rollup(event: dict[str, Any]) -> None:
+    key = (event["provider"], event["operation"], _hour_start(event["created_at"]))
+    bucket = _pending_rollups.get(key)
+    if bucket is None:
+        bucket = {name: 0 for name in _ROLLUP_COUNTER_FIELDS}
+        bucket["cost_usd"] = 0.0
+        bucket["last_called_at"] = None
+        _pending_rollups[key] = bucket
+    bucket["calls"] += 1
+    bucket["errors"] += 0 if event["success"] else 1
+    bucket["duration_ms_total"] += event["duration_ms"]
+    bucket["tokens_input"] += event["tokens_input"]
+    bucket["tokens_output"] += event["tokens_output"]
+    bucket["cost_usd"] += event["cost_usd"]
+    if (
+        bucket["last_called_at"] is None
+        or event["created_at"] > bucket["last_called_at"]
+    ):
+        bucket["last_called_at"] = event["created_at"]
+
+
+def _buffer_event(event: dict[str, Any]) -> bool:
+    capacity = _telemetry_buffer_size()
+    with _buffer_lock:
+        _sink_stats["recorded"] += 1
+        # Rollups are exact even when raw rows are shed; only the per-event
+        # detail used for recent-error listings is sampled or dropped.
+        _accumulate_rollup(event)
+        depth = len(_event_buffer)
+        if depth >= capacity:
+            _sink_stats["dropped"] += 1
+            return depth >= _telemetry_flush_batch_size()
+        if (
+            event["success"]
+            and depth >= capacity // 2
+            and random.random() >= _telemetry_pressure_sample_rate()
+        ):
+            _sink_stats["sampled_out"] += 1
+            return True
+        _event_buffer.append(event)
+        return depth + 1 >= _telemetry_flush_batch_size()
+
+
+def _apply_rollup_delta(
+    session: Any, key: tuple[str, str, datetime], delta: dict[str, Any]
+) -> None:
+    provider, operation, hour_start = key
+    statement = dialect_insert(session, ApiProviderUsageRollup).values(
+        id=str(uuid4()),
+        provider=provider,
+        operation=operation,
+        hour_start=hour_start,
+        last_called_at=delta["last_called_at"],
+        **{name: delta[name] for name in _ROLLUP_COUNTER_FIELDS},
+    )
+    # A single atomic increment: concurrent flushes from other processes add
+    # to the same hour instead of racing an update against an insert.
+    increments = {
+        name: getattr(ApiProviderUsageRollup, name) + getattr(statement.excluded, name)
+        for name in _ROLLUP_COUNTER_FIELDS
+    }
+    increments["last_called_at"] = case(
+        (
+            or_(
+                ApiProviderUsageRollup.last_called_at.is_(None),
+                ApiProviderUsageRollup.last_called_at
+                < statement.excluded.last_called_at,
+            ),
+            statement.excluded.last_called_at,
+        ),
+        else_=ApiProviderUsageRollup.last_called_at,
+    )
+    increments["updated_at"] = _utcnow()
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["provider", "operation", "hour_start"],
+            set_=increments,
+        )
+    )
+
+
+def flush_api_usage_events() -> int:
+    global _last_flush_at, _pending_rollups
+    with _flush_lock:
+        with _buffer_lock:
+            events = list(_event_buffer)
+            _event_buffer.clear()
+            rollups = _pending_rollups
+            _pending_rollups = {}
+        if not events and not rollups:
+            return 0
+        try:
+            create_all_tables()
+            with session_scope() as session:
+                if events:
+                    session.execute(insert(ApiProviderUsageEvent), events)
+                for key, delta in rollups.items():
+                    _apply_rollup_delta(session, key, delta)
+        except Exception:
+            logger.warning(
+                "api_telemetry_flush_failed",
+                extra={"events": len(events), "rollups": len(rollups)},
+                exc_info=True,
+            )
+            with _buffer_lock:
+                _sink_stats["failed"] += len(events)
+                # Rollup deltas are small (one per provider/operation/hour), so
+                # keep them for the next flush rather than losing the counts.
+                for key, delta in rollups.items():
+                    pending = _pending_rollups.get(key)
+                    if pending is None:
+                        _pending_rollups[key] = delta
+                        continue
+                    for name in _ROLLUP_COUNTER_FIELDS:
+                        pending[name] += delta[name]
+                    if pending["last_called_at"] is None or (
+                        delta["last_called_at"] is not None
+                        and delta["last_called_at"] > pending["last_called_at"]
+                    ):
+                        pending["last_called_at"] = delta["last_called_at"]
+            return 0
+        with _buffer_lock:
+            _sink_stats["written"] += len(events)
+            _last_flush_at = _utcnow()
+        return len(events)
+
+
+def _writer_loop() -> None:
+    while not _writer_stop.is_set():
+        _writer_wake.wait(_telemetry_flush_interval_seconds())
+        _writer_wake.clear()
+        try:
+            flush_api_usage_events()
+        except Exception:
+            logger.exception("api_telemetry_writer_error")
+
+
+def _ensure_writer_started() -> None:
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is not None and _writer_thread.is_alive():
+            return
+        _writer_stop.clear()
+        _writer_thread = threading.Thread(
+            target=_writer_loop, name="api-telemetry-writer", daemon=True
+        )
+        _writer_thread.start()
+
+
+def stop_api_telemetry_writer(*, timeout_seconds: float = 5.0) -> None:
+    global _writer_thread
+    with _writer_lock:
+        thread = _writer_thread
+        _writer_thread = None
+        _writer_stop.set()
+        _writer_wake.set()
+    if thread is not None:
+        thread.join(timeout=timeout_seconds)
+    flush_api_usage_events()
+
+
+def get_api_telemetry_sink_stats() -> dict[str, Any]:
+    with _buffer_lock:
+        return {
+            "mode": _telemetry_sink_mode(),
+            "buffered": len(_event_buffer),
+            "pending_rollups": len(_pending_rollups),
+            "capacity": _telemetry_buffer_size(),
+            "last_flush_at": _last_flush_at,
+            **_sink_stats,
+        }
+
+
+atexit.register(flush_api_usage_events)
+
+
 def record_api_usage_event(
     *,
     provider: str,
@@ -60,28 +338,33 @@ def record_api_usage_event(
     clean_operation = str(operation or "").strip().lower()
     if not clean_provider or not clean_operation:
         return
-    create_all_tables()
     try:
-        with session_scope() as session:
-            event = ApiProviderUsageEvent(
-                provider=clean_provider[:64],
-                operation=clean_operation[:128],
-                endpoint=str(endpoint or "").strip()[:255],
-                success=bool(success),
-                status_code=(int(status_code) if status_code is not None else None),
-                duration_ms=max(0, _safe_int(duration_ms)),
-                tokens_input=max(0, _safe_int(tokens_input)),
-                tokens_output=max(0, _safe_int(tokens_output)),
-                cost_usd=max(0.0, _safe_float(cost_usd)),
-                error_code=(str(error_code or "").strip()[:96] or None),
-                user_id=(str(user_id or "").strip() or None),
-                project_id=(str(project_id or "").strip() or None),
-                metadata_json=metadata if isinstance(metadata, dict) else {},
-            )
-            session.add(event)
-            session.flush()
+        event = {
+            "id": str(uuid4()),
+            "provider": clean_provider[:64],
+            "operation": clean_operation[:128],
+            "endpoint": str(endpoint or "").strip()[:255],
+            "success": bool(success),
+            "status_code": (int(status_code) if status_code is not None else None),
+            "duration_ms": max(0, _safe_int(duration_ms)),
+            "tokens_input": max(0, _safe_int(tokens_input)),
+            "tokens_output": max(0, _safe_int(tokens_output)),
+            "cost_usd": max(0.0, _safe_float(cost_usd)),
+            "error_code": (str(error_code or "").strip()[:96] or None),
+            "user_id": (str(user_id or "").strip() or None),
+            "project_id": (str(project_id or "").strip() or None),
+            "metadata_json": metadata if isinstance(metadata, dict) else {},
+            "created_at": _utcnow(),
+        }
     except Exception:
         return
+    flush_due = _buffer_event(event)
+    if _telemetry_sink_mode() == TELEMETRY_SINK_MODE_INLINE:
+        flush_api_usage_events()
+        return
+    _ensure_writer_started()
+    if flush_due:
+        _writer_wake.set()
 
 
 def summarize_api_usage_for_admin(*, query: str = "") -> dict[str, Any]:
@@ -99,20 +382,34 @@ def summarize_api_usage_for_admin(*, query: str = "") -> dict[str, Any]:
     query_text = str(query or "").strip().lower()
 
     with session_scope() as session:
-        rows = session.execute(
+        rollup_rows = session.execute(
+            select(
+                ApiProviderUsageRollup.provider,
+                ApiProviderUsageRollup.operation,
+                ApiProviderUsageRollup.hour_start,
+                ApiProviderUsageRollup.calls,
+                ApiProviderUsageRollup.errors,
+                ApiProviderUsageRollup.duration_ms_total,
+                ApiProviderUsageRollup.tokens_input,
+                ApiProviderUsageRollup.tokens_output,
+                ApiProviderUsageRollup.cost_usd,
+                ApiProviderUsageRollup.last_called_at,
+            ).where(ApiProviderUsageRollup.hour_start >= month_window_start)
+        ).all()
+        error_rows = session.execute(
             select(
                 ApiProviderUsageEvent.provider,
                 ApiProviderUsageEvent.operation,
                 ApiProviderUsageEvent.endpoint,
-                ApiProviderUsageEvent.success,
                 ApiProviderUsageEvent.status_code,
-                ApiProviderUsageEvent.duration_ms,
-                ApiProviderUsageEvent.tokens_input,
-                ApiProviderUsageEvent.tokens_output,
-                ApiProviderUsageEvent.cost_usd,
                 ApiProviderUsageEvent.error_code,
                 ApiProviderUsageEvent.created_at,
-            ).where(ApiProviderUsageEvent.created_at >= month_window_start)
+            )
+            .where(
+                ApiProviderUsageEvent.success.is_(False),
+                ApiProviderUsageEvent.created_at >= month_current,
+            )
+            .order_by(ApiProviderUsageEvent.created_at.asc())
         ).all()
 
     by_provider: dict[str, dict[str, Any]] = defaultdict(
@@ -134,56 +431,66 @@ def summarize_api_usage_for_admin(*, query: str = "") -> dict[str, Any]:
     for (
         provider,
         operation,
-        endpoint,
-        success,
-        status_code,
-        duration_ms,
+        hour_start,
+        calls,
+        errors,
+        duration_ms_total,
         tokens_input,
         tokens_output,
         cost_usd,
-        error_code,
-        created_at,
-    ) in rows:
+        last_called_at,
+    ) in rollup_rows:
         name = str(provider or "").strip().lower()
-        if not name:
-            continue
-        timestamp = created_at if isinstance(created_at, datetime) else None
-        if timestamp is None:
+        hour = _as_utc(hour_start)
+        if not name or hour is None:
             continue
-        month_key = f"{timestamp.year:04d}-{timestamp.month:02d}"
+        month_key = f"{hour.year:04d}-{hour.month:02d}"
         bucket = by_provider[name]
         monthly_bucket = monthly_by_provider[name][month_key]
-        monthly_bucket["calls"] += 1
+        monthly_bucket["calls"] += max(0, _safe_int(calls))
+        monthly_bucket["errors"] += max(0, _safe_int(errors))
         monthly_bucket["cost_usd"] += max(0.0, _safe_float(cost_usd))
-        if not bool(success):
-            monthly_bucket["errors"] += 1
         if month_key == month_keys[-1]:
-            bucket["calls_current_month"] += 1
+            bucket["calls_current_month"] += max(0, _safe_int(calls))
+            bucket["errors_current_month"] += max(0, _safe_int(errors))
             bucket["cost_usd_current_month"] += max(0.0, _safe_float(cost_usd))
             bucket["tokens_current_month"] += max(
                 0, _safe_int(tokens_input) + _safe_int(tokens_output)
             )
-            bucket["avg_latency_ms_current_month"] += max(0, _safe_int(duration_ms))
+            bucket["avg_latency_ms_current_month"] += max(
+                0, _safe_int(duration_ms_total)
+            )
             op = str(operation or "").strip().lower() or "unknown"
-            bucket["operations"][op] += 1
-            if not bool(success):
-                bucket["errors_current_month"] += 1
-                if len(bucket["recent_errors"]) < 5:
-                    bucket["recent_errors"].append(
-                        {
-                            "operation": op,
-                            "endpoint": str(endpoint or "").strip(),
-                            "status_code": (
-                                int(status_code) if status_code is not None else None
-                            ),
-                            "error_code": str(error_code or "").strip() or None,
-                            "created_at": timestamp,
-                        }
-                    )
+            bucket["operations"][op] += max(0, _safe_int(calls))
+        timestamp = _as_utc(last_called_at)
         last_called = bucket["last_called_at"]
-        if last_called is None or timestamp > last_called:
+        if timestamp is not None and (last_called is None or timestamp > last_called):
             bucket["last_called_at"] = timestamp
 
+    for (
+        provider,
+        operation,
+        endpoint,
+        status_code,
+        error_code,
+        created_at,
+    ) in error_rows:
+        name = str(provider or "").strip().lower()
+        if name not in by_provider:
+            continue
+        bucket = by_provider[name]
+        if len(bucket["recent_errors"]) >= 5:
+            continue
+        bucket["recent_errors"].append(
+            {
+                "operation": str(operation or "").strip().lower() or "unknown",
+                "endpoint": str(endpoint or "").strip(),
+                "status_code": (int(status_code) if status_code is not None else None),
+                "error_code": str(error_code or "").strip() or None,
+                "created_at": created_at,
+            }
+        )
+
     provider_items: list[dict[str, Any]] = []
     monthly_items: list[dict[str, Any]] = []
     total_calls = 0
@@ -221,7 +528,9 @@ def summarize_api_usage_for_admin(*, query: str = "") -> dict[str, Any]:
             "recent_errors": list(bucket["recent_errors"]),
         }
         if query_text:
-            haystack = f"{provider_name} {' '.join(op['operation'] for op in operations)}"
+            haystack = (
+                f"{provider_name} {' '.join(op['operation'] for op in operations)}"
+            )
             if query_text not in haystack:
                 continue
         provider_items.append(item)
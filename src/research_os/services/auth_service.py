@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import atexit
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import hmac
 import logging
@@ -11,7 +14,7 @@ import threading
 import time
 from pathlib import Path
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 
 from research_os.db import (
@@ -22,6 +25,7 @@ from research_os.db import (
     PublicationFile,
     User,
     create_all_tables,
+    get_engine,
     session_scope,
 )
 from research_os.services.email_delivery_service import send_plain_email
@@ -36,9 +40,14 @@ from research_os.services.security_service import (
     hash_backup_code,
     hash_password,
     hash_session_token,
+    password_hash_needs_rehash,
     password_hash_supported,
+    validate_password_policy,
     verify_totp_code,
-    verify_password,
+)
+from research_os.services.password_hashing_service import (
+    hash_password_offloaded,
+    verify_password_offloaded,
 )
 
 SESSION_DAYS = max(1, int(os.getenv("AUTH_SESSION_DAYS", "30")))
@@ -63,6 +72,13 @@ logger = logging.getLogger(__name__)
 _SIGNIN_RECONCILE_LOCK = threading.Lock()
 _SIGNIN_RECONCILE_INFLIGHT: set[str] = set()
 _SIGNIN_RECONCILE_LAST_RUN_MONOTONIC: dict[str, float] = {}
+_session_user_cache_lock = threading.Lock()
+_session_user_cache: OrderedDict[tuple[str, str], "_CachedSessionUser"] = OrderedDict()
+_session_touch_lock = threading.Lock()
+_pending_session_touches: dict[str, datetime] = {}
+_session_touch_writer_lock = threading.Lock()
+_session_touch_writer: threading.Thread | None = None
+_session_touch_writer_stop = threading.Event()
 
 
 class AuthValidationError(RuntimeError):
@@ -559,14 +575,201 @@ def _resolve_user_from_session_token(
     return user, auth_session
 
 
+@dataclass
+class _CachedSessionUser:
+    cached_until: float
+    session_id: str
+    user_updated_at: datetime | None
+    payload: dict[str, object]
+    touched_monotonic: float
+
+
+def _session_cache_ttl_seconds() -> float:
+    try:
+        value = float(os.getenv("AUTH_SESSION_CACHE_TTL_SECONDS", "30"))
+    except ValueError:
+        value = 30.0
+    return max(0.0, min(600.0, value))
+
+
+def _session_cache_max_entries() -> int:
+    try:
+        value = int(os.getenv("AUTH_SESSION_CACHE_MAX_ENTRIES", "10000"))
+    except ValueError:
+        value = 10000
+    return max(1, min(1_000_000, value))
+
+
+def _session_touch_interval_seconds() -> float:
+    try:
+        value = float(os.getenv("AUTH_SESSION_TOUCH_INTERVAL_SECONDS", "60"))
+    except ValueError:
+        value = 60.0
+    return max(1.0, min(86400.0, value))
+
+
+def _session_touch_flush_interval_seconds() -> float:
+    try:
+        value = float(os.getenv("AUTH_SESSION_TOUCH_FLUSH_INTERVAL_SECONDS", "5"))
+    except ValueError:
+        value = 5.0
+    return max(0.05, min(300.0, value))
+
+
+def _cached_session_is_current(token_hash: str, entry: _CachedSessionUser) -> bool:
+    # Logout, revocation, deactivation and profile edits can happen in any API
+    # or worker process, so every hit confirms them with one indexed read
+    # rather than relying on in-process invalidation.
+    with session_scope() as session:
+        row = session.execute(
+            select(AuthSession.expires_at, User.is_active, User.updated_at)
+            .join(User, User.id == AuthSession.user_id)
+            .where(
+                AuthSession.token_hash == token_hash,
+                AuthSession.revoked_at.is_(None),
+            )
+        ).first()
+    if row is None:
+        return False
+    expires_at, is_active, user_updated_at = row
+    expires_at = _as_utc(expires_at)
+    if expires_at is not None and expires_at <= _utcnow():
+        return False
+    return bool(is_active) and _as_utc(user_updated_at) == entry.user_updated_at
+
+
+def _cached_session_user(cache_key: tuple[str, str]) -> dict[str, object] | None:
+    now_monotonic = time.monotonic()
+    with _session_user_cache_lock:
+        entry = _session_user_cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry.cached_until <= now_monotonic:
+            _session_user_cache.pop(cache_key, None)
+            return None
+        _session_user_cache.move_to_end(cache_key)
+    if not _cached_session_is_current(cache_key[1], entry):
+        with _session_user_cache_lock:
+            if _session_user_cache.get(cache_key) is entry:
+                _session_user_cache.pop(cache_key, None)
+        return None
+    with _session_user_cache_lock:
+        touch_due = (
+            now_monotonic - entry.touched_monotonic
+            >= _session_touch_interval_seconds()
+        )
+        if touch_due:
+            entry.touched_monotonic = now_monotonic
+    if touch_due:
+        _queue_session_touch(entry.session_id)
+    return dict(entry.payload)
+
+
+def _store_cached_session_user(
+    cache_key: tuple[str, str],
+    *,
+    session_id: str,
+    payload: dict[str, object],
+) -> None:
+    now_monotonic = time.monotonic()
+    entry = _CachedSessionUser(
+        cached_until=now_monotonic + _session_cache_ttl_seconds(),
+        session_id=session_id,
+        user_updated_at=_as_utc(payload.get("updated_at")),
+        payload=dict(payload),
+        touched_monotonic=now_monotonic,
+    )
+    with _session_user_cache_lock:
+        _session_user_cache[cache_key] = entry
+        _session_user_cache.move_to_end(cache_key)
+        while len(_session_user_cache) > _session_cache_max_entries():
+            _session_user_cache.popitem(last=False)
+
+
+def _queue_session_touch(session_id: str) -> None:
+    with _session_touch_lock:
+        _pending_session_touches[session_id] = _utcnow()
+    _ensure_session_touch_writer_started()
+
+
+def flush_auth_session_touches() -> int:
+    """Write buffered ``last_seen_at`` updates in one batch."""
+    with _session_touch_lock:
+        pending = dict(_pending_session_touches)
+        _pending_session_touches.clear()
+    if not pending:
+        return 0
+    try:
+        with session_scope() as session:
+            # Bulk update by primary key: no ORM events, so the session cache
+            # is not invalidated by its own bookkeeping.
+            session.execute(
+                update(AuthSession),
+                [
+                    {"id": session_id, "last_seen_at": seen_at}
+                    for session_id, seen_at in pending.items()
+                ],
+            )
+    except Exception as exc:
+        logger.warning(
+            "auth_session_touch_flush_failed",
+            extra={"sessions": len(pending), "detail": str(exc)},
+        )
+        return 0
+    return len(pending)
+
+
+def _session_touch_writer_loop() -> None:
+    while not _session_touch_writer_stop.wait(_session_touch_flush_interval_seconds()):
+        flush_auth_session_touches()
+
+
+def _ensure_session_touch_writer_started() -> None:
+    global _session_touch_writer
+    if _session_touch_writer is not None and _session_touch_writer.is_alive():
+        return
+    with _session_touch_writer_lock:
+        if _session_touch_writer is not None and _session_touch_writer.is_alive():
+            return
+        _session_touch_writer_stop.clear()
+        _session_touch_writer = threading.Thread(
+            target=_session_touch_writer_loop,
+            name="auth-session-touch-writer",
+            daemon=True,
+        )
+        _session_touch_writer.start()
+
+
+def stop_auth_session_touch_writer(*, timeout_seconds: float = 5.0) -> None:
+    global _session_touch_writer
+    with _session_touch_writer_lock:
+        thread = _session_touch_writer
+        _session_touch_writer = None
+        _session_touch_writer_stop.set()
+    if thread is not None:
+        thread.join(timeout=timeout_seconds)
+    flush_auth_session_touches()
+
+
+atexit.register(flush_auth_session_touches)
+
+
+def _hash_new_password(password: str) -> str:
+    try:
+        clean_password = validate_password_policy(password)
+    except SecurityValidationError as exc:
+        raise AuthValidationError(str(exc)) from exc
+    return hash_password_offloaded(clean_password)
+
+
 def _get_user_by_credentials(*, session, email: str, password: str) -> User:
     normalized_email = _normalize_email(email)
     normalized_password = _normalize_password_input(password)
     user = session.scalars(select(User).where(User.email == normalized_email)).first()
     if user is None:
-        verify_password(normalized_password, _DUMMY_PASSWORD_HASH)
+        verify_password_offloaded(normalized_password, _DUMMY_PASSWORD_HASH)
         raise AuthValidationError("Invalid credentials.")
-    if not verify_password(normalized_password, user.password_hash):
+    if not verify_password_offloaded(normalized_password, user.password_hash):
         if not password_hash_supported(user.password_hash):
             raise AuthValidationError(
                 "Password format is legacy or unsupported. Use password reset, then sign in again."
@@ -574,6 +777,11 @@ def _get_user_by_credentials(*, session, email: str, password: str) -> User:
         raise AuthValidationError("Invalid credentials.")
     if not user.is_active:
         raise AuthValidationError("Account is inactive.")
+    if password_hash_needs_rehash(user.password_hash):
+        # Imported and older hashes may need several PBKDF2 runs per check;
+        # upgrade them once while the plaintext is known to be correct.
+        user.password_hash = hash_password_offloaded(normalized_password)
+        logger.info("password_rehashed_on_login", extra={"user_id": user.id})
     return user
 
 
@@ -640,7 +848,8 @@ def _prune_sessions(*, session, user_id: str) -> None:
     if len(active) < MAX_ACTIVE_SESSIONS:
         return
 
-    active.sort(key=lambda row: _as_utc(row.created_at) or now)
+    # Revoke the least recently used sessions first.
+    active.sort(key=lambda row: _as_utc(row.last_seen_at or row.created_at) or now)
     surplus = len(active) - (MAX_ACTIVE_SESSIONS - 1)
     for row in active[: max(0, surplus)]:
         row.revoked_at = now
@@ -667,10 +876,7 @@ def register_user(*, email: str, password: str, name: str) -> dict[str, object]:
     normalized_email = _normalize_email(email)
     clean_name = _normalize_name(name)
     normalized_password = _normalize_password_input(password)
-    try:
-        password_hash_value = hash_password(normalized_password)
-    except SecurityValidationError as exc:
-        raise AuthValidationError(str(exc)) from exc
+    password_hash_value = _hash_new_password(normalized_password)
 
     response_payload: dict[str, object] = {}
     signed_in_user_id = ""
@@ -749,13 +955,33 @@ def login_user(*, email: str, password: str) -> dict[str, object]:
 
 
 def get_user_by_session_token(token: str) -> dict[str, object]:
+    clean_token = (token or "").strip()
+    cache_key: tuple[str, str] | None = None
+    if clean_token and _session_cache_ttl_seconds() > 0:
+        cache_key = (str(get_engine().url), hash_session_token(clean_token))
+        cached = _cached_session_user(cache_key)
+        if cached is not None:
+            return cached
     create_all_tables()
     with session_scope() as session:
-        user, _ = _resolve_user_from_session_token(session=session, token=token)
+        user, auth_session = _resolve_user_from_session_token(
+            session=session, token=token
+        )
         _apply_env_admin_role(user)
         _auto_verify_email_if_disabled(user=user)
         session.flush()
-        return _serialize_user(user)
+        payload = _serialize_user(user)
+        session_id = str(auth_session.id)
+        last_seen_at = _as_utc(auth_session.last_seen_at)
+    if last_seen_at is None or (_utcnow() - last_seen_at).total_seconds() >= (
+        _session_touch_interval_seconds()
+    ):
+        _queue_session_touch(session_id)
+    if cache_key is not None:
+        _store_cached_session_user(
+            cache_key, session_id=session_id, payload=payload
+        )
+    return payload
 
 
 def logout_session(token: str) -> dict[str, object]:
@@ -814,10 +1040,7 @@ def update_current_user(
         _auto_verify_email_if_disabled(user=user)
         if password is not None:
             normalized_password = _normalize_password_input(password)
-            try:
-                user.password_hash = hash_password(normalized_password)
-            except SecurityValidationError as exc:
-                raise AuthValidationError(str(exc)) from exc
+            user.password_hash = _hash_new_password(normalized_password)
         if openalex_author_id is not _UNSET:
             if openalex_author_id is None or not str(openalex_author_id).strip():
                 user.openalex_author_id = None
@@ -1232,10 +1455,7 @@ def confirm_password_reset(
     if not clean_code:
         raise AuthValidationError("Reset code is required.")
     normalized_password = _normalize_password_input(new_password)
-    try:
-        password_hash_value = hash_password(normalized_password)
-    except SecurityValidationError as exc:
-        raise AuthValidationError(str(exc)) from exc
+    password_hash_value = _hash_new_password(normalized_password)
 
     with session_scope() as session:
         user = session.scalars(
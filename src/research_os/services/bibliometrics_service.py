@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+# Array-backed citation kernels shared by the publication metrics, analytics and
+# impact services. Matrices are laid out works x columns, where a column is one
+# portfolio at one point in time (a month, a year, or a different user), so a
+# whole series or a whole batch of users is computed in one call. Results match
+# the list-based implementations these replaced, including rounding.
+
+
+@dataclass(frozen=True)
+class CitationIndices:
+    works: int
+    total_citations: int
+    h_index: int
+    g_index: int
+    i10_index: int
+    gini_coefficient: float
+
+
+def citation_vector(values: Sequence[Any] | np.ndarray) -> np.ndarray:
+    """Coerce citation counts to non-negative int64, treating missing as 0."""
+    array = np.asarray(values, dtype=np.float64)
+    array = np.trunc(np.nan_to_num(array, nan=0.0, posinf=0.0, neginf=0.0))
+    return np.clip(array, 0, None).astype(np.int64)
+
+
+def _citation_matrix(matrix: Sequence[Sequence[Any]] | np.ndarray) -> np.ndarray:
+    array = np.asarray(matrix, dtype=np.float64)
+    if array.ndim != 2:
+        raise ValueError("Citation matrix must be two-dimensional.")
+    array = np.trunc(np.nan_to_num(array, nan=0.0, posinf=0.0, neginf=0.0))
+    return np.clip(array, 0, None).astype(np.int64)
+
+
+def _sorted_descending(matrix: np.ndarray) -> np.ndarray:
+    return -np.sort(-matrix, axis=0)
+
+
+def _column_counts(matrix: np.ndarray, counts: np.ndarray | None) -> np.ndarray:
+    if counts is None:
+        return np.full(matrix.shape[1], matrix.shape[0], dtype=np.int64)
+    return np.asarray(counts, dtype=np.int64)
+
+
+def h_index_by_column(matrix: Sequence[Sequence[Any]] | np.ndarray) -> np.ndarray:
+    values = _sorted_descending(_citation_matrix(matrix))
+    ranks = np.arange(1, values.shape[0] + 1, dtype=np.int64)[:, None]
+    # Sorted descending against increasing ranks, so the condition holds for a
+    # leading run and its length is the h-index.
+    return np.count_nonzero(values >= ranks, axis=0).astype(np.int64)
+
+
+def g_index_by_column(
+    matrix: Sequence[Sequence[Any]] | np.ndarray,
+    *,
+    counts: Sequence[int] | np.ndarray | None = None,
+) -> np.ndarray:
+    values = _sorted_descending(_citation_matrix(matrix))
+    column_counts = _column_counts(values, counts)
+    ranks = np.arange(1, values.shape[0] + 1, dtype=np.int64)[:, None]
+    # Zero padding can keep the cumulative sum above rank^2, but g never
+    # exceeds the number of real works in the column.
+    qualifying = (np.cumsum(values, axis=0) >= ranks * ranks) & (
+        ranks <= column_counts[None, :]
+    )
+    return np.count_nonzero(qualifying, axis=0).astype(np.int64)
+
+
+def gini_by_column(
+    matrix: Sequence[Sequence[Any]] | np.ndarray,
+    *,
+    counts: Sequence[int] | np.ndarray | None = None,
+) -> np.ndarray:
+    values = _sorted_descending(_citation_matrix(matrix))
+    column_counts = _column_counts(values, counts)
+    totals = values.sum(axis=0)
+    ranks = np.arange(1, values.shape[0] + 1, dtype=np.int64)[:, None]
+    # Ascending position i of the j-th largest value is n - j + 1, so the
+    # (2i - n - 1) weight becomes n - 2j + 1. Padding rows hold zeros.
+    weighted = ((column_counts[None, :] - 2 * ranks + 1) * values).sum(axis=0)
+    result = np.zeros(values.shape[1], dtype=np.float64)
+    valid = (column_counts > 0) & (totals > 0)
+    result[valid] = weighted[valid] / (
+        column_counts[valid].astype(np.float64) * totals[valid].astype(np.float64)
+    )
+    return np.clip(result, 0.0, 1.0)
+
+
+def top_share_pct_by_column(
+    matrix: Sequence[Sequence[Any]] | np.ndarray, *, top: int = 3
+) -> np.ndarray:
+    values = _sorted_descending(_citation_matrix(matrix))
+    totals = values.sum(axis=0)
+    heads = values[: max(0, int(top))].sum(axis=0)
+    result = np.zeros(values.shape[1], dtype=np.float64)
+    valid = totals > 0
+    result[valid] = heads[valid] / totals[valid] * 100.0
+    return result
+
+
+def h_index(values: Sequence[Any] | np.ndarray) -> int:
+    vector = citation_vector(values)
+    if vector.size == 0:
+        return 0
+    return int(h_index_by_column(vector[:, None])[0])
+
+
+def g_index(values: Sequence[Any] | np.ndarray) -> int:
+    vector = citation_vector(values)
+    if vector.size == 0:
+        return 0
+    return int(g_index_by_column(vector[:, None])[0])
+
+
+def _parse_float(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def gini_coefficient(values: Sequence[float | int]) -> float:
+    """Gini over non-negative values, rounded to 4 places; blanks are skipped."""
+    parsed = (_parse_float(item) for item in values)
+    clean = np.asarray(
+        [max(0.0, item) for item in parsed if item is not None], dtype=np.float64
+    )
+    if clean.size == 0:
+        return 0.0
+    total = float(clean.sum())
+    if total <= 0.0:
+        return 0.0
+    if np.all(clean == np.trunc(clean)):
+        return round(float(gini_by_column(clean[:, None])[0]), 4)
+    ordered = np.sort(clean)
+    n = ordered.size
+    weights = 2.0 * np.arange(1, n + 1, dtype=np.float64) - n - 1
+    gini = float(np.dot(weights, ordered)) / (float(n) * total)
+    return round(max(0.0, min(1.0, gini)), 4)
+
+
+def rolling_sums(values: Sequence[Any] | np.ndarray, window: int) -> np.ndarray:
+    """Trailing sums of ``window`` items ending at every index."""
+    vector = citation_vector(values)
+    prefix = np.concatenate(([0], np.cumsum(vector)))
+    ends = np.arange(1, vector.size + 1)
+    starts = np.maximum(0, ends - max(1, int(window)))
+    return prefix[ends] - prefix[starts]
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _next_month(value: datetime) -> datetime:
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def month_share_of_year(
+    month_starts: Sequence[datetime], *, now: datetime
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return each month's calendar year and its share of that year's citations.
+
+    A year's citations are spread evenly over the year, or over the elapsed
+    part of the current year up to ``now``. Months after ``now`` get zero.
+    """
+    now_utc = _utc(now)
+    years = np.zeros(len(month_starts), dtype=np.int64)
+    shares = np.zeros(len(month_starts), dtype=np.float64)
+    for index, month_start in enumerate(month_starts):
+        start = _utc(month_start)
+        segment_start = datetime(start.year, 1, 1, tzinfo=timezone.utc)
+        segment_end = datetime(start.year + 1, 1, 1, tzinfo=timezone.utc)
+        if start.year == now_utc.year:
+            segment_end = min(segment_end, now_utc)
+        years[index] = start.year
+        if segment_end <= segment_start:
+            continue
+        overlap_end = min(_next_month(start), segment_end)
+        if overlap_end <= start:
+            continue
+        overlap_seconds = (overlap_end - start).total_seconds()
+        segment_seconds = (segment_end - segment_start).total_seconds()
+        shares[index] = max(0.0, min(1.0, overlap_seconds / segment_seconds))
+    return years, shares
+
+
+def spread_yearly_counts(
+    yearly_counts_rows: Sequence[Mapping[int, int]],
+    month_starts: Sequence[datetime],
+    *,
+    now: datetime,
+) -> np.ndarray:
+    """Estimate monthly citations (rows x months) from per-year counts."""
+    month_years, shares = month_share_of_year(month_starts, now=now)
+    result = np.zeros((len(yearly_counts_rows), len(month_starts)), dtype=np.int64)
+    if not len(yearly_counts_rows) or not len(month_starts):
+        return result
+    first_year = int(month_years.min())
+    year_span = int(month_years.max()) - first_year + 1
+    counts = np.zeros((len(yearly_counts_rows), year_span), dtype=np.int64)
+    for row_index, yearly_counts in enumerate(yearly_counts_rows):
+        for year, count in yearly_counts.items():
+            offset = int(year) - first_year
+            if 0 <= offset < year_span:
+                counts[row_index, offset] = max(0, int(count or 0))
+    gathered = counts[:, month_years - first_year].astype(np.float64)
+    return np.rint(gathered * shares[None, :]).astype(np.int64)
+
+
+def normalize_rows_to_totals(
+    matrix: Sequence[Sequence[Any]] | np.ndarray,
+    targets: Sequence[int] | np.ndarray,
+) -> np.ndarray:
+    """Scale rows whose sum exceeds their target down to exactly the target.
+
+    Rounding drift is settled from the most recent month backwards, matching
+    the list implementation this replaced.
+    """
+    values = _citation_matrix(matrix)
+    target = np.clip(np.asarray(targets, dtype=np.int64), 0, None)
+    totals = values.sum(axis=1)
+    result = values.copy()
+    result[totals <= 0] = 0
+    scale_rows = np.nonzero((totals > 0) & (totals > target))[0]
+    if scale_rows.size == 0:
+        return result
+    scaled = np.rint(
+        (values[scale_rows] / totals[scale_rows, None]) * target[scale_rows, None]
+    ).astype(np.int64)
+    diff = target[scale_rows] - scaled.sum(axis=1)
+    width = scaled.shape[1]
+    from_end = width - 1 - np.arange(width)[None, :]
+    scaled += (from_end < np.clip(diff, 0, None)[:, None]).astype(np.int64)
+    excess = np.clip(-diff, 0, None)
+    later_sum = np.cumsum(scaled[:, ::-1], axis=1)[:, ::-1] - scaled
+    removal = np.clip(excess[:, None] - later_sum, 0, scaled)
+    result[scale_rows] = np.clip(scaled - removal, 0, None)
+    return result
+
+
+def reconcile_rows_to_totals(
+    matrix: Sequence[Sequence[Any]] | np.ndarray,
+    targets: Sequence[int] | np.ndarray,
+    *,
+    eligible: np.ndarray | None = None,
+) -> np.ndarray:
+    """Make every row sum to its target.
+
+    Rows above target are scaled down; rows below target get the remainder
+    spread evenly over their eligible months, earliest months first.
+    """
+    values = _citation_matrix(matrix)
+    target = np.clip(np.asarray(targets, dtype=np.int64), 0, None)
+    mask = (
+        np.ones(values.shape, dtype=bool)
+        if eligible is None
+        else np.asarray(eligible, dtype=bool)
+    )
+    totals = values.sum(axis=1)
+    result = values.copy()
+    over = totals > target
+    if np.any(over):
+        result[over] = normalize_rows_to_totals(values[over], target[over])
+    eligible_counts = mask.sum(axis=1)
+    under = (totals < target) & (eligible_counts > 0)
+    if np.any(under):
+        remainder = target[under] - totals[under]
+        base = remainder // eligible_counts[under]
+        extra = remainder % eligible_counts[under]
+        order = np.cumsum(mask[under], axis=1) - 1
+        additions = np.where(
+            mask[under],
+            base[:, None] + (order < extra[:, None]).astype(np.int64),
+            0,
+        )
+        result[under] = values[under] + additions
+    result[target <= 0] = 0
+    return result
+
+
+def citation_indices_for_portfolios(
+    portfolios: Mapping[str, Sequence[Any]],
+) -> dict[str, CitationIndices]:
+    """Compute headline citation indices for many portfolios in one pass.
+
+    Each portfolio (typically one user's per-work citation counts) becomes a
+    zero-padded column of a single matrix.
+    """
+    keys = list(portfolios.keys())
+    if not keys:
+        return {}
+    vectors = [citation_vector(portfolios[key]) for key in keys]
+    counts = np.asarray([vector.size for vector in vectors], dtype=np.int64)
+    matrix = np.zeros((max(1, int(counts.max())), len(keys)), dtype=np.int64)
+    for column, vector in enumerate(vectors):
+        matrix[: vector.size, column] = vector
+    h_values = h_index_by_column(matrix)
+    g_values = g_index_by_column(matrix, counts=counts)
+    gini_values = gini_by_column(matrix, counts=counts)
+    totals = matrix.sum(axis=0)
+    i10_values = np.count_nonzero(matrix >= 10, axis=0)
+    return {
+        key: CitationIndices(
+            works=int(counts[column]),
+            total_citations=int(totals[column]),
+            h_index=int(h_values[column]),
+            g_index=int(g_values[column]),
+            i10_index=int(i10_values[column]),
+            gini_coefficient=round(float(gini_values[column]), 4),
+        )
+        for column, key in enumerate(keys)
+    }
@@ -7,23 +7,25 @@ import re
 import threading
 import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
 from io import StringIO
-from typing import Any
+from typing import Any, Iterator
 from uuid import uuid4
 
 import httpx
 from sqlalchemy import delete, func, or_, select
 from sqlalchemy.orm import Session
 
+from research_os.clients.http_client import provider_client
 from research_os.db import (
     AppRuntimeLock,
     Author,
     Collaborator,
     CollaboratorAffiliation,
     CollaborationLandingCache,
+    CollaborationLandingRow,
+    CollaborationLandingSharedWork,
     CollaborationMetric,
     Manuscript,
     ManuscriptAffiliation,
@@ -36,6 +38,7 @@ from research_os.db import (
     session_scope,
 )
 from research_os.services.api_telemetry_service import record_api_usage_event
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
@@ -88,13 +91,13 @@ ACTIVITY_STATUSES = {
 }
 
 FORMULA_VERSION = "collab_strength_v1"
+LANDING_LAYOUT_VERSION = "landing_rows_v1"
 SCHEDULER_LOCK_NAME = "collaboration_metrics_scheduler"
+COLLABORATION_METRICS_JOB_KIND = "collaboration.metrics"
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
 _INSTANCE_ID = f"collab-{uuid4().hex[:12]}"
 _ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-[\dX]{4}$")
 
-_executor_lock = threading.Lock()
-_executor: ThreadPoolExecutor | None = None
 _scheduler_lock = threading.Lock()
 _scheduler: Any = None
 
@@ -298,7 +301,8 @@ def _normalize_optional_text(value: Any, *, max_length: int | None = None) -> st
     return clean
 
 
-def _email_identity_key(value: str | None) -> str:
+def email_identity_key(value: str | None) -> str:
+    """Return the comparison key two collaborator emails must share to match."""
     return re.sub(r"\s+", "", str(value or "").strip().lower())
 
 
@@ -359,13 +363,13 @@ def _metric_by_collaborator(
 def _collaborator_identity_tokens(collaborator: Collaborator) -> list[str]:
     """Return all identity tokens for a collaborator (used for union-find grouping)."""
     tokens: list[str] = []
-    openalex_key = _openalex_identity_key(collaborator.openalex_author_id)
+    openalex_key = openalex_identity_key(collaborator.openalex_author_id)
     if openalex_key:
         tokens.append(f"oa:{openalex_key}")
-    email = _email_identity_key(collaborator.email)
+    email = email_identity_key(collaborator.email)
     if email:
         tokens.append(f"email:{email}")
-    secondary_email = _email_identity_key(collaborator.secondary_email)
+    secondary_email = email_identity_key(collaborator.secondary_email)
     if secondary_email:
         tokens.append(f"email:{secondary_email}")
     name = _normalize_name_lower(collaborator.full_name or "")
@@ -379,6 +383,34 @@ def _collaborator_identity_key(collaborator: Collaborator) -> str:
     return tokens[0] if tokens else f"id:{collaborator.id}"
 
 
+def _collaborators_fuzzy_linked(left: Collaborator, right: Collaborator) -> bool:
+    """Return whether two records look like the same person by name and institution."""
+    left_name = left.full_name or ""
+    right_name = right.full_name or ""
+    name_sim = _name_similarity(left_name, right_name)
+    # Very high similarity → merge regardless
+    if name_sim >= 0.98:
+        return True
+    # Good similarity + institution match → merge
+    if name_sim >= 0.94:
+        inst_sim = _affiliation_similarity(
+            left.primary_institution, right.primary_institution
+        )
+        if inst_sim >= 0.82:
+            return True
+    # Initial-compatible names (e.g. "G. Matthews" ↔ "Gareth Matthews")
+    if _name_initial_compatible(left_name, right_name):
+        left_inst = (left.primary_institution or "").strip()
+        right_inst = (right.primary_institution or "").strip()
+        # If both have institutions, require institution similarity
+        if left_inst and right_inst:
+            return _affiliation_similarity(left_inst, right_inst) >= 0.82
+        # If exactly one has an institution, the institution side
+        # provides sufficient confirmation for the match
+        return bool(left_inst or right_inst)
+    return False
+
+
 def _collaborator_groups(
     collaborators: list[Collaborator],
 ) -> tuple[dict[str, list[Collaborator]], dict[str, str]]:
@@ -418,33 +450,8 @@ def _collaborator_groups(
             rid = str(right.id)
             if _find(lid) == _find(rid):
                 continue
-            left_name = left.full_name or ""
-            right_name = right.full_name or ""
-            name_sim = _name_similarity(left_name, right_name)
-            # Very high similarity → merge regardless
-            if name_sim >= 0.98:
+            if _collaborators_fuzzy_linked(left, right):
                 _union(lid, rid)
-                continue
-            # Good similarity + institution match → merge
-            if name_sim >= 0.94:
-                inst_sim = _affiliation_similarity(
-                    left.primary_institution, right.primary_institution
-                )
-                if inst_sim >= 0.82:
-                    _union(lid, rid)
-                    continue
-            # Initial-compatible names (e.g. "G. Matthews" ↔ "Gareth Matthews")
-            if _name_initial_compatible(left_name, right_name):
-                left_inst = (left.primary_institution or "").strip()
-                right_inst = (right.primary_institution or "").strip()
-                # If both have institutions, require institution similarity
-                if left_inst and right_inst:
-                    if _affiliation_similarity(left_inst, right_inst) >= 0.82:
-                        _union(lid, rid)
-                # If exactly one has an institution, the institution side
-                # provides sufficient confirmation for the match
-                elif left_inst or right_inst:
-                    _union(lid, rid)
 
     # Build groups
     grouped: dict[str, list[Collaborator]] = defaultdict(list)
@@ -580,84 +587,75 @@ def _merge_metric_payloads(payloads: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _canonicalize_collaborator_payloads(
-    session,
+def _is_listed_collaborator_group(members: list[Collaborator]) -> bool:
+    # Ungrouped (singleton) collaborators that have no institution are
+    # low-quality records that cannot be confirmed as real people.
+    return len(members) > 1 or any(
+        (member.primary_institution or "").strip() for member in members
+    )
+
+
+def _canonical_group_payload(
+    members: list[Collaborator],
     *,
-    collaborators: list[Collaborator],
     metrics_by_collaborator: dict[str, CollaborationMetric],
-) -> list[dict[str, Any]]:
-    groups, _ = _collaborator_groups(collaborators)
-    # Remove ungrouped (singleton) collaborators that have no institution —
-    # they are low-quality records that cannot be confirmed as real people.
-    groups = {
-        key: members
-        for key, members in groups.items()
-        if len(members) > 1
-        or any((m.primary_institution or "").strip() for m in members)
-    }
-    collaborator_ids = [str(item.id) for item in collaborators]
-    affiliation_labels = _affiliation_labels_by_collaborator(
-        session,
-        collaborator_ids=collaborator_ids,
-    )
-    rows: list[dict[str, Any]] = []
-    for members in groups.values():
-        representative = sorted(
-            members,
-            key=lambda item: (
-                -int((_safe_int(_serialize_metric(metrics_by_collaborator.get(str(item.id))).get("coauthored_works_count")) or 0)),
-                -_coerce_utc(item.updated_at).timestamp(),
-                str(item.id),
-            ),
-        )[0]
-        member_metrics = [
-            _serialize_metric(metrics_by_collaborator.get(str(member.id)))
-            for member in members
-        ]
-        merged_metrics = _merge_metric_payloads(member_metrics)
-        institution_labels: list[str] = []
-        institution_seen: set[str] = set()
-        for member in members:
-            candidate_labels = list(affiliation_labels.get(str(member.id), []))
-            primary = re.sub(r"\s+", " ", str(member.primary_institution or "").strip())
-            if primary:
-                candidate_labels.insert(0, primary)
-            for label in candidate_labels:
-                key = label.lower()
-                if key in institution_seen:
-                    continue
-                institution_seen.add(key)
-                institution_labels.append(label)
-        domain_seen: set[str] = set()
-        merged_domains: list[str] = []
-        for member in members:
-            for domain in list(member.research_domains or []):
-                text = re.sub(r"\s+", " ", str(domain or "").strip())
-                if not text:
-                    continue
-                key = text.lower()
-                if key in domain_seen:
-                    continue
-                domain_seen.add(key)
-                merged_domains.append(text)
-        duplicate_warnings: list[str] = []
-        if len(members) > 1:
-            duplicate_warnings.append(
-                f"Merged {len(members)} collaborator records with the same identity."
-            )
-        payload = _serialize_collaborator(
-            representative,
-            metric=metrics_by_collaborator.get(str(representative.id)),
-            duplicate_warnings=duplicate_warnings,
+    affiliation_labels: dict[str, list[str]],
+) -> dict[str, Any]:
+    representative = sorted(
+        members,
+        key=lambda item: (
+            -int((_safe_int(_serialize_metric(metrics_by_collaborator.get(str(item.id))).get("coauthored_works_count")) or 0)),
+            -_coerce_utc(item.updated_at).timestamp(),
+            str(item.id),
+        ),
+    )[0]
+    member_metrics = [
+        _serialize_metric(metrics_by_collaborator.get(str(member.id)))
+        for member in members
+    ]
+    merged_metrics = _merge_metric_payloads(member_metrics)
+    institution_labels: list[str] = []
+    institution_seen: set[str] = set()
+    for member in members:
+        candidate_labels = list(affiliation_labels.get(str(member.id), []))
+        primary = re.sub(r"\s+", " ", str(member.primary_institution or "").strip())
+        if primary:
+            candidate_labels.insert(0, primary)
+        for label in candidate_labels:
+            key = label.lower()
+            if key in institution_seen:
+                continue
+            institution_seen.add(key)
+            institution_labels.append(label)
+    domain_seen: set[str] = set()
+    merged_domains: list[str] = []
+    for member in members:
+        for domain in list(member.research_domains or []):
+            text = re.sub(r"\s+", " ", str(domain or "").strip())
+            if not text:
+                continue
+            key = text.lower()
+            if key in domain_seen:
+                continue
+            domain_seen.add(key)
+            merged_domains.append(text)
+    duplicate_warnings: list[str] = []
+    if len(members) > 1:
+        duplicate_warnings.append(
+            f"Merged {len(members)} collaborator records with the same identity."
         )
-        payload["metrics"] = merged_metrics
-        payload["research_domains"] = merged_domains
-        payload["institution_labels"] = institution_labels
-        payload["duplicate_count"] = len(members)
-        if institution_labels:
-            payload["primary_institution"] = institution_labels[0]
-        rows.append(payload)
-    return rows
+    payload = _serialize_collaborator(
+        representative,
+        metric=metrics_by_collaborator.get(str(representative.id)),
+        duplicate_warnings=duplicate_warnings,
+    )
+    payload["metrics"] = merged_metrics
+    payload["research_domains"] = merged_domains
+    payload["institution_labels"] = institution_labels
+    payload["duplicate_count"] = len(members)
+    if institution_labels:
+        payload["primary_institution"] = institution_labels[0]
+    return payload
 
 
 def _serialize_metric(row: CollaborationMetric | None) -> dict[str, Any]:
@@ -853,18 +851,211 @@ def _load_collaboration_work_context(
     return works, work_by_id, authorships, authors_by_id
 
 
-def _build_collaboration_landing_payload(
+def _collaborator_search_text(row: dict[str, Any]) -> str:
+    values: list[str] = []
+    for key in (
+        "full_name",
+        "preferred_name",
+        "email",
+        "secondary_email",
+        "contact_first_name",
+        "contact_surname",
+        "contact_email",
+        "contact_secondary_email",
+        "orcid_id",
+        "openalex_author_id",
+        "primary_institution",
+        "country",
+        "contact_country",
+        "current_position",
+    ):
+        values.append(re.sub(r"\s+", " ", str(row.get(key) or "").strip().lower()))
+    for key in ("research_domains", "institution_labels"):
+        items = row.get(key)
+        if not isinstance(items, list):
+            continue
+        values.extend(
+            re.sub(r"\s+", " ", str(value or "").strip().lower()) for value in items
+        )
+    # Newline-separated so a (whitespace-collapsed) query never matches across fields.
+    return "\n".join(value for value in values if value)
+
+
+def _landing_row_metrics(value: Any) -> dict[str, Any]:
+    metrics = dict(value) if isinstance(value, dict) else {}
+    computed_at = metrics.get("computed_at")
+    if isinstance(computed_at, str):
+        try:
+            metrics["computed_at"] = datetime.fromisoformat(computed_at)
+        except ValueError:
+            metrics["computed_at"] = None
+    return metrics
+
+
+def _apply_landing_row(
+    row: CollaborationLandingRow,
+    *,
+    members: list[Collaborator],
+    payload: dict[str, Any],
+    now: datetime,
+) -> None:
+    metrics = payload.get("metrics") if isinstance(payload.get("metrics"), dict) else {}
+    values: dict[str, Any] = {
+        "member_ids": sorted(str(member.id) for member in members),
+        "is_listed": _is_listed_collaborator_group(members),
+        "sort_name": str(payload.get("full_name") or "").lower()[:255],
+        "coauthored_works_count": int(
+            _safe_int(metrics.get("coauthored_works_count")) or 0
+        ),
+        "collaboration_strength_score": float(
+            _safe_float(metrics.get("collaboration_strength_score")) or 0.0
+        ),
+        "last_collaboration_year": _safe_int(metrics.get("last_collaboration_year")),
+        "collaborator_updated_at": _coerce_utc_or_none(payload.get("updated_at")),
+        "search_text": _collaborator_search_text(payload),
+        "metrics_json": _json_safe_data(metrics),
+        "payload_json": _json_safe_data(payload),
+    }
+    changed = False
+    for key, value in values.items():
+        current = getattr(row, key)
+        if isinstance(current, datetime):
+            current = _coerce_utc(current)
+        if current != value:
+            setattr(row, key, value)
+            changed = True
+    if changed or row.computed_at is None:
+        row.computed_at = now
+
+
+def _landing_refresh_scope(
+    *,
+    collaborators: list[Collaborator],
+    existing_rows: list[CollaborationLandingRow],
+    changed_collaborator_ids: set[str],
+) -> tuple[set[str], list[CollaborationLandingRow]]:
+    """Return the collaborator ids to regroup and the landing rows they replace.
+
+    Groups are connected components of identity and fuzzy links, so the rows
+    of every changed collaborator plus the rows of everyone it now links to
+    form a closed set: regrouping just those records gives the same groups as
+    regrouping the whole list.
+    """
+    collaborator_by_id = {str(item.id): item for item in collaborators}
+    row_by_member: dict[str, CollaborationLandingRow] = {}
+    for row in existing_rows:
+        for member_id in row.member_ids or []:
+            row_by_member[str(member_id)] = row
+    changed = set(changed_collaborator_ids)
+    # Records edited outside these hooks (imports, merges, deletes) heal here:
+    # unmaterialised collaborators and rows naming missing records count as changed.
+    changed.update(
+        collaborator_id
+        for collaborator_id in collaborator_by_id
+        if collaborator_id not in row_by_member
+    )
+    for row in existing_rows:
+        member_ids = [str(member_id) for member_id in row.member_ids or []]
+        if str(row.collaborator_id) not in collaborator_by_id or any(
+            member_id not in collaborator_by_id for member_id in member_ids
+        ):
+            changed.update(member_ids)
+            changed.add(str(row.collaborator_id))
+
+    scope_ids: set[str] = set()
+    stale_rows: dict[str, CollaborationLandingRow] = {}
+
+    def _include(collaborator_id: str) -> None:
+        scope_ids.add(collaborator_id)
+        row = row_by_member.get(collaborator_id)
+        if row is not None and row.id not in stale_rows:
+            stale_rows[row.id] = row
+            scope_ids.update(str(member_id) for member_id in row.member_ids or [])
+
+    for collaborator_id in changed:
+        _include(collaborator_id)
+    tokens_by_id = {
+        collaborator_id: set(_collaborator_identity_tokens(collaborator))
+        for collaborator_id, collaborator in collaborator_by_id.items()
+    }
+    for collaborator_id in changed:
+        collaborator = collaborator_by_id.get(collaborator_id)
+        if collaborator is None:
+            continue
+        for other_id, other in collaborator_by_id.items():
+            if other_id in scope_ids:
+                continue
+            if tokens_by_id[collaborator_id] & tokens_by_id[
+                other_id
+            ] or _collaborators_fuzzy_linked(collaborator, other):
+                _include(other_id)
+    return scope_ids & set(collaborator_by_id), list(stale_rows.values())
+
+
+def _sync_landing_shared_works(
+    *,
+    session: Session,
+    user_id: str,
+    collaborator_ids: set[str] | None,
+    items_by_collaborator_id: dict[str, list[dict[str, Any]]],
+) -> None:
+    query = select(CollaborationLandingSharedWork).where(
+        CollaborationLandingSharedWork.owner_user_id == user_id
+    )
+    if collaborator_ids is not None:
+        if not collaborator_ids:
+            return
+        query = query.where(
+            CollaborationLandingSharedWork.collaborator_id.in_(sorted(collaborator_ids))
+        )
+    existing = {
+        (str(row.collaborator_id), str(row.work_id)): row
+        for row in session.scalars(query).all()
+    }
+    for collaborator_id, items in items_by_collaborator_id.items():
+        for item in items:
+            key = (collaborator_id, str(item["work_id"]))
+            row = existing.pop(key, None)
+            if row is None:
+                row = CollaborationLandingSharedWork(
+                    owner_user_id=user_id,
+                    collaborator_id=collaborator_id,
+                    work_id=key[1],
+                )
+                session.add(row)
+            values = {
+                "title": item["title"],
+                "sort_title": str(item["title"]).lower()[:255],
+                "year": item.get("year"),
+                "venue_name": item.get("venue_name"),
+                "publication_type": item.get("publication_type"),
+                "citations_total": int(item.get("citations_total") or 0),
+            }
+            for field, value in values.items():
+                if getattr(row, field) != value:
+                    setattr(row, field, value)
+    for row in existing.values():
+        session.delete(row)
+
+
+def _refresh_collaboration_landing(
     *,
     session: Session,
     user_id: str,
+    changed_collaborator_ids: set[str] | None = None,
     now: datetime | None = None,
     collaborators: list[Collaborator] | None = None,
     metrics_rows: dict[str, CollaborationMetric] | None = None,
     work_by_id: dict[str, Work] | None = None,
     shared_by_collaborator: dict[str, set[str]] | None = None,
     collaborator_groups: dict[str, list[Collaborator]] | None = None,
-    collaborator_to_key: dict[str, str] | None = None,
 ) -> dict[str, Any]:
+    """Bring the landing rows up to date and return the refreshed summary.
+
+    ``changed_collaborator_ids=None`` regroups every collaborator; otherwise
+    only the groups touched by those ids are rebuilt. Either way only rows
+    whose content changed are written.
+    """
     effective_now = _coerce_utc(now) if isinstance(now, datetime) else _utcnow()
     if collaborators is None or metrics_rows is None:
         collaborators, metrics_rows = _collaborator_rows_with_metrics(
@@ -872,61 +1063,116 @@ def _build_collaboration_landing_payload(
             user_id=user_id,
             for_update=False,
         )
-    collaborator_groups = (
-        collaborator_groups
-        if collaborator_groups is not None and collaborator_to_key is not None
-        else _collaborator_groups(collaborators)
+    existing_rows = list(
+        session.scalars(
+            select(CollaborationLandingRow).where(
+                CollaborationLandingRow.owner_user_id == user_id
+            )
+        ).all()
     )
-    if isinstance(collaborator_groups, tuple):
-        collaborator_groups, collaborator_to_key = collaborator_groups
-    if collaborator_to_key is None:
-        _, collaborator_to_key = _collaborator_groups(collaborators)
-    listing_items = _canonicalize_collaborator_payloads(
+    full_rebuild = changed_collaborator_ids is None or not existing_rows
+    if full_rebuild:
+        scope_ids = {str(item.id) for item in collaborators}
+        stale_rows = existing_rows
+    else:
+        scope_ids, stale_rows = _landing_refresh_scope(
+            collaborators=collaborators,
+            existing_rows=existing_rows,
+            changed_collaborator_ids=set(changed_collaborator_ids or ()),
+        )
+        collaborator_groups = None
+        shared_by_collaborator = None
+    scope_collaborators = [item for item in collaborators if str(item.id) in scope_ids]
+    if collaborator_groups is None:
+        collaborator_groups, _ = _collaborator_groups(scope_collaborators)
+    collaborator_to_key = {
+        str(member.id): group_key
+        for group_key, members in collaborator_groups.items()
+        for member in members
+    }
+    affiliation_labels = _affiliation_labels_by_collaborator(
         session,
-        collaborators=collaborators,
-        metrics_by_collaborator=metrics_rows,
+        collaborator_ids=sorted(scope_ids),
+    )
+    rows_by_representative = {str(row.collaborator_id): row for row in stale_rows}
+    kept_row_ids: set[str] = set()
+    for members in collaborator_groups.values():
+        payload = _canonical_group_payload(
+            members,
+            metrics_by_collaborator=metrics_rows,
+            affiliation_labels=affiliation_labels,
+        )
+        row = rows_by_representative.get(str(payload["id"]))
+        if row is None:
+            row = CollaborationLandingRow(
+                owner_user_id=user_id,
+                collaborator_id=str(payload["id"]),
+            )
+            session.add(row)
+        else:
+            kept_row_ids.add(row.id)
+        _apply_landing_row(row, members=members, payload=payload, now=effective_now)
+    for row in stale_rows:
+        if row.id not in kept_row_ids:
+            session.delete(row)
+
+    items_by_collaborator_id: dict[str, list[dict[str, Any]]] = {}
+    if scope_collaborators:
+        if work_by_id is None or shared_by_collaborator is None:
+            _, work_by_id, authorships, authors_by_id = _load_collaboration_work_context(
+                session=session,
+                user_id=user_id,
+            )
+            shared_by_collaborator = _build_collaboration_work_index(
+                collaborators=scope_collaborators,
+                works=list(work_by_id.values()),
+                authorships=authorships,
+                authors_by_id=authors_by_id,
+            )
+        items_by_collaborator_id = _build_shared_work_items_by_collaborator(
+            collaborators=scope_collaborators,
+            collaborator_groups=collaborator_groups,
+            collaborator_to_key=collaborator_to_key,
+            shared_by_collaborator=shared_by_collaborator,
+            work_by_id=work_by_id,
+        )
+    _sync_landing_shared_works(
+        session=session,
+        user_id=user_id,
+        collaborator_ids=None if full_rebuild else scope_ids,
+        items_by_collaborator_id=items_by_collaborator_id,
     )
+    session.flush()
+
+    group_metrics = [
+        _landing_row_metrics(value)
+        for value in session.scalars(
+            select(CollaborationLandingRow.metrics_json).where(
+                CollaborationLandingRow.owner_user_id == user_id
+            )
+        ).all()
+    ]
     summary = _build_summary_response(
         collaborators=collaborators,
         metrics_rows=metrics_rows,
         now=effective_now,
+        group_metrics=group_metrics,
     )
-    if work_by_id is None or shared_by_collaborator is None:
-        _, work_by_id, authorships, authors_by_id = _load_collaboration_work_context(
-            session=session,
-            user_id=user_id,
-        )
-        shared_by_collaborator = _build_collaboration_work_index(
-            collaborators=collaborators,
-            works=list(work_by_id.values()),
-            authorships=authorships,
-            authors_by_id=authors_by_id,
-        )
-    shared_works_by_collaborator_id = _build_shared_work_items_by_collaborator(
-        collaborators=collaborators,
-        collaborator_groups=collaborator_groups,
-        collaborator_to_key=collaborator_to_key,
-        shared_by_collaborator=shared_by_collaborator,
-        work_by_id=work_by_id,
+    _upsert_collaboration_landing_cache(
+        session=session,
+        user_id=user_id,
+        summary=summary,
+        computed_at=effective_now,
+        status=str(summary.get("status") or READY_STATUS),
     )
-    return {
-        "summary": summary,
-        "listing": {
-            "items": listing_items,
-            "page": 1,
-            "page_size": max(1, len(listing_items)),
-            "total": len(listing_items),
-            "has_more": False,
-        },
-        "sharedWorksByCollaboratorId": shared_works_by_collaborator_id,
-    }
+    return _json_safe_data(summary)
 
 
 def _upsert_collaboration_landing_cache(
     *,
     session: Session,
     user_id: str,
-    payload: dict[str, Any],
+    summary: dict[str, Any],
     computed_at: datetime | None = None,
     status: str = READY_STATUS,
     last_error: str | None = None,
@@ -939,7 +1185,9 @@ def _upsert_collaboration_landing_cache(
     if row is None:
         row = CollaborationLandingCache(owner_user_id=user_id)
         session.add(row)
-    row.payload_json = _json_safe_data(payload)
+    row.payload_json = _json_safe_data(
+        {"layout": LANDING_LAYOUT_VERSION, "summary": summary}
+    )
     row.computed_at = _coerce_utc_or_none(computed_at)
     row.status = _normalize_status(status)
     row.last_error = (
@@ -948,7 +1196,7 @@ def _upsert_collaboration_landing_cache(
     session.flush()
 
 
-def _read_collaboration_landing_cache(
+def _read_collaboration_landing_summary(
     *, session: Session, user_id: str
 ) -> dict[str, Any] | None:
     row = session.scalars(
@@ -959,59 +1207,126 @@ def _read_collaboration_landing_cache(
     payload = row.payload_json if row and isinstance(row.payload_json, dict) else None
     if not isinstance(payload, dict):
         return None
-    summary = payload.get("summary")
-    listing = payload.get("listing")
-    shared_works_by_collaborator_id = payload.get("sharedWorksByCollaboratorId")
-    if not isinstance(summary, dict) or not isinstance(listing, dict):
-        return None
-    if not isinstance(listing.get("items"), list):
+    # Caches written before the landing rows existed hold the whole listing
+    # in one blob; treat them as a miss so the rows get materialised.
+    if payload.get("layout") != LANDING_LAYOUT_VERSION:
         return None
-    if not isinstance(shared_works_by_collaborator_id, dict):
-        shared_works_by_collaborator_id = {}
-    return {
-        "summary": summary,
-        "listing": listing,
-        "sharedWorksByCollaboratorId": shared_works_by_collaborator_id,
-    }
+    summary = payload.get("summary")
+    return summary if isinstance(summary, dict) else None
 
 
-def _collaborator_row_matches_query(row: dict[str, Any], clean_query: str) -> bool:
-    if not clean_query:
-        return True
-    haystack: list[str] = []
-    for key in (
-        "full_name",
-        "preferred_name",
-        "email",
-        "secondary_email",
-        "contact_first_name",
-        "contact_surname",
-        "contact_email",
-        "contact_secondary_email",
-        "orcid_id",
-        "openalex_author_id",
-        "primary_institution",
-        "country",
-        "contact_country",
-        "current_position",
-    ):
-        haystack.append(re.sub(r"\s+", " ", str(row.get(key) or "").strip().lower()))
-    for key in ("research_domains", "institution_labels"):
-        values = row.get(key)
-        if not isinstance(values, list):
-            continue
-        haystack.extend(
-            re.sub(r"\s+", " ", str(value or "").strip().lower()) for value in values
+def _ensure_collaboration_landing(*, session: Session, user_id: str) -> dict[str, Any]:
+    summary = _read_collaboration_landing_summary(session=session, user_id=user_id)
+    if summary is None:
+        summary = _refresh_collaboration_landing(session=session, user_id=user_id)
+    return summary
+
+
+def _landing_row_order_by(sort: str) -> list[Any]:
+    normalized = (sort or "name").strip().lower()
+    if normalized in {"coauthored", "coauthored_works", "works"}:
+        leading = [CollaborationLandingRow.coauthored_works_count.desc()]
+    elif normalized in {"strength", "score"}:
+        leading = [CollaborationLandingRow.collaboration_strength_score.desc()]
+    elif normalized in {"last_year", "last_collaboration_year"}:
+        leading = [
+            func.coalesce(CollaborationLandingRow.last_collaboration_year, -1).desc()
+        ]
+    elif normalized in {"updated", "updated_at"}:
+        leading = [CollaborationLandingRow.collaborator_updated_at.desc()]
+    else:
+        leading = []
+    return [
+        *leading,
+        CollaborationLandingRow.sort_name.asc(),
+        CollaborationLandingRow.collaborator_id.asc(),
+    ]
+
+
+def _query_collaboration_landing_page(
+    *,
+    session: Session,
+    user_id: str,
+    clean_query: str,
+    sort: str,
+    page: int,
+    page_size: int,
+) -> tuple[dict[str, Any], list[CollaborationLandingRow]]:
+    conditions = [
+        CollaborationLandingRow.owner_user_id == user_id,
+        CollaborationLandingRow.is_listed.is_(True),
+    ]
+    if clean_query:
+        conditions.append(
+            CollaborationLandingRow.search_text.contains(clean_query, autoescape=True)
+        )
+    total = int(
+        session.scalar(
+            select(func.count())
+            .select_from(CollaborationLandingRow)
+            .where(*conditions)
         )
-    return any(clean_query in value for value in haystack if value)
+        or 0
+    )
+    rows = session.scalars(
+        select(CollaborationLandingRow)
+        .where(*conditions)
+        .order_by(*_landing_row_order_by(sort))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).all()
+    listing = {
+        "items": [dict(row.payload_json or {}) for row in rows],
+        "page": page,
+        "page_size": page_size,
+        "total": total,
+        "has_more": page * page_size < total,
+    }
+    return listing, list(rows)
 
 
-def _filter_collaborator_rows(
-    rows: list[dict[str, Any]], *, clean_query: str
-) -> list[dict[str, Any]]:
-    if not clean_query:
-        return list(rows)
-    return [row for row in rows if _collaborator_row_matches_query(row, clean_query)]
+def _serialize_landing_shared_work(row: CollaborationLandingSharedWork) -> dict[str, Any]:
+    return {
+        "work_id": str(row.work_id),
+        "title": row.title,
+        "year": row.year,
+        "venue_name": row.venue_name,
+        "publication_type": row.publication_type,
+        "citations_total": int(row.citations_total or 0),
+    }
+
+
+def _landing_shared_works_by_collaborator(
+    *,
+    session: Session,
+    user_id: str,
+    collaborator_ids: list[str] | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return shared works keyed by collaborator id; ``None`` means every collaborator."""
+    items_by_collaborator_id: dict[str, list[dict[str, Any]]] = {
+        collaborator_id: [] for collaborator_id in collaborator_ids or []
+    }
+    conditions = [CollaborationLandingSharedWork.owner_user_id == user_id]
+    if collaborator_ids is not None:
+        if not collaborator_ids:
+            return items_by_collaborator_id
+        conditions.append(
+            CollaborationLandingSharedWork.collaborator_id.in_(collaborator_ids)
+        )
+    rows = session.scalars(
+        select(CollaborationLandingSharedWork)
+        .where(*conditions)
+        .order_by(
+            CollaborationLandingSharedWork.collaborator_id.asc(),
+            func.coalesce(CollaborationLandingSharedWork.year, -1).desc(),
+            CollaborationLandingSharedWork.sort_title.asc(),
+        )
+    ).all()
+    for row in rows:
+        items_by_collaborator_id.setdefault(str(row.collaborator_id), []).append(
+            _serialize_landing_shared_work(row)
+        )
+    return items_by_collaborator_id
 
 
 def _affiliation_similarity(a: str | None, b: str | None) -> float:
@@ -1034,7 +1349,7 @@ _SURNAME_PARTICLES = frozenset({
 })
 
 
-def _parse_name_parts(name: str) -> tuple[str, list[str]]:
+def parse_name_parts(name: str) -> tuple[str, list[str]]:
     """Parse a name into (surname, [given_name_parts]).
 
     Handles:
@@ -1106,8 +1421,8 @@ def _name_initial_compatible(a: str, b: str) -> bool:
       "Alice Matthews"  ↔ "Gareth Matthews"  (different first name)
       "Gareth Matthews" ↔ "Gareth Smith"     (different surname)
     """
-    surname_a, given_a = _parse_name_parts(a)
-    surname_b, given_b = _parse_name_parts(b)
+    surname_a, given_a = parse_name_parts(a)
+    surname_b, given_b = parse_name_parts(b)
     if not surname_a or not surname_b:
         return False
     # Surnames must match closely
@@ -1193,9 +1508,9 @@ def _match_existing_collaborator_identity(
     name_only_similarity_threshold: float = 0.97,
 ) -> Collaborator | None:
     candidate_openalex = _normalize_openalex_author_id(openalex_author_id)
-    candidate_openalex_key = _openalex_identity_key(candidate_openalex)
-    candidate_email_key = _email_identity_key(email)
-    candidate_secondary_email_key = _email_identity_key(secondary_email)
+    candidate_openalex_key = openalex_identity_key(candidate_openalex)
+    candidate_email_key = email_identity_key(email)
+    candidate_secondary_email_key = email_identity_key(secondary_email)
     candidate_name = _normalize_name(str(full_name or ""))
     candidate_institution = re.sub(
         r"\s+", " ", str(primary_institution or "").strip()
@@ -1209,11 +1524,11 @@ def _match_existing_collaborator_identity(
         if exclude_collaborator_id and str(row.id) == str(exclude_collaborator_id):
             continue
         if candidate_openalex_key:
-            if _openalex_identity_key(row.openalex_author_id) == candidate_openalex_key:
+            if openalex_identity_key(row.openalex_author_id) == candidate_openalex_key:
                 return row
         row_email_keys = {
-            _email_identity_key(row.email),
-            _email_identity_key(row.secondary_email),
+            email_identity_key(row.email),
+            email_identity_key(row.secondary_email),
         }
         if candidate_email_key and candidate_email_key in row_email_keys:
             return row
@@ -1255,31 +1570,6 @@ def _match_existing_collaborator_identity(
     return None
 
 
-def _collab_sort_key(item: dict[str, Any], sort: str) -> tuple:
-    metrics = item.get("metrics") if isinstance(item.get("metrics"), dict) else {}
-    normalized = (sort or "name").strip().lower()
-    if normalized in {"coauthored", "coauthored_works", "works"}:
-        return (
-            -int(metrics.get("coauthored_works_count") or 0),
-            item["full_name"].lower(),
-        )
-    if normalized in {"strength", "score"}:
-        return (
-            -float(metrics.get("collaboration_strength_score") or 0.0),
-            item["full_name"].lower(),
-        )
-    if normalized in {"last_year", "last_collaboration_year"}:
-        year = _safe_int(metrics.get("last_collaboration_year"))
-        return (-(year if year is not None else -1), item["full_name"].lower())
-    if normalized in {"updated", "updated_at"}:
-        updated = item.get("updated_at")
-        timestamp = (
-            _coerce_utc(updated).timestamp() if isinstance(updated, datetime) else 0.0
-        )
-        return (-timestamp, item["full_name"].lower())
-    return (item["full_name"].lower(),)
-
-
 def list_collaborators_for_user(
     *,
     user_id: str,
@@ -1294,37 +1584,16 @@ def list_collaborators_for_user(
     page_size = max(1, min(int(page_size or 50), 200))
     with session_scope() as session:
         _resolve_user_or_raise(session, user_id)
-        cached_payload = _read_collaboration_landing_cache(
+        _ensure_collaboration_landing(session=session, user_id=user_id)
+        listing, _ = _query_collaboration_landing_page(
             session=session,
             user_id=user_id,
-        )
-        if cached_payload is None:
-            cached_payload = _build_collaboration_landing_payload(
-                session=session,
-                user_id=user_id,
-            )
-            _upsert_collaboration_landing_cache(
-                session=session,
-                user_id=user_id,
-                payload=cached_payload,
-                computed_at=_utcnow(),
-                status=str(cached_payload.get("summary", {}).get("status") or READY_STATUS),
-            )
-        rows = _filter_collaborator_rows(
-            list(cached_payload["listing"].get("items") or []),
             clean_query=clean_query,
+            sort=sort,
+            page=page,
+            page_size=page_size,
         )
-        rows.sort(key=lambda item: _collab_sort_key(item, sort))
-        total = len(rows)
-        start = (page - 1) * page_size
-        end = start + page_size
-        return {
-            "items": rows[start:end],
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "has_more": end < total,
-        }
+        return listing
 
 
 def get_collaboration_landing_for_user(
@@ -1342,44 +1611,34 @@ def get_collaboration_landing_for_user(
     page_size = max(1, min(int(page_size or 50), 200))
     with session_scope() as session:
         _resolve_user_or_raise(session, user_id)
-        cached_payload = _read_collaboration_landing_cache(
+        summary = _ensure_collaboration_landing(session=session, user_id=user_id)
+        listing, rows = _query_collaboration_landing_page(
             session=session,
             user_id=user_id,
-        )
-        if cached_payload is None:
-            cached_payload = _build_collaboration_landing_payload(
-                session=session,
-                user_id=user_id,
-            )
-            _upsert_collaboration_landing_cache(
-                session=session,
-                user_id=user_id,
-                payload=cached_payload,
-                computed_at=_utcnow(),
-                status=str(cached_payload.get("summary", {}).get("status") or READY_STATUS),
-            )
-        rows = _filter_collaborator_rows(
-            list(cached_payload["listing"].get("items") or []),
             clean_query=clean_query,
+            sort=sort,
+            page=page,
+            page_size=page_size,
         )
-        rows.sort(key=lambda item: _collab_sort_key(item, sort))
-        total = len(rows)
-        start = (page - 1) * page_size
-        end = start + page_size
         response: dict[str, Any] = {
-            "summary": dict(cached_payload.get("summary") or {}),
-            "listing": {
-                "items": rows[start:end],
-                "page": page,
-                "page_size": page_size,
-                "total": total,
-                "has_more": end < total,
-            },
+            "summary": dict(summary),
+            "listing": listing,
             "sharedWorksByCollaboratorId": {},
         }
         if include_shared_works:
-            response["sharedWorksByCollaboratorId"] = dict(
-                cached_payload.get("sharedWorksByCollaboratorId") or {}
+            # Only the groups on this page; other collaborators load on demand.
+            response["sharedWorksByCollaboratorId"] = (
+                _landing_shared_works_by_collaborator(
+                    session=session,
+                    user_id=user_id,
+                    collaborator_ids=sorted(
+                        {
+                            str(member_id)
+                            for row in rows
+                            for member_id in row.member_ids or []
+                        }
+                    ),
+                )
             )
         return response
 
@@ -1553,6 +1812,11 @@ def create_collaborator_for_user(
         )
         session.add(metric)
         session.flush()
+        _refresh_collaboration_landing(
+            session=session,
+            user_id=user_id,
+            changed_collaborator_ids={str(collaborator.id)},
+        )
         response = _serialize_collaborator(
             collaborator,
             metric=metric,
@@ -1594,24 +1858,13 @@ def list_collaborator_shared_works_for_user(
             user_id=user_id,
             collaborator_id=collaborator_id,
         )
-        cached_payload = _read_collaboration_landing_cache(
+        _ensure_collaboration_landing(session=session, user_id=user_id)
+        items_by_collaborator_id = _landing_shared_works_by_collaborator(
             session=session,
             user_id=user_id,
+            collaborator_ids=[str(collaborator.id)],
         )
-        if cached_payload is None:
-            cached_payload = _build_collaboration_landing_payload(
-                session=session,
-                user_id=user_id,
-            )
-            _upsert_collaboration_landing_cache(
-                session=session,
-                user_id=user_id,
-                payload=cached_payload,
-                computed_at=_utcnow(),
-                status=str(cached_payload.get("summary", {}).get("status") or READY_STATUS),
-            )
-        items_by_collaborator_id = cached_payload["sharedWorksByCollaboratorId"]
-        return {"items": list(items_by_collaborator_id.get(str(collaborator.id), []))}
+        return {"items": items_by_collaborator_id[str(collaborator.id)]}
 
 
 def list_collaborators_shared_works_for_user(
@@ -1621,25 +1874,17 @@ def list_collaborators_shared_works_for_user(
     create_all_tables()
     with session_scope() as session:
         _resolve_user_or_raise(session, user_id)
-        cached_payload = _read_collaboration_landing_cache(
+        _ensure_collaboration_landing(session=session, user_id=user_id)
+        items_by_collaborator_id = _landing_shared_works_by_collaborator(
             session=session,
             user_id=user_id,
+            collaborator_ids=None,
         )
-        if cached_payload is None:
-            cached_payload = _build_collaboration_landing_payload(
-                session=session,
-                user_id=user_id,
-            )
-            _upsert_collaboration_landing_cache(
-                session=session,
-                user_id=user_id,
-                payload=cached_payload,
-                computed_at=_utcnow(),
-                status=str(cached_payload.get("summary", {}).get("status") or READY_STATUS),
-            )
-        return {
-            "items_by_collaborator_id": cached_payload["sharedWorksByCollaboratorId"]
-        }
+        for collaborator_id in session.scalars(
+            select(Collaborator.id).where(Collaborator.owner_user_id == user_id)
+        ).all():
+            items_by_collaborator_id.setdefault(str(collaborator_id), [])
+        return {"items_by_collaborator_id": items_by_collaborator_id}
 
 
 def _list_shared_works_by_collaborator_for_user(
@@ -1964,7 +2209,12 @@ def update_collaborator_for_user(
                 source_json={"formula_version": FORMULA_VERSION, "failures_in_row": 0},
             )
             session.add(metric)
-            session.flush()
+        session.flush()
+        _refresh_collaboration_landing(
+            session=session,
+            user_id=user_id,
+            changed_collaborator_ids={str(collaborator.id)},
+        )
         response = _serialize_collaborator(
             collaborator,
             metric=metric,
@@ -1989,6 +2239,12 @@ def delete_collaborator_for_user(
             collaborator_id=collaborator_id,
         )
         session.delete(collaborator)
+        session.flush()
+        _refresh_collaboration_landing(
+            session=session,
+            user_id=user_id,
+            changed_collaborator_ids={str(collaborator_id)},
+        )
         deleted = True
     if deleted:
         enqueue_collaboration_metrics_recompute(
@@ -2405,25 +2661,6 @@ def _mark_running(*, user_id: str, force: bool = False) -> bool:
         return True
 
 
-def _get_executor() -> ThreadPoolExecutor:
-    global _executor
-    with _executor_lock:
-        if _executor is None:
-            _executor = ThreadPoolExecutor(
-                max_workers=_max_concurrent_jobs(),
-                thread_name_prefix="collab-metrics",
-            )
-        return _executor
-
-
-def _shutdown_executor() -> None:
-    global _executor
-    with _executor_lock:
-        if _executor is not None:
-            _executor.shutdown(wait=False, cancel_futures=False)
-            _executor = None
-
-
 def _persist_failed(*, user_id: str, detail: str) -> None:
     now = _utcnow()
     with session_scope() as session:
@@ -2481,6 +2718,17 @@ def _run_background_compute(user_id: str) -> None:
         _persist_failed(user_id=user_id, detail=str(exc))
 
 
+def _run_background_compute_job(payload: dict[str, Any]) -> None:
+    _run_background_compute(str(payload.get("user_id") or ""))
+
+
+register_job_kind(
+    COLLABORATION_METRICS_JOB_KIND,
+    _run_background_compute_job,
+    max_concurrency=_max_concurrent_jobs,
+)
+
+
 def enqueue_collaboration_metrics_recompute(
     *,
     user_id: str,
@@ -2492,19 +2740,23 @@ def enqueue_collaboration_metrics_recompute(
     if not should_enqueue:
         return False
     try:
-        _get_executor().submit(_run_background_compute, user_id)
-        if reason:
-            logger.info(
-                "collaboration_metrics_enqueue",
-                extra={"user_id": user_id, "reason": reason},
-            )
-        return True
+        enqueued = enqueue_job(
+            kind=COLLABORATION_METRICS_JOB_KIND,
+            payload={"user_id": user_id, "reason": reason},
+            dedupe_key=user_id,
+        )
     except Exception as exc:
         _persist_failed(
             user_id=user_id,
             detail=f"Failed to enqueue collaboration recompute: {exc}",
         )
         return False
+    if enqueued and reason:
+        logger.info(
+            "collaboration_metrics_enqueue",
+            extra={"user_id": user_id, "reason": reason},
+        )
+    return enqueued
 
 
 def _build_collaboration_work_index(
@@ -2559,27 +2811,12 @@ def compute_collaboration_metrics(*, user_id: str) -> dict[str, Any]:
             for_update=True,
         )
         if not collaborators:
-            empty_payload = {
-                "summary": _build_summary_response(
-                    collaborators=[],
-                    metrics_rows={},
-                    now=now,
-                ),
-                "listing": {
-                    "items": [],
-                    "page": 1,
-                    "page_size": 1,
-                    "total": 0,
-                    "has_more": False,
-                },
-                "sharedWorksByCollaboratorId": {},
-            }
-            _upsert_collaboration_landing_cache(
+            _refresh_collaboration_landing(
                 session=session,
                 user_id=user_id,
-                payload=empty_payload,
-                computed_at=now,
-                status=READY_STATUS,
+                now=now,
+                collaborators=[],
+                metrics_rows={},
             )
             return {
                 "updated_collaborators": 0,
@@ -2755,7 +2992,7 @@ def compute_collaboration_metrics(*, user_id: str) -> dict[str, Any]:
         for orphan in orphan_rows:
             session.delete(orphan)
         session.flush()
-        landing_payload = _build_collaboration_landing_payload(
+        _refresh_collaboration_landing(
             session=session,
             user_id=user_id,
             now=now,
@@ -2764,14 +3001,6 @@ def compute_collaboration_metrics(*, user_id: str) -> dict[str, Any]:
             work_by_id=work_by_id,
             shared_by_collaborator=shared_by_collaborator,
             collaborator_groups=collaborator_groups,
-            collaborator_to_key=collaborator_to_key,
-        )
-        _upsert_collaboration_landing_cache(
-            session=session,
-            user_id=user_id,
-            payload=landing_payload,
-            computed_at=now,
-            status=READY_STATUS,
         )
         return {
             "updated_collaborators": len(collaborators),
@@ -2785,21 +3014,25 @@ def _build_summary_response(
     metrics_rows: dict[str, CollaborationMetric],
     now: datetime,
     force_running: bool = False,
+    group_metrics: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    groups, collaborator_to_key = _collaborator_groups(collaborators)
-    total_collaborators = len(groups)
-    metric_payloads_by_group: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for collaborator in collaborators:
-        key = collaborator_to_key.get(str(collaborator.id))
-        if not key:
-            continue
-        metric_payloads_by_group[key].append(
-            _serialize_metric(metrics_rows.get(str(collaborator.id)))
-        )
-    rows = [
-        _merge_metric_payloads(payloads)
-        for payloads in metric_payloads_by_group.values()
-    ]
+    if group_metrics is None:
+        _, collaborator_to_key = _collaborator_groups(collaborators)
+        metric_payloads_by_group: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for collaborator in collaborators:
+            key = collaborator_to_key.get(str(collaborator.id))
+            if not key:
+                continue
+            metric_payloads_by_group[key].append(
+                _serialize_metric(metrics_rows.get(str(collaborator.id)))
+            )
+        rows = [
+            _merge_metric_payloads(payloads)
+            for payloads in metric_payloads_by_group.values()
+        ]
+    else:
+        rows = list(group_metrics)
+    total_collaborators = len(rows)
     computed_values = [
         _coerce_utc_or_none(row.get("computed_at"))
         for row in rows
@@ -2919,7 +3152,7 @@ def _openalex_request_with_retry(*, url: str, params: dict[str, Any]) -> dict[st
     timeout = httpx.Timeout(_openalex_timeout_seconds())
     retries = _openalex_retry_count()
     last_exception: Exception | None = None
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         for attempt in range(retries + 1):
             started = time.perf_counter()
             try:
@@ -3027,7 +3260,8 @@ def _normalize_openalex_institution_id(value: str | None) -> str | None:
     return clean
 
 
-def _openalex_identity_key(value: str | None) -> str:
+def openalex_identity_key(value: str | None) -> str:
+    """Return the comparison key for an OpenAlex author ID or URL."""
     normalized = _normalize_openalex_author_id(value)
     if not normalized:
         return ""
@@ -3152,7 +3386,7 @@ def _iter_openalex_coauthors(
     openalex_author_id: str,
     mailto: str | None,
 ) -> list[dict[str, Any]]:
-    target_openalex_key = _openalex_identity_key(openalex_author_id)
+    target_openalex_key = openalex_identity_key(openalex_author_id)
     max_pages = _openalex_max_pages()
     coauthors: dict[str, dict[str, Any]] = {}
     for page in range(1, max_pages + 1):
@@ -3187,7 +3421,7 @@ def _iter_openalex_coauthors(
                 candidate_openalex_id = _normalize_openalex_author_id(
                     str(author.get("id") or "").strip()
                 )
-                candidate_openalex_key = _openalex_identity_key(candidate_openalex_id)
+                candidate_openalex_key = openalex_identity_key(candidate_openalex_id)
                 if (
                     not candidate_openalex_id
                     or (
@@ -3875,11 +4109,18 @@ def _parse_roles(values: Any) -> list[str]:
     return parsed[:8]
 
 
-def generate_collaboration_ai_insights_draft(*, user_id: str) -> dict[str, Any]:
+def _iter_collaboration_ai_insights_events(
+    *, user_id: str
+) -> Iterator[tuple[str, dict[str, Any]]]:
     create_all_tables()
     with session_scope() as session:
         _resolve_user_or_raise(session, user_id)
+    yield "progress", {"stage": "started"}
     summary = get_collaboration_metrics_summary(user_id=user_id)
+    yield "progress", {
+        "stage": "metrics_loaded",
+        "total_collaborators": int(summary.get("total_collaborators") or 0),
+    }
     listing = list_collaborators_for_user(
         user_id=user_id,
         sort="strength",
@@ -3887,6 +4128,7 @@ def generate_collaboration_ai_insights_draft(*, user_id: str) -> dict[str, Any]:
         page_size=200,
     )
     items = list(listing.get("items") or [])
+    yield "progress", {"stage": "collaborators_loaded", "count": len(items)}
     now_year = _utcnow().year
 
     domain_counter: defaultdict[str, int] = defaultdict(int)
@@ -3955,7 +4197,7 @@ def generate_collaboration_ai_insights_draft(*, user_id: str) -> dict[str, Any]:
             "Maintain cadence with existing collaborators and review domain balance quarterly."
         )
 
-    return {
+    yield "result", {
         "status": "draft",
         "insights": insights[:6],
         "suggested_actions": actions[:5],
@@ -3968,6 +4210,26 @@ def generate_collaboration_ai_insights_draft(*, user_id: str) -> dict[str, Any]:
     }
 
 
+def generate_collaboration_ai_insights_draft(*, user_id: str) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for event, data in _iter_collaboration_ai_insights_events(user_id=user_id):
+        if event == "result":
+            result = data
+    return result
+
+
+def stream_collaboration_ai_insights_draft(
+    *, user_id: str
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(event, data)`` pairs: load-stage progress, then the draft.
+
+    The draft is assembled from collaborator metrics without a model call, so
+    there are no text deltas; the stream exists so every draft endpoint shares
+    one event protocol.
+    """
+    return _iter_collaboration_ai_insights_events(user_id=user_id)
+
+
 def suggest_collaborators_for_manuscript_draft(
     *,
     user_id: str,
@@ -4632,4 +4894,3 @@ def stop_collaboration_metrics_scheduler() -> None:
         if _scheduler is not None:
             _scheduler.shutdown(wait=False)
             _scheduler = None
-    _shutdown_executor()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import csv
 import gzip
 import hashlib
@@ -15,10 +17,12 @@ from typing import Any, Literal
 from uuid import uuid4
 
 from sqlalchemy import String, and_, cast, func, or_, select
+from sqlalchemy.orm import aliased
 
 from research_os.config import get_data_library_root
 from research_os.db import (
     DataLibraryAsset,
+    DataLibraryAssetAccess,
     DataLibraryAssetBlob,
     DataProfile,
     Manuscript,
@@ -37,6 +41,7 @@ from research_os.services.workspace_service import (
     _remove_author_request_for_invitation,
     _save_workspace_state_row,
     get_workspace_access_snapshot,
+    list_workspace_access_snapshots,
 )
 
 SECTION_CONTEXTS = {"RESULTS", "TABLES", "FIGURES", "PLANNER"}
@@ -92,6 +97,7 @@ class PlannerValidationError(RuntimeError):
 
 
 _STORAGE_MIGRATED_ROOTS: set[str] = set()
+_ACCESS_INDEX_BACKFILLED_BINDS: set[str] = set()
 _METADATA_INDEX_CACHE: dict[str, tuple[float, list[str]]] = {}
 
 
@@ -194,20 +200,20 @@ def _escape_like_pattern(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
-def _shared_access_hint_expression(user_ids: list[str]):
-    clean_ids = _normalize_user_ids(user_ids)
+def _json_id_list_hint_expression(column, ids: list[str]):
+    clean_ids = _normalize_user_ids(ids)
     if not clean_ids:
         # Return a deterministic no-match predicate.
-        return cast(DataLibraryAsset.shared_with_user_ids, String).like(
+        return cast(column, String).like(
             '%"__aawe_no_match__"%',
             escape="\\",
         )
     expressions = []
-    for user_id in clean_ids:
-        escaped_user_id = _escape_like_pattern(user_id)
-        pattern = f'%"{escaped_user_id}"%'
+    for clean_id in clean_ids:
+        escaped_id = _escape_like_pattern(clean_id)
+        pattern = f'%"{escaped_id}"%'
         expressions.append(
-            cast(DataLibraryAsset.shared_with_user_ids, String).like(
+            cast(column, String).like(
                 pattern,
                 escape="\\",
             )
@@ -1696,10 +1702,12 @@ def _claim_legacy_ownerless_assets_for_user(*, session, user_id: str | None) ->
         return 0
 
     owner_rows = session.scalars(
-        select(DataLibraryAsset.owner_user_id).where(
+        select(DataLibraryAsset.owner_user_id)
+        .where(
             DataLibraryAsset.owner_user_id.is_not(None),
             DataLibraryAsset.owner_user_id != "",
         )
+        .distinct()
     ).all()
     existing_owner_ids: set[str] = set()
     for owner_row in owner_rows:
@@ -1948,7 +1956,69 @@ def _build_asset_metadata_payload(
     }
 
 
+def _asset_access_index_entries(
+    asset: DataLibraryAsset,
+) -> dict[tuple[str, str], str | None]:
+    entries: dict[tuple[str, str], str | None] = {}
+    for shared_user_id, role in _asset_shared_role_map(asset).items():
+        entries[("share", shared_user_id)] = role
+    for workspace_id in _asset_explicit_workspace_ids(asset):
+        entries[("workspace", workspace_id)] = None
+    for archived_user_id in _asset_archived_user_ids(asset):
+        entries[("archive", archived_user_id)] = None
+    return entries
+
+
+def sync_library_asset_access_index(*, session, asset: DataLibraryAsset) -> None:
+    """Bring the asset's ``data_library_asset_access`` rows in line with its JSON columns."""
+    # Sessions do not autoflush; flushing assigns new asset ids and makes
+    # earlier syncs in this transaction visible to the diff below.
+    session.flush()
+    desired = _asset_access_index_entries(asset)
+    existing_rows = session.scalars(
+        select(DataLibraryAssetAccess).where(
+            DataLibraryAssetAccess.asset_id == asset.id
+        )
+    ).all()
+    for row in existing_rows:
+        key = (row.relation, row.subject_id)
+        if key not in desired:
+            session.delete(row)
+            continue
+        role = desired.pop(key)
+        if row.role != role:
+            row.role = role
+    for (relation, subject_id), role in desired.items():
+        session.add(
+            DataLibraryAssetAccess(
+                asset_id=asset.id,
+                relation=relation,
+                subject_id=subject_id,
+                role=role,
+            )
+        )
+
+
+def _ensure_library_asset_access_index(*, session) -> None:
+    # Assets written before the index existed (or by direct SQL) have no
+    # access rows; index them once per process and database.
+    bind_key = str(session.get_bind().url)
+    if bind_key in _ACCESS_INDEX_BACKFILLED_BINDS:
+        return
+    unindexed_assets = session.scalars(
+        select(DataLibraryAsset).where(
+            DataLibraryAsset.id.not_in(select(DataLibraryAssetAccess.asset_id))
+        )
+    ).all()
+    for asset in unindexed_assets:
+        if _asset_access_index_entries(asset):
+            sync_library_asset_access_index(session=session, asset=asset)
+    session.flush()
+    _ACCESS_INDEX_BACKFILLED_BINDS.add(bind_key)
+
+
 def _sync_asset_metadata_for_row(*, session, asset: DataLibraryAsset, primary_root: Path) -> None:
+    sync_library_asset_access_index(session=session, asset=asset)
     payload = _build_asset_metadata_payload(
         session=session,
         asset=asset,
@@ -2688,6 +2758,144 @@ def upload_library_assets(
     return asset_ids
 
 
+def _encode_library_asset_cursor(
+    *, sort_by: str, sort_direction: str, sort_value: Any, asset_id: str
+) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps(
+        {"s": sort_by, "d": sort_direction, "v": sort_value, "id": asset_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_library_asset_cursor(
+    cursor: str, *, sort_by: str, sort_direction: str
+) -> tuple[Any, str]:
+    clean_cursor = _trim(cursor)
+    try:
+        raw = base64.urlsafe_b64decode(clean_cursor + "=" * (-len(clean_cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise PlannerValidationError("cursor is invalid.") from None
+    if not isinstance(payload, dict) or not _trim(payload.get("id")):
+        raise PlannerValidationError("cursor is invalid.")
+    if payload.get("s") != sort_by or payload.get("d") != sort_direction:
+        raise PlannerValidationError(
+            "cursor does not match the requested sort_by and sort_direction."
+        )
+    value = payload.get("v")
+    try:
+        if sort_by == "uploaded_at":
+            value = datetime.fromisoformat(str(value))
+        elif sort_by == "byte_size":
+            value = int(value or 0)
+        else:
+            value = str(value or "")
+    except (TypeError, ValueError):
+        raise PlannerValidationError("cursor is invalid.") from None
+    return value, _trim(payload.get("id"))
+
+
+def _accessible_project_ids_for_user(
+    *, session, user_id: str, related_user_ids: set[str]
+) -> list[str]:
+    related_user_id_list = sorted(related_user_ids)
+    candidates = session.scalars(
+        select(Project).where(
+            or_(
+                Project.owner_user_id.in_(related_user_id_list),
+                Project.owner_user_id.is_(None),
+                Project.owner_user_id == "",
+                _json_id_list_hint_expression(
+                    Project.collaborator_user_ids, related_user_id_list
+                ),
+            )
+        )
+    ).all()
+    return sorted(
+        _trim(project.id)
+        for project in candidates
+        if _project_allows_user(
+            project, user_id, related_user_ids=related_user_ids
+        )
+    )
+
+
+def _repair_library_asset_owners(
+    *, session, user_id: str, related_user_ids: set[str], storage_root: Path
+) -> None:
+    # Only rows owned by a linked identity or by nobody need repair, so both
+    # lookups use the owner index instead of scanning the library.
+    rebind_ids = sorted(related_user_ids - {user_id})
+    rebound_rows = (
+        session.scalars(
+            select(DataLibraryAsset).where(
+                DataLibraryAsset.owner_user_id.in_(rebind_ids)
+            )
+        ).all()
+        if rebind_ids
+        else []
+    )
+    for row in rebound_rows:
+        row.owner_user_id = user_id
+    ownerless_rows = session.scalars(
+        select(DataLibraryAsset).where(
+            or_(
+                DataLibraryAsset.owner_user_id.is_(None),
+                DataLibraryAsset.owner_user_id == "",
+            )
+        )
+    ).all()
+    fallback_single_owner_user_id = (
+        _single_user_owner_id(session=session) if ownerless_rows else None
+    )
+    for row in ownerless_rows:
+        if fallback_single_owner_user_id:
+            row.owner_user_id = fallback_single_owner_user_id
+        elif not _trim(row.project_id) and not _asset_shared_user_ids(row):
+            row.owner_user_id = user_id
+        elif _trim(row.project_id):
+            project = session.get(Project, _trim(row.project_id))
+            if project is not None:
+                project_owner = _trim(project.owner_user_id)
+                project_collaborators = _normalize_user_ids(
+                    project.collaborator_user_ids
+                )
+                if project_owner:
+                    row.owner_user_id = project_owner
+                elif len(project_collaborators) == 0:
+                    project.owner_user_id = user_id
+                    row.owner_user_id = user_id
+    session.flush()
+    for row in [*rebound_rows, *ownerless_rows]:
+        _refresh_library_asset_storage(
+            session=session, asset=row, storage_root=storage_root
+        )
+
+
+def _refresh_library_asset_storage(
+    *, session, asset: DataLibraryAsset, storage_root: Path
+) -> bool:
+    resolved_storage_path = _resolve_existing_asset_path(
+        asset,
+        storage_root,
+        session=session,
+    )
+    if resolved_storage_path is None:
+        return False
+    resolved_storage_str = str(resolved_storage_path)
+    if _trim(asset.storage_path) != resolved_storage_str:
+        asset.storage_path = resolved_storage_str
+    _sync_asset_metadata_for_row(
+        session=session,
+        asset=asset,
+        primary_root=storage_root,
+    )
+    return True
+
+
 def list_library_assets(
     *,
     project_id: str | None = None,
@@ -2703,6 +2911,7 @@ def list_library_assets(
         "uploaded_at", "filename", "byte_size", "kind", "owner_name"
     ] = "uploaded_at",
     sort_direction: Literal["asc", "desc"] = "desc",
+    cursor: str | None = None,
 ) -> dict[str, object]:
     create_all_tables()
     clean_ownership = _trim(ownership).lower() or "all"
@@ -2730,6 +2939,7 @@ def list_library_assets(
     clean_page = max(1, int(page or 1))
     clean_page_size = max(1, min(int(page_size or 50), 200))
     clean_query = _trim(query).lower()
+    clean_cursor = _trim(cursor)
 
     with session_scope() as session:
         clean_user_id = _trim(user_id) or None
@@ -2740,6 +2950,7 @@ def list_library_assets(
                 "page_size": clean_page_size,
                 "total": 0,
                 "has_more": False,
+                "next_cursor": None,
                 "sort_by": clean_sort_by,
                 "sort_direction": clean_sort_direction,
                 "query": clean_query,
@@ -2790,234 +3001,304 @@ def list_library_assets(
                 session=session, project_id=clean_project_id, user_id=clean_user_id
             )
 
-        def _all_rows() -> list[DataLibraryAsset]:
-            return session.scalars(
-                select(DataLibraryAsset).order_by(DataLibraryAsset.uploaded_at.desc())
-            ).all()
-
-        rows = _all_rows()
-        if not rows:
+        if session.execute(select(DataLibraryAsset.id).limit(1)).first() is None:
             restored_any = _restore_asset_row_from_metadata(
                 session=session,
                 primary_root=storage_root,
                 claimant_user_id=clean_user_id,
             )
-            if restored_any:
-                rows = _all_rows()
-        if not rows:
-            recovered_by_identity = _recover_assets_for_user_from_identity_metadata(
-                session=session,
-                primary_root=storage_root,
-                user_id=clean_user_id,
-                account_key_hint=account_key_hint,
+            if not restored_any:
+                _recover_assets_for_user_from_identity_metadata(
+                    session=session,
+                    primary_root=storage_root,
+                    user_id=clean_user_id,
+                    account_key_hint=account_key_hint,
+                )
+        _repair_library_asset_owners(
+            session=session,
+            user_id=clean_user_id,
+            related_user_ids=related_user_ids,
+            storage_root=storage_root,
+        )
+        _ensure_library_asset_access_index(session=session)
+
+        workspace_snapshots = list_workspace_access_snapshots(
+            session=session,
+            user_id=clean_user_id,
+            include_removed_collaborator=True,
+        )
+        accessible_workspace_ids: list[str] = []
+        external_workspace_ids: list[str] = []
+        workspace_names: dict[str, str] = {}
+        for snapshot in workspace_snapshots:
+            snapshot_workspace_id = _trim(snapshot.get("workspace_id"))
+            if snapshot.get("membership_role") is not None:
+                workspace_names[snapshot_workspace_id] = (
+                    _trim(snapshot.get("workspace_name")) or snapshot_workspace_id
+                )
+            snapshot_role = _trim(snapshot.get("collaborator_role")) or (
+                "owner" if _trim(snapshot.get("membership_role")) == "owner" else ""
             )
-            if recovered_by_identity > 0:
-                rows = _all_rows()
-        fallback_single_owner_user_id = _single_user_owner_id(session=session)
-        storage_available_by_asset_id: dict[str, bool] = {}
-        for row in rows:
-            row_id = _trim(row.id)
-            row_owner_user_id = _trim(row.owner_user_id)
-            if (
-                row_owner_user_id
-                and row_owner_user_id in related_user_ids
-                and row_owner_user_id != clean_user_id
-            ):
-                row.owner_user_id = clean_user_id
-            if (
-                not _trim(row.owner_user_id)
-                and fallback_single_owner_user_id
+            if _workspace_role_to_asset_role(
+                membership_role=snapshot.get("membership_role"),
+                collaborator_role=snapshot_role or None,
             ):
-                row.owner_user_id = fallback_single_owner_user_id
-            elif (
-                not _trim(row.owner_user_id)
-                and clean_user_id
-                and not _trim(row.project_id)
-                and not _asset_shared_user_ids(row)
+                accessible_workspace_ids.append(snapshot_workspace_id)
+            if any(
+                member_id not in related_user_ids
+                for member_id in _normalize_user_ids(snapshot.get("active_member_ids"))
             ):
-                row.owner_user_id = clean_user_id
-            elif (
-                not _trim(row.owner_user_id)
-                and clean_user_id
-                and _trim(row.project_id)
-            ):
-                project = session.get(Project, _trim(row.project_id))
-                if project is not None:
-                    project_owner = _trim(project.owner_user_id)
-                    project_collaborators = _normalize_user_ids(project.collaborator_user_ids)
-                    if project_owner:
-                        row.owner_user_id = project_owner
-                    elif len(project_collaborators) == 0:
-                        project.owner_user_id = clean_user_id
-                        row.owner_user_id = clean_user_id
-            resolved_storage_path = _resolve_existing_asset_path(
-                row,
-                storage_root,
-                session=session,
+                external_workspace_ids.append(snapshot_workspace_id)
+        accessible_project_ids = _accessible_project_ids_for_user(
+            session=session,
+            user_id=clean_user_id,
+            related_user_ids=related_user_ids,
+        )
+
+        asset = DataLibraryAsset
+        access = DataLibraryAssetAccess
+        owner_user = aliased(User)
+
+        def _access_exists(relation: str, subject_predicate):
+            return (
+                select(access.id)
+                .where(
+                    access.asset_id == asset.id,
+                    access.relation == relation,
+                    subject_predicate,
+                )
+                .exists()
             )
-            if resolved_storage_path is None:
-                if row_id:
-                    storage_available_by_asset_id[row_id] = False
-                continue
-            if row_id:
-                storage_available_by_asset_id[row_id] = True
-            resolved_storage_str = str(resolved_storage_path)
-            if _trim(row.storage_path) != resolved_storage_str:
-                row.storage_path = resolved_storage_str
-            _sync_asset_metadata_for_row(
-                session=session,
-                asset=row,
-                primary_root=storage_root,
+
+        def _placed_in(workspace_ids: list[str]):
+            return or_(
+                _access_exists("workspace", access.subject_id.in_(workspace_ids)),
+                Project.workspace_id.in_(workspace_ids),
             )
-        session.flush()
-        accessible_rows = [
-            row
-            for row in rows
-            if _asset_accessible_for_user(session=session, asset=row, user_id=clean_user_id)
-        ]
+
+        owner_is_related = asset.owner_user_id.in_(related_user_id_list)
+        access_source_predicates = {
+            "owner": or_(
+                owner_is_related,
+                and_(
+                    or_(asset.owner_user_id.is_(None), asset.owner_user_id == ""),
+                    or_(asset.project_id.is_(None), asset.project_id == ""),
+                ),
+            ),
+            "direct_share": _access_exists(
+                "share", access.subject_id.in_(related_user_id_list)
+            ),
+            "workspace_member": _placed_in(accessible_workspace_ids),
+            "project_collaborator": asset.project_id.in_(accessible_project_ids),
+        }
+        filters = [or_(*access_source_predicates.values())]
         if clean_project_id:
-            accessible_rows = [
-                row for row in accessible_rows if _trim(row.project_id) == clean_project_id
-            ]
+            filters.append(asset.project_id == clean_project_id)
         if clean_workspace_id:
-            accessible_rows = [
-                row
-                for row in accessible_rows
-                if clean_workspace_id in _asset_workspace_ids(session=session, asset=row)
-            ]
+            filters.append(_placed_in([clean_workspace_id]))
         if clean_ownership == "owned":
-            accessible_rows = [
-                row
-                for row in accessible_rows
-                if _trim(row.owner_user_id) in related_user_ids
-            ]
+            filters.append(owner_is_related)
         elif clean_ownership == "shared_by_me":
-            workspace_member_cache: dict[str, bool] = {}
-            accessible_rows = [
-                row
-                for row in accessible_rows
-                if _asset_is_shared_by_owner(
-                    session=session,
-                    asset=row,
-                    user_id=clean_user_id,
-                    related_user_ids=related_user_ids,
-                    workspace_member_cache=workspace_member_cache,
-                    pending_invitation_asset_ids=pending_invitation_asset_ids,
+            filters.append(owner_is_related)
+            filters.append(
+                or_(
+                    asset.id.in_(sorted(pending_invitation_asset_ids)),
+                    _access_exists(
+                        "share", access.subject_id.not_in(related_user_id_list)
+                    ),
+                    _placed_in(external_workspace_ids),
                 )
-            ]
+            )
         elif clean_ownership == "shared":
-            accessible_rows = [
-                row
-                for row in accessible_rows
-                if _trim(row.owner_user_id) not in related_user_ids
-            ]
-        payload_items = [
-            _serialize_library_asset(
-                session=session,
-                asset=row,
-                requesting_user_id=clean_user_id,
-                related_user_ids=related_user_ids,
-                is_available=storage_available_by_asset_id.get(
-                    _trim(row.id),
-                    _asset_storage_exists(row, storage_root, session=session),
-                ),
-                pending_members_by_asset_id=pending_members_by_asset_id,
+            filters.append(
+                or_(
+                    asset.owner_user_id.is_(None),
+                    asset.owner_user_id.not_in(related_user_id_list),
+                )
             )
-            for row in accessible_rows
-        ]
-
+        archived_for_user = _access_exists(
+            "archive", access.subject_id.in_(related_user_id_list)
+        )
         if clean_scope == "active":
-            payload_items = [
-                item for item in payload_items if not bool(item.get("archived_for_current_user"))
-            ]
+            filters.append(~archived_for_user)
         elif clean_scope == "archived":
-            payload_items = [
-                item for item in payload_items if bool(item.get("archived_for_current_user"))
-            ]
+            filters.append(archived_for_user)
 
+        owner_display_name = func.coalesce(
+            func.nullif(func.trim(owner_user.name), ""),
+            func.nullif(asset.owner_user_id, ""),
+            "Unknown user",
+        )
         if clean_query:
-            def _matches(item: dict[str, object]) -> bool:
-                shared_with = item.get("shared_with")
-                shared_names = ""
-                if isinstance(shared_with, list):
-                    shared_names = " ".join(
-                        _trim(entry.get("name")) if isinstance(entry, dict) else ""
-                        for entry in shared_with
-                    )
-                pending_with = item.get("pending_with")
-                pending_names = ""
-                if isinstance(pending_with, list):
-                    pending_names = " ".join(
-                        _trim(entry.get("name")) if isinstance(entry, dict) else ""
-                        for entry in pending_with
-                    )
-                haystack = " ".join(
-                    [
-                        _trim(item.get("filename")),
-                        _trim(item.get("kind")),
-                        _trim(item.get("mime_type")),
-                        _trim(item.get("owner_name")),
-                        _trim(item.get("workspace_name")),
-                        " ".join(
-                            _trim(name)
-                            for name in (
-                                item.get("workspace_names")
-                                if isinstance(item.get("workspace_names"), list)
-                                else []
-                            )
+            pattern = f"%{_escape_like_pattern(clean_query)}%"
+
+            def _contains(expression):
+                return func.lower(func.coalesce(expression, "")).like(
+                    pattern, escape="\\"
+                )
+
+            shared_user = aliased(User)
+            matching_workspace_ids = sorted(
+                workspace_id
+                for workspace_id, workspace_name in workspace_names.items()
+                if clean_query in workspace_name.lower()
+            )
+            matching_pending_asset_ids = sorted(
+                asset_id
+                for asset_id, members in pending_members_by_asset_id.items()
+                if any(
+                    clean_query in _trim(member.get("name")).lower()
+                    for member in members
+                    if isinstance(member, dict)
+                )
+            )
+            has_placement = or_(
+                _access_exists("workspace", access.subject_id != ""),
+                func.coalesce(Project.workspace_id, "") != "",
+            )
+            has_origin = func.coalesce(asset.origin_workspace_id, "") != ""
+            query_predicates = [
+                _contains(asset.filename),
+                _contains(asset.kind),
+                _contains(asset.mime_type),
+                _contains(owner_display_name),
+                select(access.id)
+                .outerjoin(shared_user, shared_user.id == access.subject_id)
+                .where(
+                    access.asset_id == asset.id,
+                    access.relation == "share",
+                    _contains(
+                        func.coalesce(
+                            func.nullif(func.trim(shared_user.name), ""),
+                            access.subject_id,
+                        )
+                    ),
+                )
+                .exists(),
+                _placed_in(matching_workspace_ids),
+                _access_exists("workspace", _contains(access.subject_id)),
+                _contains(Project.workspace_id),
+                asset.origin_workspace_id.in_(matching_workspace_ids),
+                _contains(asset.origin_workspace_id),
+                asset.id.in_(matching_pending_asset_ids),
+            ]
+            # Derived labels that the serialized item exposes and users can
+            # search for, mapped back to the predicates that produce them.
+            if clean_query in "workspace":
+                query_predicates.append(has_origin)
+            if clean_query in "library":
+                query_predicates.append(~has_origin)
+            if clean_query in "workspace_linked":
+                query_predicates.append(has_placement)
+            if clean_query in "personal":
+                query_predicates.append(~has_placement)
+            for source, predicate in access_source_predicates.items():
+                if clean_query in source:
+                    query_predicates.append(predicate)
+            filters.append(or_(*query_predicates))
+
+        if clean_sort_by == "filename":
+            sort_expression = func.lower(func.coalesce(asset.filename, ""))
+        elif clean_sort_by == "byte_size":
+            sort_expression = func.coalesce(asset.byte_size, 0)
+        elif clean_sort_by == "kind":
+            sort_expression = func.lower(func.coalesce(asset.kind, ""))
+        elif clean_sort_by == "owner_name":
+            sort_expression = func.lower(owner_display_name)
+        else:
+            sort_expression = asset.uploaded_at
+
+        def _listing_statement(*columns):
+            return (
+                select(*columns)
+                .select_from(asset)
+                .outerjoin(Project, Project.id == asset.project_id)
+                .outerjoin(owner_user, owner_user.id == asset.owner_user_id)
+                .where(*filters)
+            )
+
+        total_row = session.execute(
+            _listing_statement(func.count(asset.id))
+        ).first()
+        total = int(total_row[0] or 0) if total_row else 0
+
+        page_statement = _listing_statement(asset, sort_expression.label("sort_value"))
+        descending = clean_sort_direction == "desc"
+        if clean_cursor:
+            cursor_value, cursor_asset_id = _decode_library_asset_cursor(
+                clean_cursor,
+                sort_by=clean_sort_by,
+                sort_direction=clean_sort_direction,
+            )
+            if descending:
+                page_statement = page_statement.where(
+                    or_(
+                        sort_expression < cursor_value,
+                        and_(
+                            sort_expression == cursor_value,
+                            asset.id < cursor_asset_id,
                         ),
-                        _trim(item.get("origin")),
-                        _trim(item.get("origin_workspace_name")),
-                        _trim(item.get("ownership_scope")),
-                        " ".join(
-                            _trim(source)
-                            for source in (
-                                item.get("current_user_access_sources")
-                                if isinstance(item.get("current_user_access_sources"), list)
-                                else []
-                            )
+                    )
+                )
+            else:
+                page_statement = page_statement.where(
+                    or_(
+                        sort_expression > cursor_value,
+                        and_(
+                            sort_expression == cursor_value,
+                            asset.id > cursor_asset_id,
                         ),
-                        shared_names,
-                        pending_names,
-                    ]
-                ).lower()
-                return clean_query in haystack
-
-            payload_items = [item for item in payload_items if _matches(item)]
-
-        reverse = clean_sort_direction == "desc"
-
-        def _sort_key(item: dict[str, object]):
-            if clean_sort_by == "filename":
-                return _trim(item.get("filename")).lower()
-            if clean_sort_by == "byte_size":
-                return int(item.get("byte_size") or 0)
-            if clean_sort_by == "kind":
-                return _trim(item.get("kind")).lower()
-            if clean_sort_by == "owner_name":
-                return _trim(item.get("owner_name")).lower()
-            uploaded_at = item.get("uploaded_at")
-            if isinstance(uploaded_at, datetime):
-                return uploaded_at
-            if isinstance(uploaded_at, str):
-                try:
-                    return datetime.fromisoformat(uploaded_at.replace("Z", "+00:00"))
-                except ValueError:
-                    return datetime.fromtimestamp(0)
-            return datetime.fromtimestamp(0)
+                    )
+                )
+        else:
+            page_statement = page_statement.offset((clean_page - 1) * clean_page_size)
+        if descending:
+            page_statement = page_statement.order_by(
+                sort_expression.desc(), asset.id.desc()
+            )
+        else:
+            page_statement = page_statement.order_by(
+                sort_expression.asc(), asset.id.asc()
+            )
+        page_rows = session.execute(
+            page_statement.limit(clean_page_size + 1)
+        ).all()
+        has_more = len(page_rows) > clean_page_size
+        page_rows = page_rows[:clean_page_size]
 
-        payload_items = sorted(payload_items, key=_sort_key, reverse=reverse)
-        total = len(payload_items)
-        start_index = (clean_page - 1) * clean_page_size
-        end_index = start_index + clean_page_size
-        paged_items = payload_items[start_index:end_index]
+        payload_items = []
+        for row, _ in page_rows:
+            is_available = _refresh_library_asset_storage(
+                session=session, asset=row, storage_root=storage_root
+            )
+            payload_items.append(
+                _serialize_library_asset(
+                    session=session,
+                    asset=row,
+                    requesting_user_id=clean_user_id,
+                    related_user_ids=related_user_ids,
+                    is_available=is_available,
+                    pending_members_by_asset_id=pending_members_by_asset_id,
+                )
+            )
+        session.flush()
+        next_cursor = None
+        if has_more and page_rows:
+            last_row, last_sort_value = page_rows[-1]
+            next_cursor = _encode_library_asset_cursor(
+                sort_by=clean_sort_by,
+                sort_direction=clean_sort_direction,
+                sort_value=last_sort_value,
+                asset_id=_trim(last_row.id),
+            )
 
         return {
-            "items": paged_items,
+            "items": payload_items,
             "page": clean_page,
             "page_size": clean_page_size,
             "total": total,
-            "has_more": end_index < total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
             "sort_by": clean_sort_by,
             "sort_direction": clean_sort_direction,
             "query": clean_query,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import threading
+import os
 from datetime import date, datetime, timezone
+from typing import Any
 
 from sqlalchemy import select
 
@@ -12,6 +13,7 @@ from research_os.db import (
     create_all_tables,
     get_session_factory,
 )
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 from research_os.services.manuscript_service import draft_section_from_notes
 from research_os.services.project_service import (
     DEFAULT_SECTIONS,
@@ -41,6 +43,7 @@ class GenerationJobStateError(RuntimeError):
 
 
 DEFAULT_GENERATION_MODEL = "gpt-4.1-mini"
+GENERATION_JOB_KIND = "generation.manuscript_sections"
 _MODEL_PRICING_USD_PER_1M = {
     "gpt-4.1-mini": {"input": 0.40, "output": 1.60},
 }
@@ -117,6 +120,15 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _max_concurrent_jobs() -> int:
+    raw = str(os.getenv("GENERATION_MAX_CONCURRENT_JOBS", "4")).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return 4
+    return max(1, value)
+
+
 def _coerce_utc_date(timestamp: datetime) -> date:
     if timestamp.tzinfo is None:
         return timestamp.date()
@@ -377,14 +389,23 @@ def _run_generation_job(job_id: str) -> None:
         session.close()
 
 
-def _start_generation_thread(job_id: str) -> None:
-    thread = threading.Thread(
-        target=_run_generation_job,
-        args=(job_id,),
-        daemon=True,
-        name=f"generation-job-{job_id[:8]}",
+def _run_generation_queue_job(payload: dict[str, Any]) -> None:
+    _run_generation_job(str(payload.get("job_id") or ""))
+
+
+register_job_kind(
+    GENERATION_JOB_KIND,
+    _run_generation_queue_job,
+    max_concurrency=_max_concurrent_jobs,
+)
+
+
+def _dispatch_generation_job(job_id: str) -> None:
+    enqueue_job(
+        kind=GENERATION_JOB_KIND,
+        payload={"job_id": job_id},
+        dedupe_key=job_id,
     )
-    thread.start()
 
 
 def enqueue_generation_job(
@@ -452,7 +473,7 @@ def enqueue_generation_job(
     finally:
         session.close()
 
-    _start_generation_thread(job.id)
+    _dispatch_generation_job(job.id)
     return job
 
 
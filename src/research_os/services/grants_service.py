@@ -11,6 +11,7 @@ from typing import Any
 import httpx
 from sqlalchemy import delete, select
 
+from research_os.clients.http_client import ProviderClient, provider_client
 from research_os.db import PersonaGrantRecord, User, create_all_tables, session_scope
 
 from research_os.services.api_telemetry_service import record_api_usage_event
@@ -209,7 +210,7 @@ def _author_id_token(value: Any) -> str | None:
 
 def _request_openalex_json(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     url: str,
     params: dict[str, Any],
 ) -> dict[str, Any]:
@@ -265,7 +266,7 @@ def _request_openalex_json(
 
 def _request_provider_json(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     provider: str,
     url: str,
     method: str = "GET",
@@ -360,7 +361,7 @@ def _score_author_match(*, candidate_name: str, first_name: str, last_name: str,
 
 def _resolve_openalex_author(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     mailto: str | None,
@@ -445,7 +446,7 @@ def _grant_key(raw_award: dict[str, Any]) -> str | None:
 
 def _lookup_award_detail(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     mailto: str | None,
     award_id: str | None,
     funder_id: str | None,
@@ -965,7 +966,7 @@ def _enforce_openalex_supporting_works_only(
 
 def _fetch_ukri_grants_for_person(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     target_display_name: str,
@@ -1087,7 +1088,7 @@ def _fetch_ukri_grants_for_person(
 
 def _fetch_nih_reporter_grants_for_person(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     target_display_name: str,
@@ -1210,7 +1211,7 @@ def _fetch_nih_reporter_grants_for_person(
 
 def _fetch_nsf_grants_for_person(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     target_display_name: str,
@@ -1320,7 +1321,7 @@ def _fetch_nsf_grants_for_person(
 
 def _fetch_cordis_grants_for_person(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     target_display_name: str,
@@ -1408,7 +1409,7 @@ def _fetch_cordis_grants_for_person(
 
 def _fetch_external_provider_grants_for_person(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     first_name: str,
     last_name: str,
     target_display_name: str,
@@ -1690,7 +1691,7 @@ def list_openalex_grants_for_person(
     }
     merged_items: list[dict[str, Any]] = []
 
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         author = _resolve_openalex_author(
             client=client,
             first_name=clean_first_name,
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Literal
+from typing import Iterator, Literal
 
-from research_os.clients.openai_client import ask_gpt
+from research_os.clients.openai_client import ask_gpt, ask_gpt_stream
 from research_os.services.citation_service import get_claim_citation_state
 
 StyleProfile = Literal["technical", "concise", "narrative_review"]
@@ -239,37 +239,45 @@ def _extract_unsupported_sentences(
     return unsupported
 
 
-def generate_grounded_section_draft(
+def _iter_grounded_draft_events(
     *,
     section: str,
     notes_context: str,
-    style_profile: StyleProfile = "technical",
-    generation_mode: GenerationMode = "full",
-    plan_objective: str | None = None,
-    must_include: list[str] | None = None,
-    evidence_links: list[dict[str, str]] | None = None,
-    citation_ids: list[str] | None = None,
-    target_instruction: str | None = None,
-    locked_text: str | None = None,
-    model: str = "gpt-4.1-mini",
-) -> dict[str, object]:
+    style_profile: StyleProfile,
+    generation_mode: GenerationMode,
+    plan_objective: str | None,
+    must_include: list[str] | None,
+    evidence_links: list[dict[str, str]] | None,
+    citation_ids: list[str] | None,
+    target_instruction: str | None,
+    locked_text: str | None,
+    model: str,
+    stream: bool,
+) -> Iterator[tuple[str, dict[str, object]]]:
     section_name = section.strip() or "section"
     normalized_must_include = _normalize_text_items(must_include)
     normalized_evidence_links = _normalize_evidence_links(evidence_links)
     explicit_citation_ids = _normalize_text_items(citation_ids)
-    resolved_citation_ids = _resolve_citation_ids(
-        normalized_evidence_links,
-        explicit_citation_ids,
-    )
 
     if generation_mode == "targeted" and not (target_instruction or "").strip():
         raise GroundedDraftGenerationError(
             "Targeted generation mode requires a target instruction."
         )
 
+    pass_names = _pass_sequence(generation_mode)
+    yield "progress", {
+        "stage": "started",
+        "section": section_name,
+        "pass_count": len(pass_names),
+    }
+    resolved_citation_ids = _resolve_citation_ids(
+        normalized_evidence_links,
+        explicit_citation_ids,
+    )
+
     draft = ""
     passes: list[dict[str, str]] = []
-    for pass_name in _pass_sequence(generation_mode):
+    for pass_index, pass_name in enumerate(pass_names):
         prompt = _build_pass_prompt(
             pass_name=pass_name,
             section=section_name,
@@ -284,13 +292,32 @@ def generate_grounded_section_draft(
             locked_text=locked_text,
             current_draft=draft,
         )
+        yield "progress", {
+            "stage": "pass_started",
+            "pass": pass_name,
+            "pass_index": pass_index,
+            "pass_count": len(pass_names),
+        }
         try:
-            draft = ask_gpt(prompt=prompt, model=model).strip()
+            if stream:
+                chunks: list[str] = []
+                for delta in ask_gpt_stream(prompt=prompt, model=model):
+                    chunks.append(delta)
+                    yield "delta", {"pass": pass_name, "text": delta}
+                draft = "".join(chunks).strip()
+            else:
+                draft = ask_gpt(prompt=prompt, model=model).strip()
         except Exception as exc:
             raise GroundedDraftGenerationError(
                 f"Failed to generate grounded draft for '{section_name}' during pass '{pass_name}'."
             ) from exc
         passes.append({"name": pass_name, "content": draft})
+        yield "progress", {
+            "stage": "pass_completed",
+            "pass": pass_name,
+            "pass_index": pass_index,
+            "pass_count": len(pass_names),
+        }
 
     unsupported_sentences = _extract_unsupported_sentences(
         draft,
@@ -298,7 +325,7 @@ def generate_grounded_section_draft(
         citation_ids=resolved_citation_ids,
     )
 
-    return {
+    yield "result", {
         "section": section_name,
         "style_profile": style_profile,
         "generation_mode": generation_mode,
@@ -310,3 +337,72 @@ def generate_grounded_section_draft(
         "citation_ids": resolved_citation_ids,
         "unsupported_sentences": unsupported_sentences,
     }
+
+
+def generate_grounded_section_draft(
+    *,
+    section: str,
+    notes_context: str,
+    style_profile: StyleProfile = "technical",
+    generation_mode: GenerationMode = "full",
+    plan_objective: str | None = None,
+    must_include: list[str] | None = None,
+    evidence_links: list[dict[str, str]] | None = None,
+    citation_ids: list[str] | None = None,
+    target_instruction: str | None = None,
+    locked_text: str | None = None,
+    model: str = "gpt-4.1-mini",
+) -> dict[str, object]:
+    result: dict[str, object] = {}
+    for event, data in _iter_grounded_draft_events(
+        section=section,
+        notes_context=notes_context,
+        style_profile=style_profile,
+        generation_mode=generation_mode,
+        plan_objective=plan_objective,
+        must_include=must_include,
+        evidence_links=evidence_links,
+        citation_ids=citation_ids,
+        target_instruction=target_instruction,
+        locked_text=locked_text,
+        model=model,
+        stream=False,
+    ):
+        if event == "result":
+            result = data
+    return result
+
+
+def stream_grounded_section_draft(
+    *,
+    section: str,
+    notes_context: str,
+    style_profile: StyleProfile = "technical",
+    generation_mode: GenerationMode = "full",
+    plan_objective: str | None = None,
+    must_include: list[str] | None = None,
+    evidence_links: list[dict[str, str]] | None = None,
+    citation_ids: list[str] | None = None,
+    target_instruction: str | None = None,
+    locked_text: str | None = None,
+    model: str = "gpt-4.1-mini",
+) -> Iterator[tuple[str, dict[str, object]]]:
+    """Yield ``(event, data)`` pairs: progress, per-pass text deltas, then the result.
+
+    The first event is yielded only after the request is validated, so callers
+    can pull it eagerly to surface validation errors before streaming starts.
+    """
+    return _iter_grounded_draft_events(
+        section=section,
+        notes_context=notes_context,
+        style_profile=style_profile,
+        generation_mode=generation_mode,
+        plan_objective=plan_objective,
+        must_include=must_include,
+        evidence_links=evidence_links,
+        citation_ids=citation_ids,
+        target_instruction=target_instruction,
+        locked_text=locked_text,
+        model=model,
+        stream=True,
+    )
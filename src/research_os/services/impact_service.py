@@ -11,6 +11,7 @@ from sqlalchemy import select
 
 from research_os.clients.openai_client import create_response
 from research_os.db import ImpactSnapshot, User, create_all_tables, session_scope
+from research_os.services import bibliometrics_service
 from research_os.services.persona_service import (
     get_persona_context,
     get_themes,
@@ -44,14 +45,7 @@ def _resolve_user_or_raise(session, user_id: str) -> User:
 
 
 def _compute_h_index(citations: list[int]) -> int:
-    ordered = sorted([max(0, int(value)) for value in citations], reverse=True)
-    h = 0
-    for index, value in enumerate(ordered, start=1):
-        if value >= index:
-            h = index
-        else:
-            break
-    return h
+    return bibliometrics_service.h_index(citations)
 
 
 def _linear_regression_slope(points: list[tuple[int, float]]) -> float:
@@ -0,0 +1,784 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import signal
+import socket
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+from typing import Any, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select, text, update
+
+from research_os.db import (
+    BackgroundJob,
+    create_all_tables,
+    dialect_insert,
+    session_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED_STATUS = "queued"
+RUNNING_STATUS = "running"
+COMPLETED_STATUS = "completed"
+FAILED_STATUS = "failed"
+ACTIVE_STATUSES = (QUEUED_STATUS, RUNNING_STATUS)
+
+JOB_LANE_INTERACTIVE = "interactive"
+JOB_LANE_DEFAULT = "default"
+JOB_LANE_BULK = "bulk"
+LANE_PRIORITIES = {
+    JOB_LANE_INTERACTIVE: 100,
+    JOB_LANE_DEFAULT: 50,
+    JOB_LANE_BULK: 10,
+}
+
+WORKER_MODE_EMBEDDED = "embedded"
+WORKER_MODE_EXTERNAL = "external"
+WORKER_MODE_INLINE = "inline"
+WORKER_MODES = {WORKER_MODE_EMBEDDED, WORKER_MODE_EXTERNAL, WORKER_MODE_INLINE}
+
+# Modules that register job kinds at import time. Dedicated worker processes
+# import all of them so every kind the API enqueues has a handler.
+JOB_HANDLER_MODULES = (
+    "research_os.services.publication_console_service",
+    "research_os.services.publication_metrics_service",
+    "research_os.services.publications_analytics_service",
+    "research_os.services.collaboration_service",
+    "research_os.services.generation_job_service",
+    "research_os.services.persona_sync_job_service",
+    "research_os.services.publication_insights_agent_service",
+    "research_os.services.admin_service",
+)
+
+_STATS_WINDOW_HOURS = 24
+_POSTGRES_CLAIM_LOCK_KEY = 7_240_415_001
+
+_registry_lock = threading.Lock()
+_job_kinds: dict[str, "JobKind"] = {}
+_claim_lock = threading.Lock()
+_worker_pool_lock = threading.Lock()
+_worker_pool: "JobWorkerPool | None" = None
+
+
+class JobQueueValidationError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class JobKind:
+    kind: str
+    handler: Callable[[dict[str, Any]], None]
+    max_concurrency: int | Callable[[], int] = 2
+    max_attempts: int = 3
+    lane: str = JOB_LANE_DEFAULT
+
+    def concurrency_limit(self) -> int:
+        value = (
+            self.max_concurrency()
+            if callable(self.max_concurrency)
+            else self.max_concurrency
+        )
+        return max(1, _safe_int(value) or 1)
+
+
+@dataclass
+class _ClaimedJob:
+    id: str
+    kind: str
+    lane: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 1
+    max_attempts: int = 1
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _coerce_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _safe_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        clean = value.strip()
+        if not clean:
+            return None
+        try:
+            return int(clean)
+        except Exception:
+            return None
+    return None
+
+
+def _safe_float(value: Any) -> float | None:
+    try:
+        parsed = float(value)
+    except Exception:
+        return None
+    if math.isnan(parsed) or math.isinf(parsed):
+        return None
+    return parsed
+
+
+def _worker_mode() -> str:
+    value = (
+        str(os.getenv("JOB_QUEUE_WORKER_MODE", WORKER_MODE_EMBEDDED)).strip().lower()
+    )
+    return value if value in WORKER_MODES else WORKER_MODE_EMBEDDED
+
+
+def _max_workers() -> int:
+    value = _safe_int(os.getenv("JOB_QUEUE_MAX_WORKERS", "4"))
+    return max(1, min(64, value if value is not None else 4))
+
+
+def _interactive_reserved_slots(max_workers: int) -> int:
+    value = _safe_int(os.getenv("JOB_QUEUE_INTERACTIVE_RESERVED_SLOTS", "1"))
+    return max(0, min(max_workers - 1, value if value is not None else 1))
+
+
+def _poll_seconds() -> float:
+    value = _safe_float(os.getenv("JOB_QUEUE_POLL_SECONDS", "2"))
+    return max(0.05, min(60.0, value if value is not None else 2.0))
+
+
+def _lease_seconds() -> int:
+    value = _safe_int(os.getenv("JOB_QUEUE_LEASE_SECONDS", "120"))
+    return max(15, min(3600, value if value is not None else 120))
+
+
+def _retry_backoff_seconds() -> int:
+    value = _safe_int(os.getenv("JOB_QUEUE_RETRY_BACKOFF_SECONDS", "30"))
+    return max(0, min(3600, value if value is not None else 30))
+
+
+def _retention_hours() -> int:
+    value = _safe_int(os.getenv("JOB_QUEUE_RETENTION_HOURS", "72"))
+    return max(1, min(24 * 90, value if value is not None else 72))
+
+
+def _worker_kinds_filter() -> set[str]:
+    raw = str(os.getenv("JOB_QUEUE_KINDS", "")).strip()
+    return {item.strip() for item in raw.split(",") if item.strip()}
+
+
+def _normalize_lane(value: str | None) -> str:
+    clean = str(value or "").strip().lower()
+    return clean if clean in LANE_PRIORITIES else JOB_LANE_DEFAULT
+
+
+def _new_worker_id() -> str:
+    host = socket.gethostname()[:48] or "host"
+    return f"jobs-{host}-{os.getpid()}-{uuid4().hex[:8]}"
+
+
+def register_job_kind(
+    kind: str,
+    handler: Callable[[dict[str, Any]], None],
+    *,
+    max_concurrency: int | Callable[[], int] = 2,
+    max_attempts: int = 3,
+    lane: str = JOB_LANE_DEFAULT,
+) -> JobKind:
+    clean_kind = str(kind or "").strip()
+    if not clean_kind or len(clean_kind) > 64:
+        raise JobQueueValidationError("Job kind must be 1-64 characters.")
+    spec = JobKind(
+        kind=clean_kind,
+        handler=handler,
+        max_concurrency=max_concurrency,
+        max_attempts=max(1, int(max_attempts)),
+        lane=_normalize_lane(lane),
+    )
+    with _registry_lock:
+        _job_kinds[clean_kind] = spec
+    return spec
+
+
+def registered_job_kinds() -> dict[str, JobKind]:
+    with _registry_lock:
+        return dict(_job_kinds)
+
+
+def load_job_handlers() -> dict[str, JobKind]:
+    for module_name in JOB_HANDLER_MODULES:
+        import_module(module_name)
+    return registered_job_kinds()
+
+
+def enqueue_job(
+    *,
+    kind: str,
+    payload: dict[str, Any] | None = None,
+    dedupe_key: str | None = None,
+    lane: str | None = None,
+    delay_seconds: float = 0,
+) -> bool:
+    spec = registered_job_kinds().get(str(kind or "").strip())
+    if spec is None:
+        raise JobQueueValidationError(f"Unknown job kind '{kind}'.")
+    clean_dedupe_key = str(dedupe_key or "").strip()[:255] or None
+    clean_lane = _normalize_lane(lane or spec.lane)
+    now = _utcnow()
+    create_all_tables()
+    job_id = str(uuid4())
+    with session_scope() as session:
+        # The partial unique index on (kind, dedupe_key) over active jobs turns
+        # a concurrent duplicate enqueue into a no-op instead of a second job.
+        result = session.execute(
+            dialect_insert(session, BackgroundJob)
+            .values(
+                id=job_id,
+                kind=spec.kind,
+                lane=clean_lane,
+                priority=LANE_PRIORITIES[clean_lane],
+                status=QUEUED_STATUS,
+                dedupe_key=clean_dedupe_key,
+                payload_json=dict(payload or {}),
+                attempts=0,
+                max_attempts=spec.max_attempts,
+                available_at=now
+                + timedelta(seconds=max(0.0, float(delay_seconds or 0))),
+                enqueued_at=now,
+            )
+            .on_conflict_do_nothing()
+        )
+        if not result.rowcount:
+            return False
+
+    mode = _worker_mode()
+    if mode == WORKER_MODE_INLINE:
+        run_job_inline(job_id)
+    elif mode == WORKER_MODE_EMBEDDED:
+        _ensure_embedded_worker_pool().kick()
+    return True
+
+
+def _running_counts_by_kind(session, kinds: list[str]) -> dict[str, int]:
+    rows = session.execute(
+        select(BackgroundJob.kind, func.count(BackgroundJob.id))
+        .where(
+            BackgroundJob.status == RUNNING_STATUS,
+            BackgroundJob.kind.in_(kinds),
+        )
+        .group_by(BackgroundJob.kind)
+    ).all()
+    return {str(kind): int(count or 0) for kind, count in rows}
+
+
+def _claim_jobs(
+    *,
+    worker_id: str,
+    kinds: list[str],
+    slots: int,
+    lanes: tuple[str, ...] | None = None,
+    job_id: str | None = None,
+) -> list[_ClaimedJob]:
+    if slots <= 0 or not kinds:
+        return []
+    specs = registered_job_kinds()
+    now = _utcnow()
+    lease_expires_at = now + timedelta(seconds=_lease_seconds())
+    claimed: list[_ClaimedJob] = []
+    with _claim_lock, session_scope() as session:
+        is_postgresql = session.get_bind().dialect.name == "postgresql"
+        if is_postgresql:
+            # Serialise claims across worker processes so per-kind limits hold
+            # globally rather than per process.
+            session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {"key": _POSTGRES_CLAIM_LOCK_KEY},
+            )
+        running = _running_counts_by_kind(session, kinds)
+        capacity = {
+            kind: specs[kind].concurrency_limit() - running.get(kind, 0)
+            for kind in kinds
+            if kind in specs
+        }
+        open_kinds = [kind for kind, free in capacity.items() if free > 0]
+        if not open_kinds:
+            return []
+        stmt = select(BackgroundJob).where(
+            BackgroundJob.status == QUEUED_STATUS,
+            BackgroundJob.kind.in_(open_kinds),
+            BackgroundJob.available_at <= now,
+        )
+        if job_id:
+            stmt = stmt.where(BackgroundJob.id == job_id)
+        if lanes:
+            stmt = stmt.where(BackgroundJob.lane.in_(lanes))
+        stmt = stmt.order_by(
+            BackgroundJob.priority.desc(), BackgroundJob.enqueued_at.asc()
+        ).limit(max(slots * 4, 8))
+        if is_postgresql:
+            stmt = stmt.with_for_update(skip_locked=True)
+        for job in session.scalars(stmt).all():
+            if len(claimed) >= slots:
+                break
+            if capacity.get(job.kind, 0) <= 0:
+                continue
+            capacity[job.kind] -= 1
+            job.status = RUNNING_STATUS
+            job.worker_id = worker_id
+            job.attempts = int(job.attempts or 0) + 1
+            job.started_at = now
+            job.heartbeat_at = now
+            job.lease_expires_at = lease_expires_at
+            job.last_error = None
+            claimed.append(
+                _ClaimedJob(
+                    id=str(job.id),
+                    kind=str(job.kind),
+                    lane=_normalize_lane(job.lane),
+                    payload=dict(job.payload_json or {}),
+                    attempts=int(job.attempts),
+                    max_attempts=max(1, int(job.max_attempts or 1)),
+                )
+            )
+        session.flush()
+    return claimed
+
+
+def _heartbeat_jobs(*, worker_id: str, job_ids: list[str]) -> None:
+    if not job_ids:
+        return
+    now = _utcnow()
+    with session_scope() as session:
+        session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id.in_(job_ids),
+                BackgroundJob.worker_id == worker_id,
+                BackgroundJob.status == RUNNING_STATUS,
+            )
+            .values(
+                heartbeat_at=now,
+                lease_expires_at=now + timedelta(seconds=_lease_seconds()),
+                updated_at=now,
+            )
+        )
+
+
+def _finish_job(*, worker_id: str, job: _ClaimedJob, error: str | None) -> None:
+    now = _utcnow()
+    with session_scope() as session:
+        row = session.get(BackgroundJob, job.id)
+        if row is None or str(row.worker_id or "") != worker_id:
+            # The lease expired and another worker took the job over.
+            return
+        if str(row.status or "") != RUNNING_STATUS:
+            return
+        row.heartbeat_at = now
+        row.lease_expires_at = None
+        if error is None:
+            row.status = COMPLETED_STATUS
+            row.finished_at = now
+            row.last_error = None
+            return
+        row.last_error = str(error)[:2000]
+        if int(row.attempts or 0) < int(row.max_attempts or 1):
+            row.status = QUEUED_STATUS
+            row.worker_id = None
+            row.available_at = now + timedelta(
+                seconds=_retry_backoff_seconds() * max(1, int(row.attempts or 1))
+            )
+            return
+        row.status = FAILED_STATUS
+        row.finished_at = now
+
+
+def _execute_claimed_job(*, worker_id: str, job: _ClaimedJob) -> None:
+    spec = registered_job_kinds().get(job.kind)
+    error: str | None = None
+    if spec is None:
+        error = f"No handler registered for job kind '{job.kind}'."
+    else:
+        try:
+            spec.handler(dict(job.payload))
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception(
+                "background_job_failed",
+                extra={"job_id": job.id, "kind": job.kind, "attempt": job.attempts},
+            )
+    try:
+        _finish_job(worker_id=worker_id, job=job, error=error)
+    except Exception:
+        logger.exception(
+            "background_job_finish_failed",
+            extra={"job_id": job.id, "kind": job.kind},
+        )
+
+
+def run_job_inline(job_id: str) -> bool:
+    worker_id = f"inline-{uuid4().hex[:12]}"
+    claimed = _claim_jobs(
+        worker_id=worker_id,
+        kinds=list(registered_job_kinds().keys()),
+        slots=1,
+        job_id=job_id,
+    )
+    for job in claimed:
+        _execute_claimed_job(worker_id=worker_id, job=job)
+    return bool(claimed)
+
+
+def recover_expired_jobs() -> dict[str, int]:
+    create_all_tables()
+    now = _utcnow()
+    requeued = 0
+    failed = 0
+    with session_scope() as session:
+        rows = session.scalars(
+            select(BackgroundJob).where(
+                BackgroundJob.status == RUNNING_STATUS,
+                BackgroundJob.lease_expires_at.is_not(None),
+                BackgroundJob.lease_expires_at < now,
+            )
+        ).all()
+        for row in rows:
+            row.last_error = (
+                f"Lease held by {row.worker_id or 'unknown worker'} expired before "
+                "the job finished."
+            )
+            row.worker_id = None
+            row.lease_expires_at = None
+            if int(row.attempts or 0) < int(row.max_attempts or 1):
+                row.status = QUEUED_STATUS
+                row.available_at = now
+                requeued += 1
+            else:
+                row.status = FAILED_STATUS
+                row.finished_at = now
+                failed += 1
+        purged = session.execute(
+            delete(BackgroundJob).where(
+                BackgroundJob.status.in_((COMPLETED_STATUS, FAILED_STATUS)),
+                BackgroundJob.finished_at < now - timedelta(hours=_retention_hours()),
+            )
+        ).rowcount
+    if requeued or failed:
+        logger.warning(
+            "background_jobs_recovered",
+            extra={"requeued": requeued, "failed": failed},
+        )
+    return {"requeued": requeued, "failed": failed, "purged": int(purged or 0)}
+
+
+class JobWorkerPool:
+    def __init__(
+        self,
+        *,
+        kinds: set[str] | None = None,
+        max_workers: int | None = None,
+        worker_id: str | None = None,
+    ) -> None:
+        self.worker_id = worker_id or _new_worker_id()
+        self.max_workers = max(1, int(max_workers or _max_workers()))
+        self._kinds = set(kinds or ())
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="job-worker"
+        )
+        self._running: dict[str, _ClaimedJob] = {}
+        self._running_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_heartbeat_at = 0.0
+        self._last_recovery_at = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, daemon=True, name=f"job-dispatch-{self.worker_id[-8:]}"
+        )
+        self._thread.start()
+
+    def stop(self, *, wait: bool = False) -> None:
+        self._stop.set()
+        self._wake.set()
+        if wait and self._thread is not None:
+            self._thread.join(timeout=_poll_seconds() + 5)
+        self._executor.shutdown(wait=wait, cancel_futures=False)
+
+    def kick(self) -> None:
+        self._wake.set()
+
+    def _kinds_to_claim(self) -> list[str]:
+        kinds = list(registered_job_kinds().keys())
+        if self._kinds:
+            kinds = [kind for kind in kinds if kind in self._kinds]
+        return kinds
+
+    def _free_slots(self) -> tuple[int, int]:
+        with self._running_lock:
+            running = list(self._running.values())
+        free_total = self.max_workers - len(running)
+        shared_capacity = self.max_workers - _interactive_reserved_slots(
+            self.max_workers
+        )
+        shared_running = sum(1 for job in running if job.lane != JOB_LANE_INTERACTIVE)
+        return max(0, free_total), max(
+            0, min(free_total, shared_capacity - shared_running)
+        )
+
+    def run_once(self) -> int:
+        kinds = self._kinds_to_claim()
+        free_total, free_shared = self._free_slots()
+        if free_total <= 0 or not kinds:
+            return 0
+        claimed = _claim_jobs(
+            worker_id=self.worker_id,
+            kinds=kinds,
+            slots=free_total,
+            lanes=(JOB_LANE_INTERACTIVE,),
+        )
+        if free_shared > 0:
+            claimed.extend(
+                _claim_jobs(
+                    worker_id=self.worker_id,
+                    kinds=kinds,
+                    slots=min(free_shared, free_total - len(claimed)),
+                    lanes=(JOB_LANE_DEFAULT, JOB_LANE_BULK),
+                )
+            )
+        for job in claimed:
+            with self._running_lock:
+                self._running[job.id] = job
+            self._executor.submit(self._execute, job)
+        return len(claimed)
+
+    def _execute(self, job: _ClaimedJob) -> None:
+        try:
+            _execute_claimed_job(worker_id=self.worker_id, job=job)
+        finally:
+            with self._running_lock:
+                self._running.pop(job.id, None)
+            self._wake.set()
+
+    def _heartbeat_if_due(self, now_monotonic: float) -> None:
+        if now_monotonic - self._last_heartbeat_at < _lease_seconds() / 4:
+            return
+        self._last_heartbeat_at = now_monotonic
+        with self._running_lock:
+            job_ids = list(self._running.keys())
+        _heartbeat_jobs(worker_id=self.worker_id, job_ids=job_ids)
+
+    def _recover_if_due(self, now_monotonic: float) -> None:
+        if now_monotonic - self._last_recovery_at < _lease_seconds() / 2:
+            return
+        self._last_recovery_at = now_monotonic
+        recover_expired_jobs()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                now_monotonic = time.monotonic()
+                self._heartbeat_if_due(now_monotonic)
+                self._recover_if_due(now_monotonic)
+                self.run_once()
+            except Exception:
+                logger.exception(
+                    "background_job_dispatch_failed",
+                    extra={"worker_id": self.worker_id},
+                )
+            self._wake.wait(timeout=_poll_seconds())
+
+
+def _ensure_embedded_worker_pool() -> JobWorkerPool:
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None or not _worker_pool.is_running:
+            _worker_pool = JobWorkerPool(kinds=_worker_kinds_filter() or None)
+            _worker_pool.start()
+        return _worker_pool
+
+
+def start_job_workers() -> JobWorkerPool | None:
+    try:
+        recover_expired_jobs()
+    except Exception as exc:
+        logger.warning("background_job_recovery_failed", extra={"detail": str(exc)})
+    if _worker_mode() != WORKER_MODE_EMBEDDED:
+        return None
+    pool = _ensure_embedded_worker_pool()
+    pool.kick()
+    return pool
+
+
+def stop_job_workers(*, wait: bool = False) -> None:
+    global _worker_pool
+    with _worker_pool_lock:
+        pool = _worker_pool
+        _worker_pool = None
+    if pool is not None:
+        pool.stop(wait=wait)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+def _mean(values: list[float]) -> float | None:
+    if not values:
+        return None
+    return round(sum(values) / len(values), 3)
+
+
+def get_job_queue_stats() -> dict[str, Any]:
+    create_all_tables()
+    now = _utcnow()
+    window_start = now - timedelta(hours=_STATS_WINDOW_HOURS)
+    specs = registered_job_kinds()
+    with session_scope() as session:
+        active_rows = session.execute(
+            select(
+                BackgroundJob.kind,
+                BackgroundJob.status,
+                func.count(BackgroundJob.id),
+                func.min(BackgroundJob.enqueued_at),
+            )
+            .where(BackgroundJob.status.in_(ACTIVE_STATUSES))
+            .group_by(BackgroundJob.kind, BackgroundJob.status)
+        ).all()
+        recent_rows = session.execute(
+            select(
+                BackgroundJob.kind,
+                BackgroundJob.status,
+                BackgroundJob.enqueued_at,
+                BackgroundJob.started_at,
+                BackgroundJob.finished_at,
+            ).where(BackgroundJob.started_at >= window_start)
+        ).all()
+
+    by_kind: dict[str, dict[str, Any]] = defaultdict(
+        lambda: {
+            "queued": 0,
+            "running": 0,
+            "completed_recent": 0,
+            "failed_recent": 0,
+            "oldest_queued_at": None,
+            "wait_seconds": [],
+            "run_seconds": [],
+        }
+    )
+    for kind, status, count, oldest in active_rows:
+        bucket = by_kind[str(kind)]
+        if status == QUEUED_STATUS:
+            bucket["queued"] = int(count or 0)
+            bucket["oldest_queued_at"] = _coerce_utc(oldest)
+        else:
+            bucket["running"] = int(count or 0)
+    for kind, status, enqueued_at, started_at, finished_at in recent_rows:
+        bucket = by_kind[str(kind)]
+        enqueued_utc = _coerce_utc(enqueued_at)
+        started_utc = _coerce_utc(started_at)
+        finished_utc = _coerce_utc(finished_at)
+        if enqueued_utc is not None and started_utc is not None:
+            bucket["wait_seconds"].append(
+                max(0.0, (started_utc - enqueued_utc).total_seconds())
+            )
+        if started_utc is not None and finished_utc is not None:
+            bucket["run_seconds"].append(
+                max(0.0, (finished_utc - started_utc).total_seconds())
+            )
+        if status == COMPLETED_STATUS:
+            bucket["completed_recent"] += 1
+        elif status == FAILED_STATUS:
+            bucket["failed_recent"] += 1
+
+    items: list[dict[str, Any]] = []
+    for kind in sorted(set(specs.keys()) | set(by_kind.keys())):
+        bucket = by_kind[kind]
+        spec = specs.get(kind)
+        oldest = bucket["oldest_queued_at"]
+        items.append(
+            {
+                "kind": kind,
+                "lane": spec.lane if spec is not None else JOB_LANE_DEFAULT,
+                "max_concurrency": spec.concurrency_limit() if spec is not None else 0,
+                "queued": bucket["queued"],
+                "running": bucket["running"],
+                "completed_recent": bucket["completed_recent"],
+                "failed_recent": bucket["failed_recent"],
+                "oldest_queued_age_seconds": (
+                    round(max(0.0, (now - oldest).total_seconds()), 3)
+                    if oldest is not None
+                    else None
+                ),
+                "avg_wait_seconds": _mean(bucket["wait_seconds"]),
+                "p95_wait_seconds": _percentile(bucket["wait_seconds"], 0.95),
+                "avg_run_seconds": _mean(bucket["run_seconds"]),
+                "p95_run_seconds": _percentile(bucket["run_seconds"], 0.95),
+            }
+        )
+    return {
+        "generated_at": now,
+        "worker_mode": _worker_mode(),
+        "window_hours": _STATS_WINDOW_HOURS,
+        "queued": sum(int(item["queued"]) for item in items),
+        "running": sum(int(item["running"]) for item in items),
+        "kinds": items,
+    }
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    kinds = load_job_handlers()
+    selected = _worker_kinds_filter() or set(kinds.keys())
+    pool = JobWorkerPool(kinds=selected)
+    stop_event = threading.Event()
+
+    def _handle_signal(signum, frame) -> None:  # noqa: ANN001
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+    recover_expired_jobs()
+    pool.start()
+    logger.info(
+        "background_job_worker_started",
+        extra={
+            "worker_id": pool.worker_id,
+            "kinds": sorted(selected),
+            "max_workers": pool.max_workers,
+        },
+    )
+    stop_event.wait()
+    pool.stop(wait=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,6 +10,7 @@ import httpx
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from research_os.clients.http_client import provider_client
 from research_os.db import (
     JournalProfile,
     MetricsSnapshot,
@@ -142,7 +143,7 @@ def _openalex_request_with_retry(*, url: str, params: dict[str, Any]) -> dict[st
     timeout = httpx.Timeout(_openalex_timeout_seconds())
     retries = _openalex_retry_count()
     last_exception: Exception | None = None
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         for attempt in range(retries + 1):
             started = time.perf_counter()
             try:
@@ -10,6 +10,7 @@ from urllib.parse import quote
 
 import httpx
 
+from research_os.clients.http_client import ProviderClient, provider_client
 from research_os.services.journal_identity import (
     extract_openalex_source_id,
     normalize_issn,
@@ -155,7 +156,7 @@ class OpenAlexMetricsProvider(MetricsProvider):
 
     @staticmethod
     def _request_with_retry(
-        client: httpx.Client,
+        client: ProviderClient,
         *,
         url: str,
         params: dict[str, Any],
@@ -208,7 +209,7 @@ class OpenAlexMetricsProvider(MetricsProvider):
         year = int(year_raw) if str(year_raw).strip().isdigit() else None
         pmid = self._extract_pmid(work.get("pmid") or work.get("url"))
 
-        with httpx.Client(timeout=12.0) as client:
+        with provider_client(timeout=12.0) as client:
             try:
                 candidate: dict[str, Any] | None = None
                 match_method = ""
@@ -431,7 +432,7 @@ class SemanticScholarMetricsProvider(MetricsProvider):
 
     @staticmethod
     def _request_with_retry(
-        client: httpx.Client,
+        client: ProviderClient,
         *,
         url: str,
         params: dict[str, Any] | None = None,
@@ -482,7 +483,7 @@ class SemanticScholarMetricsProvider(MetricsProvider):
         year = int(year_raw) if str(year_raw).strip().isdigit() else None
         pmid = self._extract_pmid(work.get("pmid") or work.get("url"))
 
-        with httpx.Client(timeout=12.0) as client:
+        with provider_client(timeout=12.0) as client:
             try:
                 payload: dict[str, Any] | None = None
                 match_method = ""
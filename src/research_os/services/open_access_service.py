@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 from sqlalchemy import select
 
+from research_os.clients.http_client import ProviderClient, provider_client
 from research_os.db import (
     DataLibraryAsset,
     User,
@@ -90,7 +91,7 @@ def _title_similarity(expected: str, observed: str) -> float:
 
 
 def _request_with_retry(
-    client: httpx.Client,
+    client: ProviderClient,
     *,
     url: str,
     params: dict[str, Any] | None = None,
@@ -136,7 +137,7 @@ def _best_title_match(
 
 def _fetch_openalex_candidate(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     work: _WorkPayload,
 ) -> tuple[dict[str, Any] | None, str]:
     doi = _normalize_doi(work.doi)
@@ -223,7 +224,7 @@ def _pdf_filename(work: _WorkPayload) -> str:
 
 def _download_pdf(
     *,
-    client: httpx.Client,
+    client: ProviderClient,
     pdf_url: str,
 ) -> bytes:
     response = _request_with_retry(client, url=pdf_url)
@@ -308,7 +309,7 @@ def discover_open_access_for_persona(
             "records": [],
         }
 
-    with httpx.Client(
+    with provider_client(
         timeout=OPEN_ACCESS_HTTP_TIMEOUT_SECONDS, follow_redirects=True
     ) as client:
         for work in works:
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-import inspect
 import os
 import re
 import secrets
@@ -20,7 +19,7 @@ from research_os.services.publication_console_service import (
 from research_os.services.persona_service import (
     recompute_collaborator_edges,
     sync_metrics,
-    upsert_work,
+    upsert_works,
 )
 from research_os.services.security_service import decrypt_secret, encrypt_secret
 from research_os.services.api_telemetry_service import record_api_usage_event
@@ -53,7 +52,6 @@ ORCID_HTTP_TIMEOUT_SECONDS = max(
 ORCID_IMPORT_SKIP_EXISTING_WORKS = os.getenv(
     "ORCID_IMPORT_SKIP_EXISTING_WORKS", "1"
 ).strip().lower() in {"1", "true", "yes"}
-UPSERT_WORK_ACCEPTS_SESSION = "session" in inspect.signature(upsert_work).parameters
 LOCAL_REDIRECT_HOSTS = {"localhost", "127.0.0.1"}
 
 
@@ -642,25 +640,6 @@ def _fetch_orcid_work_detail(
         return None
 
 
-def _upsert_imported_orcid_work(
-    *,
-    user_id: str,
-    work: dict[str, Any],
-    overwrite_user_metadata: bool,
-    session,
-) -> dict[str, Any]:
-    kwargs: dict[str, Any] = {
-        "user_id": user_id,
-        "work": work,
-        "provenance": "orcid",
-        "overwrite_user_metadata": overwrite_user_metadata,
-        "ensure_tables": False,
-    }
-    if UPSERT_WORK_ACCEPTS_SESSION:
-        kwargs["session"] = session
-    return upsert_work(**kwargs)
-
-
 def import_orcid_works(
     *, user_id: str, overwrite_user_metadata: bool = False
 ) -> dict[str, Any]:
@@ -768,13 +747,14 @@ def import_orcid_works(
             session.scalar(select(func.count(Work.id)).where(Work.user_id == user_id))
             or 0
         )
-        for work in imported:
-            record = _upsert_imported_orcid_work(
-                user_id=user_id,
-                work=work,
-                overwrite_user_metadata=overwrite_user_metadata,
-                session=session,
-            )
+        records = upsert_works(
+            user_id=user_id,
+            works=imported,
+            provenance="orcid",
+            overwrite_user_metadata=overwrite_user_metadata,
+            session=session,
+        )
+        for record in records:
             work_id = str(record["id"])
             if work_id in seen_upserted_ids:
                 continue
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Literal
+from typing import Iterator, Literal
 
-from research_os.clients.openai_client import ask_gpt
+from research_os.clients.openai_client import ask_gpt, ask_gpt_stream
 
 ConstraintPreset = Literal[
     "shorter",
@@ -165,17 +165,18 @@ def _extract_unsupported_sentences(
     return unsupported
 
 
-def regenerate_paragraph_text(
+def _iter_paragraph_regeneration_events(
     *,
     section: str,
     paragraph_text: str,
     notes_context: str,
-    constraints: list[ConstraintPreset] | None = None,
-    evidence_links: list[dict[str, str]] | None = None,
-    citation_ids: list[str] | None = None,
-    freeform_instruction: str | None = None,
-    model: str = "gpt-4.1-mini",
-) -> dict[str, object]:
+    constraints: list[ConstraintPreset] | None,
+    evidence_links: list[dict[str, str]] | None,
+    citation_ids: list[str] | None,
+    freeform_instruction: str | None,
+    model: str,
+    stream: bool,
+) -> Iterator[tuple[str, dict[str, object]]]:
     normalized_constraints = _normalize_constraints(constraints)
     normalized_evidence = _normalize_evidence_links(evidence_links)
     normalized_citations = [
@@ -193,8 +194,16 @@ def regenerate_paragraph_text(
         citation_ids=normalized_citations,
         freeform_instruction=freeform_instruction,
     )
+    yield "progress", {"stage": "started", "section": section.strip() or "section"}
     try:
-        revised = ask_gpt(prompt=prompt, model=model).strip()
+        if stream:
+            chunks: list[str] = []
+            for delta in ask_gpt_stream(prompt=prompt, model=model):
+                chunks.append(delta)
+                yield "delta", {"text": delta}
+            revised = "".join(chunks).strip()
+        else:
+            revised = ask_gpt(prompt=prompt, model=model).strip()
     except Exception as exc:
         raise ParagraphRegenerationError("Failed to regenerate paragraph.") from exc
 
@@ -203,9 +212,62 @@ def regenerate_paragraph_text(
         evidence_count=len(normalized_evidence),
         citation_ids=normalized_citations,
     )
-    return {
+    yield "result", {
         "section": section.strip() or "section",
         "constraints": normalized_constraints,
         "revised_paragraph": revised,
         "unsupported_sentences": unsupported,
     }
+
+
+def regenerate_paragraph_text(
+    *,
+    section: str,
+    paragraph_text: str,
+    notes_context: str,
+    constraints: list[ConstraintPreset] | None = None,
+    evidence_links: list[dict[str, str]] | None = None,
+    citation_ids: list[str] | None = None,
+    freeform_instruction: str | None = None,
+    model: str = "gpt-4.1-mini",
+) -> dict[str, object]:
+    result: dict[str, object] = {}
+    for event, data in _iter_paragraph_regeneration_events(
+        section=section,
+        paragraph_text=paragraph_text,
+        notes_context=notes_context,
+        constraints=constraints,
+        evidence_links=evidence_links,
+        citation_ids=citation_ids,
+        freeform_instruction=freeform_instruction,
+        model=model,
+        stream=False,
+    ):
+        if event == "result":
+            result = data
+    return result
+
+
+def stream_paragraph_regeneration(
+    *,
+    section: str,
+    paragraph_text: str,
+    notes_context: str,
+    constraints: list[ConstraintPreset] | None = None,
+    evidence_links: list[dict[str, str]] | None = None,
+    citation_ids: list[str] | None = None,
+    freeform_instruction: str | None = None,
+    model: str = "gpt-4.1-mini",
+) -> Iterator[tuple[str, dict[str, object]]]:
+    """Yield ``(event, data)`` pairs: a start event, text deltas, then the result."""
+    return _iter_paragraph_regeneration_events(
+        section=section,
+        paragraph_text=paragraph_text,
+        notes_context=notes_context,
+        constraints=constraints,
+        evidence_links=evidence_links,
+        citation_ids=citation_ids,
+        freeform_instruction=freeform_instruction,
+        model=model,
+        stream=True,
+    )
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Evict down to this fraction of the size cap so that every store after the
+# cap is reached does not trigger another directory scan.
+_EVICTION_TARGET_RATIO = 0.9
+_ARTIFACT_NAME_PATTERN = re.compile(r"[^a-z0-9_.-]+")
+
+
+@dataclass
+class _ParseArtifactScope:
+    parser_version: str
+    refresh: bool = False
+    content_keys: dict[int, tuple[bytes, str]] = field(default_factory=dict)
+
+    def content_key(self, content: bytes) -> str:
+        cached = self.content_keys.get(id(content))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        key = hashlib.sha256(content).hexdigest()
+        self.content_keys[id(content)] = (content, key)
+        return key
+
+
+_active_scope: contextvars.ContextVar[_ParseArtifactScope | None] = (
+    contextvars.ContextVar("parse_artifact_scope", default=None)
+)
+_state_lock = threading.Lock()
+_estimated_bytes: dict[str, int] = {}
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+
+def _parse_cache_enabled() -> bool:
+    value = str(os.getenv("PUBLICATION_PARSE_CACHE_ENABLED", "1")).strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _parse_cache_root() -> Path:
+    configured = str(os.getenv("PUBLICATION_PARSE_CACHE_ROOT", "")).strip()
+    if configured:
+        root = Path(configured)
+    else:
+        files_root = Path(
+            os.getenv("PUBLICATION_FILES_ROOT", "./publication_files_store")
+        )
+        root = files_root / ".parse-cache"
+    root.mkdir(parents=True, exist_ok=True)
+    return root.resolve()
+
+
+def _parse_cache_max_bytes() -> int:
+    try:
+        value = int(os.getenv("PUBLICATION_PARSE_CACHE_MAX_MB", "2048"))
+    except ValueError:
+        value = 2048
+    return max(16, value) * 1024 * 1024
+
+
+def _artifact_path(
+    *, root: Path, parser_version: str, key: str, artifact: str, variant: Any
+) -> Path:
+    name = _ARTIFACT_NAME_PATTERN.sub("-", artifact.strip().lower()) or "artifact"
+    if variant is not None:
+        variant_hash = hashlib.sha256(
+            json.dumps(variant, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        name = f"{name}-{variant_hash}"
+    clean_version = _ARTIFACT_NAME_PATTERN.sub("-", parser_version.lower())
+    return root / clean_version / key[:2] / key / f"{name}.json"
+
+
+def _scan_cache_files(root: Path) -> list[tuple[float, int, Path]]:
+    entries: list[tuple[float, int, Path]] = []
+    for path in root.rglob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def _record_store(root: Path, size: int) -> None:
+    root_key = str(root)
+    with _state_lock:
+        if root_key not in _estimated_bytes:
+            _estimated_bytes[root_key] = sum(
+                entry[1] for entry in _scan_cache_files(root)
+            )
+        else:
+            _estimated_bytes[root_key] += size
+        _stats["stores"] += 1
+        if _estimated_bytes[root_key] <= _parse_cache_max_bytes():
+            return
+        entries = sorted(_scan_cache_files(root))
+        total = sum(entry[1] for entry in entries)
+        target = int(_parse_cache_max_bytes() * _EVICTION_TARGET_RATIO)
+        for _, entry_size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= entry_size
+            _stats["evictions"] += 1
+        _estimated_bytes[root_key] = total
+
+
+def _read_artifact(path: Path) -> tuple[bool, Any]:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return False, None
+    except OSError as exc:
+        logger.warning("parse_artifact_cache_read_failed: %s", exc)
+        return False, None
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return False, None
+    try:
+        # Reads refresh the modification time so eviction is least-recently-used.
+        os.utime(path)
+    except OSError:
+        pass
+    return True, value
+
+
+def _write_artifact(path: Path, value: Any) -> int:
+    encoded = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=".tmp-", suffix=".part", delete=False
+    ) as handle:
+        handle.write(encoded)
+        tmp_path = Path(handle.name)
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+@contextmanager
+def parse_artifact_scope(
+    *, parser_version: str, refresh: bool = False
+) -> Iterator[None]:
+    """Enable content-addressed artefact caching for parses run in this block.
+
+    With ``refresh`` set, cached artefacts are ignored and overwritten by the
+    freshly built ones.
+    """
+    if not _parse_cache_enabled():
+        yield
+        return
+    token = _active_scope.set(
+        _ParseArtifactScope(parser_version=parser_version, refresh=refresh)
+    )
+    try:
+        yield
+    finally:
+        _active_scope.reset(token)
+
+
+def cached_parse_artifact(
+    *,
+    artifact: str,
+    build: Callable[[], Any],
+    content: bytes | None = None,
+    key: str | None = None,
+    variant: Any = None,
+    skip_empty: bool = False,
+) -> Any:
+    """Return a JSON-serialisable parse artefact, building it on a cache miss.
+
+    Artefacts are keyed by the SHA-256 of ``content`` (or an explicit ``key``),
+    the active scope's parser version, the artefact name and an optional
+    ``variant``. Outside a ``parse_artifact_scope`` this simply calls ``build``.
+    """
+    scope = _active_scope.get()
+    if scope is None or (content is None and not key):
+        return build()
+    cache_key = key or scope.content_key(content or b"")
+    cache_key = _ARTIFACT_NAME_PATTERN.sub("-", cache_key.lower())
+    root = _parse_cache_root()
+    path = _artifact_path(
+        root=root,
+        parser_version=scope.parser_version,
+        key=cache_key,
+        artifact=artifact,
+        variant=variant,
+    )
+    found, value = (False, None) if scope.refresh else _read_artifact(path)
+    with _state_lock:
+        _stats["hits" if found else "misses"] += 1
+    if found:
+        return value
+    value = build()
+    if skip_empty and not value:
+        return value
+    try:
+        size = _write_artifact(path, value)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning("parse_artifact_cache_write_failed: %s", exc)
+        return value
+    _record_store(root, size)
+    return value
+
+
+def get_parse_cache_stats() -> dict[str, int]:
+    with _state_lock:
+        return dict(_stats)
+
+
+def reset_parse_cache_stats() -> None:
+    with _state_lock:
+        for name in _stats:
+            _stats[name] = 0
+        _estimated_bytes.clear()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_offload_enabled: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "parse_process_offload", default=False
+)
+_pool_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+
+
+def _parse_process_workers() -> int:
+    default = min(4, os.cpu_count() or 1)
+    try:
+        value = int(os.getenv("PUB_PARSE_PROCESS_WORKERS", str(default)))
+    except ValueError:
+        value = default
+    return max(0, min(32, value))
+
+
+def _parse_process_max_tasks_per_child() -> int:
+    try:
+        value = int(os.getenv("PUB_PARSE_PROCESS_MAX_TASKS_PER_CHILD", "50"))
+    except ValueError:
+        value = 50
+    return max(1, value)
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    workers = _parse_process_workers()
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Spawned children avoid inheriting locks held by the API process's
+            # threads, and recycling them bounds memory growth from PDF/docling
+            # native allocations.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=_parse_process_max_tasks_per_child(),
+            )
+            logger.info("parse_process_pool_started", extra={"workers": workers})
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_process_workers() -> int:
+    return _parse_process_workers()
+
+
+@contextmanager
+def parse_process_scope() -> Iterator[None]:
+    """Allow CPU-bound parse stages called in this block to run in the pool."""
+    token = _offload_enabled.set(True)
+    try:
+        yield
+    finally:
+        _offload_enabled.reset(token)
+
+
+def run_parse_task(fn: Callable[..., T], *args: Any) -> T:
+    return map_parse_tasks(fn, [args])[0]
+
+
+def map_parse_tasks(
+    fn: Callable[..., T], arg_tuples: Sequence[tuple[Any, ...]]
+) -> list[T]:
+    """Run ``fn(*args)`` for each tuple, in worker processes when offload is on.
+
+    ``fn`` and its arguments must be picklable (module-level functions and plain
+    data). Results are returned in input order. Without an active
+    ``parse_process_scope`` or with ``PUB_PARSE_PROCESS_WORKERS=0`` the calls run
+    inline in the current thread.
+    """
+    pool = _get_pool() if _offload_enabled.get() and arg_tuples else None
+    if pool is None:
+        return [fn(*args) for args in arg_tuples]
+    try:
+        futures = [pool.submit(fn, *args) for args in arg_tuples]
+        return [future.result() for future in futures]
+    except BrokenProcessPool as exc:
+        logger.warning("parse_process_pool_broken: %s", exc)
+        _discard_pool(pool)
+        return [fn(*args) for args in arg_tuples]
+
+
+def shutdown_parse_process_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool = _pool
+        _pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from research_os.services.security_service import (
+    PBKDF2_ITERATIONS,
+    derive_password_hash,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_pool_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pending_lock = threading.Lock()
+_pending = 0
+
+
+class PasswordHashingOverloadedError(RuntimeError):
+    """Raised instead of queueing when too many password hashes are in flight."""
+
+    def __init__(self, message: str, *, retry_after_seconds: int = 1) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+def _password_hash_workers() -> int:
+    # Tests hash inline so they do not pay for spawning interpreters.
+    running_tests = bool(os.getenv("PYTEST_CURRENT_TEST", "").strip())
+    default = 0 if running_tests else min(4, os.cpu_count() or 1)
+    try:
+        value = int(os.getenv("AUTH_PASSWORD_HASH_WORKERS", str(default)))
+    except ValueError:
+        value = default
+    return max(0, min(32, value))
+
+
+def _password_hash_max_pending() -> int:
+    default = max(1, _password_hash_workers()) * 8
+    try:
+        value = int(os.getenv("AUTH_PASSWORD_HASH_MAX_PENDING", str(default)))
+    except ValueError:
+        value = default
+    return max(1, min(10_000, value))
+
+
+def _password_hash_timeout_seconds() -> float:
+    try:
+        value = float(os.getenv("AUTH_PASSWORD_HASH_TIMEOUT_SECONDS", "10"))
+    except ValueError:
+        value = 10.0
+    return max(0.5, min(120.0, value))
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    workers = _password_hash_workers()
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("password_hash_pool_started", extra={"workers": workers})
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@contextmanager
+def _password_hash_slot() -> Iterator[None]:
+    global _pending
+    limit = _password_hash_max_pending()
+    with _pending_lock:
+        if _pending >= limit:
+            logger.warning(
+                "password_hash_overloaded",
+                extra={"pending": _pending, "max_pending": limit},
+            )
+            raise PasswordHashingOverloadedError(
+                "Sign-in is busy. Please retry shortly."
+            )
+        _pending += 1
+    try:
+        yield
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+
+def _run_password_task(fn: Callable[..., T], *args: Any) -> T:
+    with _password_hash_slot():
+        pool = _get_pool()
+        if pool is None:
+            return fn(*args)
+        try:
+            future = pool.submit(fn, *args)
+        except BrokenProcessPool as exc:
+            logger.warning("password_hash_pool_broken: %s", exc)
+            _discard_pool(pool)
+            return fn(*args)
+        try:
+            return future.result(timeout=_password_hash_timeout_seconds())
+        except FutureTimeoutError as exc:
+            future.cancel()
+            raise PasswordHashingOverloadedError(
+                "Sign-in is busy. Please retry shortly."
+            ) from exc
+        except BrokenProcessPool as exc:
+            logger.warning("password_hash_pool_broken: %s", exc)
+            _discard_pool(pool)
+            return fn(*args)
+
+
+def password_hash_workers() -> int:
+    return _password_hash_workers()
+
+
+def hash_password_offloaded(password: str) -> str:
+    """Derive a current-format hash for an already validated password.
+
+    Runs in the password hashing pool (``AUTH_PASSWORD_HASH_WORKERS``, ``0``
+    hashes inline) and raises ``PasswordHashingOverloadedError`` rather than
+    queueing once ``AUTH_PASSWORD_HASH_MAX_PENDING`` hashes are in flight.
+    """
+    return _run_password_task(derive_password_hash, password, PBKDF2_ITERATIONS)
+
+
+def verify_password_offloaded(password: str, stored_hash: str) -> bool:
+    """``verify_password`` in the password hashing pool, with the same limits."""
+    return _run_password_task(verify_password, password, stored_hash)
+
+
+def shutdown_password_hash_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool = _pool
+        _pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
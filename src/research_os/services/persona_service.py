@@ -2,20 +2,25 @@ from __future__ import annotations
 
 from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import hashlib
 import math
 import os
 import re
+import threading
 import time
 from statistics import mean, median
-from typing import Any
+from typing import Any, Callable
+from uuid import uuid4
 import xml.etree.ElementTree as ET
 
 import httpx
-from sqlalchemy import func, select
+import numpy as np
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.orm import Session
 
+from research_os.clients.http_client import provider_client
 from research_os.clients.openai_client import create_response, get_client
 from research_os.db import (
     Author,
@@ -28,6 +33,7 @@ from research_os.db import (
     Work,
     WorkAuthorship,
     create_all_tables,
+    dialect_insert,
     session_scope,
 )
 from research_os.services.journal_identity import (
@@ -475,7 +481,7 @@ def _infer_article_type_for_work(
 def _pubmed_request_xml(pmid: str) -> str:
     url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
     params = {"db": "pubmed", "id": pmid, "retmode": "xml"}
-    with httpx.Client(timeout=PUBMED_FETCH_TIMEOUT_SECONDS) as client:
+    with provider_client(timeout=PUBMED_FETCH_TIMEOUT_SECONDS) as client:
         response: httpx.Response | None = None
         for attempt in range(PUBMED_FETCH_RETRY_COUNT + 1):
             started = time.perf_counter()
@@ -1200,151 +1206,310 @@ def _resolve_user_or_raise(session, user_id: str) -> User:
     return user
 
 
-def _find_existing_work(
-    session,
+def _normalize_author_name(value: str) -> str:
+    return re.sub(r"\s+", " ", (value or "").strip())
+
+
+def _author_name_key(value: str) -> str:
+    return _normalize_author_name(value).lower()
+
+
+class _FirstRowIndex:
+    """First-row-wins lookups over rows loaded or created during a batch upsert.
+
+    Mirrors ``select(...).first()`` against the session: rows keep the position
+    they were loaded or created in, and re-keying a row after an update makes
+    later lookups see its new values instead of the old ones.
+    """
+
+    def __init__(self, key_fns: dict[str, Callable[[Any], Any]]) -> None:
+        self._key_fns = key_fns
+        self._rows: dict[str, dict[Any, list[Any]]] = {name: {} for name in key_fns}
+        self._keys: dict[str, dict[str, Any]] = {}
+        self._positions: dict[str, int] = {}
+
+    def add(self, row: Any) -> None:
+        row_id = str(row.id)
+        self._positions.setdefault(row_id, len(self._positions))
+        for name, values in self._keys.pop(row_id, {}).items():
+            bucket = self._rows[name].get(values)
+            if bucket is not None and row in bucket:
+                bucket.remove(row)
+        keys: dict[str, Any] = {}
+        for name, key_fn in self._key_fns.items():
+            key = key_fn(row)
+            if key is None:
+                continue
+            keys[name] = key
+            bucket = self._rows[name].setdefault(key, [])
+            bucket.append(row)
+            bucket.sort(key=lambda item: self._positions[str(item.id)])
+        self._keys[row_id] = keys
+
+    def first(self, name: str, key: Any) -> Any | None:
+        bucket = self._rows[name].get(key)
+        return bucket[0] if bucket else None
+
+
+def _prepare_work_upsert(work: dict[str, Any]) -> dict[str, Any]:
+    title = _normalize_title(str(work.get("title", "")))
+    if not title:
+        raise PersonaValidationError("Work title is required.")
+    year_raw = work.get("year")
+    url = str(work.get("url", "")).strip()
+    openalex_work_id = str(work.get("openalex_work_id") or "").strip()
+    if openalex_work_id:
+        openalex_work_id = openalex_work_id.rstrip("/")
+        if openalex_work_id.startswith("https://openalex.org/"):
+            openalex_work_id = openalex_work_id.removeprefix(
+                "https://openalex.org/"
+            )
+        elif openalex_work_id.startswith("http://openalex.org/"):
+            openalex_work_id = openalex_work_id.removeprefix(
+                "http://openalex.org/"
+            )
+        openalex_work_id = openalex_work_id.strip().strip("/")
+        openalex_work_id = openalex_work_id.split("/")[-1].strip()
+        if not openalex_work_id or openalex_work_id[0].lower() != "w":
+            openalex_work_id = ""
+        else:
+            openalex_work_id = openalex_work_id.upper()
+    issn_l = normalize_issn(work.get("issn_l"))
+    authors = work.get("authors", [])
+    if not isinstance(authors, list):
+        authors = []
+    user_author_position_hint = _safe_int(work.get("user_author_position"))
+    if user_author_position_hint is not None and user_author_position_hint <= 0:
+        user_author_position_hint = None
+    return {
+        "work": work,
+        "title": title,
+        "title_lower": title.lower(),
+        "year": int(year_raw) if str(year_raw).strip().isdigit() else None,
+        "doi": _normalize_doi(work.get("doi")),
+        "url": url,
+        "pmid": _extract_pmid(work.get("pmid")) or _extract_pmid(url),
+        "citations_total": max(0, int(_safe_int(work.get("citations_total")) or 0)),
+        "openalex_work_id": openalex_work_id or None,
+        "openalex_source_id": extract_openalex_source_id(
+            work.get("openalex_source_id")
+        ),
+        "issn_l": issn_l,
+        "issns": _normalize_work_issns(
+            work.get("issns") or work.get("issns_json"),
+            issn_l=issn_l,
+        ),
+        "venue_type": normalize_venue_type(work.get("venue_type")),
+        "authors": authors,
+        "user_author_position_hint": user_author_position_hint,
+    }
+
+
+def _work_index_for_upsert(
+    session, *, user_id: str, prepared: list[dict[str, Any]]
+) -> _FirstRowIndex:
+    index = _FirstRowIndex(
+        {
+            "doi": lambda row: row.doi or None,
+            "url": lambda row: row.url or None,
+            "title": lambda row: (row.title_lower, row.year)
+            if row.title_lower
+            else None,
+        }
+    )
+    dois = sorted({item["doi"] for item in prepared if item["doi"]})
+    urls = sorted({item["url"] for item in prepared if item["url"]})
+    titles = sorted({item["title_lower"] for item in prepared})
+    conditions = []
+    if dois:
+        conditions.append(Work.doi.in_(dois))
+    if urls:
+        conditions.append(Work.url.in_(urls))
+    if titles:
+        conditions.append(Work.title_lower.in_(titles))
+    if conditions:
+        for row in session.scalars(
+            select(Work)
+            .where(Work.user_id == user_id, or_(*conditions))
+            .order_by(Work.created_at, Work.id)
+        ).all():
+            index.add(row)
+    return index
+
+
+def _match_existing_work(
+    index: _FirstRowIndex,
     *,
-    user_id: str,
     doi: str | None,
     url: str | None,
     title_lower: str,
     year: int | None,
 ) -> Work | None:
+    # DOI first, then URL, then title + year. A concrete URL without a DOI
+    # match is treated as a distinct work.
     if doi:
-        by_doi = session.scalars(
-            select(Work).where(Work.user_id == user_id, Work.doi == doi)
-        ).first()
+        by_doi = index.first("doi", doi)
         if by_doi is not None:
             return by_doi
     clean_url = re.sub(r"\s+", "", (url or "").strip())
     if clean_url:
-        by_url = session.scalars(
-            select(Work).where(Work.user_id == user_id, Work.url == url)
-        ).first()
+        by_url = index.first("url", url)
         if by_url is not None:
             return by_url
-        # If the caller has a concrete URL but no DOI match, treat as a distinct work.
         if not doi:
             return None
     if title_lower:
-        by_title = session.scalars(
-            select(Work).where(
-                Work.user_id == user_id,
-                Work.title_lower == title_lower,
-                Work.year == year,
-            )
-        ).first()
-        if by_title is not None:
-            return by_title
+        return index.first("title", (title_lower, year))
     return None
 
 
-def _normalize_author_name(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip())
-
-
-def _author_name_key(value: str) -> str:
-    return _normalize_author_name(value).lower()
-
-
-def _upsert_author(
-    session, *, canonical_name: str, orcid_id: str | None = None
+def _author_index_for_upsert(
+    session, *, prepared: list[dict[str, Any]]
+) -> _FirstRowIndex:
+    index = _FirstRowIndex(
+        {
+            "orcid": lambda row: row.orcid_id or None,
+            "name": lambda row: row.canonical_name_lower or None,
+        }
+    )
+    orcids: set[str] = set()
+    name_keys: set[str] = set()
+    for item in prepared:
+        for author_item in item["authors"]:
+            if not isinstance(author_item, dict):
+                continue
+            author_name = _normalize_author_name(str(author_item.get("name", "")))
+            if not author_name:
+                continue
+            name_keys.add(_author_name_key(author_name))
+            author_orcid = re.sub(r"\s+", "", str(author_item.get("orcid_id", "")))
+            if author_orcid:
+                orcids.add(author_orcid)
+    conditions = []
+    if orcids:
+        conditions.append(Author.orcid_id.in_(sorted(orcids)))
+    if name_keys:
+        conditions.append(Author.canonical_name_lower.in_(sorted(name_keys)))
+    if conditions:
+        for row in session.scalars(
+            select(Author).where(or_(*conditions)).order_by(Author.id)
+        ).all():
+            index.add(row)
+    return index
+
+
+def _resolve_batch_author(
+    session,
+    index: _FirstRowIndex,
+    *,
+    canonical_name: str,
+    orcid_id: str | None,
 ) -> Author:
+    """Match by ORCID, then by name key, creating the author if neither hits."""
     clean_name = _normalize_author_name(canonical_name)
-    if not clean_name:
-        raise PersonaValidationError("Author name cannot be empty.")
     clean_orcid = re.sub(r"\s+", "", (orcid_id or "").strip()) or None
-
+    key = _author_name_key(clean_name)
     if clean_orcid:
-        author = session.scalars(
-            select(Author).where(Author.orcid_id == clean_orcid)
-        ).first()
+        author = index.first("orcid", clean_orcid)
         if author is not None:
             author.canonical_name = clean_name
-            author.canonical_name_lower = _author_name_key(clean_name)
+            author.canonical_name_lower = key
+            index.add(author)
             return author
-
-    key = _author_name_key(clean_name)
-    author = session.scalars(
-        select(Author).where(Author.canonical_name_lower == key)
-    ).first()
+    author = index.first("name", key)
     if author is not None:
         if clean_orcid and not author.orcid_id:
             author.orcid_id = clean_orcid
         author.canonical_name = clean_name
+        index.add(author)
         return author
-
     author = Author(
+        id=str(uuid4()),
         canonical_name=clean_name,
         canonical_name_lower=key,
         orcid_id=clean_orcid,
     )
     session.add(author)
-    session.flush()
+    index.add(author)
     return author
 
 
-def upsert_work(
+def _write_work_authorships(
+    session,
+    *,
+    links_by_work: dict[str, list[dict[str, Any]]],
+    deleted_link_ids: set[str],
+) -> None:
+    if deleted_link_ids:
+        session.execute(
+            delete(WorkAuthorship).where(
+                WorkAuthorship.id.in_(sorted(deleted_link_ids))
+            )
+        )
+    rows = [
+        {
+            "id": link["id"],
+            "work_id": work_id,
+            "author_id": link["author_id"],
+            "author_order": link["author_order"],
+            "is_user": link["is_user"],
+        }
+        for work_id, links in links_by_work.items()
+        for link in links
+    ]
+    if not rows:
+        return
+    statement = dialect_insert(session, WorkAuthorship)
+    statement = statement.on_conflict_do_update(
+        index_elements=["work_id", "author_id"],
+        set_={
+            "author_order": statement.excluded.author_order,
+            "is_user": statement.excluded.is_user,
+        },
+    )
+    session.execute(statement, rows)
+
+
+def upsert_works(
     *,
     user_id: str,
-    work: dict[str, Any],
+    works: list[dict[str, Any]],
     provenance: str,
     overwrite_user_metadata: bool = False,
-    ensure_tables: bool = True,
-    session: Session | None = None,
-) -> dict[str, Any]:
-    if ensure_tables:
-        create_all_tables()
-    title = _normalize_title(str(work.get("title", "")))
-    if not title:
-        raise PersonaValidationError("Work title is required.")
-    title_lower = title.lower()
-    year_raw = work.get("year")
-    year = int(year_raw) if str(year_raw).strip().isdigit() else None
-    doi = _normalize_doi(work.get("doi"))
-    url = str(work.get("url", "")).strip()
-    pmid = _extract_pmid(work.get("pmid")) or _extract_pmid(url)
-    citations_total = max(0, int(_safe_int(work.get("citations_total")) or 0))
-    openalex_work_id = str(work.get("openalex_work_id") or "").strip()
-    if openalex_work_id:
-        openalex_work_id = openalex_work_id.rstrip("/")
-        if openalex_work_id.startswith("https://openalex.org/"):
-            openalex_work_id = openalex_work_id.removeprefix(
-                "https://openalex.org/"
-            )
-        elif openalex_work_id.startswith("http://openalex.org/"):
-            openalex_work_id = openalex_work_id.removeprefix(
-                "http://openalex.org/"
-            )
-        openalex_work_id = openalex_work_id.strip().strip("/")
-        openalex_work_id = openalex_work_id.split("/")[-1].strip()
-        if not openalex_work_id or openalex_work_id[0].lower() != "w":
-            openalex_work_id = ""
-        else:
-            openalex_work_id = openalex_work_id.upper()
-    openalex_work_id = openalex_work_id or None
-    openalex_source_id = extract_openalex_source_id(work.get("openalex_source_id"))
-    issn_l = normalize_issn(work.get("issn_l"))
-    issns = _normalize_work_issns(
-        work.get("issns") or work.get("issns_json"),
-        issn_l=issn_l,
+    session: Session,
+) -> list[dict[str, Any]]:
+    """Upsert a batch of works, authors and authorships for one user.
+
+    Existing works and authors are resolved with one set-based query each,
+    new rows are flushed together, and authorships are written with a single
+    multi-row ``INSERT ... ON CONFLICT``. Records are returned in input order
+    and match what ``upsert_work`` returns for each item.
+    """
+    prepared = [_prepare_work_upsert(work) for work in works]
+    if not prepared:
+        return []
+    user = _resolve_user_or_raise(session, user_id)
+    work_index = _work_index_for_upsert(session, user_id=user.id, prepared=prepared)
+    author_index = (
+        _author_index_for_upsert(session, prepared=prepared)
+        if any(item["authors"] for item in prepared)
+        else None
     )
-    venue_type = normalize_venue_type(work.get("venue_type"))
-    authors = work.get("authors", [])
-    if not isinstance(authors, list):
-        authors = []
-    user_author_position_hint = _safe_int(work.get("user_author_position"))
-    if user_author_position_hint is not None and user_author_position_hint <= 0:
-        user_author_position_hint = None
-
-    def _upsert(db_session: Session) -> dict[str, Any]:
-        user = _resolve_user_or_raise(db_session, user_id)
-        existing = _find_existing_work(
-            db_session,
-            user_id=user.id,
+    authored_work_ids: list[str] = []
+    links_by_work: dict[str, list[dict[str, Any]]] = {}
+    deleted_link_ids: set[str] = set()
+    results: list[tuple[Work, dict[str, Any]]] = []
+    for item in prepared:
+        work = item["work"]
+        title = item["title"]
+        doi = item["doi"]
+        url = item["url"]
+        existing = _match_existing_work(
+            work_index,
             doi=doi,
             url=url,
-            title_lower=title_lower,
-            year=year,
+            title_lower=item["title_lower"],
+            year=item["year"],
         )
         previous_abstract = (
             re.sub(r"\s+", " ", str(existing.abstract or "").strip()) or None
@@ -1384,11 +1549,11 @@ def upsert_work(
 
         mutable_fields = {
             "title": title,
-            "title_lower": title_lower,
-            "year": year,
+            "title_lower": item["title_lower"],
+            "year": item["year"],
             "doi": doi,
-            "pmid": pmid,
-            "citations_total": citations_total,
+            "pmid": item["pmid"],
+            "citations_total": item["citations_total"],
             "work_type": normalized_work_type,
             "journal": journal_name,
             "venue_name": venue_name,
@@ -1398,15 +1563,16 @@ def upsert_work(
             "keywords": _normalize_keywords(work.get("keywords")),
             "url": url,
             "provenance": provenance,
-            "openalex_work_id": openalex_work_id,
-            "openalex_source_id": openalex_source_id,
-            "issn_l": issn_l,
-            "issns": issns,
-            "venue_type": venue_type,
+            "openalex_work_id": item["openalex_work_id"],
+            "openalex_source_id": item["openalex_source_id"],
+            "issn_l": item["issn_l"],
+            "issns": item["issns"],
+            "venue_type": item["venue_type"],
         }
 
         if existing is None:
             existing = Work(
+                id=str(uuid4()),
                 user_id=user.id,
                 title=mutable_fields["title"],
                 title_lower=mutable_fields["title_lower"],
@@ -1435,8 +1601,8 @@ def upsert_work(
                 venue_type=mutable_fields["venue_type"],
                 overwrite_existing=True,
             )
-            db_session.add(existing)
-            db_session.flush()
+            session.add(existing)
+            links_by_work.setdefault(existing.id, [])
         else:
             if overwrite_user_metadata or not existing.user_edited:
                 existing.title = mutable_fields["title"]
@@ -1476,105 +1642,180 @@ def upsert_work(
                 ),
             )
             existing.provenance = mutable_fields["provenance"] or existing.provenance
+        work_index.add(existing)
+        if item["authors"]:
+            authored_work_ids.append(str(existing.id))
+        current_abstract = (
+            re.sub(r"\s+", " ", str(existing.abstract or "").strip()) or None
+        )
+        # Later items can update the same row, so capture the record now.
+        results.append(
+            (
+                existing,
+                {
+                    "id": existing.id,
+                    "title": existing.title,
+                    "year": existing.year,
+                    "doi": existing.doi,
+                    "work_type": existing.work_type,
+                    "provenance": existing.provenance,
+                    "openalex_source_id": existing.openalex_source_id,
+                    "issn_l": existing.issn_l,
+                    "issns": list(existing.issns_json or []),
+                    "venue_type": existing.venue_type,
+                    "structured_abstract_refresh_needed": previous_abstract
+                    != current_abstract,
+                },
+            )
+        )
 
-        if authors:
-            existing_authorships = db_session.scalars(
-                select(WorkAuthorship).where(WorkAuthorship.work_id == existing.id)
-            ).all()
-            by_author_id = {item.author_id: item for item in existing_authorships}
-            seen_author_ids: set[str] = set()
-            author_order_position = 0
-            user_marked_from_identity = False
-            user_marked_from_hint = False
-
-            for author_item in authors:
-                if not isinstance(author_item, dict):
-                    continue
-                author_name = _normalize_author_name(str(author_item.get("name", "")))
-                if not author_name:
-                    continue
-                author_orcid = (
-                    re.sub(r"\s+", "", str(author_item.get("orcid_id", "")).strip())
-                    or None
-                )
-                author = _upsert_author(
-                    db_session,
-                    canonical_name=author_name,
-                    orcid_id=author_orcid,
-                )
-                is_user_identity = bool(
-                    user.orcid_id and author.orcid_id == user.orcid_id
-                ) or (_author_name_key(author_name) == _author_name_key(user.name))
-                explicit_user_flag = bool(author_item.get("is_user"))
-
-                # ORCID/OpenAlex payloads can include the same person multiple times;
-                # keep the first occurrence and avoid duplicate (work_id, author_id) inserts.
-                if author.id in seen_author_ids:
-                    link = by_author_id.get(author.id)
-                    if link is not None:
-                        link.is_user = bool(
-                            link.is_user or is_user_identity or explicit_user_flag
-                        )
-                    continue
-
-                seen_author_ids.add(author.id)
-                author_order_position += 1
-                is_user_from_hint = bool(
-                    user_author_position_hint is not None
-                    and author_order_position == user_author_position_hint
-                )
-                is_user = bool(
-                    is_user_identity or explicit_user_flag or is_user_from_hint
-                )
-                link = by_author_id.get(author.id)
-                if link is None:
-                    link = WorkAuthorship(
-                        work_id=existing.id,
-                        author_id=author.id,
-                        author_order=author_order_position,
-                        is_user=is_user,
+    pending_link_work_ids = sorted(
+        {work_id for work_id in authored_work_ids if work_id not in links_by_work}
+    )
+    if pending_link_work_ids:
+        for link_id, work_id, author_id, author_order, is_user in session.execute(
+            select(
+                WorkAuthorship.id,
+                WorkAuthorship.work_id,
+                WorkAuthorship.author_id,
+                WorkAuthorship.author_order,
+                WorkAuthorship.is_user,
+            ).where(WorkAuthorship.work_id.in_(pending_link_work_ids))
+        ).all():
+            links_by_work.setdefault(str(work_id), []).append(
+                {
+                    "id": str(link_id),
+                    "author_id": str(author_id),
+                    "author_order": int(author_order or 0),
+                    "is_user": bool(is_user),
+                }
+            )
+    for item, (existing, _) in zip(prepared, results):
+        if not item["authors"] or author_index is None:
+            continue
+        work_id = str(existing.id)
+        existing_authorships = links_by_work.setdefault(work_id, [])
+        by_author_id = {link["author_id"]: link for link in existing_authorships}
+        new_links: list[dict[str, Any]] = []
+        seen_author_ids: set[str] = set()
+        author_order_position = 0
+        user_marked_from_identity = False
+        user_marked_from_hint = False
+        hint = item["user_author_position_hint"]
+
+        for author_item in item["authors"]:
+            if not isinstance(author_item, dict):
+                continue
+            author_name = _normalize_author_name(str(author_item.get("name", "")))
+            if not author_name:
+                continue
+            author_orcid = (
+                re.sub(r"\s+", "", str(author_item.get("orcid_id", "")).strip())
+                or None
+            )
+            author = _resolve_batch_author(
+                session,
+                author_index,
+                canonical_name=author_name,
+                orcid_id=author_orcid,
+            )
+            author_id = str(author.id)
+            is_user_identity = bool(
+                user.orcid_id and author.orcid_id == user.orcid_id
+            ) or (_author_name_key(author_name) == _author_name_key(user.name))
+            explicit_user_flag = bool(author_item.get("is_user"))
+
+            # ORCID/OpenAlex payloads can include the same person multiple times;
+            # keep the first occurrence and avoid duplicate (work_id, author_id) inserts.
+            if author_id in seen_author_ids:
+                link = by_author_id.get(author_id)
+                if link is not None:
+                    link["is_user"] = bool(
+                        link["is_user"] or is_user_identity or explicit_user_flag
                     )
-                    db_session.add(link)
-                    by_author_id[author.id] = link
-                else:
-                    link.author_order = author_order_position
-                    link.is_user = is_user
-
-                if is_user_identity or explicit_user_flag:
-                    user_marked_from_identity = True
-                if is_user_from_hint:
-                    user_marked_from_hint = True
+                continue
+
+            seen_author_ids.add(author_id)
+            author_order_position += 1
+            is_user_from_hint = bool(
+                hint is not None and author_order_position == hint
+            )
+            is_user = bool(is_user_identity or explicit_user_flag or is_user_from_hint)
+            link = by_author_id.get(author_id)
+            if link is None:
+                link = {
+                    "id": str(uuid4()),
+                    "author_id": author_id,
+                    "author_order": author_order_position,
+                    "is_user": is_user,
+                }
+                new_links.append(link)
+                by_author_id[author_id] = link
+            else:
+                link["author_order"] = author_order_position
+                link["is_user"] = is_user
 
-            if user_author_position_hint is not None and not user_marked_from_identity:
-                for link in existing_authorships:
-                    if link.author_order == user_author_position_hint:
-                        link.is_user = True
-                        user_marked_from_hint = True
-                    elif user_marked_from_hint:
-                        link.is_user = False
+            if is_user_identity or explicit_user_flag:
+                user_marked_from_identity = True
+            if is_user_from_hint:
+                user_marked_from_hint = True
 
+        if hint is not None and not user_marked_from_identity:
             for link in existing_authorships:
-                if link.author_id not in seen_author_ids:
-                    db_session.delete(link)
+                if link["author_order"] == hint:
+                    link["is_user"] = True
+                    user_marked_from_hint = True
+                elif user_marked_from_hint:
+                    link["is_user"] = False
 
-        db_session.flush()
-        current_abstract = (
-            re.sub(r"\s+", " ", str(existing.abstract or "").strip()) or None
+        kept_links: list[dict[str, Any]] = []
+        for link in existing_authorships:
+            if link["author_id"] in seen_author_ids:
+                kept_links.append(link)
+            else:
+                deleted_link_ids.add(link["id"])
+        links_by_work[work_id] = kept_links + new_links
+
+    session.flush()
+    if authored_work_ids:
+        _write_work_authorships(
+            session,
+            links_by_work={
+                work_id: links_by_work[work_id]
+                for work_id in dict.fromkeys(authored_work_ids)
+            },
+            deleted_link_ids=deleted_link_ids,
         )
-        return {
-            "id": existing.id,
-            "title": existing.title,
-            "year": existing.year,
-            "doi": existing.doi,
-            "work_type": existing.work_type,
-            "provenance": existing.provenance,
-            "openalex_source_id": existing.openalex_source_id,
-            "issn_l": existing.issn_l,
-            "issns": list(existing.issns_json or []),
-            "venue_type": existing.venue_type,
-            "updated_at": existing.updated_at,
-            "structured_abstract_refresh_needed": previous_abstract != current_abstract,
-        }
+        for existing, _ in results:
+            session.expire(existing, ["authorships"])
+
+    records: list[dict[str, Any]] = []
+    for existing, record in results:
+        record["updated_at"] = existing.updated_at
+        records.append(record)
+    return records
+
+
+def upsert_work(
+    *,
+    user_id: str,
+    work: dict[str, Any],
+    provenance: str,
+    overwrite_user_metadata: bool = False,
+    ensure_tables: bool = True,
+    session: Session | None = None,
+) -> dict[str, Any]:
+    if ensure_tables:
+        create_all_tables()
+
+    def _upsert(db_session: Session) -> dict[str, Any]:
+        return upsert_works(
+            user_id=user_id,
+            works=[work],
+            provenance=provenance,
+            overwrite_user_metadata=overwrite_user_metadata,
+            session=db_session,
+        )[0]
 
     if session is not None:
         return _upsert(session)
@@ -2904,6 +3145,12 @@ def sync_metrics(
             if current_work_type in {"", "other", "dataset", "data-set"}:
                 work.work_type = "journal-article"
         session.flush()
+        if synced:
+            from research_os.services.publications_analytics_service import (
+                sync_citation_series,
+            )
+
+            sync_citation_series(session, user_id=user_id)
 
     if structured_abstract_refresh_ids:
         try:
@@ -2928,32 +3175,91 @@ def sync_metrics(
     }
 
 
+def _local_embeddings(texts: list[str], size: int = 96) -> np.ndarray:
+    vocabulary: dict[str, int] = {}
+    row_indices: list[int] = []
+    token_indices: list[int] = []
+    for row_index, text in enumerate(texts):
+        for token in TOKEN_PATTERN.findall(text or ""):
+            token_index = vocabulary.setdefault(token.lower(), len(vocabulary))
+            row_indices.append(row_index)
+            token_indices.append(token_index)
+    digest_size = hashlib.sha256().digest_size
+    digests = np.frombuffer(
+        b"".join(
+            hashlib.sha256(token.encode("utf-8")).digest() for token in vocabulary
+        ),
+        dtype=np.uint8,
+    ).reshape(len(vocabulary), digest_size)
+    sums = np.zeros((len(texts), digest_size), dtype=np.float64)
+    # np.add.at accumulates unbuffered in token order, so each row matches the
+    # per-token loop that produced existing local-hash-1 vectors bit for bit.
+    np.add.at(
+        sums,
+        np.asarray(row_indices, dtype=np.intp),
+        digests[np.asarray(token_indices, dtype=np.intp)] / 255.0,
+    )
+    repeats = -(-size // digest_size)
+    vectors = np.tile(sums, (1, repeats))[:, :size]
+    for row in vectors:
+        norm = math.sqrt(sum(value * value for value in row.tolist()))
+        if norm:
+            row /= norm
+    return vectors
+
+
 def _local_embedding(text: str, size: int = 96) -> list[float]:
-    vector = [0.0] * size
-    tokens = [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
-    for token in tokens:
-        digest = hashlib.sha256(token.encode("utf-8")).digest()
-        for index in range(size):
-            vector[index] += digest[index % len(digest)] / 255.0
-    norm = math.sqrt(sum(value * value for value in vector))
-    if norm == 0:
-        return vector
-    return [value / norm for value in vector]
-
-
-def _embed_text(
-    text: str, preferred_model: str = DEFAULT_EMBEDDING_MODEL
-) -> tuple[list[float], str]:
-    clean = re.sub(r"\s+", " ", text).strip()
-    if not clean:
-        return [], FALLBACK_EMBEDDING_MODEL
+    return _local_embeddings([text], size=size)[0].tolist()
+
+
+def _embedding_batch_size() -> int:
+    try:
+        value = int(os.getenv("PERSONA_EMBEDDING_BATCH_SIZE", "64"))
+    except ValueError:
+        value = 64
+    return max(1, min(2048, value))
+
+
+def _embedding_index_ttl_seconds() -> int:
+    try:
+        value = int(os.getenv("PERSONA_EMBEDDING_INDEX_TTL_SECONDS", "300"))
+    except ValueError:
+        value = 300
+    return max(0, value)
+
+
+def _pack_embedding(vector: list[float] | np.ndarray) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _embedding_array(row: Embedding) -> np.ndarray:
+    if row.embedding_blob:
+        return np.frombuffer(bytes(row.embedding_blob), dtype=np.float32)
+    return np.asarray(row.embedding_vector or [], dtype=np.float32)
+
+
+def _embed_texts(
+    texts: list[str], preferred_model: str = DEFAULT_EMBEDDING_MODEL
+) -> tuple[list[list[float]], str]:
+    clean_texts = [re.sub(r"\s+", " ", text).strip() for text in texts]
+    if not clean_texts:
+        return [], preferred_model
+    batch_size = _embedding_batch_size()
     try:
         client = get_client()
-        response = client.embeddings.create(model=preferred_model, input=clean)
-        vector = list(response.data[0].embedding)
-        return [float(value) for value in vector], preferred_model
+        vectors: list[list[float]] = []
+        for start in range(0, len(clean_texts), batch_size):
+            batch = clean_texts[start : start + batch_size]
+            response = client.embeddings.create(model=preferred_model, input=batch)
+            ordered = sorted(response.data, key=lambda item: int(item.index))
+            if len(ordered) != len(batch):
+                raise PersonaValidationError("Embedding response size mismatch.")
+            vectors.extend(
+                [float(value) for value in item.embedding] for item in ordered
+            )
+        return vectors, preferred_model
     except Exception:
-        return _local_embedding(clean), FALLBACK_EMBEDDING_MODEL
+        return _local_embeddings(clean_texts).tolist(), FALLBACK_EMBEDDING_MODEL
 
 
 def _work_theme_key(work: Work) -> str:
@@ -2984,33 +3290,37 @@ def generate_embeddings(
     with session_scope() as session:
         _resolve_user_or_raise(session, user_id)
         works = session.scalars(select(Work).where(Work.user_id == user_id)).all()
-        generated = 0
-        actual_model = model_name
+        pending: list[tuple[Work, str]] = []
         for work in works:
             source_text = f"{work.title}\n{work.abstract or ''}".strip()
-            if not source_text:
-                continue
-            vector, used_model = _embed_text(source_text, preferred_model=model_name)
-            actual_model = used_model
-            existing = session.scalars(
+            if source_text:
+                pending.append((work, source_text))
+        vectors, actual_model = _embed_texts(
+            [source_text for _, source_text in pending], preferred_model=model_name
+        )
+        existing_by_work = {
+            row.work_id: row
+            for row in session.scalars(
                 select(Embedding).where(
-                    Embedding.work_id == work.id,
-                    Embedding.model_name == used_model,
+                    Embedding.work_id.in_([work.id for work, _ in pending] or [""]),
+                    Embedding.model_name == actual_model,
                 )
-            ).first()
+            ).all()
+        }
+        generated = 0
+        for (work, _), vector in zip(pending, vectors):
+            existing = existing_by_work.get(work.id)
             if existing is None:
-                existing = Embedding(
-                    work_id=work.id,
-                    model_name=used_model,
-                    embedding_vector=vector,
-                )
+                existing = Embedding(work_id=work.id, model_name=actual_model)
                 session.add(existing)
-            else:
-                existing.embedding_vector = vector
-                existing.created_at = _utcnow()
+            existing.embedding_vector = []
+            existing.embedding_blob = _pack_embedding(vector)
+            existing.dimensions = len(vector)
+            existing.created_at = _utcnow()
             generated += 1
 
         session.flush()
+        invalidate_work_embedding_index(user_id=user_id)
         clustered = _cluster_themes_in_session(session, user_id)
         return {
             "generated_embeddings": generated,
@@ -3019,6 +3329,120 @@ def generate_embeddings(
         }
 
 
+@dataclass(frozen=True)
+class _WorkEmbeddingIndex:
+    model_name: str
+    work_ids: tuple[str, ...]
+    matrix: np.ndarray
+    built_at: float
+
+
+_embedding_index_lock = threading.Lock()
+_embedding_indexes: dict[tuple[str, str], _WorkEmbeddingIndex] = {}
+
+
+def invalidate_work_embedding_index(*, user_id: str) -> None:
+    with _embedding_index_lock:
+        for key in [key for key in _embedding_indexes if key[0] == user_id]:
+            _embedding_indexes.pop(key, None)
+
+
+def _load_work_embedding_index(
+    session, *, user_id: str, model_name: str
+) -> _WorkEmbeddingIndex:
+    cache_key = (user_id, model_name)
+    ttl_seconds = _embedding_index_ttl_seconds()
+    with _embedding_index_lock:
+        cached = _embedding_indexes.get(cache_key)
+    if cached is not None and (time.monotonic() - cached.built_at) < ttl_seconds:
+        return cached
+
+    rows = session.scalars(
+        select(Embedding)
+        .join(Work, Embedding.work_id == Work.id)
+        .where(Work.user_id == user_id, Embedding.model_name == model_name)
+        .order_by(Embedding.work_id.asc())
+    ).all()
+    vectors = [(row.work_id, _embedding_array(row)) for row in rows]
+    dimension_counts = Counter(vector.shape[0] for _, vector in vectors if vector.size)
+    dimensions = dimension_counts.most_common(1)[0][0] if dimension_counts else 0
+    kept = [(work_id, vector) for work_id, vector in vectors if vector.shape[0] == dimensions]
+    if kept:
+        matrix = np.vstack([vector for _, vector in kept]).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+    else:
+        matrix = np.zeros((0, 0), dtype=np.float32)
+    index = _WorkEmbeddingIndex(
+        model_name=model_name,
+        work_ids=tuple(work_id for work_id, _ in kept),
+        matrix=matrix,
+        built_at=time.monotonic(),
+    )
+    with _embedding_index_lock:
+        _embedding_indexes[cache_key] = index
+    return index
+
+
+def find_similar_works(
+    *, user_id: str, work_id: str, limit: int = 10
+) -> dict[str, Any]:
+    create_all_tables()
+    limit = max(1, min(100, int(limit)))
+    with session_scope() as session:
+        _resolve_user_or_raise(session, user_id)
+        work = session.get(Work, work_id)
+        if work is None or work.user_id != user_id:
+            raise PersonaNotFoundError(f"Work '{work_id}' was not found.")
+        target = session.scalars(
+            select(Embedding)
+            .where(Embedding.work_id == work_id)
+            .order_by(Embedding.created_at.desc())
+        ).first()
+        if target is None:
+            return {"work_id": work_id, "model_name": None, "items": []}
+
+        index = _load_work_embedding_index(
+            session, user_id=user_id, model_name=target.model_name
+        )
+        try:
+            position = index.work_ids.index(work_id)
+        except ValueError:
+            return {"work_id": work_id, "model_name": target.model_name, "items": []}
+        scores = index.matrix @ index.matrix[position]
+        scores[position] = -np.inf
+        count = min(limit, len(index.work_ids) - 1)
+        if count <= 0:
+            return {"work_id": work_id, "model_name": target.model_name, "items": []}
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top])]
+        ranked_ids = [index.work_ids[int(item)] for item in top]
+        works_by_id = {
+            row.id: row
+            for row in session.scalars(select(Work).where(Work.id.in_(ranked_ids))).all()
+        }
+        items = []
+        for item, similar_id in zip(top, ranked_ids):
+            similar = works_by_id.get(similar_id)
+            if similar is None:
+                continue
+            items.append(
+                {
+                    "work_id": similar.id,
+                    "title": similar.title,
+                    "year": similar.year,
+                    "venue_name": similar.venue_name,
+                    "doi": similar.doi,
+                    "score": round(float(scores[int(item)]), 6),
+                }
+            )
+        return {
+            "work_id": work_id,
+            "model_name": target.model_name,
+            "items": items,
+        }
+
+
 def _cluster_themes_in_session(session, user_id: str) -> list[dict[str, Any]]:
     works = session.scalars(select(Work).where(Work.user_id == user_id)).all()
     grouped: dict[str, list[Work]] = defaultdict(list)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -13,6 +12,7 @@ from research_os.db import (
     create_all_tables,
     get_session_factory,
 )
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 from research_os.services.orcid_service import import_orcid_works
 from research_os.services.persona_service import sync_metrics
 from research_os.services.publications_analytics_service import (
@@ -33,6 +33,7 @@ class PersonaSyncJobValidationError(RuntimeError):
 
 
 _ACTIVE_STATUSES = ("queued", "running")
+PERSONA_SYNC_JOB_KIND = "persona_sync.run"
 _ALLOWED_JOB_TYPES = {"orcid_import", "openalex_import", "metrics_sync", "analytics_refresh"}
 _ALLOWED_PROVIDERS = {"openalex", "semantic_scholar", "manual"}
 _DEFAULT_STALE_JOB_AFTER_SECONDS = 6 * 60 * 60
@@ -100,6 +101,15 @@ def _stale_job_after_seconds() -> int:
     return max(0, value)
 
 
+def _max_concurrent_jobs() -> int:
+    raw = str(os.getenv("PERSONA_SYNC_MAX_CONCURRENT_JOBS", "2")).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return 2
+    return max(1, value)
+
+
 def _json_safe(value: Any) -> Any:
     if isinstance(value, datetime):
         return _coerce_utc(value).isoformat() if _coerce_utc(value) else None
@@ -335,14 +345,23 @@ def _run_persona_sync_job(job_id: str) -> None:
         session.close()
 
 
-def _start_persona_sync_thread(job_id: str) -> None:
-    thread = threading.Thread(
-        target=_run_persona_sync_job,
-        args=(job_id,),
-        daemon=True,
-        name=f"persona-sync-job-{job_id[:8]}",
+def _run_persona_sync_queue_job(payload: dict[str, Any]) -> None:
+    _run_persona_sync_job(str(payload.get("job_id") or ""))
+
+
+register_job_kind(
+    PERSONA_SYNC_JOB_KIND,
+    _run_persona_sync_queue_job,
+    max_concurrency=_max_concurrent_jobs,
+)
+
+
+def _dispatch_persona_sync_job(job_id: str) -> None:
+    enqueue_job(
+        kind=PERSONA_SYNC_JOB_KIND,
+        payload={"job_id": job_id},
+        dedupe_key=job_id,
     )
-    thread.start()
 
 
 def enqueue_persona_sync_job(
@@ -415,7 +434,7 @@ def enqueue_persona_sync_job(
     finally:
         session.close()
 
-    _start_persona_sync_thread(job.id)
+    _dispatch_persona_sync_job(job.id)
     return job
 
 
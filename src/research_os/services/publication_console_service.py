@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import base64
+import functools
 from difflib import SequenceMatcher
 import html
 import hashlib
+import importlib.util
 from io import BytesIO
 import json
 import logging
@@ -12,13 +14,12 @@ import os
 import re
 import shutil
 import subprocess
+import sys
 import tarfile
 import tempfile
-import threading
 import time
 import xml.etree.ElementTree as ET
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable
@@ -50,7 +51,27 @@ from research_os.db import (
     create_all_tables,
     session_scope,
 )
-from research_os.clients.openai_client import create_response
+from research_os.clients.http_client import provider_client
+from research_os.clients.openai_client import (
+    create_response,
+    run_llm_calls_concurrently,
+)
+from research_os.services.job_queue_service import (
+    JOB_LANE_DEFAULT,
+    JOB_LANE_INTERACTIVE,
+    enqueue_job,
+    register_job_kind,
+)
+from research_os.services.parse_artifact_cache_service import (
+    cached_parse_artifact,
+    parse_artifact_scope,
+)
+from research_os.services.parse_worker_pool_service import (
+    map_parse_tasks,
+    parse_process_scope,
+    parse_process_workers,
+    run_parse_task,
+)
 from research_os.services.supplementary_work_service import (
     extract_parent_publication_title,
     is_supplementary_material_work,
@@ -381,6 +402,9 @@ PUBLICATION_PAPER_DISPLAY_GROUP_TITLE_ALIASES = {
 MAX_UPLOAD_BYTES = 50 * 1024 * 1024
 STRUCTURED_ABSTRACT_CACHE_VERSION = "publication_structured_abstract_v6"
 STRUCTURED_PAPER_CACHE_VERSION = "publication_structured_paper_v70"
+# Smallest page range sent to a parse worker; below this, pickling the PDF
+# bytes costs more than the text extraction it parallelises.
+PDF_PAGE_TEXT_MIN_PAGES_PER_TASK = 4
 STRUCTURED_PAPER_STATUS_STRUCTURE_ONLY = "STRUCTURE_ONLY"
 STRUCTURED_PAPER_STATUS_PDF_ATTACHED = "PDF_ATTACHED"
 STRUCTURED_PAPER_STATUS_PARSING = "PARSING"
@@ -444,11 +468,8 @@ STRUCTURED_PAPER_ASSET_ENRICHMENT_STATUS_COMPLETE = "COMPLETE"
 STRUCTURED_PAPER_ASSET_ENRICHMENT_STATUS_EMPTY = "EMPTY"
 STRUCTURED_PAPER_ASSET_ENRICHMENT_STATUS_FAILED = "FAILED"
 GROBID_AVAILABILITY_CACHE_TTL_SECONDS = 60
+BACKGROUND_JOB_KIND_PREFIX = "publication_console."
 
-_executor_lock = threading.Lock()
-_executor: ThreadPoolExecutor | None = None
-_inflight_lock = threading.Lock()
-_inflight_jobs: set[tuple[str, str, str]] = set()
 _grobid_availability_checked_at: float | None = None
 _grobid_availability_value = False
 
@@ -916,7 +937,7 @@ def _probe_grobid_availability() -> bool:
     endpoint = f"{base_url}/api/isalive"
     timeout_seconds = min(3.0, max(1.0, _grobid_timeout_seconds()))
     try:
-        with httpx.Client(timeout=httpx.Timeout(timeout_seconds), follow_redirects=True) as client:
+        with provider_client(timeout=timeout_seconds, follow_redirects=True) as client:
             response = client.get(endpoint)
     except Exception:
         return False
@@ -981,25 +1002,17 @@ def _request_json_with_retry(
     retries: int,
     headers: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    timeout = httpx.Timeout(timeout_seconds)
-    with httpx.Client(
-        timeout=timeout, follow_redirects=True, headers=headers or {}
-    ) as client:
-        for attempt in range(retries + 1):
-            try:
-                response = client.get(url, params=params)
-            except Exception:
-                if attempt < retries:
-                    time.sleep(0.35 * (attempt + 1))
-                    continue
-                return {}
-            if response.status_code < 400:
-                payload = response.json()
-                return payload if isinstance(payload, dict) else {}
-            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
-                return {}
-            time.sleep(0.35 * (attempt + 1))
-    return {}
+    response = _request_with_retry(
+        url=url,
+        params=params,
+        timeout_seconds=timeout_seconds,
+        retries=retries,
+        headers=headers,
+    )
+    if response is None:
+        return {}
+    payload = response.json()
+    return payload if isinstance(payload, dict) else {}
 
 
 def _request_text_with_retry(
@@ -1010,24 +1023,16 @@ def _request_text_with_retry(
     retries: int,
     headers: dict[str, str] | None = None,
 ) -> str:
-    timeout = httpx.Timeout(timeout_seconds)
-    with httpx.Client(
-        timeout=timeout, follow_redirects=True, headers=headers or {}
-    ) as client:
-        for attempt in range(retries + 1):
-            try:
-                response = client.get(url, params=params)
-            except Exception:
-                if attempt < retries:
-                    time.sleep(0.35 * (attempt + 1))
-                    continue
-                return ""
-            if response.status_code < 400:
-                return str(response.text or "")
-            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
-                return ""
-            time.sleep(0.35 * (attempt + 1))
-    return ""
+    response = _request_with_retry(
+        url=url,
+        params=params,
+        timeout_seconds=timeout_seconds,
+        retries=retries,
+        headers=headers,
+    )
+    if response is None:
+        return ""
+    return str(response.text or "")
 
 
 def _request_bytes_with_retry(
@@ -1038,25 +1043,43 @@ def _request_bytes_with_retry(
     retries: int,
     headers: dict[str, str] | None = None,
 ) -> tuple[bytes, str | None]:
-    timeout = httpx.Timeout(timeout_seconds)
-    with httpx.Client(
-        timeout=timeout, follow_redirects=True, headers=headers or {}
-    ) as client:
-        for attempt in range(retries + 1):
-            try:
-                response = client.get(url, params=params)
-            except Exception:
-                if attempt < retries:
-                    time.sleep(0.35 * (attempt + 1))
-                    continue
-                return b"", None
-            if response.status_code < 400:
-                content_type = str(response.headers.get("content-type") or "").strip() or None
-                return bytes(response.content or b""), content_type
-            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
-                return b"", None
-            time.sleep(0.35 * (attempt + 1))
-    return b"", None
+    response = _request_with_retry(
+        url=url,
+        params=params,
+        timeout_seconds=timeout_seconds,
+        retries=retries,
+        headers=headers,
+    )
+    if response is None:
+        return b"", None
+    content_type = str(response.headers.get("content-type") or "").strip() or None
+    return bytes(response.content or b""), content_type
+
+
+def _request_with_retry(
+    *,
+    url: str,
+    params: dict[str, Any] | None,
+    timeout_seconds: float,
+    retries: int,
+    headers: dict[str, str] | None,
+) -> httpx.Response | None:
+    client = provider_client(
+        timeout=timeout_seconds, headers=headers, follow_redirects=True
+    )
+    try:
+        response = client.request_with_retry(
+            "GET",
+            url,
+            params=params,
+            retries=retries,
+            retry_status_codes=RETRYABLE_STATUS_CODES,
+        )
+    except Exception:
+        return None
+    if response.status_code >= 400:
+        return None
+    return response
 
 
 def _openalex_mailto(*, user_email: str | None = None) -> str | None:
@@ -2349,41 +2372,35 @@ def _hydrate_authors_data(*, work: Work, user_email: str | None) -> dict[str, An
     }
 
 
-def _get_executor() -> ThreadPoolExecutor:
-    global _executor
-    with _executor_lock:
-        if _executor is None:
-            _executor = ThreadPoolExecutor(
-                max_workers=_max_workers(), thread_name_prefix="pub-console"
-            )
-        return _executor
-
-
-def _submit_background_job(*, kind: str, user_id: str, publication_id: str, fn) -> bool:  # noqa: ANN001
-    key = (kind, user_id, publication_id)
-    with _inflight_lock:
-        if key in _inflight_jobs:
-            return False
-        _inflight_jobs.add(key)
+def _submit_background_job(
+    *,
+    kind: str,
+    user_id: str,
+    publication_id: str,
+    options: dict[str, Any] | None = None,
+) -> bool:
+    return enqueue_job(
+        kind=f"{BACKGROUND_JOB_KIND_PREFIX}{kind}",
+        payload={
+            "user_id": user_id,
+            "publication_id": publication_id,
+            "options": dict(options or {}),
+        },
+        dedupe_key=f"{user_id}:{publication_id}",
+    )
 
-    def _run() -> None:
-        try:
-            fn(user_id=user_id, publication_id=publication_id)
-        except Exception:
-            logger.exception(
-                "publication_console_background_job_failed",
-                extra={
-                    "kind": kind,
-                    "user_id": user_id,
-                    "publication_id": publication_id,
-                },
-            )
-        finally:
-            with _inflight_lock:
-                _inflight_jobs.discard(key)
 
-    _get_executor().submit(_run)
-    return True
+def _run_background_job(
+    *,
+    kind: str,
+    user_id: str,
+    publication_id: str,
+    options: dict[str, Any] | None = None,
+) -> None:
+    # Failures propagate to the queue worker, which logs them once and marks
+    # the job failed; these kinds run a single attempt (see registration).
+    runner = _BACKGROUND_JOB_RUNNERS[kind]
+    runner(user_id=user_id, publication_id=publication_id, **dict(options or {}))
 
 
 def _portfolio_context(
@@ -7427,19 +7444,48 @@ def _find_publication_paper_section_anchor_page(
     return None
 
 
+def _publication_pdf_page_search_texts_for_range(
+    content: bytes, start: int, stop: int
+) -> list[str]:
+    reader = PdfReader(BytesIO(content))
+    return [
+        _normalize_publication_pdf_search_text(reader.pages[index].extract_text() or "")
+        for index in range(start, stop)
+    ]
+
+
 def _publication_pdf_page_search_texts_from_content(
     content: bytes,
 ) -> tuple[list[str], int | None]:
     if not content or PdfReader is None:
         return [], None
     try:
-        reader = PdfReader(BytesIO(content))
+        page_total = len(PdfReader(BytesIO(content)).pages)
     except Exception:
         return [], None
-    page_search_texts = [
-        _normalize_publication_pdf_search_text(page.extract_text() or "")
-        for page in reader.pages
-    ]
+
+    def _extract_page_texts() -> list[str]:
+        pages_per_task = max(
+            PDF_PAGE_TEXT_MIN_PAGES_PER_TASK,
+            -(-page_total // max(1, parse_process_workers())),
+        )
+        page_ranges = [
+            (content, start, min(page_total, start + pages_per_task))
+            for start in range(0, page_total, pages_per_task)
+        ]
+        return [
+            text
+            for texts in map_parse_tasks(
+                _publication_pdf_page_search_texts_for_range, page_ranges
+            )
+            for text in texts
+        ]
+
+    page_search_texts = cached_parse_artifact(
+        artifact="pdf_page_search_texts",
+        content=content,
+        build=_extract_page_texts,
+    )
     return page_search_texts, (len(page_search_texts) or None)
 
 
@@ -7950,6 +7996,29 @@ def _request_grobid_fulltext_tei(
     file_name: str,
     tei_coordinates: str = "head,p,s,ref,biblStruct,formula,figure,table",
     include_raw_affiliations: bool = True,
+) -> str:
+    return cached_parse_artifact(
+        artifact="grobid_tei",
+        content=content,
+        variant={
+            "tei_coordinates": tei_coordinates,
+            "include_raw_affiliations": include_raw_affiliations,
+        },
+        build=lambda: _request_grobid_fulltext_tei_uncached(
+            content=content,
+            file_name=file_name,
+            tei_coordinates=tei_coordinates,
+            include_raw_affiliations=include_raw_affiliations,
+        ),
+    )
+
+
+def _request_grobid_fulltext_tei_uncached(
+    *,
+    content: bytes,
+    file_name: str,
+    tei_coordinates: str,
+    include_raw_affiliations: bool,
 ) -> str:
     if not content:
         raise PublicationConsoleValidationError("Publication PDF bytes are empty.")
@@ -7965,7 +8034,7 @@ def _request_grobid_fulltext_tei(
     last_error = (
         f"GROBID is required for full-paper parsing and could not be reached at {endpoint}."
     )
-    with httpx.Client(
+    with provider_client(
         timeout=timeout,
         follow_redirects=True,
         headers={"Accept": "application/xml"},
@@ -9682,6 +9751,20 @@ def _crop_figure_images_from_pdf(
 ) -> list[dict[str, Any]]:
     if _fitz is None or not content or not figures:
         return figures
+    return cached_parse_artifact(
+        artifact="figure_crops",
+        content=content,
+        variant=figures,
+        build=lambda: run_parse_task(
+            _crop_figure_images_from_pdf_uncached, content, figures
+        ),
+    )
+
+
+def _crop_figure_images_from_pdf_uncached(
+    content: bytes,
+    figures: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
     try:
         doc = _fitz.open(stream=content, filetype="pdf")
     except Exception:
@@ -9755,15 +9838,32 @@ def _crop_figure_images_from_pdf(
         doc.close()
 
 
+def _docling_available() -> bool:
+    # Probe without importing: loading docling pulls in its model stack, and
+    # the conversion itself runs in a parse worker.
+    if "docling" in sys.modules:
+        return True
+    return importlib.util.find_spec("docling") is not None
+
+
 def _extract_docling_tables_html(content: bytes) -> list[dict[str, Any]]:
-    try:
-        from docling.document_converter import DocumentConverter
-    except Exception:
-        return []
-    if not content:
+    if not content or not _docling_available():
         return []
+    # Docling reports failures as an empty list, so only non-empty results are
+    # cached.
+    return cached_parse_artifact(
+        artifact="docling_tables",
+        content=content,
+        skip_empty=True,
+        build=lambda: run_parse_task(_extract_docling_tables_html_uncached, content),
+    )
+
+
+def _extract_docling_tables_html_uncached(content: bytes) -> list[dict[str, Any]]:
     tmp_path: Path | None = None
     try:
+        from docling.document_converter import DocumentConverter
+
         hf_endpoint = os.getenv("HF_ENDPOINT", "").strip()
         if not hf_endpoint:
             os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
@@ -12987,6 +13087,31 @@ def _extract_publication_paper_references_from_pmc_archive_content(
         return []
 
 
+def _structure_pmc_archive_table_html(
+    *,
+    raw_table_html: str,
+    table_notes: list[str],
+    table_title: str | None,
+    table_caption: str | None,
+    abstract_context: str | None,
+) -> str:
+    structured_html = _canonicalize_docling_table_html(
+        raw_table_html,
+        table_title=table_title,
+        table_caption=table_caption,
+        abstract_context=abstract_context,
+    )
+    if table_notes:
+        structured_html = _append_publication_structured_table_notes(
+            structured_html,
+            table_notes,
+            table_title=table_title,
+            table_caption=table_caption,
+            abstract_context=abstract_context,
+        )
+    return structured_html
+
+
 def _extract_structured_publication_assets_from_pmc_archive_content(
     archive_content: bytes,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -13004,6 +13129,8 @@ def _extract_structured_publication_assets_from_pmc_archive_content(
 
             figures: list[dict[str, Any]] = []
             tables: list[dict[str, Any]] = []
+            table_structuring_calls: list[Callable[[], str]] = []
+            table_structuring_targets: list[dict[str, Any]] = []
             for node in root.iter():
                 local_name = _xml_local_name(getattr(node, "tag", ""))
                 if local_name == "fig":
@@ -13083,24 +13210,28 @@ def _extract_structured_publication_assets_from_pmc_archive_content(
                             table_element = candidate
                             break
                     if table_element is not None:
-                        raw_table_html = ET.tostring(table_element, encoding="unicode")
-                        structured_html = _canonicalize_docling_table_html(
-                            raw_table_html,
-                            table_title=head_text or title,
-                            table_caption=caption,
-                            abstract_context=abstract_context,
-                        )
-                        table_notes = _pmc_archive_table_notes(node)
-                        if table_notes:
-                            structured_html = _append_publication_structured_table_notes(
-                                structured_html,
-                                table_notes,
+                        table_structuring_calls.append(
+                            functools.partial(
+                                _structure_pmc_archive_table_html,
+                                raw_table_html=ET.tostring(
+                                    table_element, encoding="unicode"
+                                ),
+                                table_notes=_pmc_archive_table_notes(node),
                                 table_title=head_text or title,
                                 table_caption=caption,
                                 abstract_context=abstract_context,
                             )
-                        parsed_asset["structured_html"] = structured_html
+                        )
+                        table_structuring_targets.append(parsed_asset)
                     tables.append(parsed_asset)
+            # Row-grouping and footer classification may call the LLM once or
+            # twice per table; tables are independent, so structure them in
+            # parallel and finish in roughly the time of the slowest table.
+            for parsed_asset, structured_html in zip(
+                table_structuring_targets,
+                run_llm_calls_concurrently(table_structuring_calls),
+            ):
+                parsed_asset["structured_html"] = structured_html
     except Exception:
         logger.exception("publication_pmc_archive_asset_extract_failed")
         return [], []
@@ -13447,6 +13578,15 @@ def _request_pmc_bioc_payload(pmcid: str) -> Any:
     clean_pmcid = str(pmcid or "").strip().upper()
     if not clean_pmcid.startswith("PMC"):
         return None
+    return cached_parse_artifact(
+        artifact="pmc_bioc",
+        key=f"pmc-bioc-{clean_pmcid}",
+        skip_empty=True,
+        build=lambda: _request_pmc_bioc_payload_uncached(clean_pmcid),
+    )
+
+
+def _request_pmc_bioc_payload_uncached(clean_pmcid: str) -> Any:
     json_text = _request_text_with_retry(
         url=(
             "https://www.ncbi.nlm.nih.gov/research/bionlp/RESTful/pmcoa.cgi/"
@@ -14247,7 +14387,6 @@ def _enqueue_authors_if_needed(*, user_id: str, publication_id: str) -> bool:
         kind="authors",
         user_id=user_id,
         publication_id=publication_id,
-        fn=_run_authors_hydration_job,
     )
 
 
@@ -14292,7 +14431,6 @@ def _enqueue_impact_if_needed(*, user_id: str, publication_id: str) -> bool:
         kind="impact",
         user_id=user_id,
         publication_id=publication_id,
-        fn=_run_impact_compute_job,
     )
 
 
@@ -14337,7 +14475,6 @@ def _enqueue_ai_if_needed(*, user_id: str, publication_id: str) -> bool:
         kind="ai",
         user_id=user_id,
         publication_id=publication_id,
-        fn=_run_ai_compute_job,
     )
 
 
@@ -14425,11 +14562,7 @@ def _enqueue_structured_abstract_if_needed(
         kind="structured_abstract",
         user_id=user_id,
         publication_id=publication_id,
-        fn=lambda *, user_id, publication_id: _run_structured_abstract_compute_job(
-            user_id=user_id,
-            publication_id=publication_id,
-            force=force,
-        ),
+        options={"force": bool(force)},
     )
 
 
@@ -14694,7 +14827,9 @@ def _run_structured_abstract_compute_job(
             session.flush()
 
 
-def _run_structured_paper_parse_job(*, user_id: str, publication_id: str) -> None:
+def _run_structured_paper_parse_job(
+    *, user_id: str, publication_id: str, force_reparse: bool = False
+) -> None:
     parse_started_at = _utcnow()
     now = parse_started_at
     source_state: dict[str, Any] | None = None
@@ -14802,15 +14937,28 @@ def _run_structured_paper_parse_job(*, user_id: str, publication_id: str) -> Non
             file_id=primary_pdf_file_id,
             proxy_remote=True,
         )
-        parsed_paper = _extract_structured_publication_paper_with_best_available_parser(
-            content=bytes(binary_payload.get("content") or b""),
-            title=str(source_state["publication"].get("title") or "").strip() or None,
-            file_name=str(binary_payload.get("file_name") or "").strip() or None,
-            pmid=str(source_state["publication"].get("pmid") or "").strip() or None,
-            doi=str(source_state["publication"].get("doi") or "").strip() or None,
-            year=_safe_int(source_state["publication"].get("year")),
-            progress_callback=_report_progress,
-        )
+        pdf_content = bytes(binary_payload.get("content") or b"")
+        parser_inputs = {
+            "title": str(source_state["publication"].get("title") or "").strip()
+            or None,
+            "file_name": str(binary_payload.get("file_name") or "").strip() or None,
+            "pmid": str(source_state["publication"].get("pmid") or "").strip() or None,
+            "doi": str(source_state["publication"].get("doi") or "").strip() or None,
+            "year": _safe_int(source_state["publication"].get("year")),
+        }
+        # Intermediate artefacts are keyed by PDF bytes, so the same open-access
+        # PDF attached to several users' works is only sent through
+        # GROBID/docling once. The composite is rebuilt every time so a result
+        # degraded by a transient PMC, BioC or docling failure is not pinned.
+        with parse_artifact_scope(
+            parser_version=STRUCTURED_PAPER_CACHE_VERSION,
+            refresh=force_reparse,
+        ), parse_process_scope():
+            parsed_paper = _extract_structured_publication_paper_with_best_available_parser(
+                content=pdf_content,
+                progress_callback=_report_progress,
+                **parser_inputs,
+            )
         _report_progress(STRUCTURED_PAPER_PROGRESS_STAGE_FINALIZING)
         payload, source_signature = _build_publication_paper_payload(
             publication=source_state["publication"],
@@ -14887,6 +15035,47 @@ def _run_structured_paper_parse_job(*, user_id: str, publication_id: str) -> Non
             session.flush()
 
 
+_BACKGROUND_JOB_RUNNERS = {
+    "authors": _run_authors_hydration_job,
+    "impact": _run_impact_compute_job,
+    "ai": _run_ai_compute_job,
+    "structured_abstract": _run_structured_abstract_compute_job,
+    "structured_paper": _run_structured_paper_parse_job,
+}
+_BACKGROUND_JOB_LANES = {
+    "authors": JOB_LANE_INTERACTIVE,
+    "impact": JOB_LANE_INTERACTIVE,
+    "ai": JOB_LANE_INTERACTIVE,
+    "structured_abstract": JOB_LANE_INTERACTIVE,
+    "structured_paper": JOB_LANE_DEFAULT,
+}
+
+
+def _background_job_handler(kind: str):  # noqa: ANN202
+    def _handle(payload: dict[str, Any]) -> None:
+        options = payload.get("options")
+        _run_background_job(
+            kind=kind,
+            user_id=str(payload.get("user_id") or ""),
+            publication_id=str(payload.get("publication_id") or ""),
+            options=options if isinstance(options, dict) else None,
+        )
+
+    return _handle
+
+
+for _job_kind in _BACKGROUND_JOB_RUNNERS:
+    register_job_kind(
+        f"{BACKGROUND_JOB_KIND_PREFIX}{_job_kind}",
+        _background_job_handler(_job_kind),
+        max_concurrency=_max_workers,
+        # Runners persist their own failure state, and retrying an AI or
+        # impact job would repeat its model spend, so failures are not retried.
+        max_attempts=1,
+        lane=_BACKGROUND_JOB_LANES[_job_kind],
+    )
+
+
 def enqueue_publication_structured_abstract_refresh(
     *, user_id: str, publication_id: str, force: bool = False
 ) -> bool:
@@ -15150,7 +15339,7 @@ def get_publication_paper_model(*, user_id: str, publication_id: str, force_repa
             kind="structured_paper",
             user_id=user_id,
             publication_id=publication_id,
-            fn=_run_structured_paper_parse_job,
+            options={"force_reparse": True} if force_reparse else None,
         )
     return response_payload
 
@@ -15762,12 +15951,47 @@ def rename_publication_file(
     )
 
 
+def _publication_file_content_type(file_name: str) -> str:
+    lower = file_name.lower()
+    if lower.endswith(".pdf"):
+        return "application/pdf"
+    if lower.endswith(".docx"):
+        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    return "application/octet-stream"
+
+
+def _publication_file_etag(row: PublicationFile, path: Path) -> str:
+    checksum = str(row.checksum or "").strip()
+    if checksum:
+        return f'"{checksum}"'
+    stat_result = path.stat()
+    # Weak validator for legacy rows stored before checksums were recorded.
+    return f'W/"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _publication_file_local_payload(
+    row: PublicationFile, *, path: Path, load_content: bool
+) -> dict[str, Any]:
+    file_name = _coerce_download_filename(file_name=row.file_name, path=path)
+    return {
+        "mode": "content",
+        "url": None,
+        "file_name": file_name,
+        "content_type": _publication_file_content_type(file_name),
+        "content": path.read_bytes() if load_content else b"",
+        "path": str(path),
+        "size": path.stat().st_size,
+        "etag": _publication_file_etag(row, path),
+    }
+
+
 def _resolve_publication_file_binary_payload(
     *,
     user_id: str,
     publication_id: str,
     file_id: str,
     proxy_remote: bool,
+    load_content: bool = True,
 ) -> dict[str, Any]:
     with session_scope() as session:
         work = _resolve_work_or_raise(
@@ -15797,26 +16021,9 @@ def _resolve_publication_file_binary_payload(
         source = str(row.source or "").upper()
         stored_path = _publication_file_storage_path(row.storage_key)
         if stored_path is not None and stored_path.exists() and stored_path.is_file():
-            content = stored_path.read_bytes()
-            file_name = _coerce_download_filename(
-                file_name=row.file_name, path=stored_path
-            )
-            lower = file_name.lower()
-            if lower.endswith(".pdf"):
-                content_type = "application/pdf"
-            elif lower.endswith(".docx"):
-                content_type = (
-                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                )
-            else:
-                content_type = "application/octet-stream"
-            return {
-                "mode": "content",
-                "url": None,
-                "file_name": file_name,
-                "content_type": content_type,
-                "content": content,
-            }
+            return _publication_file_local_payload(
+                row, path=stored_path, load_content=load_content
+            )
 
         if source == FILE_SOURCE_OA_LINK and row.oa_url:
             oa_name = _coerce_download_filename(
@@ -15835,7 +16042,7 @@ def _resolve_publication_file_binary_payload(
                 raise PublicationConsoleValidationError(
                     "Open-access PDF bytes could not be retrieved for the in-app viewer."
                 )
-            _persist_publication_file_content(
+            persisted_path = _persist_publication_file_content(
                 row,
                 content=content,
                 content_type=content_type,
@@ -15848,6 +16055,9 @@ def _resolve_publication_file_binary_payload(
                 "file_name": oa_name,
                 "content_type": content_type or "application/pdf",
                 "content": content,
+                "path": str(persisted_path),
+                "size": len(content),
+                "etag": _publication_file_etag(row, persisted_path),
             }
 
         path = _publication_file_storage_path(row.storage_key)
@@ -15856,25 +16066,7 @@ def _resolve_publication_file_binary_payload(
                 "Uploaded file bytes were not found on disk."
             )
 
-        content = path.read_bytes()
-        file_name = _coerce_download_filename(file_name=row.file_name, path=path)
-        lower = file_name.lower()
-        if lower.endswith(".pdf"):
-            content_type = "application/pdf"
-        elif lower.endswith(".docx"):
-            content_type = (
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            )
-        else:
-            content_type = "application/octet-stream"
-
-        return {
-            "mode": "content",
-            "url": None,
-            "file_name": file_name,
-            "content_type": content_type,
-            "content": content,
-        }
+        return _publication_file_local_payload(row, path=path, load_content=load_content)
 
 
 def get_publication_file_download(
@@ -15886,6 +16078,7 @@ def get_publication_file_download(
         publication_id=publication_id,
         file_id=file_id,
         proxy_remote=False,
+        load_content=False,
     )
 
 
@@ -15898,6 +16091,7 @@ def get_publication_file_content(
         publication_id=publication_id,
         file_id=file_id,
         proxy_remote=True,
+        load_content=False,
     )
     payload["mode"] = "content"
     payload["url"] = None
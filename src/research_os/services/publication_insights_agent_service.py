@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
+import hashlib
 import json
+import logging
 import math
 import os
 import re
+import threading
 import time
 from collections import Counter
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterator, Literal
+from uuid import uuid4
 
-from research_os.clients.openai_client import create_response
+from sqlalchemy import delete, func, select
+
+from research_os.clients.openai_client import create_response, stream_response
 from research_os.clients.openai_client import get_client
 from research_os.config import ConfigurationError
 from research_os.config import get_openai_api_key
+from research_os.db import (
+    PublicationInsightsDraftCache,
+    create_all_tables,
+    dialect_insert,
+    session_scope,
+)
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 from research_os.services.publication_metrics_service import (
     PublicationMetricsNotFoundError,
     get_publication_top_metrics,
@@ -22,9 +35,25 @@ AGENT_NAME = "Publication insights agent"
 PROMPT_VERSION = "publication_insights_agent_v12"
 PREFERRED_MODEL = "gpt-5.4"
 PUBLICATION_INSIGHTS_AVAILABILITY_CACHE_TTL_SECONDS = 60
+PUBLICATION_INSIGHTS_DRAFT_CACHE_FRESH_SECONDS = 24 * 60 * 60
+PUBLICATION_INSIGHTS_DRAFT_CACHE_STALE_SECONDS = 7 * 24 * 60 * 60
+PUBLICATION_INSIGHTS_DRAFT_REFRESH_JOB_KIND = "publication_insights_draft_refresh"
+# Bundle timestamps change on every metrics recompute even when the numbers
+# behind a draft do not, so they are left out of the evidence hash.
+_EVIDENCE_HASH_IGNORED_KEYS = frozenset({"computed_at"})
+
+logger = logging.getLogger(__name__)
 
 _publication_insights_availability_checked_at: float | None = None
 _publication_insights_availability_value = False
+_draft_cache_stats_lock = threading.Lock()
+_draft_cache_stats = {
+    "hits": 0,
+    "stale_hits": 0,
+    "misses": 0,
+    "stores": 0,
+    "revalidations_enqueued": 0,
+}
 
 WINDOW_CONFIG: dict[str, dict[str, str]] = {
     "1y": {
@@ -9023,6 +9052,190 @@ def publication_insights_available(*, force_refresh: bool = False) -> bool:
     return available
 
 
+def _env_seconds(name: str, default: int) -> int:
+    raw_value = str(os.getenv(name, str(default))).strip()
+    try:
+        return max(0, int(raw_value))
+    except ValueError:
+        return default
+
+
+def _publication_insights_draft_cache_enabled() -> bool:
+    value = str(
+        os.getenv("PUBLICATION_INSIGHTS_DRAFT_CACHE_ENABLED", "1")
+    ).strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _publication_insights_draft_cache_fresh_seconds() -> int:
+    return _env_seconds(
+        "PUBLICATION_INSIGHTS_DRAFT_CACHE_FRESH_SECONDS",
+        PUBLICATION_INSIGHTS_DRAFT_CACHE_FRESH_SECONDS,
+    )
+
+
+def _publication_insights_draft_cache_stale_seconds() -> int:
+    return _env_seconds(
+        "PUBLICATION_INSIGHTS_DRAFT_CACHE_STALE_SECONDS",
+        PUBLICATION_INSIGHTS_DRAFT_CACHE_STALE_SECONDS,
+    )
+
+
+def _publication_insights_evidence_hash(evidence: dict[str, Any]) -> str:
+    canonical = json.dumps(
+        {
+            key: value
+            for key, value in evidence.items()
+            if key not in _EVIDENCE_HASH_IGNORED_KEYS
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _publication_insights_draft_cache_key(
+    *,
+    user_id: str,
+    section_key: str | None,
+    window_id: str,
+    scope: str,
+    model: str,
+    evidence_hash: str,
+) -> str:
+    parts = [
+        user_id,
+        section_key or "",
+        window_id,
+        scope,
+        PROMPT_VERSION,
+        model,
+        evidence_hash,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _record_draft_cache_event(name: str) -> None:
+    with _draft_cache_stats_lock:
+        _draft_cache_stats[name] += 1
+
+
+def _read_cached_publication_insights_draft(
+    cache_key: str,
+) -> tuple[dict[str, Any], datetime] | None:
+    create_all_tables()
+    now = _utcnow()
+    with session_scope() as session:
+        row = session.scalars(
+            select(PublicationInsightsDraftCache).where(
+                PublicationInsightsDraftCache.cache_key == cache_key
+            )
+        ).first()
+        if row is None or not isinstance(row.payload_json, dict):
+            return None
+        row.hit_count = int(row.hit_count or 0) + 1
+        row.last_hit_at = now
+        generated_at = row.generated_at
+        if generated_at.tzinfo is None:
+            generated_at = generated_at.replace(tzinfo=timezone.utc)
+        payload = dict(row.payload_json)
+    provenance = dict(payload.get("provenance") or {})
+    provenance["generated_at"] = generated_at
+    payload["provenance"] = provenance
+    return payload, generated_at
+
+
+def _store_cached_publication_insights_draft(
+    *,
+    cache_key: str,
+    user_id: str,
+    section_key: str | None,
+    window_id: str,
+    scope: str,
+    model: str,
+    evidence_hash: str,
+    draft: dict[str, Any],
+) -> None:
+    generated_at = draft["provenance"]["generated_at"]
+    payload = json.loads(json.dumps(draft, default=str))
+    values = {
+        "user_id": user_id,
+        "cache_key": cache_key,
+        "section_key": section_key or "",
+        "window_id": window_id,
+        "scope": scope,
+        "prompt_version": PROMPT_VERSION,
+        "model": model,
+        "evidence_hash": evidence_hash,
+        "payload_json": payload,
+        "hit_count": 0,
+        "generated_at": generated_at,
+        "last_hit_at": None,
+    }
+    try:
+        with session_scope() as session:
+            # One draft per slot: a new evidence hash supersedes older drafts.
+            session.execute(
+                delete(PublicationInsightsDraftCache).where(
+                    PublicationInsightsDraftCache.user_id == user_id,
+                    PublicationInsightsDraftCache.section_key == (section_key or ""),
+                    PublicationInsightsDraftCache.window_id == window_id,
+                    PublicationInsightsDraftCache.scope == scope,
+                    PublicationInsightsDraftCache.cache_key != cache_key,
+                )
+            )
+            statement = dialect_insert(session, PublicationInsightsDraftCache).values(
+                id=str(uuid4()), **values
+            )
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["cache_key"],
+                    set_={
+                        "payload_json": statement.excluded.payload_json,
+                        "hit_count": 0,
+                        "generated_at": statement.excluded.generated_at,
+                        "last_hit_at": None,
+                    },
+                )
+            )
+    except Exception:
+        logger.exception("publication_insights_draft_cache_store_failed")
+        return
+    _record_draft_cache_event("stores")
+
+
+def _with_draft_cache_provenance(
+    draft: dict[str, Any], *, status: str, evidence_hash: str
+) -> dict[str, Any]:
+    provenance = dict(draft.get("provenance") or {})
+    provenance["cache"] = {"status": status, "evidence_hash": evidence_hash}
+    return {**draft, "provenance": provenance}
+
+
+def get_publication_insights_draft_cache_stats() -> dict[str, Any]:
+    with _draft_cache_stats_lock:
+        stats: dict[str, Any] = dict(_draft_cache_stats)
+    lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+    stats["hit_rate_pct"] = (
+        round(100.0 * (stats["hits"] + stats["stale_hits"]) / lookups, 1)
+        if lookups
+        else 0.0
+    )
+    create_all_tables()
+    with session_scope() as session:
+        stats["entries"] = int(
+            session.scalar(select(func.count(PublicationInsightsDraftCache.id))) or 0
+        )
+    return stats
+
+
+def reset_publication_insights_draft_cache_stats() -> None:
+    with _draft_cache_stats_lock:
+        for name in _draft_cache_stats:
+            _draft_cache_stats[name] = 0
+
+
 def _build_publication_insights_provenance_evidence(
     *, evidence: dict[str, Any], section_key: str | None
 ) -> dict[str, Any]:
@@ -9260,7 +9473,7 @@ def _build_publication_insights_provenance_evidence(
     }
 
 
-def generate_publication_insights_agent_draft(
+def _iter_publication_insights_draft_events(
     *,
     user_id: str,
     window_id: Literal["1y", "3y", "5y", "all"] = "1y",
@@ -9270,7 +9483,9 @@ def generate_publication_insights_agent_draft(
     | None = None,
     scope: Literal["window", "section"] = "window",
     ui_context: str | None = None,
-) -> dict[str, Any]:
+    force_refresh: bool = False,
+    stream: bool = False,
+) -> Iterator[tuple[str, dict[str, Any]]]:
     if section_key == "publication_output_pattern":
         evidence = _build_publication_output_pattern_evidence(user_id=user_id)
         request_input: Any = _build_publication_output_pattern_prompt(evidence)
@@ -9319,6 +9534,50 @@ def generate_publication_insights_agent_draft(
         )
 
     model_used = _configured_publication_insights_model()
+    evidence_hash = _publication_insights_evidence_hash(evidence)
+    cache_key = _publication_insights_draft_cache_key(
+        user_id=user_id,
+        section_key=section_key,
+        window_id=str(window_id),
+        scope=scope,
+        model=model_used,
+        evidence_hash=evidence_hash,
+    )
+    yield "progress", {"stage": "evidence_ready", "evidence_hash": evidence_hash}
+    if _publication_insights_draft_cache_enabled() and not force_refresh:
+        cached = _read_cached_publication_insights_draft(cache_key)
+        if cached is not None:
+            payload, generated_at = cached
+            age_seconds = (_utcnow() - generated_at).total_seconds()
+            if age_seconds < _publication_insights_draft_cache_fresh_seconds():
+                _record_draft_cache_event("hits")
+                yield "result", _with_draft_cache_provenance(
+                    payload, status="hit", evidence_hash=evidence_hash
+                )
+                return
+            if age_seconds < (
+                _publication_insights_draft_cache_fresh_seconds()
+                + _publication_insights_draft_cache_stale_seconds()
+            ):
+                _record_draft_cache_event("stale_hits")
+                if enqueue_job(
+                    kind=PUBLICATION_INSIGHTS_DRAFT_REFRESH_JOB_KIND,
+                    payload={
+                        "user_id": user_id,
+                        "window_id": str(window_id),
+                        "section_key": section_key,
+                        "scope": scope,
+                        "ui_context": ui_context,
+                    },
+                    dedupe_key=cache_key,
+                ):
+                    _record_draft_cache_event("revalidations_enqueued")
+                yield "result", _with_draft_cache_provenance(
+                    payload, status="stale", evidence_hash=evidence_hash
+                )
+                return
+        _record_draft_cache_event("misses")
+
     text_config = (
         _publication_output_pattern_text_config()
         if section_key == "publication_output_pattern"
@@ -9352,17 +9611,40 @@ def generate_publication_insights_agent_draft(
         "publication_type_over_time",
     }:
         response_create_kwargs["store"] = False
+    yield "progress", {"stage": "generating", "model": model_used}
+    request_kwargs: dict[str, Any] = {
+        "model": model_used,
+        "input": request_input,
+        "max_output_tokens": max_output_tokens,
+        "text": text_config,
+        "reasoning": {"effort": _publication_insights_reasoning_effort()},
+        "timeout": _publication_insights_openai_timeout_seconds(),
+        "max_retries": 0,
+        **response_create_kwargs,
+    }
+    streamed_text: list[str] = []
+    response: Any = None
     try:
-        response = create_response(
-            model=model_used,
-            input=request_input,
-            max_output_tokens=max_output_tokens,
-            text=text_config,
-            reasoning={"effort": _publication_insights_reasoning_effort()},
-            timeout=_publication_insights_openai_timeout_seconds(),
-            max_retries=0,
-            **response_create_kwargs,
-        )
+        if stream:
+            for event in stream_response(**request_kwargs):
+                event_type = str(getattr(event, "type", "") or "")
+                if event_type == "response.output_text.delta":
+                    delta = str(getattr(event, "delta", "") or "")
+                    if delta:
+                        streamed_text.append(delta)
+                        yield "delta", {"text": delta}
+                elif event_type in {
+                    "response.completed",
+                    "response.incomplete",
+                    "response.failed",
+                }:
+                    response = getattr(event, "response", None)
+                elif event_type == "error":
+                    raise RuntimeError("Publication insights AI stream failed.")
+            if response is None:
+                raise RuntimeError("Publication insights AI stream ended early.")
+        else:
+            response = create_response(**request_kwargs)
     except Exception as exc:
         raise PublicationInsightsAgentValidationError(
             "Publication insights AI generation failed."
@@ -9376,7 +9658,9 @@ def generate_publication_insights_agent_draft(
             f"Publication insights AI response was incomplete ({reason})."
         )
 
-    output_text = str(getattr(response, "output_text", "") or "")
+    output_text = str(getattr(response, "output_text", "") or "") or "".join(
+        streamed_text
+    )
     if not output_text.strip():
         raise PublicationInsightsAgentValidationError(
             "Publication insights AI returned an empty body."
@@ -9410,7 +9694,7 @@ def generate_publication_insights_agent_draft(
         list(payload.get("sections") or [])
     )
 
-    return {
+    draft = {
         "agent_name": AGENT_NAME,
         "status": "draft",
         "window_id": str(evidence.get("window_id") or "1y"),
@@ -9430,3 +9714,96 @@ def generate_publication_insights_agent_draft(
             ),
         },
     }
+    if _publication_insights_draft_cache_enabled():
+        _store_cached_publication_insights_draft(
+            cache_key=cache_key,
+            user_id=user_id,
+            section_key=section_key,
+            window_id=str(window_id),
+            scope=scope,
+            model=model_used,
+            evidence_hash=evidence_hash,
+            draft=draft,
+        )
+    yield "result", _with_draft_cache_provenance(
+        draft, status="miss", evidence_hash=evidence_hash
+    )
+
+
+def generate_publication_insights_agent_draft(
+    *,
+    user_id: str,
+    window_id: Literal["1y", "3y", "5y", "all"] = "1y",
+    section_key: Literal[
+        "uncited_works", "citation_drivers", "citation_activation", "citation_activation_history", "publication_output_pattern", "publication_production_phase", "publication_year_over_year_trajectory", "publication_volume_over_time", "publication_article_type_over_time", "publication_type_over_time"
+    ]
+    | None = None,
+    scope: Literal["window", "section"] = "window",
+    ui_context: str | None = None,
+    force_refresh: bool = False,
+) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for event, data in _iter_publication_insights_draft_events(
+        user_id=user_id,
+        window_id=window_id,
+        section_key=section_key,
+        scope=scope,
+        ui_context=ui_context,
+        force_refresh=force_refresh,
+    ):
+        if event == "result":
+            result = data
+    return result
+
+
+def stream_publication_insights_agent_draft(
+    *,
+    user_id: str,
+    window_id: Literal["1y", "3y", "5y", "all"] = "1y",
+    section_key: Literal[
+        "uncited_works", "citation_drivers", "citation_activation", "citation_activation_history", "publication_output_pattern", "publication_production_phase", "publication_year_over_year_trajectory", "publication_volume_over_time", "publication_article_type_over_time", "publication_type_over_time"
+    ]
+    | None = None,
+    scope: Literal["window", "section"] = "window",
+    ui_context: str | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(event, data)`` pairs for a draft: progress, JSON text deltas, result.
+
+    Cache hits and stale hits go straight to the result event. On a miss the
+    deltas are fragments of the model's JSON body; only the result event is
+    validated and coerced. The first event follows evidence building, so
+    missing metrics surface before any streaming starts.
+    """
+    return _iter_publication_insights_draft_events(
+        user_id=user_id,
+        window_id=window_id,
+        section_key=section_key,
+        scope=scope,
+        ui_context=ui_context,
+        stream=True,
+    )
+
+
+def _run_publication_insights_draft_refresh_job(payload: dict[str, Any]) -> None:
+    try:
+        generate_publication_insights_agent_draft(
+            user_id=str(payload.get("user_id") or ""),
+            window_id=payload.get("window_id") or "1y",
+            section_key=payload.get("section_key"),
+            scope=payload.get("scope") or "window",
+            ui_context=payload.get("ui_context"),
+            force_refresh=True,
+        )
+    except (PublicationInsightsAgentValidationError, PublicationMetricsNotFoundError):
+        logger.info(
+            "publication_insights_draft_refresh_skipped",
+            extra={"user_id": payload.get("user_id")},
+        )
+
+
+register_job_kind(
+    PUBLICATION_INSIGHTS_DRAFT_REFRESH_JOB_KIND,
+    _run_publication_insights_draft_refresh_job,
+    max_concurrency=1,
+    max_attempts=1,
+)
@@ -9,6 +9,7 @@ from typing import Any
 import httpx
 from sqlalchemy import func, select
 
+from research_os.clients.http_client import provider_client
 from research_os.db import User, Work, create_all_tables, session_scope
 from research_os.services.collaboration_service import (
     CollaborationValidationError,
@@ -17,7 +18,7 @@ from research_os.services.collaboration_service import (
 from research_os.services.persona_service import (
     PersonaNotFoundError,
     recompute_collaborator_edges,
-    upsert_work,
+    upsert_works,
 )
 from research_os.services.journal_identity import (
     extract_openalex_source_id,
@@ -107,7 +108,7 @@ def _openalex_mailto(*, fallback_email: str | None = None) -> str | None:
 def _openalex_request_with_retry(*, url: str, params: dict[str, Any]) -> dict[str, Any]:
     timeout = httpx.Timeout(_openalex_timeout_seconds())
     retries = _openalex_retry_count()
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         for attempt in range(retries + 1):
             try:
                 response = client.get(url, params=params)
@@ -641,6 +642,7 @@ def bootstrap_publication_insights_from_orcid(
                 select(Work.id).where(Work.user_id == user_id)
             ).all()
         }
+        work_payloads: list[dict[str, Any]] = []
         for item in openalex_works:
             if not isinstance(item, dict):
                 continue
@@ -649,14 +651,15 @@ def bootstrap_publication_insights_from_orcid(
             )
             if not work_payload.get("title"):
                 continue
-            record = upsert_work(
-                user_id=user_id,
-                work=work_payload,
-                provenance="openalex",
-                overwrite_user_metadata=False,
-                ensure_tables=False,
-                session=session,
-            )
+            work_payloads.append(work_payload)
+        records = upsert_works(
+            user_id=user_id,
+            works=work_payloads,
+            provenance="openalex",
+            overwrite_user_metadata=False,
+            session=session,
+        )
+        for work_payload, record in zip(work_payloads, records):
             work_id = str(record.get("id") or "").strip()
             if not work_id or work_id in seen_upserted:
                 continue
@@ -746,8 +749,6 @@ def import_openalex_works_direct(
     This bypasses ORCID and name resolution, using the author ID provided.
     Returns the same structure as import_orcid_works for consistency.
     """
-    from research_os.services.orcid_service import _upsert_imported_orcid_work
-
     # Normalize the author ID
     author_id = str(openalex_author_id).strip()
     if author_id.startswith("https://openalex.org/"):
@@ -820,13 +821,14 @@ def import_openalex_works_direct(
             ).all()
         }
 
-        for work in imported:
-            record = _upsert_imported_orcid_work(
-                user_id=user_id,
-                work=work,
-                overwrite_user_metadata=overwrite_user_metadata,
-                session=session,
-            )
+        records = upsert_works(
+            user_id=user_id,
+            works=imported,
+            provenance="orcid",
+            overwrite_user_metadata=overwrite_user_metadata,
+            session=session,
+        )
+        for record in records:
             work_id = str(record["id"])
             if work_id in seen_upserted_ids:
                 continue
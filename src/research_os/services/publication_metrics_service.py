@@ -5,21 +5,24 @@ import logging
 import math
 import os
 import random
-import threading
 import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import httpx
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import func, select
 
+from research_os.clients.http_client import provider_client
 from research_os.db import (
     Collaborator,
     CollaboratorAffiliation,
     MetricsSnapshot,
     PublicationMetric,
+    PublicationMetricWorkAggregate,
     PublicationMetricsSourceCache,
     User,
     Work,
@@ -28,7 +31,9 @@ from research_os.db import (
     get_session_factory,
     session_scope,
 )
+from research_os.services import bibliometrics_service
 from research_os.services.api_telemetry_service import record_api_usage_event
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 from research_os.services.supplementary_work_service import primary_publication_records
 
 logger = logging.getLogger(__name__)
@@ -38,9 +43,26 @@ RUNNING_STATUS = "RUNNING"
 FAILED_STATUS = "FAILED"
 STATUSES = {READY_STATUS, RUNNING_STATUS, FAILED_STATUS}
 TOP_METRICS_KEY = "top_metrics_strip_v1"
+TOP_METRICS_JOB_KIND = "publication_metrics.top_metrics"
 TOP_METRICS_SCHEMA_VERSION = 26
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
 FIELD_PERCENTILE_THRESHOLDS = [50, 75, 90, 95, 99]
+FIELD_HISTOGRAM_CACHE_SOURCE = "openalex_field_percentile_histograms"
+OPENALEX_WORK_BATCH_SIZE = 50
+WORK_AGGREGATE_VERSION = 1
+# Payload keys every snapshot point keeps (history selection, match confidence,
+# yearly counts) versus keys only the latest OpenAlex/Dimensions point needs.
+WORK_AGGREGATE_HISTORY_KEYS = ("note", "match_method", "counts_by_year")
+WORK_AGGREGATE_DETAIL_KEYS = (
+    "id",
+    "publication_date",
+    "from_publication_date",
+    "publication_month",
+    "primary_topic",
+    "topics",
+    "open_access",
+    "field_normalized_impact",
+)
 DRILLDOWN_TILE_ID_BY_KEY = {
     "this_year_vs_last": "t1_total_publications",
     "total_citations": "t2_total_citations",
@@ -60,10 +82,6 @@ DELTA_COLOR_BY_TONE = {
     "negative": "#B91C1C",
 }
 
-_executor_lock = threading.Lock()
-_executor: ThreadPoolExecutor | None = None
-_inflight_lock = threading.Lock()
-_inflight_users: set[str] = set()
 
 
 class PublicationMetricsValidationError(RuntimeError):
@@ -86,6 +104,17 @@ def _coerce_utc(value: datetime | None) -> datetime:
     return value.astimezone(timezone.utc)
 
 
+def _parse_iso_datetime(value: Any) -> datetime | None:
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return _coerce_utc(parsed)
+
+
 def _safe_int(value: Any) -> int | None:
     if isinstance(value, bool):
         return None
@@ -312,6 +341,21 @@ def _openalex_field_percentile_exact_runtime_seconds() -> float:
     return max(2.0, min(300.0, value if value is not None else 25.0))
 
 
+def _openalex_field_histogram_max_pages() -> int:
+    value = _safe_int(os.getenv("PUB_METRICS_FIELD_HISTOGRAM_MAX_PAGES", "10"))
+    return max(1, min(50, value if value is not None else 10))
+
+
+def _openalex_field_histogram_ttl_hours() -> int:
+    value = _safe_int(os.getenv("PUB_METRICS_FIELD_HISTOGRAM_TTL_HOURS", "168"))
+    return max(1, min(24 * 90, value if value is not None else 168))
+
+
+def _openalex_field_percentile_concurrency() -> int:
+    value = _safe_int(os.getenv("PUB_METRICS_FIELD_PERCENTILE_CONCURRENCY", "4"))
+    return max(1, min(16, value if value is not None else 4))
+
+
 def _openalex_mailto(*, fallback_email: str | None = None) -> str | None:
     explicit = str(os.getenv("OPENALEX_MAILTO", "")).strip()
     if explicit and "@" in explicit:
@@ -490,7 +534,7 @@ def _openalex_request_with_retry(*, url: str, params: dict[str, Any]) -> dict[st
     timeout = httpx.Timeout(_openalex_timeout_seconds())
     retries = _openalex_retry_count()
     last_exception: Exception | None = None
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         for attempt in range(retries + 1):
             started = time.perf_counter()
             try:
@@ -627,6 +671,10 @@ def _openalex_primary_field_and_year_for_work(
         return {}
     if not payload:
         return {}
+    return _openalex_primary_field_payload(payload)
+
+
+def _openalex_primary_field_payload(payload: dict[str, Any]) -> dict[str, Any]:
     primary_topic = (
         payload.get("primary_topic")
         if isinstance(payload.get("primary_topic"), dict)
@@ -649,6 +697,70 @@ def _openalex_primary_field_and_year_for_work(
     }
 
 
+def _openalex_primary_fields_for_works(
+    *,
+    openalex_work_ids: list[str],
+    mailto: str | None,
+) -> dict[str, dict[str, Any]]:
+    work_ids = list(
+        dict.fromkeys(
+            work_id
+            for work_id in (
+                _extract_openalex_work_id(value) for value in openalex_work_ids
+            )
+            if work_id
+        )
+    )
+    if not work_ids:
+        return {}
+
+    def _fetch_batch(batch: list[str]) -> dict[str, dict[str, Any]]:
+        params: dict[str, Any] = {
+            "filter": f"openalex:{'|'.join(batch)}",
+            "select": "id,publication_year,cited_by_count,primary_topic",
+            "per-page": len(batch),
+        }
+        if mailto:
+            params["mailto"] = mailto
+        try:
+            payload = _openalex_request_with_retry(
+                url="https://api.openalex.org/works",
+                params=params,
+            )
+        except Exception:
+            return {}
+        results = payload.get("results") if isinstance(payload, dict) else None
+        output: dict[str, dict[str, Any]] = {}
+        for item in results if isinstance(results, list) else []:
+            if not isinstance(item, dict):
+                continue
+            work_id = _extract_openalex_work_id(str(item.get("id") or "").strip())
+            if work_id:
+                output[work_id] = _openalex_primary_field_payload(item)
+        return output
+
+    batches = [
+        work_ids[index : index + OPENALEX_WORK_BATCH_SIZE]
+        for index in range(0, len(work_ids), OPENALEX_WORK_BATCH_SIZE)
+    ]
+    resolved: dict[str, dict[str, Any]] = {}
+    for batch_result in _run_bounded(
+        [lambda batch=batch: _fetch_batch(batch) for batch in batches]
+    ):
+        resolved.update(batch_result)
+    return resolved
+
+
+def _run_bounded(tasks: list[Callable[[], Any]]) -> list[Any]:
+    if len(tasks) <= 1:
+        return [task() for task in tasks]
+    max_workers = min(len(tasks), _openalex_field_percentile_concurrency())
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="field-percentile"
+    ) as executor:
+        return list(executor.map(lambda task: task(), tasks))
+
+
 def _openalex_field_year_citation_cohort(
     *,
     field_id: str,
@@ -911,6 +1023,368 @@ def _openalex_field_year_percentile_rank_exact(
     }
 
 
+def _openalex_field_year_citation_histogram(
+    *,
+    field_id: str,
+    year: int,
+    mailto: str | None,
+    max_pages: int,
+) -> dict[str, Any]:
+    field_filter_id = _openalex_field_filter_token(field_id)
+    if not field_filter_id or year < 1900 or year > 2100:
+        return {"histogram": [], "total_results": 0, "complete": False}
+
+    counts: dict[int, int] = {}
+    total_results: int | None = None
+    cursor = "*"
+    truncated = False
+    for page_index in range(max_pages):
+        params: dict[str, Any] = {
+            "filter": f"primary_topic.field.id:{field_filter_id},publication_year:{int(year)}",
+            "group_by": "cited_by_count",
+            "per-page": 200,
+            "cursor": cursor,
+        }
+        if mailto:
+            params["mailto"] = mailto
+        try:
+            payload = _openalex_request_with_retry(
+                url="https://api.openalex.org/works",
+                params=params,
+            )
+        except Exception:
+            payload = {}
+        if not payload:
+            truncated = True
+            break
+        meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+        if total_results is None:
+            total_results = _safe_int(meta.get("count"))
+        groups = payload.get("group_by")
+        for group in groups if isinstance(groups, list) else []:
+            if not isinstance(group, dict):
+                continue
+            key = _safe_int(group.get("key"))
+            count = _safe_int(group.get("count"))
+            if key is None or count is None or count <= 0:
+                continue
+            counts[max(0, key)] = counts.get(max(0, key), 0) + count
+        cursor = str(meta.get("next_cursor") or "").strip()
+        if not cursor:
+            break
+        if page_index == max_pages - 1:
+            truncated = True
+
+    histogram = [[key, counts[key]] for key in sorted(counts)]
+    covered = sum(count for _, count in histogram)
+    resolved_total = max(covered, int(total_results or 0))
+    return {
+        "histogram": histogram,
+        "total_results": resolved_total,
+        "complete": bool(histogram) and not truncated and covered >= resolved_total,
+    }
+
+
+def _histogram_cumulative(histogram: list[list[int]]) -> tuple[list[int], list[int]]:
+    keys: list[int] = []
+    cumulative: list[int] = []
+    running = 0
+    for key, count in histogram:
+        running += int(count)
+        keys.append(int(key))
+        cumulative.append(running)
+    return keys, cumulative
+
+
+def _histogram_percentile_rank(
+    *, keys: list[int], cumulative: list[int], citations: int
+) -> float | None:
+    total = cumulative[-1] if cumulative else 0
+    if total <= 0:
+        return None
+    index = bisect_left(keys, citations)
+    below = cumulative[index - 1] if index > 0 else 0
+    equal = 0
+    if index < len(keys) and keys[index] == citations:
+        equal = cumulative[index] - below
+    rank = ((below + (equal / 2.0)) / float(total)) * 100.0
+    return round(max(0.0, min(100.0, rank)), 2)
+
+
+def _histogram_value_at(*, keys: list[int], cumulative: list[int], position: int) -> int:
+    return int(keys[min(len(keys) - 1, bisect_right(cumulative, position))])
+
+
+def _histogram_percentile_cutoff(
+    *, keys: list[int], cumulative: list[int], percentile: float
+) -> int | None:
+    total = cumulative[-1] if cumulative else 0
+    if total <= 0:
+        return None
+    p = max(0.0, min(100.0, float(percentile)))
+    position = (p / 100.0) * (total - 1)
+    lower = int(math.floor(position))
+    upper = int(math.ceil(position))
+    low = float(_histogram_value_at(keys=keys, cumulative=cumulative, position=lower))
+    if lower == upper:
+        return int(low)
+    high = float(_histogram_value_at(keys=keys, cumulative=cumulative, position=upper))
+    return int(round(low + ((high - low) * (position - lower))))
+
+
+def _load_field_histogram_cache(
+    session, *, user_id: str, now: datetime
+) -> dict[str, dict[str, Any]]:
+    row = session.scalars(
+        select(PublicationMetricsSourceCache)
+        .where(
+            PublicationMetricsSourceCache.user_id == user_id,
+            PublicationMetricsSourceCache.source == FIELD_HISTOGRAM_CACHE_SOURCE,
+        )
+        .order_by(PublicationMetricsSourceCache.refresh_date.desc())
+        .limit(1)
+    ).first()
+    if row is None or not isinstance(row.payload_json, dict):
+        return {}
+    entries = row.payload_json.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    max_age = timedelta(hours=_openalex_field_histogram_ttl_hours())
+    fresh: dict[str, dict[str, Any]] = {}
+    for key, entry in entries.items():
+        if not isinstance(entry, dict):
+            continue
+        fetched_at = _parse_iso_datetime(entry.get("fetched_at"))
+        if fetched_at is None or (now - fetched_at) > max_age:
+            continue
+        fresh[str(key)] = entry
+    return fresh
+
+
+def _field_histogram_cache_key(field_id: str, year: int) -> str:
+    return f"{_openalex_field_filter_token(field_id)}:{int(year)}"
+
+
+def _resolve_field_percentile_rows(
+    session,
+    *,
+    user_id: str,
+    now: datetime,
+    per_work_rows: list[dict[str, Any]],
+    mailto: str | None,
+) -> list[dict[str, Any]]:
+    work_fields = _openalex_primary_fields_for_works(
+        openalex_work_ids=[
+            str(row.get("openalex_work_id") or "").strip()
+            for row in per_work_rows
+            if str(row.get("openalex_work_id") or "").strip()
+        ],
+        mailto=mailto,
+    )
+
+    candidates: list[dict[str, Any]] = []
+    for row in per_work_rows:
+        openalex_work_id = _extract_openalex_work_id(
+            str(row.get("openalex_work_id") or "").strip() or None
+        )
+        if not openalex_work_id:
+            continue
+        work_field = work_fields.get(openalex_work_id) or {}
+        field_id = _normalize_openalex_field_id(work_field.get("field_id"))
+        if not field_id:
+            continue
+        paper_year = _safe_int(row.get("year"))
+        resolved_year = (
+            int(paper_year)
+            if paper_year is not None and 1900 <= paper_year <= now.year
+            else _safe_int(work_field.get("publication_year"))
+        )
+        if resolved_year is None or resolved_year < 1900 or resolved_year > now.year:
+            continue
+        candidates.append(
+            {
+                "row": row,
+                "work_field": work_field,
+                "field_id": field_id,
+                "year": int(resolved_year),
+                "citations": max(0, int(row.get("citations_lifetime") or 0)),
+            }
+        )
+    if not candidates:
+        return []
+
+    cohort_keys = list(
+        dict.fromkeys((item["field_id"], item["year"]) for item in candidates)
+    )
+    cached_histograms = _load_field_histogram_cache(session, user_id=user_id, now=now)
+    histograms: dict[tuple[str, int], dict[str, Any]] = {}
+    missing_keys: list[tuple[str, int]] = []
+    for cohort_key in cohort_keys:
+        cached = cached_histograms.get(_field_histogram_cache_key(*cohort_key))
+        if cached is not None:
+            histograms[cohort_key] = cached
+        else:
+            missing_keys.append(cohort_key)
+    max_pages = _openalex_field_histogram_max_pages()
+    fetched = _run_bounded(
+        [
+            lambda field_id=field_id, year=year: _openalex_field_year_citation_histogram(
+                field_id=field_id, year=year, mailto=mailto, max_pages=max_pages
+            )
+            for field_id, year in missing_keys
+        ]
+    )
+    fetched_at = now.isoformat()
+    for cohort_key, histogram in zip(missing_keys, fetched):
+        histogram["fetched_at"] = fetched_at
+        histograms[cohort_key] = histogram
+        if histogram.get("histogram"):
+            cached_histograms[_field_histogram_cache_key(*cohort_key)] = histogram
+    if missing_keys:
+        _upsert_source_cache(
+            session,
+            user_id=user_id,
+            source=FIELD_HISTOGRAM_CACHE_SOURCE,
+            refresh_date=now.date(),
+            payload={"computed_at": fetched_at, "entries": cached_histograms},
+        )
+
+    # Cohorts whose histogram could not be fetched in full fall back to the
+    # sampled cohort plus exact per-paper rank queries.
+    cohorts: dict[tuple[str, int], dict[str, Any]] = {}
+    sampled_keys: list[tuple[str, int]] = []
+    for cohort_key in cohort_keys:
+        histogram = histograms.get(cohort_key) or {}
+        if histogram.get("complete") and histogram.get("histogram"):
+            keys, cumulative = _histogram_cumulative(histogram["histogram"])
+            cohorts[cohort_key] = {
+                "keys": keys,
+                "cumulative": cumulative,
+                "citations": [],
+                "sample_size": cumulative[-1],
+                "total_results": cumulative[-1],
+                "cutoffs": {
+                    str(threshold): _histogram_percentile_cutoff(
+                        keys=keys, cumulative=cumulative, percentile=float(threshold)
+                    )
+                    for threshold in FIELD_PERCENTILE_THRESHOLDS
+                },
+            }
+        else:
+            sampled_keys.append(cohort_key)
+    cohort_max_pages = _openalex_field_cohort_max_pages()
+    sampled = _run_bounded(
+        [
+            lambda field_id=field_id, year=year: (
+                _openalex_field_year_citation_cohort(
+                    field_id=field_id,
+                    year=year,
+                    mailto=mailto,
+                    max_pages=cohort_max_pages,
+                ),
+                _openalex_field_year_total_count(
+                    field_id=field_id, year=year, mailto=mailto
+                ),
+            )
+            for field_id, year in sampled_keys
+        ]
+    )
+    for cohort_key, (cohort_payload, total_results_exact) in zip(sampled_keys, sampled):
+        cohort_values = sorted(
+            max(0, int(_safe_int(value) or 0))
+            for value in (cohort_payload or {}).get("citations") or []
+        )
+        histogram_total = int(
+            _safe_int((histograms.get(cohort_key) or {}).get("total_results")) or 0
+        )
+        resolved_total = (
+            int(total_results_exact)
+            if total_results_exact is not None and total_results_exact >= 0
+            else max(histogram_total, len(cohort_values))
+        )
+        cohorts[cohort_key] = {
+            "keys": None,
+            "cumulative": None,
+            "citations": cohort_values,
+            "sample_size": len(cohort_values),
+            "total_results": max(0, resolved_total),
+            "cutoffs": {
+                str(threshold): _percentile_cutoff(cohort_values, float(threshold))
+                for threshold in FIELD_PERCENTILE_THRESHOLDS
+            },
+        }
+
+    min_cohort_size = _openalex_field_cohort_min_size()
+    ranks: dict[tuple[str, int, int], float | None] = {}
+    exact_keys: list[tuple[str, int, int]] = []
+    for item in candidates:
+        rank_key = (item["field_id"], item["year"], item["citations"])
+        if rank_key in ranks or rank_key in exact_keys:
+            continue
+        cohort = cohorts[(item["field_id"], item["year"])]
+        if cohort["keys"] is not None:
+            ranks[rank_key] = _histogram_percentile_rank(
+                keys=cohort["keys"],
+                cumulative=cohort["cumulative"],
+                citations=item["citations"],
+            )
+        elif max(cohort["sample_size"], cohort["total_results"]) >= min_cohort_size:
+            exact_keys.append(rank_key)
+
+    max_exact = _openalex_field_percentile_max_exact_ranks()
+    runtime_limit = _openalex_field_percentile_exact_runtime_seconds()
+    started = time.monotonic()
+
+    def _exact_rank(rank_key: tuple[str, int, int]) -> float | None:
+        if time.monotonic() - started >= runtime_limit:
+            return None
+        field_id, year, citations = rank_key
+        total_results = int(cohorts[(field_id, year)]["total_results"] or 0)
+        payload = _openalex_field_year_percentile_rank_exact(
+            field_id=field_id,
+            year=year,
+            citations=citations,
+            mailto=mailto,
+            total_count=total_results if total_results > 0 else None,
+        )
+        rank_raw = payload.get("percentile_rank")
+        return float(rank_raw) if isinstance(rank_raw, (int, float)) else None
+
+    exact_budgeted = exact_keys[:max_exact]
+    if len(exact_keys) > len(exact_budgeted):
+        logger.info(
+            "Field percentile exact rank budget reached for user %s after %s requests",
+            user_id,
+            len(exact_budgeted),
+        )
+    for rank_key, rank in zip(
+        exact_budgeted,
+        _run_bounded(
+            [lambda rank_key=rank_key: _exact_rank(rank_key) for rank_key in exact_budgeted]
+        ),
+    ):
+        ranks[rank_key] = rank
+    for rank_key in exact_keys:
+        if ranks.get(rank_key) is None:
+            ranks[rank_key] = _empirical_percentile_rank(
+                cohorts[(rank_key[0], rank_key[1])]["citations"], rank_key[2]
+            )
+
+    resolved: list[dict[str, Any]] = []
+    for item in candidates:
+        cohort = cohorts[(item["field_id"], item["year"])]
+        resolved.append(
+            {
+                **item,
+                "cohort": cohort,
+                "percentile_rank": ranks.get(
+                    (item["field_id"], item["year"], item["citations"])
+                ),
+            }
+        )
+    return resolved
+
+
 def _empirical_percentile_rank(
     sorted_values: list[int], value: int | float
 ) -> float | None:
@@ -1136,16 +1610,10 @@ def _monthly_from_yearly_counts(
     if not yearly_counts:
         return [0 for _ in range(months)]
     oldest_month = _shift_month(_month_start(now), -months)
-    values: list[int] = []
-    for index in range(months):
-        start = _shift_month(oldest_month, index)
-        end = _shift_month(start, 1)
-        if start.year == now.year and start.month == now.month:
-            end = now
-        values.append(
-            _estimate_window_citations(yearly_counts, start=start, end=end, now=now)
-        )
-    return values
+    month_starts = [_shift_month(oldest_month, index) for index in range(months)]
+    return bibliometrics_service.spread_yearly_counts(
+        [yearly_counts], month_starts, now=now
+    )[0].tolist()
 
 
 def _normalize_monthly_to_total(
@@ -1177,42 +1645,6 @@ def _normalize_monthly_to_total(
     return [max(0, int(value)) for value in scaled]
 
 
-def _reconcile_monthly_series_to_total(
-    *,
-    monthly_values: list[int],
-    target_total: int,
-    eligible_indexes: list[int] | None = None,
-) -> list[int]:
-    clean = [max(0, int(value or 0)) for value in monthly_values]
-    target = max(0, int(target_total or 0))
-    if target <= 0:
-        return [0 for _ in clean]
-
-    total = int(sum(clean))
-    if total > target:
-        return _normalize_monthly_to_total(
-            monthly_added=clean,
-            target_total=target,
-        )
-    if total == target:
-        return clean
-
-    resolved_indexes = [
-        int(index)
-        for index in (eligible_indexes if eligible_indexes is not None else range(len(clean)))
-        if 0 <= int(index) < len(clean)
-    ]
-    if not resolved_indexes:
-        return clean
-
-    remainder = target - total
-    base = remainder // len(resolved_indexes)
-    extra = remainder % len(resolved_indexes)
-    for offset, target_index in enumerate(resolved_indexes):
-        clean[target_index] += base + (1 if offset < extra else 0)
-    return clean
-
-
 def _cumulative_from_monthly(
     *, monthly_added: list[int], target_total: int
 ) -> list[int]:
@@ -1286,27 +1718,11 @@ def _best_snapshot_at_or_before(
 
 
 def compute_h_index(citations: list[int]) -> int:
-    values = sorted([max(0, int(v or 0)) for v in citations], reverse=True)
-    h_value = 0
-    for index, value in enumerate(values, start=1):
-        if value >= index:
-            h_value = index
-        else:
-            break
-    return h_value
+    return bibliometrics_service.h_index(citations)
 
 
 def compute_g_index(citations: list[int]) -> int:
-    values = sorted([max(0, int(v or 0)) for v in citations], reverse=True)
-    cumulative = 0
-    g_value = 0
-    for index, value in enumerate(values, start=1):
-        cumulative += value
-        if cumulative >= (index * index):
-            g_value = index
-        else:
-            break
-    return g_value
+    return bibliometrics_service.g_index(citations)
 
 
 def compute_m_index(
@@ -1408,24 +1824,7 @@ def compute_concentration_risk_percent(
 
 
 def compute_gini_coefficient(values: list[int | float]) -> float:
-    clean: list[float] = []
-    for item in values:
-        parsed = _safe_float(item)
-        if parsed is None:
-            continue
-        clean.append(max(0.0, float(parsed)))
-    n = len(clean)
-    if n <= 0:
-        return 0.0
-    total = float(sum(clean))
-    if total <= 0.0:
-        return 0.0
-    sorted_values = sorted(clean)
-    weighted_sum = 0.0
-    for index, value in enumerate(sorted_values, start=1):
-        weighted_sum += ((2 * index) - n - 1) * value
-    gini = weighted_sum / (float(n) * total)
-    return round(max(0.0, min(1.0, gini)), 4)
+    return bibliometrics_service.gini_coefficient(values)
 
 
 def _concentration_profile_from_gini(value: float) -> str:
@@ -1581,19 +1980,65 @@ def _series_to_sparkline(values: list[int | float], *, digits: int = 2) -> list[
     return output
 
 
-def _rolling_sum(values: list[int], window_size: int, index: int) -> int:
-    start = max(0, index - window_size + 1)
-    return int(sum(max(0, int(v or 0)) for v in values[start : index + 1]))
+def _lifetime_row_start_point(row: dict[str, Any], *, default_year: int) -> datetime:
+    publication_month_start = _safe_publication_month_start(
+        row.get("publication_month_start")
+    )
+    if publication_month_start is not None:
+        return datetime(
+            int(publication_month_start.year),
+            int(publication_month_start.month),
+            1,
+            tzinfo=timezone.utc,
+        )
+    fallback_year = _safe_int(row.get("fallback_year"))
+    publication_year = _safe_int(row.get("year"))
+    row_start_year = (
+        fallback_year
+        if fallback_year is not None
+        else publication_year
+        if publication_year is not None
+        else default_year
+    )
+    return datetime(int(row_start_year), 1, 1, tzinfo=timezone.utc)
+
 
+def _cumulative_citations_by_year(
+    rows: list[dict[str, Any]], years: list[int]
+) -> np.ndarray:
+    """Works x years matrix of citations accrued by the end of each year.
 
-def _rolling_yoy_percent(values: list[int], index: int) -> float | None:
-    current = _rolling_sum(values, 12, index)
-    previous_start = max(0, index - 23)
-    previous_end = max(0, index - 11)
-    previous = int(
-        sum(max(0, int(v or 0)) for v in values[previous_start:previous_end])
-    )
-    return compute_yoy_percent(citations_last_12m=current, citations_prev_12m=previous)
+    ``years`` must be ascending. Works without yearly counts are credited with
+    their lifetime total from their fallback or publication year onwards.
+    """
+    year_axis = np.asarray(years, dtype=np.int64)
+    matrix = np.zeros((len(rows), len(years)), dtype=np.int64)
+    for row_index, row in enumerate(rows):
+        yearly = row.get("yearly_counts")
+        if isinstance(yearly, dict) and yearly:
+            added = np.zeros(len(years) + 1, dtype=np.int64)
+            for key, value in yearly.items():
+                parsed_year = _safe_int(key)
+                if parsed_year is None:
+                    continue
+                added[int(np.searchsorted(year_axis, parsed_year))] += max(
+                    0, int(_safe_int(value) or 0)
+                )
+            matrix[row_index] = np.cumsum(added[:-1])
+            continue
+        lifetime = max(0, int(row.get("citations_lifetime") or 0))
+        fallback_year = _safe_int(row.get("fallback_year"))
+        publication_year = _safe_int(row.get("year"))
+        if publication_year is None:
+            matrix[row_index] = lifetime
+            continue
+        first_year = (
+            publication_year
+            if fallback_year is None
+            else min(fallback_year, publication_year)
+        )
+        matrix[row_index] = np.where(year_axis >= first_year, lifetime, 0)
+    return matrix
 
 
 def _year_back_safe(base: date, years: int) -> date:
@@ -3105,6 +3550,157 @@ def _build_momentum_context_modules(
     }
 
 
+@dataclass(frozen=True)
+class _SnapshotPoint:
+    """The parts of a ``MetricsSnapshot`` that the top-metrics build reads."""
+
+    provider: str
+    citations_count: int
+    influential_citations: int | None
+    altmetric_score: float | None
+    captured_at: datetime
+    metric_payload: dict[str, Any]
+
+
+def _snapshot_point_payload(
+    row: MetricsSnapshot, *, detail: bool
+) -> dict[str, Any]:
+    payload = row.metric_payload if isinstance(row.metric_payload, dict) else {}
+    keys = WORK_AGGREGATE_HISTORY_KEYS + (WORK_AGGREGATE_DETAIL_KEYS if detail else ())
+    point_payload = {key: payload[key] for key in keys if key in payload}
+    if isinstance(point_payload.get("topics"), list):
+        point_payload["topics"] = point_payload["topics"][:5]
+    return {
+        "provider": row.provider,
+        "citations_count": row.citations_count,
+        "influential_citations": row.influential_citations,
+        "altmetric_score": row.altmetric_score,
+        "captured_at": _coerce_utc(row.captured_at).isoformat(),
+        "metric_payload": point_payload,
+    }
+
+
+def _work_aggregate_payload(rows: list[MetricsSnapshot]) -> dict[str, Any]:
+    detail_ids: set[int] = set()
+    for provider in ("openalex", "dimensions"):
+        best = _best_snapshot(
+            [
+                item
+                for item in rows
+                if str(item.provider or "").strip().lower() == provider
+            ]
+        )
+        if best is not None:
+            detail_ids.add(id(best))
+    return {
+        "version": WORK_AGGREGATE_VERSION,
+        "snapshots": [
+            _snapshot_point_payload(row, detail=id(row) in detail_ids) for row in rows
+        ],
+    }
+
+
+def _snapshot_points_from_aggregate(payload: dict[str, Any]) -> list[_SnapshotPoint]:
+    points: list[_SnapshotPoint] = []
+    for item in payload.get("snapshots") or []:
+        if not isinstance(item, dict):
+            continue
+        points.append(
+            _SnapshotPoint(
+                provider=str(item.get("provider") or "manual"),
+                citations_count=int(item.get("citations_count") or 0),
+                influential_citations=_safe_int(item.get("influential_citations")),
+                altmetric_score=_safe_float(item.get("altmetric_score")),
+                captured_at=_coerce_utc(_parse_iso_datetime(item.get("captured_at"))),
+                metric_payload=dict(item.get("metric_payload") or {}),
+            )
+        )
+    return points
+
+
+def _work_snapshot_fingerprints(session, *, work_ids: list[str]) -> dict[str, str]:
+    # Snapshots are insert-only and cascade with their work, so the count and
+    # newest timestamps change whenever a work's snapshot history does.
+    rows = session.execute(
+        select(
+            MetricsSnapshot.work_id,
+            func.count(MetricsSnapshot.id),
+            func.max(MetricsSnapshot.created_at),
+            func.max(MetricsSnapshot.captured_at),
+        )
+        .where(MetricsSnapshot.work_id.in_(work_ids))
+        .group_by(MetricsSnapshot.work_id)
+    ).all()
+    fingerprints = {work_id: f"v{WORK_AGGREGATE_VERSION}:0" for work_id in work_ids}
+    for work_id, count, created_at, captured_at in rows:
+        fingerprints[str(work_id)] = ":".join(
+            [
+                f"v{WORK_AGGREGATE_VERSION}",
+                str(int(count or 0)),
+                _coerce_utc(created_at).isoformat() if created_at else "",
+                _coerce_utc(captured_at).isoformat() if captured_at else "",
+            ]
+        )
+    return fingerprints
+
+
+def _load_work_snapshot_points(
+    session, *, user_id: str, work_ids: list[str]
+) -> dict[str, list[_SnapshotPoint]]:
+    """Return compact snapshot history per work, re-reading only changed works.
+
+    Unchanged works are served from ``publication_metric_work_aggregates`` so a
+    rebuild does not decode every snapshot payload for the whole portfolio.
+    """
+    fingerprints = _work_snapshot_fingerprints(session, work_ids=work_ids)
+    aggregates = {
+        str(row.work_id): row
+        for row in session.scalars(
+            select(PublicationMetricWorkAggregate).where(
+                PublicationMetricWorkAggregate.work_id.in_(work_ids)
+            )
+        ).all()
+    }
+    stale_work_ids = [
+        work_id
+        for work_id in work_ids
+        if work_id not in aggregates
+        or aggregates[work_id].snapshot_fingerprint != fingerprints[work_id]
+        or not isinstance(aggregates[work_id].payload_json, dict)
+    ]
+    snapshots_by_work: dict[str, list[MetricsSnapshot]] = {
+        work_id: [] for work_id in stale_work_ids
+    }
+    if stale_work_ids:
+        for row in session.scalars(
+            select(MetricsSnapshot).where(MetricsSnapshot.work_id.in_(stale_work_ids))
+        ).all():
+            snapshots_by_work[str(row.work_id)].append(row)
+    for work_id, rows in snapshots_by_work.items():
+        payload = _work_aggregate_payload(rows)
+        aggregate = aggregates.get(work_id)
+        if aggregate is None:
+            aggregate = PublicationMetricWorkAggregate(user_id=user_id, work_id=work_id)
+            session.add(aggregate)
+            aggregates[work_id] = aggregate
+        aggregate.snapshot_fingerprint = fingerprints[work_id]
+        aggregate.payload_json = payload
+    if stale_work_ids:
+        session.flush()
+    logger.info(
+        "publication_metrics_work_aggregates_loaded",
+        extra={
+            "user_id": user_id,
+            "works": len(work_ids),
+            "recomputed": len(stale_work_ids),
+        },
+    )
+    return {
+        work_id: _snapshot_points_from_aggregate(aggregates[work_id].payload_json)
+        for work_id in work_ids
+    }
+
+
 def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str, Any]:
     user = _resolve_user_or_raise(session, user_id)
     works = session.scalars(select(Work).where(Work.user_id == user_id)).all()
@@ -3167,21 +3763,18 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
             return "last"
         return "other"
 
-    snapshot_rows = session.scalars(
-        select(MetricsSnapshot).where(MetricsSnapshot.work_id.in_(work_ids))
-    ).all()
-    snapshots_by_work: dict[str, list[MetricsSnapshot]] = {
-        work_id: [] for work_id in work_ids
-    }
-    semantic_by_work: dict[str, list[MetricsSnapshot]] = {
-        work_id: [] for work_id in work_ids
+    snapshots_by_work = _load_work_snapshot_points(
+        session, user_id=user_id, work_ids=work_ids
+    )
+    semantic_by_work: dict[str, list[_SnapshotPoint]] = {
+        work_id: [
+            row
+            for row in rows
+            if str(row.provider or "").strip().lower()
+            in {"semantic_scholar", "semanticscholar"}
+        ]
+        for work_id, rows in snapshots_by_work.items()
     }
-    for row in snapshot_rows:
-        work_id = str(row.work_id)
-        snapshots_by_work.setdefault(work_id, []).append(row)
-        provider = str(row.provider or "").strip().lower()
-        if provider in {"semantic_scholar", "semanticscholar"}:
-            semantic_by_work.setdefault(work_id, []).append(row)
 
     month_end_points = _month_end_points(now=now, months=24)
     cutoff_12 = now - timedelta(days=365)
@@ -3576,27 +4169,23 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
         first_publication_year=first_publication_year,
         current_year=now.year,
     )
-    h_index_series: list[int] = []
-    for month_index in range(13, 25):
-        month_citations = [
-            int(row["monthly_cumulative_25"][month_index]) for row in per_work_rows
-        ]
-        h_index_series.append(compute_h_index(month_citations))
-
-    concentration_series: list[float] = []
-    for month_index in range(13, 25):
-        ranked = sorted(
-            [int(row["monthly_cumulative_25"][month_index]) for row in per_work_rows],
-            reverse=True,
-        )
-        total_month = int(sum(ranked))
-        top3_month = int(sum(ranked[:3]))
-        concentration_series.append(
-            compute_concentration_risk_percent(
-                total_citations=total_month,
-                top3_citations=top3_month,
-            )
+    # Works x months matrix of cumulative citations over the trailing 12 months.
+    cumulative_12m = np.asarray(
+        [
+            [int(value) for value in row["monthly_cumulative_25"][13:25]]
+            for row in per_work_rows
+        ],
+        dtype=np.int64,
+    ).reshape(len(per_work_rows), 12)
+    h_index_series = [
+        int(value) for value in bibliometrics_service.h_index_by_column(cumulative_12m)
+    ]
+    concentration_series = [
+        round(float(value), 2)
+        for value in bibliometrics_service.top_share_pct_by_column(
+            cumulative_12m, top=3
         )
+    ]
 
     influence_candidates = [
         row
@@ -3822,9 +4411,9 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
     concentration_previous = concentration_series[0] if concentration_series else 0.0
     concentration_delta = round(concentration_risk - concentration_previous, 2)
 
-    rolling_last_12_series_24 = [
-        _rolling_sum(monthly_added_totals, 12, index) for index in range(24)
-    ]
+    rolling_last_12_series_24 = bibliometrics_service.rolling_sums(
+        monthly_added_totals, 12
+    ).tolist()
     momentum_weighted_monthly = [
         round(float(value) * (1.5 if index >= 9 else 1.0), 2)
         for index, value in enumerate(monthly_added_totals[-12:])
@@ -3889,25 +4478,6 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
         else "Projection unavailable"
     )
 
-    def _citations_at_year(row: dict[str, Any], year: int) -> int:
-        yearly = row.get("yearly_counts")
-        if isinstance(yearly, dict) and yearly:
-            total = 0
-            for key, value in yearly.items():
-                parsed_year = _safe_int(key)
-                if parsed_year is None:
-                    continue
-                if parsed_year <= year:
-                    total += max(0, int(_safe_int(value) or 0))
-            return max(0, int(total))
-        fallback_year = _safe_int(row.get("fallback_year"))
-        if fallback_year is not None and fallback_year <= year:
-            return max(0, int(row.get("citations_lifetime") or 0))
-        publication_year = _safe_int(row.get("year"))
-        if publication_year is not None and publication_year > year:
-            return 0
-        return max(0, int(row.get("citations_lifetime") or 0))
-
     h_projection = project_h_index(current_h_index=h_index, publications=per_work_rows)
 
     h_full_years = (
@@ -3915,14 +4485,12 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
         if first_publication_year is not None
         else [now.year]
     )
-    h_yearly_values_full = [
-        compute_h_index([_citations_at_year(row, year) for row in per_work_rows])
-        for year in h_full_years
-    ]
-    h_yearly_values = [
-        compute_h_index([_citations_at_year(row, year) for row in per_work_rows])
-        for year in last5_complete_years
-    ]
+    h_yearly_values_full = bibliometrics_service.h_index_by_column(
+        _cumulative_citations_by_year(per_work_rows, h_full_years)
+    ).tolist()
+    h_yearly_values = bibliometrics_service.h_index_by_column(
+        _cumulative_citations_by_year(per_work_rows, last5_complete_years)
+    ).tolist()
     h_projected_current_year = max(
         h_yearly_values[-1] if h_yearly_values else h_index,
         int(h_projection.get("projected_h_index") or h_index),
@@ -4735,73 +5303,79 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
     citation_activation_history_rolling_inactive = [0 for _ in range(len(lifetime_month_points))]
     citation_activation_history_rolling_published = [0 for _ in range(len(lifetime_month_points))]
 
-    for row in per_work_rows:
-        row_total_citations = max(0, int(row.get("citations_lifetime") or 0))
-        row_monthly_values = [0 for _ in range(len(lifetime_month_points))]
-        publication_month_start = _safe_publication_month_start(
-            row.get("publication_month_start")
+    row_start_points = [
+        _lifetime_row_start_point(row, default_year=lifetime_month_points[0].year)
+        for row in per_work_rows
+    ]
+    # Works with yearly counts are spread over lifetime months as one works x
+    # months matrix rather than one window estimate per work and month.
+    yearly_spread_row_indexes: list[int] = []
+    yearly_spread_counts: list[dict[int, int]] = []
+    for row_index, row in enumerate(per_work_rows):
+        if max(0, int(row.get("citations_lifetime") or 0)) <= 0:
+            continue
+        yearly_counts_raw = row.get("yearly_counts")
+        yearly_counts = (
+            {
+                int(year): max(0, int(value or 0))
+                for year, value in yearly_counts_raw.items()
+                if _safe_int(year) is not None and int(_safe_int(year) or 0) >= 1900
+            }
+            if isinstance(yearly_counts_raw, dict)
+            else {}
         )
-        fallback_year = _safe_int(row.get("fallback_year"))
-        publication_year = _safe_int(row.get("year"))
-        row_start_year = (
-            publication_month_start.year
-            if publication_month_start is not None
-            else fallback_year
-            if fallback_year is not None
-            else publication_year
-            if publication_year is not None
-            else lifetime_month_points[0].year
+        if yearly_counts:
+            yearly_spread_row_indexes.append(row_index)
+            yearly_spread_counts.append(yearly_counts)
+    yearly_spread_values: dict[int, list[int]] = {}
+    if yearly_spread_row_indexes:
+        lifetime_month_ordinals = np.asarray(
+            [point.year * 12 + point.month for point in lifetime_month_points],
+            dtype=np.int64,
+        )
+        start_ordinals = np.asarray(
+            [
+                row_start_points[row_index].year * 12
+                + row_start_points[row_index].month
+                for row_index in yearly_spread_row_indexes
+            ],
+            dtype=np.int64,
+        )
+        spread_matrix = bibliometrics_service.reconcile_rows_to_totals(
+            bibliometrics_service.spread_yearly_counts(
+                yearly_spread_counts,
+                lifetime_month_points,
+                now=current_month_start,
+            ),
+            [
+                max(0, int(per_work_rows[row_index].get("citations_lifetime") or 0))
+                for row_index in yearly_spread_row_indexes
+            ],
+            eligible=lifetime_month_ordinals[None, :] >= start_ordinals[:, None],
         )
+        yearly_spread_values = {
+            row_index: spread_matrix[position].tolist()
+            for position, row_index in enumerate(yearly_spread_row_indexes)
+        }
+
+    for row_index, row in enumerate(per_work_rows):
+        row_total_citations = max(0, int(row.get("citations_lifetime") or 0))
+        row_monthly_values = [0 for _ in range(len(lifetime_month_points))]
+        row_start_point = row_start_points[row_index]
+        row_start_year = row_start_point.year
         if row_total_citations <= 0:
             row["citations_1y_rolling"] = 0
             row["citations_3y_rolling"] = 0
             row["citations_5y_rolling"] = 0
             row["citations_life_rolling"] = 0
-        row_start_month = (
-            publication_month_start.month if publication_month_start is not None else 1
-        )
-        row_start_point = datetime(
-            int(row_start_year),
-            int(row_start_month),
-            1,
-            tzinfo=timezone.utc,
-        )
         eligible_lifetime_indexes = [
             index
             for index, point in enumerate(lifetime_month_points)
             if point >= row_start_point
         ]
         if row_total_citations > 0:
-            yearly_counts_raw = row.get("yearly_counts")
-            yearly_counts = (
-                {
-                    int(year): max(0, int(value or 0))
-                    for year, value in yearly_counts_raw.items()
-                    if _safe_int(year) is not None and int(_safe_int(year) or 0) >= 1900
-                }
-                if isinstance(yearly_counts_raw, dict)
-                else {}
-            )
-            if yearly_counts:
-                row_monthly_values = [
-                    max(
-                        0,
-                        int(
-                            _estimate_window_citations(
-                                yearly_counts,
-                                start=point,
-                                end=_shift_month(point, 1),
-                                now=current_month_start,
-                            )
-                        ),
-                    )
-                    for point in lifetime_month_points
-                ]
-                row_monthly_values = _reconcile_monthly_series_to_total(
-                    monthly_values=row_monthly_values,
-                    target_total=row_total_citations,
-                    eligible_indexes=eligible_lifetime_indexes,
-                )
+            if row_index in yearly_spread_values:
+                row_monthly_values = yearly_spread_values[row_index]
             else:
                 monthly_added_24 = [
                     max(0, int(value or 0))
@@ -5033,158 +5607,33 @@ def _build_payload(session, *, user_id: str, computed_at: datetime) -> dict[str,
         openalex_mailto = _openalex_mailto(
             fallback_email=str(user.email or "").strip() or None
         )
-        field_cohort_max_pages = _openalex_field_cohort_max_pages()
         field_cohort_min_size = _openalex_field_cohort_min_size()
-        field_exact_rank_max_requests = _openalex_field_percentile_max_exact_ranks()
-        field_exact_rank_runtime_limit_seconds = (
-            _openalex_field_percentile_exact_runtime_seconds()
-        )
-        work_field_cache: dict[str, dict[str, Any]] = {}
-        cohort_cache: dict[tuple[str, int], dict[str, Any]] = {}
-        exact_rank_cache: dict[tuple[str, int, int], float | None] = {}
         percentile_ranks: list[float] = []
         used_cohort_keys: set[tuple[str, int]] = set()
-        exact_rank_requests_made = 0
-        exact_rank_window_start = time.monotonic()
-        exact_rank_budget_exhausted = False
-        exact_rank_runtime_exhausted = False
-
-        for row in per_work_rows:
-            openalex_work_id = _extract_openalex_work_id(
-                str(row.get("openalex_work_id") or "").strip() or None
-            )
-            if not openalex_work_id:
-                continue
-            work_field = work_field_cache.get(openalex_work_id)
-            if work_field is None:
-                work_field = _openalex_primary_field_and_year_for_work(
-                    openalex_work_id=openalex_work_id,
-                    mailto=openalex_mailto,
-                )
-                work_field_cache[openalex_work_id] = work_field
-            field_id = _normalize_openalex_field_id(work_field.get("field_id"))
-            if not field_id:
-                continue
-            paper_year = _safe_int(row.get("year"))
-            resolved_year = (
-                int(paper_year)
-                if paper_year is not None and 1900 <= paper_year <= now.year
-                else _safe_int(work_field.get("publication_year"))
-            )
-            if (
-                resolved_year is None
-                or resolved_year < 1900
-                or resolved_year > now.year
-            ):
-                continue
 
+        for item in _resolve_field_percentile_rows(
+            session,
+            user_id=user_id,
+            now=now,
+            per_work_rows=per_work_rows,
+            mailto=openalex_mailto,
+        ):
+            row = item["row"]
+            work_field = item["work_field"]
+            field_id = item["field_id"]
+            resolved_year = item["year"]
+            cohort_entry = item["cohort"]
             cohort_key = (field_id, int(resolved_year))
-            cohort_entry = cohort_cache.get(cohort_key)
-            if cohort_entry is None:
-                cohort_payload = _openalex_field_year_citation_cohort(
-                    field_id=field_id,
-                    year=int(resolved_year),
-                    mailto=openalex_mailto,
-                    max_pages=field_cohort_max_pages,
-                )
-                cohort_values = [
-                    max(0, int(_safe_int(value) or 0))
-                    for value in (
-                        cohort_payload.get("citations")
-                        if isinstance(cohort_payload, dict)
-                        else []
-                    )
-                ]
-                cohort_values.sort()
-                total_results_exact = _openalex_field_year_total_count(
-                    field_id=field_id,
-                    year=int(resolved_year),
-                    mailto=openalex_mailto,
-                )
-                sampled_total_results = max(
-                    0,
-                    int(_safe_int((cohort_payload or {}).get("total_results")) or 0),
-                )
-                resolved_total_results = (
-                    int(total_results_exact)
-                    if total_results_exact is not None and total_results_exact >= 0
-                    else sampled_total_results
-                )
-                cohort_entry = {
-                    "citations": cohort_values,
-                    "sample_size": len(cohort_values),
-                    "total_results": max(0, int(resolved_total_results)),
-                    "cutoffs": {
-                        str(threshold): _percentile_cutoff(
-                            cohort_values, float(threshold)
-                        )
-                        for threshold in FIELD_PERCENTILE_THRESHOLDS
-                    },
-                }
-                cohort_cache[cohort_key] = cohort_entry
-            cohort_values = (
-                cohort_entry.get("citations")
-                if isinstance(cohort_entry.get("citations"), list)
-                else []
-            )
-            sampled_cohort_size = len(cohort_values)
             total_results = max(
                 0,
                 int(_safe_int(cohort_entry.get("total_results")) or 0),
             )
-            cohort_size = max(sampled_cohort_size, total_results)
+            cohort_size = max(int(cohort_entry.get("sample_size") or 0), total_results)
             if cohort_size < field_cohort_min_size:
                 continue
 
-            paper_citations = max(0, int(row.get("citations_lifetime") or 0))
-            exact_rank_key = (field_id, int(resolved_year), paper_citations)
-            percentile_rank = exact_rank_cache.get(exact_rank_key)
-            if exact_rank_key not in exact_rank_cache:
-                elapsed = time.monotonic() - exact_rank_window_start
-                can_call_exact = (
-                    field_exact_rank_max_requests > 0
-                    and exact_rank_requests_made < field_exact_rank_max_requests
-                    and elapsed < field_exact_rank_runtime_limit_seconds
-                )
-                if can_call_exact:
-                    exact_rank_requests_made += 1
-                    exact_rank_payload = _openalex_field_year_percentile_rank_exact(
-                        field_id=field_id,
-                        year=int(resolved_year),
-                        citations=paper_citations,
-                        mailto=openalex_mailto,
-                        total_count=total_results if total_results > 0 else None,
-                    )
-                    rank_raw = exact_rank_payload.get("percentile_rank")
-                    percentile_rank = (
-                        float(rank_raw) if isinstance(rank_raw, (int, float)) else None
-                    )
-                else:
-                    if (
-                        not exact_rank_budget_exhausted
-                        and exact_rank_requests_made >= field_exact_rank_max_requests
-                    ):
-                        exact_rank_budget_exhausted = True
-                        logger.info(
-                            "Field percentile exact rank budget reached for user %s after %s requests",
-                            user_id,
-                            exact_rank_requests_made,
-                        )
-                    if (
-                        not exact_rank_runtime_exhausted
-                        and elapsed >= field_exact_rank_runtime_limit_seconds
-                    ):
-                        exact_rank_runtime_exhausted = True
-                        logger.info(
-                            "Field percentile exact rank runtime reached for user %s after %.1fs",
-                            user_id,
-                            elapsed,
-                        )
-                if percentile_rank is None:
-                    percentile_rank = _empirical_percentile_rank(
-                        cohort_values, paper_citations
-                    )
-                exact_rank_cache[exact_rank_key] = percentile_rank
+            paper_citations = item["citations"]
+            percentile_rank = item["percentile_rank"]
             if percentile_rank is None:
                 continue
 
@@ -6231,17 +6680,6 @@ def _persist_failed_bundle(*, user_id: str, detail: str) -> None:
         session.flush()
 
 
-def _get_executor() -> ThreadPoolExecutor:
-    global _executor
-    with _executor_lock:
-        if _executor is None:
-            _executor = ThreadPoolExecutor(
-                max_workers=_max_workers(),
-                thread_name_prefix="pub-top-metrics",
-            )
-        return _executor
-
-
 def _run_background_compute(user_id: str) -> None:
     try:
         compute_publication_top_metrics(user_id=user_id)
@@ -6250,9 +6688,17 @@ def _run_background_compute(user_id: str) -> None:
             user_id=user_id,
             detail=f"Failed to compute publication top metrics: {exc}",
         )
-    finally:
-        with _inflight_lock:
-            _inflight_users.discard(user_id)
+
+
+def _run_background_compute_job(payload: dict[str, Any]) -> None:
+    _run_background_compute(str(payload.get("user_id") or ""))
+
+
+register_job_kind(
+    TOP_METRICS_JOB_KIND,
+    _run_background_compute_job,
+    max_concurrency=_max_workers,
+)
 
 
 def _mark_job_running(*, user_id: str, force: bool) -> bool:
@@ -6295,25 +6741,24 @@ def enqueue_publication_top_metrics_refresh(
     marked = _mark_job_running(user_id=user_id, force=force)
     if not marked:
         return False
-    with _inflight_lock:
-        if user_id in _inflight_users:
-            return False
-        _inflight_users.add(user_id)
     try:
-        _get_executor().submit(_run_background_compute, user_id)
-        logger.info(
-            "publication_top_metrics_enqueued",
-            extra={"user_id": user_id, "reason": reason},
+        enqueued = enqueue_job(
+            kind=TOP_METRICS_JOB_KIND,
+            payload={"user_id": user_id, "reason": reason},
+            dedupe_key=user_id,
         )
-        return True
     except Exception as exc:
         _persist_failed_bundle(
             user_id=user_id,
             detail=f"Failed to enqueue publication top metrics refresh: {exc}",
         )
-        with _inflight_lock:
-            _inflight_users.discard(user_id)
         return False
+    if enqueued:
+        logger.info(
+            "publication_top_metrics_enqueued",
+            extra={"user_id": user_id, "reason": reason},
+        )
+    return enqueued
 
 
 def compute_publication_top_metrics(*, user_id: str) -> dict[str, Any]:
@@ -6,24 +6,29 @@ import threading
 import time
 import copy
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import uuid4
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 
+from research_os.clients.http_client import provider_client
 from research_os.db import (
     AppRuntimeLock,
     MetricsSnapshot,
+    PublicationCitationRollup,
+    PublicationCitationSeriesPoint,
     PublicationMetric,
     User,
     Work,
     create_all_tables,
     session_scope,
 )
+from research_os.services import bibliometrics_service
 from research_os.services.supplementary_work_service import primary_publication_records
+from research_os.services.job_queue_service import enqueue_job, register_job_kind
 
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
@@ -43,11 +48,10 @@ READY_STATUS = "READY"
 RUNNING_STATUS = "RUNNING"
 FAILED_STATUS = "FAILED"
 BUNDLE_METRIC_KEY = "bundle"
+ANALYTICS_JOB_KIND = "publications_analytics.bundle"
 SCHEDULER_LOCK_NAME = "publications_analytics_scheduler"
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
 
-_executor_lock = threading.Lock()
-_executor: ThreadPoolExecutor | None = None
 _scheduler_lock = threading.Lock()
 _scheduler: Any = None
 _INSTANCE_ID = f"pub-analytics-{uuid4().hex[:12]}"
@@ -142,43 +146,248 @@ def _provider_priority(name: str) -> int:
     return 0
 
 
-def _snapshot_rank(row: MetricsSnapshot) -> tuple[int, datetime]:
+@dataclass(frozen=True)
+class _SeriesPoint:
+    """The parts of a snapshot the analytics compute reads for one work."""
+
+    work_id: str
+    provider: str
+    citations_count: int
+    captured_at: datetime
+    history_usable: bool
+    yearly_counts: dict[int, int]
+
+
+def _snapshot_rank(row: _SeriesPoint) -> tuple[int, datetime]:
     return _provider_priority(row.provider), _coerce_utc(row.captured_at)
 
 
-def _latest_metrics_by_work(
-    session, *, work_ids: list[str]
-) -> dict[str, MetricsSnapshot]:
-    if not work_ids:
-        return {}
-    rows = session.scalars(
-        select(MetricsSnapshot).where(MetricsSnapshot.work_id.in_(work_ids))
-    ).all()
-    best: dict[str, MetricsSnapshot] = {}
-    for row in rows:
-        existing = best.get(row.work_id)
-        if existing is None or _snapshot_rank(row) > _snapshot_rank(existing):
-            best[row.work_id] = row
+def _month_start(value: datetime) -> datetime:
+    value_utc = _coerce_utc(value)
+    return datetime(value_utc.year, value_utc.month, 1, tzinfo=timezone.utc)
+
+
+def _series_point_from_snapshot(row: MetricsSnapshot) -> _SeriesPoint:
+    return _SeriesPoint(
+        work_id=str(row.work_id),
+        provider=str(row.provider or "manual"),
+        citations_count=int(row.citations_count or 0),
+        captured_at=_coerce_utc(row.captured_at),
+        history_usable=_is_history_snapshot_usable(row),
+        yearly_counts=_payload_counts_by_year(row.metric_payload),
+    )
+
+
+def _series_point_from_row(row: PublicationCitationSeriesPoint) -> _SeriesPoint:
+    yearly_counts: dict[int, int] = {}
+    for key, value in (row.yearly_counts or {}).items():
+        year = _safe_int(key)
+        count = _safe_int(value)
+        if year is not None and count is not None:
+            yearly_counts[year] = count
+    return _SeriesPoint(
+        work_id=str(row.work_id),
+        provider=str(row.provider or "manual"),
+        citations_count=int(row.citations_count or 0),
+        captured_at=_coerce_utc(row.captured_at),
+        history_usable=bool(row.history_usable),
+        yearly_counts=yearly_counts,
+    )
+
+
+def _best_points_by_work(points: list[_SeriesPoint]) -> dict[str, _SeriesPoint]:
+    best: dict[str, _SeriesPoint] = {}
+    for point in points:
+        existing = best.get(point.work_id)
+        if existing is None or _snapshot_rank(point) > _snapshot_rank(existing):
+            best[point.work_id] = point
     return best
 
 
-def _latest_metrics_by_work_at_or_before(
-    session, *, work_ids: list[str], cutoff: datetime
-) -> dict[str, MetricsSnapshot]:
+def _user_snapshot_stats(session, *, user_id: str) -> tuple[int, Any, Any]:
+    count, last_created_at, latest_captured_at = session.execute(
+        select(
+            func.count(MetricsSnapshot.id),
+            func.max(MetricsSnapshot.created_at),
+            func.max(MetricsSnapshot.captured_at),
+        )
+        .join(Work, MetricsSnapshot.work_id == Work.id)
+        .where(Work.user_id == user_id)
+    ).one()
+    return int(count or 0), last_created_at, latest_captured_at
+
+
+def sync_citation_series(session, *, user_id: str) -> int:
+    """Fold newly ingested metrics snapshots into the user's citation series.
+
+    Each series point keeps the latest capture per work, provider and calendar
+    month. Snapshots are insert-only, so only rows created after the rollup's
+    watermark are merged; if the snapshot count no longer adds up (a work was
+    deleted) the user's series is rebuilt. Returns the number of snapshots
+    merged.
+    """
+    snapshot_count, last_created_at, latest_captured_at = _user_snapshot_stats(
+        session, user_id=user_id
+    )
+    rollup = session.scalars(
+        select(PublicationCitationRollup).where(
+            PublicationCitationRollup.user_id == user_id
+        )
+    ).first()
+    since = (
+        _coerce_utc_or_none(rollup.last_snapshot_created_at)
+        if rollup is not None
+        else None
+    )
+    if (
+        rollup is not None
+        and int(rollup.snapshots_count or 0) == snapshot_count
+        and since == _coerce_utc_or_none(last_created_at)
+    ):
+        return 0
+
+    user_snapshots = (
+        select(MetricsSnapshot)
+        .join(Work, MetricsSnapshot.work_id == Work.id)
+        .where(Work.user_id == user_id)
+    )
+    query = user_snapshots
+    incremental = rollup is not None
+    if incremental and since is not None:
+        newer_count = session.scalar(
+            select(func.count(MetricsSnapshot.id))
+            .join(Work, MetricsSnapshot.work_id == Work.id)
+            .where(Work.user_id == user_id, MetricsSnapshot.created_at > since)
+        )
+        incremental = (
+            int(rollup.snapshots_count or 0) + int(newer_count or 0) == snapshot_count
+        )
+        query = query.where(MetricsSnapshot.created_at > since)
+    elif incremental:
+        incremental = int(rollup.snapshots_count or 0) == 0
+    if not incremental:
+        query = user_snapshots
+        session.execute(
+            delete(PublicationCitationSeriesPoint).where(
+                PublicationCitationSeriesPoint.user_id == user_id
+            )
+        )
+
+    snapshots = sorted(
+        session.scalars(query).all(), key=lambda row: _coerce_utc(row.captured_at)
+    )
+    touched_work_ids = sorted({str(row.work_id) for row in snapshots})
+    points_by_key: dict[tuple[str, str, datetime], PublicationCitationSeriesPoint] = {}
+    if incremental and touched_work_ids:
+        for row in session.scalars(
+            select(PublicationCitationSeriesPoint).where(
+                PublicationCitationSeriesPoint.work_id.in_(touched_work_ids)
+            )
+        ).all():
+            key = (str(row.work_id), str(row.provider), _month_start(row.month_start))
+            points_by_key[key] = row
+    for snapshot in snapshots:
+        captured_at = _coerce_utc(snapshot.captured_at)
+        provider = str(snapshot.provider or "manual")
+        key = (str(snapshot.work_id), provider, _month_start(captured_at))
+        point = points_by_key.get(key)
+        if point is None:
+            point = PublicationCitationSeriesPoint(
+                user_id=user_id,
+                work_id=key[0],
+                provider=provider,
+                month_start=key[2],
+                snapshots_merged=0,
+            )
+            session.add(point)
+            points_by_key[key] = point
+        point.snapshots_merged = int(point.snapshots_merged or 0) + 1
+        point.last_snapshot_created_at = _max_timestamp(
+            _coerce_utc_or_none(point.last_snapshot_created_at), snapshot.created_at
+        )
+        if point.captured_at is not None and captured_at < _coerce_utc(
+            point.captured_at
+        ):
+            continue
+        point.citations_count = int(snapshot.citations_count or 0)
+        point.captured_at = captured_at
+        point.history_usable = _is_history_snapshot_usable(snapshot)
+        point.yearly_counts = {
+            str(year): count
+            for year, count in sorted(
+                _payload_counts_by_year(snapshot.metric_payload).items()
+            )
+        }
+    session.flush()
+
+    works_count, points_count = session.execute(
+        select(
+            func.count(func.distinct(PublicationCitationSeriesPoint.work_id)),
+            func.count(PublicationCitationSeriesPoint.id),
+        ).where(PublicationCitationSeriesPoint.user_id == user_id)
+    ).one()
+    if rollup is None:
+        rollup = PublicationCitationRollup(user_id=user_id)
+        session.add(rollup)
+    rollup.works_count = int(works_count or 0)
+    rollup.snapshots_count = snapshot_count
+    rollup.series_points_count = int(points_count or 0)
+    rollup.last_snapshot_created_at = _coerce_utc_or_none(last_created_at)
+    rollup.latest_captured_at = _coerce_utc_or_none(latest_captured_at)
+    session.flush()
+    logger.info(
+        "publications_analytics_citation_series_synced",
+        extra={
+            "user_id": user_id,
+            "snapshots_merged": len(snapshots),
+            "rebuilt": not incremental,
+        },
+    )
+    return len(snapshots)
+
+
+def _load_series_points(
+    session, *, user_id: str, work_ids: list[str], cutoffs: list[datetime]
+) -> tuple[dict[str, _SeriesPoint], list[dict[str, _SeriesPoint]]]:
+    """Return the best point per work now and at or before each cutoff.
+
+    A series point carries its month's last capture, so a snapshot captured
+    earlier in the cutoff's own month can be hidden behind a point dated after
+    the cutoff. Only that partial month is read back from ``metrics_snapshots``.
+    """
     if not work_ids:
-        return {}
-    rows = session.scalars(
-        select(MetricsSnapshot).where(
-            MetricsSnapshot.work_id.in_(work_ids),
-            MetricsSnapshot.captured_at <= _coerce_utc(cutoff),
+        return {}, [{} for _ in cutoffs]
+    wanted = set(work_ids)
+    points = [
+        _series_point_from_row(row)
+        for row in session.scalars(
+            select(PublicationCitationSeriesPoint).where(
+                PublicationCitationSeriesPoint.user_id == user_id
+            )
+        ).all()
+        if str(row.work_id) in wanted
+    ]
+    latest = _best_points_by_work(points)
+    at_cutoffs: list[dict[str, _SeriesPoint]] = []
+    for cutoff in cutoffs:
+        cutoff_utc = _coerce_utc(cutoff)
+        month_start = _month_start(cutoff_utc)
+        candidates = [point for point in points if point.captured_at < month_start]
+        candidates.extend(
+            _series_point_from_snapshot(row)
+            for row in session.scalars(
+                select(MetricsSnapshot)
+                .join(Work, MetricsSnapshot.work_id == Work.id)
+                .where(
+                    Work.user_id == user_id,
+                    MetricsSnapshot.captured_at >= month_start,
+                    MetricsSnapshot.captured_at <= cutoff_utc,
+                )
+            ).all()
+            if str(row.work_id) in wanted
         )
-    ).all()
-    best: dict[str, MetricsSnapshot] = {}
-    for row in rows:
-        existing = best.get(row.work_id)
-        if existing is None or _snapshot_rank(row) > _snapshot_rank(existing):
-            best[row.work_id] = row
-    return best
+        at_cutoffs.append(_best_points_by_work(candidates))
+    return latest, at_cutoffs
 
 
 def _max_timestamp(
@@ -195,26 +404,24 @@ def _max_timestamp(
 def _latest_bundle_input_timestamp(session, *, user_id: str) -> datetime | None:
     latest: datetime | None = None
 
-    work_rows = session.execute(
-        select(Work.updated_at, Work.created_at).where(Work.user_id == user_id)
-    ).all()
-    for updated_at, created_at in work_rows:
-        latest = _max_timestamp(latest, updated_at)
-        latest = _max_timestamp(latest, created_at)
+    work_updated_at, work_created_at = session.execute(
+        select(func.max(Work.updated_at), func.max(Work.created_at)).where(
+            Work.user_id == user_id
+        )
+    ).one()
+    latest = _max_timestamp(latest, work_updated_at)
+    latest = _max_timestamp(latest, work_created_at)
 
-    snapshot_rows = session.execute(
-        select(MetricsSnapshot.captured_at, MetricsSnapshot.created_at)
-        .join(Work, MetricsSnapshot.work_id == Work.id)
-        .where(Work.user_id == user_id)
-    ).all()
-    for captured_at, created_at in snapshot_rows:
-        latest = _max_timestamp(latest, captured_at)
-        latest = _max_timestamp(latest, created_at)
+    _, snapshot_created_at, snapshot_captured_at = _user_snapshot_stats(
+        session, user_id=user_id
+    )
+    latest = _max_timestamp(latest, snapshot_captured_at)
+    latest = _max_timestamp(latest, snapshot_created_at)
 
     return latest
 
 
-def _sum_citations(rows: dict[str, MetricsSnapshot]) -> int:
+def _sum_citations(rows: dict[str, _SeriesPoint]) -> int:
     return sum(max(0, int(snapshot.citations_count or 0)) for snapshot in rows.values())
 
 
@@ -237,13 +444,8 @@ def _is_history_snapshot_usable(snapshot: MetricsSnapshot | None) -> bool:
     return True
 
 
-def _extract_counts_by_year(
-    snapshot: MetricsSnapshot, *, now_year: int
-) -> dict[int, int]:
-    payload = (
-        snapshot.metric_payload if isinstance(snapshot.metric_payload, dict) else {}
-    )
-    raw = payload.get("counts_by_year")
+def _payload_counts_by_year(payload: Any) -> dict[int, int]:
+    raw = payload.get("counts_by_year") if isinstance(payload, dict) else None
     if not isinstance(raw, list):
         return {}
     yearly: dict[int, int] = {}
@@ -256,12 +458,18 @@ def _extract_counts_by_year(
             count = _safe_int(item.get("citation_count"))
         if count is None:
             count = _safe_int(item.get("citations"))
-        if year is None or count is None or year < 1900 or year > now_year:
+        if year is None or count is None or year < 1900:
             continue
         yearly[year] = max(0, count)
     return yearly
 
 
+def _extract_counts_by_year(point: _SeriesPoint, *, now_year: int) -> dict[int, int]:
+    return {
+        year: count for year, count in point.yearly_counts.items() if year <= now_year
+    }
+
+
 def _fallback_year_for_work(work: Work | None, *, now_year: int) -> int:
     if (
         work is not None
@@ -320,14 +528,7 @@ def _build_timeseries_points_from_yearly_counts(
 
 
 def _compute_h_index(citations: list[int]) -> int:
-    values = sorted([max(0, int(v or 0)) for v in citations], reverse=True)
-    h_index = 0
-    for idx, value in enumerate(values, start=1):
-        if value >= idx:
-            h_index = idx
-        else:
-            break
-    return h_index
+    return bibliometrics_service.h_index(citations)
 
 
 def _compute_per_year_with_yoy(points: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -646,7 +847,7 @@ def _openalex_request_with_retry(*, url: str, params: dict[str, Any]) -> dict[st
     timeout = httpx.Timeout(_openalex_timeout_seconds())
     retries = _openalex_retry_count()
     last_exception: Exception | None = None
-    with httpx.Client(timeout=timeout) as client:
+    with provider_client(timeout=timeout) as client:
         for attempt in range(retries + 1):
             try:
                 response = client.get(url, params=params)
@@ -703,12 +904,9 @@ def _compute_payload(session, *, user_id: str, computed_at: datetime) -> dict[st
     cutoff_12 = now - timedelta(days=365)
     cutoff_24 = now - timedelta(days=730)
 
-    latest = _latest_metrics_by_work(session, work_ids=work_ids)
-    at_12 = _latest_metrics_by_work_at_or_before(
-        session, work_ids=work_ids, cutoff=cutoff_12
-    )
-    at_24 = _latest_metrics_by_work_at_or_before(
-        session, work_ids=work_ids, cutoff=cutoff_24
+    sync_citation_series(session, user_id=user_id)
+    latest, (at_12, at_24) = _load_series_points(
+        session, user_id=user_id, work_ids=work_ids, cutoffs=[cutoff_12, cutoff_24]
     )
     latest_total = _sum_citations(latest)
     work_by_id = {str(work.id): work for work in works}
@@ -760,12 +958,12 @@ def _compute_payload(session, *, user_id: str, computed_at: datetime) -> dict[st
         if latest_provider:
             if snap_12 is not None and (
                 str(snap_12.provider or "").strip().lower() != latest_provider
-                or not _is_history_snapshot_usable(snap_12)
+                or not snap_12.history_usable
             ):
                 snap_12 = None
             if snap_24 is not None and (
                 str(snap_24.provider or "").strip().lower() != latest_provider
-                or not _is_history_snapshot_usable(snap_24)
+                or not snap_24.history_usable
             ):
                 snap_24 = None
         yearly = yearly_by_work.get(work_id, {})
@@ -1017,25 +1215,6 @@ def _persist_failed_bundle(*, user_id: str, detail: str) -> None:
         session.flush()
 
 
-def _get_executor() -> ThreadPoolExecutor:
-    global _executor
-    with _executor_lock:
-        if _executor is None:
-            _executor = ThreadPoolExecutor(
-                max_workers=_max_concurrent_jobs(),
-                thread_name_prefix="pub-analytics",
-            )
-        return _executor
-
-
-def _shutdown_executor() -> None:
-    global _executor
-    with _executor_lock:
-        if _executor is not None:
-            _executor.shutdown(wait=False, cancel_futures=False)
-            _executor = None
-
-
 def _run_background_compute(user_id: str) -> None:
     try:
         compute_publications_analytics(user_id=user_id)
@@ -1043,6 +1222,17 @@ def _run_background_compute(user_id: str) -> None:
         _persist_failed_bundle(user_id=user_id, detail=str(exc))
 
 
+def _run_background_compute_job(payload: dict[str, Any]) -> None:
+    _run_background_compute(str(payload.get("user_id") or ""))
+
+
+register_job_kind(
+    ANALYTICS_JOB_KIND,
+    _run_background_compute_job,
+    max_concurrency=_max_concurrent_jobs,
+)
+
+
 def _should_enqueue_from_row(
     row: PublicationMetric | None,
     *,
@@ -1117,19 +1307,23 @@ def enqueue_publications_analytics_recompute(
     if not should_enqueue:
         return False
     try:
-        _get_executor().submit(_run_background_compute, user_id)
-        if reason:
-            logger.info(
-                "publications_analytics_enqueue",
-                extra={"user_id": user_id, "reason": reason},
-            )
-        return True
+        enqueued = enqueue_job(
+            kind=ANALYTICS_JOB_KIND,
+            payload={"user_id": user_id, "reason": reason},
+            dedupe_key=user_id,
+        )
     except Exception as exc:
         _persist_failed_bundle(
             user_id=user_id,
             detail=f"Failed to enqueue publications analytics recompute: {exc}",
         )
         return False
+    if enqueued and reason:
+        logger.info(
+            "publications_analytics_enqueue",
+            extra={"user_id": user_id, "reason": reason},
+        )
+    return enqueued
 
 
 def compute_publications_analytics(
@@ -1410,7 +1604,6 @@ def stop_publications_analytics_scheduler() -> None:
         if _scheduler is not None:
             _scheduler.shutdown(wait=False)
             _scheduler = None
-    _shutdown_executor()
 
 
 def refresh_publications_analytics_now(*, user_id: str) -> dict[str, Any]:
@@ -9,6 +9,7 @@ import time
 
 PBKDF2_ALGORITHM = "pbkdf2_sha256"
 PBKDF2_ITERATIONS = max(200_000, int(os.getenv("AUTH_PBKDF2_ITERATIONS", "390000")))
+PBKDF2_SALT_BYTES = 16
 TOTP_PERIOD_SECONDS = 30
 TOTP_DIGITS = 6
 
@@ -27,6 +28,10 @@ def _safe_b64decode(value: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
+    return derive_password_hash(validate_password_policy(password))
+
+
+def validate_password_policy(password: str) -> str:
     clean = (password or "").strip()
     if len(clean) < 10:
         raise SecurityValidationError("Password must be at least 10 characters.")
@@ -40,16 +45,37 @@ def hash_password(password: str) -> str:
         )
     if not any(char.isdigit() for char in clean):
         raise SecurityValidationError("Password must include at least one number.")
-    salt = secrets.token_bytes(16)
-    digest = hashlib.pbkdf2_hmac(
-        "sha256", clean.encode("utf-8"), salt, PBKDF2_ITERATIONS
-    )
+    return clean
+
+
+def derive_password_hash(password: str, iterations: int | None = None) -> str:
+    """Hash ``password`` in the current format without applying password policy.
+
+    Used directly when re-hashing a password that has just been verified, which
+    may predate the current policy.
+    """
+    rounds = int(iterations or PBKDF2_ITERATIONS)
+    salt = secrets.token_bytes(PBKDF2_SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, rounds)
     return (
-        f"{PBKDF2_ALGORITHM}${PBKDF2_ITERATIONS}$"
+        f"{PBKDF2_ALGORITHM}${rounds}$"
         f"{_safe_b64encode(salt)}${_safe_b64encode(digest)}"
     )
 
 
+def _is_native_pbkdf2_salt(salt_raw: str) -> bool:
+    # Salts written by ``derive_password_hash`` are padded URL-safe base64 of
+    # exactly PBKDF2_SALT_BYTES bytes. Imported hashes use unpadded text salts,
+    # so the padding tells the two apart and native hashes need one PBKDF2 run.
+    if not salt_raw.endswith("="):
+        return False
+    try:
+        decoded = _safe_b64decode(salt_raw)
+    except Exception:
+        return False
+    return len(decoded) == PBKDF2_SALT_BYTES and _safe_b64encode(decoded) == salt_raw
+
+
 def verify_password(password: str, stored_hash: str) -> bool:
     clean_hash = (stored_hash or "").strip()
     clean_password = (password or "").encode("utf-8")
@@ -105,7 +131,10 @@ def verify_password(password: str, stored_hash: str) -> bool:
     if algorithm == PBKDF2_ALGORITHM:
         try:
             iterations = int(iterations_raw)
-            salts = _candidate_salts(salt_raw)
+            if _is_native_pbkdf2_salt(salt_raw):
+                salts = [_safe_b64decode(salt_raw)]
+            else:
+                salts = _candidate_salts(salt_raw)
             digests = _candidate_digests(digest_raw)
             if iterations > 0 and salts and digests:
                 return _verify_pbkdf2(
@@ -145,6 +174,24 @@ def password_hash_supported(stored_hash: str) -> bool:
     )
 
 
+def password_hash_needs_rehash(stored_hash: str) -> bool:
+    """Return True when a verified hash should be replaced with the current format."""
+    clean_hash = (stored_hash or "").strip()
+    try:
+        algorithm, iterations_raw, salt_raw, digest_raw = clean_hash.split("$", 3)
+        iterations = int(iterations_raw)
+        digest = _safe_b64decode(digest_raw)
+    except Exception:
+        return True
+    return not (
+        algorithm == PBKDF2_ALGORITHM
+        and iterations == PBKDF2_ITERATIONS
+        and _is_native_pbkdf2_salt(salt_raw)
+        and _safe_b64encode(digest) == digest_raw
+        and len(digest) == hashlib.sha256().digest_size
+    )
+
+
 def generate_session_token() -> str:
     return secrets.token_urlsafe(48)
 
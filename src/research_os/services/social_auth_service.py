@@ -22,9 +22,9 @@ from research_os.db import (
 )
 from research_os.services.auth_service import AuthNotFoundError, AuthValidationError
 from research_os.services.api_telemetry_service import record_api_usage_event
+from research_os.services.password_hashing_service import hash_password_offloaded
 from research_os.services.security_service import (
     generate_session_token,
-    hash_password,
     hash_session_token,
 )
 
@@ -445,7 +445,7 @@ def _prune_sessions(*, session, user_id: str) -> None:
         active.append(row)
     if len(active) < MAX_ACTIVE_SESSIONS:
         return
-    active.sort(key=lambda row: _as_utc(row.created_at) or now)
+    active.sort(key=lambda row: _as_utc(row.last_seen_at or row.created_at) or now)
     surplus = len(active) - (MAX_ACTIVE_SESSIONS - 1)
     for row in active[: max(0, surplus)]:
         row.revoked_at = now
@@ -497,7 +497,7 @@ def _resolve_user_for_oauth(
     if user is None:
         user = User(
             email=email,
-            password_hash=hash_password(_random_password_seed()),
+            password_hash=hash_password_offloaded(_random_password_seed()),
             name=name,
             is_active=True,
             role="user",
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Literal
+from typing import Iterator, Literal
 
-from research_os.clients.openai_client import ask_gpt
+from research_os.clients.openai_client import ask_gpt, ask_gpt_stream
 
 StyleProfile = Literal["technical", "concise", "narrative_review"]
 
@@ -90,13 +90,14 @@ def _parse_output(output: str) -> tuple[str, str]:
     )
 
 
-def synthesize_title_and_abstract(
+def _iter_title_abstract_events(
     *,
     sections: dict[str, str],
-    style_profile: StyleProfile = "technical",
-    max_abstract_words: int = 250,
-    model: str = "gpt-4.1-mini",
-) -> dict[str, str]:
+    style_profile: StyleProfile,
+    max_abstract_words: int,
+    model: str,
+    stream: bool,
+) -> Iterator[tuple[str, dict[str, object]]]:
     normalized_sections = _normalize_sections(sections)
     if not normalized_sections:
         raise TitleAbstractSynthesisError(
@@ -108,12 +109,64 @@ def synthesize_title_and_abstract(
         style_profile=style_profile,
         max_abstract_words=max_abstract_words,
     )
+    yield "progress", {
+        "stage": "started",
+        "section_count": len(normalized_sections),
+    }
     try:
-        output = ask_gpt(prompt=prompt, model=model)
+        if stream:
+            chunks: list[str] = []
+            for delta in ask_gpt_stream(prompt=prompt, model=model):
+                chunks.append(delta)
+                yield "delta", {"text": delta}
+            output = "".join(chunks)
+        else:
+            output = ask_gpt(prompt=prompt, model=model)
     except Exception as exc:
         raise TitleAbstractSynthesisError(
             "Failed to synthesize title and abstract."
         ) from exc
 
     title, abstract = _parse_output(output)
-    return {"title": title, "abstract": abstract}
+    yield "result", {"title": title, "abstract": abstract}
+
+
+def synthesize_title_and_abstract(
+    *,
+    sections: dict[str, str],
+    style_profile: StyleProfile = "technical",
+    max_abstract_words: int = 250,
+    model: str = "gpt-4.1-mini",
+) -> dict[str, str]:
+    result: dict[str, str] = {}
+    for event, data in _iter_title_abstract_events(
+        sections=sections,
+        style_profile=style_profile,
+        max_abstract_words=max_abstract_words,
+        model=model,
+        stream=False,
+    ):
+        if event == "result":
+            result = {key: str(value) for key, value in data.items()}
+    return result
+
+
+def stream_title_and_abstract(
+    *,
+    sections: dict[str, str],
+    style_profile: StyleProfile = "technical",
+    max_abstract_words: int = 250,
+    model: str = "gpt-4.1-mini",
+) -> Iterator[tuple[str, dict[str, object]]]:
+    """Yield ``(event, data)`` pairs: a start event, raw text deltas, then the parsed result.
+
+    Deltas carry the unparsed ``TITLE:``/``ABSTRACT:`` output; the result event
+    carries the parsed fields.
+    """
+    return _iter_title_abstract_events(
+        sections=sections,
+        style_profile=style_profile,
+        max_abstract_words=max_abstract_words,
+        model=model,
+        stream=True,
+    )
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Protocol
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+
+from research_os.db import get_database_url
+from research_os.services.workspace_service import get_workspace_member_ids
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_REALTIME_NOTIFY_CHANNEL = "workspace_inbox_realtime"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+_NOTIFY_PAYLOAD_LIMIT_BYTES = 7900
+_CLOSE_TIMEOUT_SECONDS = 2.0
+
+
+class RealtimeSocket(Protocol):
+    async def accept(self) -> None: ...
+
+    async def send_json(self, data: Any) -> None: ...
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None: ...
+
+
+Deliver = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class RealtimeBackend(Protocol):
+    async def start(self, deliver: Deliver) -> None: ...
+
+    async def publish(self, envelope: dict[str, Any]) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+def _realtime_backend_name() -> str:
+    return str(os.getenv("WORKSPACE_REALTIME_BACKEND", "memory")).strip().lower()
+
+
+def _realtime_send_queue_size() -> int:
+    try:
+        value = int(os.getenv("WORKSPACE_REALTIME_SEND_QUEUE_SIZE", "64"))
+    except ValueError:
+        value = 64
+    return max(1, min(10000, value))
+
+
+def _realtime_send_timeout_seconds() -> float:
+    try:
+        value = float(os.getenv("WORKSPACE_REALTIME_SEND_TIMEOUT_SECONDS", "5"))
+    except ValueError:
+        value = 5.0
+    return max(0.05, min(120.0, value))
+
+
+class InMemoryRealtimeBackend:
+    """Single-process backend: the hub already delivers to its own sockets."""
+
+    async def start(self, deliver: Deliver) -> None:
+        del deliver
+
+    async def publish(self, envelope: dict[str, Any]) -> None:
+        del envelope
+
+    async def stop(self) -> None:
+        return None
+
+
+class PostgresNotifyRealtimeBackend:
+    """Relay hub events between API processes with PostgreSQL LISTEN/NOTIFY."""
+
+    def __init__(
+        self, *, conninfo: str, channel: str = WORKSPACE_REALTIME_NOTIFY_CHANNEL
+    ) -> None:
+        self._conninfo = conninfo
+        self._channel = channel
+        self._deliver: Deliver | None = None
+        self._listen_task: asyncio.Task | None = None
+        self._publish_connection: Any = None
+        self._publish_lock = asyncio.Lock()
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._listen_forever())
+
+    async def _listen_forever(self) -> None:
+        import psycopg
+
+        retry_seconds = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self._conninfo, autocommit=True
+                ) as connection:
+                    await connection.execute(f"LISTEN {self._channel}")
+                    retry_seconds = 1.0
+                    async for notification in connection.notifies():
+                        try:
+                            envelope = json.loads(notification.payload)
+                        except ValueError:
+                            continue
+                        if isinstance(envelope, dict) and self._deliver is not None:
+                            await self._deliver(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("workspace_realtime_listen_failed: %s", exc)
+                await asyncio.sleep(retry_seconds)
+                retry_seconds = min(30.0, retry_seconds * 2)
+
+    async def publish(self, envelope: dict[str, Any]) -> None:
+        import psycopg
+
+        encoded = json.dumps(envelope, separators=(",", ":"), default=str)
+        if len(encoded.encode("utf-8")) >= _NOTIFY_PAYLOAD_LIMIT_BYTES:
+            logger.warning(
+                "workspace_realtime_payload_too_large",
+                extra={"workspace_id": envelope.get("workspace_id")},
+            )
+            return
+        async with self._publish_lock:
+            try:
+                if self._publish_connection is None or self._publish_connection.closed:
+                    self._publish_connection = await psycopg.AsyncConnection.connect(
+                        self._conninfo, autocommit=True
+                    )
+                await self._publish_connection.execute(
+                    "SELECT pg_notify(%s, %s)", (self._channel, encoded)
+                )
+            except Exception as exc:
+                logger.warning("workspace_realtime_publish_failed: %s", exc)
+                connection, self._publish_connection = self._publish_connection, None
+                if connection is not None:
+                    try:
+                        await connection.close()
+                    except Exception:
+                        pass
+
+    async def stop(self) -> None:
+        task, self._listen_task = self._listen_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        connection, self._publish_connection = self._publish_connection, None
+        if connection is not None:
+            try:
+                await connection.close()
+            except Exception:
+                pass
+
+
+def build_workspace_realtime_backend() -> RealtimeBackend:
+    backend_name = _realtime_backend_name()
+    if backend_name == "postgres":
+        url = make_url(get_database_url())
+        if url.get_backend_name() == "postgresql":
+            conninfo = url.set(drivername="postgresql").render_as_string(
+                hide_password=False
+            )
+            return PostgresNotifyRealtimeBackend(conninfo=conninfo)
+        logger.warning(
+            "workspace_realtime_backend_unavailable",
+            extra={"backend": backend_name, "database": url.get_backend_name()},
+        )
+    return InMemoryRealtimeBackend()
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    connection_id: str
+    workspace_id: str
+    user_id: str
+    socket: RealtimeSocket
+    queue: asyncio.Queue
+    sender: asyncio.Task | None = None
+    closed: bool = False
+    sent: int = field(default=0)
+
+
+class WorkspaceRealtimeHub:
+    """Workspace-scoped websocket fan-out.
+
+    Each socket gets a bounded send queue drained by its own task, so a
+    broadcast only enqueues and one slow client cannot hold up the rest;
+    clients whose queue overflows or whose send times out are disconnected.
+    Membership checks run in a worker thread against the cached member set,
+    and events are relayed to other processes through the backend.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: RealtimeBackend | None = None,
+        member_ids_loader: Callable[[str], frozenset[str]] | None = None,
+        send_queue_size: int | None = None,
+        send_timeout_seconds: float | None = None,
+    ) -> None:
+        self._backend = backend
+        self._member_ids_loader = member_ids_loader or (
+            lambda workspace_id: get_workspace_member_ids(workspace_id=workspace_id)
+        )
+        self._send_queue_size = send_queue_size
+        self._send_timeout_seconds = send_timeout_seconds
+        self._origin_id = uuid4().hex
+        self._subscribers_by_workspace: dict[str, dict[str, _Subscriber]] = {}
+        self._subscriber_by_socket: dict[Any, _Subscriber] = {}
+        self._background_tasks: set[asyncio.Task] = set()
+        self.stats = {"enqueued": 0, "denied": 0, "evicted_slow": 0, "send_failed": 0}
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._subscriber_by_socket)
+
+    async def start(self) -> None:
+        if self._backend is None:
+            self._backend = build_workspace_realtime_backend()
+        await self._backend.start(self._deliver_remote)
+
+    async def stop(self) -> None:
+        backend = self._backend
+        if backend is not None:
+            await backend.stop()
+        for subscriber in list(self._subscriber_by_socket.values()):
+            self._remove(subscriber)
+
+    async def member_ids(self, workspace_id: str) -> frozenset[str]:
+        return await asyncio.to_thread(self._member_ids_loader, workspace_id)
+
+    async def has_access(self, *, user_id: str, workspace_id: str) -> bool:
+        clean_user_id = str(user_id or "").strip()
+        if not clean_user_id:
+            return False
+        return clean_user_id in await self.member_ids(workspace_id)
+
+    async def connect(
+        self, *, workspace_id: str, websocket: RealtimeSocket, user_id: str
+    ) -> None:
+        await websocket.accept()
+        subscriber = _Subscriber(
+            connection_id=uuid4().hex,
+            workspace_id=workspace_id,
+            user_id=str(user_id or "").strip(),
+            socket=websocket,
+            queue=asyncio.Queue(
+                maxsize=self._send_queue_size or _realtime_send_queue_size()
+            ),
+        )
+        subscriber.sender = asyncio.create_task(self._run_sender(subscriber))
+        self._subscribers_by_workspace.setdefault(workspace_id, {})[
+            subscriber.connection_id
+        ] = subscriber
+        self._subscriber_by_socket[websocket] = subscriber
+
+    async def disconnect(self, websocket: RealtimeSocket) -> None:
+        subscriber = self._subscriber_by_socket.get(websocket)
+        if subscriber is not None:
+            self._remove(subscriber)
+
+    async def send(self, websocket: RealtimeSocket, payload: dict[str, Any]) -> None:
+        subscriber = self._subscriber_by_socket.get(websocket)
+        if subscriber is None or subscriber.closed:
+            return
+        try:
+            subscriber.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.stats["evicted_slow"] += 1
+            self._evict(subscriber, code=1013, reason="Realtime client too slow.")
+            return
+        self.stats["enqueued"] += 1
+
+    async def broadcast(
+        self,
+        *,
+        workspace_id: str,
+        payload: dict[str, Any],
+        exclude: RealtimeSocket | None = None,
+    ) -> None:
+        excluded = (
+            self._subscriber_by_socket.get(exclude) if exclude is not None else None
+        )
+        await self._deliver_local(
+            workspace_id=workspace_id,
+            payload=payload,
+            exclude_connection_id=excluded.connection_id if excluded else None,
+        )
+        if self._backend is not None:
+            await self._backend.publish(
+                {
+                    "origin": self._origin_id,
+                    "workspace_id": workspace_id,
+                    "payload": payload,
+                }
+            )
+
+    async def _deliver_remote(self, envelope: dict[str, Any]) -> None:
+        if envelope.get("origin") == self._origin_id:
+            return
+        workspace_id = str(envelope.get("workspace_id") or "").strip()
+        payload = envelope.get("payload")
+        if not workspace_id or not isinstance(payload, dict):
+            return
+        await self._deliver_local(
+            workspace_id=workspace_id, payload=payload, exclude_connection_id=None
+        )
+
+    async def _deliver_local(
+        self,
+        *,
+        workspace_id: str,
+        payload: dict[str, Any],
+        exclude_connection_id: str | None,
+    ) -> None:
+        subscribers = list(
+            (self._subscribers_by_workspace.get(workspace_id) or {}).values()
+        )
+        if not subscribers:
+            return
+        member_ids = await self.member_ids(workspace_id)
+        for subscriber in subscribers:
+            if subscriber.closed or subscriber.connection_id == exclude_connection_id:
+                continue
+            if subscriber.user_id not in member_ids:
+                self.stats["denied"] += 1
+                self._evict(subscriber, code=1008, reason="Workspace access denied.")
+                continue
+            await self.send(subscriber.socket, payload)
+
+    async def _run_sender(self, subscriber: _Subscriber) -> None:
+        timeout_seconds = (
+            self._send_timeout_seconds or _realtime_send_timeout_seconds()
+        )
+        while True:
+            payload = await subscriber.queue.get()
+            try:
+                await asyncio.wait_for(
+                    subscriber.socket.send_json(payload), timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                self.stats["evicted_slow"] += 1
+                self._evict(subscriber, code=1013, reason="Realtime client too slow.")
+                return
+            except Exception:
+                self.stats["send_failed"] += 1
+                self._remove(subscriber)
+                return
+            subscriber.sent += 1
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        subscriber.closed = True
+        if self._subscriber_by_socket.get(subscriber.socket) is subscriber:
+            self._subscriber_by_socket.pop(subscriber.socket, None)
+        workspace_subscribers = self._subscribers_by_workspace.get(
+            subscriber.workspace_id
+        )
+        if workspace_subscribers is not None:
+            workspace_subscribers.pop(subscriber.connection_id, None)
+            if not workspace_subscribers:
+                self._subscribers_by_workspace.pop(subscriber.workspace_id, None)
+        sender = subscriber.sender
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
+    def _evict(self, subscriber: _Subscriber, *, code: int, reason: str) -> None:
+        if subscriber.closed:
+            return
+        self._remove(subscriber)
+        task = asyncio.create_task(self._close_quietly(subscriber.socket, code, reason))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    @staticmethod
+    async def _close_quietly(socket: RealtimeSocket, code: int, reason: str) -> None:
+        try:
+            await asyncio.wait_for(
+                socket.close(code=code, reason=reason), timeout=_CLOSE_TIMEOUT_SECONDS
+            )
+        except Exception:
+            pass
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import os
 import re
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from hashlib import sha1
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, delete, event, exists, func, or_, select
+from sqlalchemy.orm import object_session
 
 from research_os.db import (
     DataLibraryAsset,
     User,
+    WorkspaceInboxMessage,
+    WorkspaceInboxRead,
     WorkspaceInboxStateCache,
+    WorkspaceInboxVisibility,
+    WorkspaceMembership,
     WorkspaceStateCache,
     create_all_tables,
+    get_engine,
     session_scope,
 )
 
@@ -46,6 +58,13 @@ WORKSPACE_AUDIT_EVENT_TYPE_VALUES = {
 WORKSPACE_FALLBACK_NAME = "Workspace"
 WORKSPACE_FALLBACK_OWNER_NAME = "Not set"
 
+WORKSPACE_INBOX_PAGE_SIZE_MAX = 200
+
+_MEMBERSHIP_INDEX_BACKFILLED_BINDS: set[str] = set()
+_INBOX_STORE_MIGRATED_BINDS: set[str] = set()
+_member_ids_cache_lock = threading.Lock()
+_member_ids_cache: dict[tuple[str, str], tuple[float, frozenset[str]]] = {}
+
 
 class WorkspaceValidationError(RuntimeError):
     pass
@@ -917,8 +936,14 @@ def _load_workspace_state_row(
         row = WorkspaceStateCache(user_id=user_id, payload_json=normalized)
         session.add(row)
         session.flush()
+        _sync_workspace_membership_index(
+            session=session, user_id=user_id, state=normalized
+        )
     elif payload != normalized:
         row.payload_json = normalized
+        _sync_workspace_membership_index(
+            session=session, user_id=user_id, state=normalized
+        )
     # Return a detached normalized copy so callers can mutate state safely
     # without relying on SQLAlchemy JSON mutation tracking.
     return row, normalize_workspace_state(normalized)
@@ -929,39 +954,180 @@ def _save_workspace_state_row(
 ) -> dict[str, Any]:
     normalized = normalize_workspace_state(state)
     row.payload_json = normalized
+    session = object_session(row)
+    if session is not None:
+        _sync_workspace_membership_index(
+            session=session, user_id=row.user_id, state=normalized
+        )
     return normalized
 
 
-def _load_workspace_inbox_state_row(
-    *, session, user_id: str
-) -> tuple[WorkspaceInboxStateCache, dict[str, Any]]:
-    row = session.scalars(
-        select(WorkspaceInboxStateCache).where(
-            WorkspaceInboxStateCache.user_id == user_id
+def _workspace_access_cache_ttl_seconds() -> float:
+    try:
+        value = float(os.getenv("WORKSPACE_ACCESS_CACHE_TTL_SECONDS", "15"))
+    except ValueError:
+        value = 15.0
+    return max(0.0, min(300.0, value))
+
+
+def _invalidate_workspace_member_ids(workspace_ids: set[str]) -> None:
+    if not workspace_ids:
+        return
+    with _member_ids_cache_lock:
+        for cache_key in list(_member_ids_cache):
+            if cache_key[1] in workspace_ids:
+                _member_ids_cache.pop(cache_key, None)
+
+
+def _invalidate_workspace_member_ids_on_commit(
+    *, session, workspace_ids: set[str]
+) -> None:
+    if not workspace_ids:
+        return
+    _invalidate_workspace_member_ids(workspace_ids)
+    # Drop again once committed so a lookup racing the open transaction cannot
+    # keep serving the pre-commit membership until the TTL expires.
+    pending = session.info.get("workspace_member_invalidations")
+    if pending is None:
+        pending = session.info["workspace_member_invalidations"] = set()
+
+        def _after_commit(committed_session) -> None:
+            _invalidate_workspace_member_ids(
+                committed_session.info.pop("workspace_member_invalidations", set())
+            )
+
+        event.listen(session, "after_commit", _after_commit, once=True)
+    pending.update(workspace_ids)
+
+
+def _sync_workspace_membership_index(
+    *, session, user_id: str, state: dict[str, Any]
+) -> None:
+    clean_user_id = _trim(user_id)
+    if not clean_user_id:
+        return
+    desired: dict[str, tuple[str, str | None]] = {}
+    for workspace in state.get("workspaces") or []:
+        workspace_id = _trim(workspace.get("id"))
+        if not workspace_id or workspace_id in desired:
+            continue
+        membership_role = _workspace_membership_role(
+            workspace=workspace, user_id=clean_user_id
+        )
+        if membership_role is None:
+            continue
+        desired[workspace_id] = (
+            membership_role,
+            _workspace_collaborator_role(workspace=workspace, user_id=clean_user_id),
+        )
+    changed_workspace_ids: set[str] = set()
+    # Sessions do not autoflush; earlier syncs in this transaction must be
+    # visible so the diff below does not insert duplicate rows.
+    session.flush()
+    existing_rows = session.scalars(
+        select(WorkspaceMembership).where(WorkspaceMembership.user_id == clean_user_id)
+    ).all()
+    for membership in existing_rows:
+        roles = desired.pop(membership.workspace_id, None)
+        if roles is None:
+            session.delete(membership)
+            _close_inbox_visibility(
+                session=session,
+                user_id=clean_user_id,
+                workspace_id=membership.workspace_id,
+            )
+            changed_workspace_ids.add(membership.workspace_id)
+        elif (membership.membership_role, membership.collaborator_role) != roles:
+            membership.membership_role, membership.collaborator_role = roles
+            changed_workspace_ids.add(membership.workspace_id)
+    for workspace_id, (membership_role, collaborator_role) in desired.items():
+        session.add(
+            WorkspaceMembership(
+                workspace_id=workspace_id,
+                user_id=clean_user_id,
+                membership_role=membership_role,
+                collaborator_role=collaborator_role,
+            )
+        )
+        _open_inbox_visibility(
+            session=session, user_id=clean_user_id, workspace_id=workspace_id
+        )
+        changed_workspace_ids.add(workspace_id)
+    _invalidate_workspace_member_ids_on_commit(
+        session=session, workspace_ids=changed_workspace_ids
+    )
+
+
+def _ensure_workspace_membership_index(*, session) -> None:
+    # State rows written before the index existed have no membership rows;
+    # derive them once per process and database.
+    bind_key = str(session.get_bind().url)
+    if bind_key in _MEMBERSHIP_INDEX_BACKFILLED_BINDS:
+        return
+    unindexed_rows = session.scalars(
+        select(WorkspaceStateCache).where(
+            WorkspaceStateCache.user_id.not_in(select(WorkspaceMembership.user_id))
+        )
+    ).all()
+    for state_row in unindexed_rows:
+        payload = (
+            state_row.payload_json if isinstance(state_row.payload_json, dict) else {}
+        )
+        _sync_workspace_membership_index(
+            session=session,
+            user_id=state_row.user_id,
+            state=normalize_workspace_state(payload),
+        )
+    session.flush()
+    _MEMBERSHIP_INDEX_BACKFILLED_BINDS.add(bind_key)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _serialize_inbox_message(row: WorkspaceInboxMessage) -> dict[str, Any]:
+    return {
+        "id": row.message_id,
+        "workspace_id": row.workspace_id,
+        "sender_name": row.sender_name,
+        "encrypted_body": row.encrypted_body,
+        "iv": row.iv,
+        "created_at": _iso_timestamp(_as_utc(row.created_at)),
+    }
+
+
+def _open_inbox_visibility(*, session, user_id: str, workspace_id: str) -> None:
+    open_window = session.scalars(
+        select(WorkspaceInboxVisibility.id).where(
+            WorkspaceInboxVisibility.user_id == user_id,
+            WorkspaceInboxVisibility.workspace_id == workspace_id,
+            WorkspaceInboxVisibility.visible_until.is_(None),
         )
     ).first()
-    payload = row.payload_json if row and isinstance(row.payload_json, dict) else {}
-    normalized = normalize_workspace_inbox_state(payload)
-    if row is None:
-        row = WorkspaceInboxStateCache(user_id=user_id, payload_json=normalized)
-        session.add(row)
-        session.flush()
-    elif payload != normalized:
-        row.payload_json = normalized
-    # Return a detached normalized copy so callers can mutate state safely
-    # without relying on SQLAlchemy JSON mutation tracking.
-    return row, normalize_workspace_inbox_state(normalized)
+    if open_window is None:
+        session.add(
+            WorkspaceInboxVisibility(
+                user_id=user_id, workspace_id=workspace_id, visible_from=_utcnow()
+            )
+        )
 
 
-def _save_workspace_inbox_state_row(
-    *, row: WorkspaceInboxStateCache, state: dict[str, Any]
-) -> dict[str, Any]:
-    normalized = normalize_workspace_inbox_state(state)
-    row.payload_json = normalized
-    return normalized
+def _close_inbox_visibility(*, session, user_id: str, workspace_id: str) -> None:
+    now = _utcnow()
+    for window in session.scalars(
+        select(WorkspaceInboxVisibility).where(
+            WorkspaceInboxVisibility.user_id == user_id,
+            WorkspaceInboxVisibility.workspace_id == workspace_id,
+            WorkspaceInboxVisibility.visible_until.is_(None),
+        )
+    ).all():
+        window.visible_until = now
 
 
-def _remove_workspace_from_inbox_state(
+def _clear_workspace_inbox_history(
     *,
     session,
     user_id: str,
@@ -971,17 +1137,256 @@ def _remove_workspace_from_inbox_state(
     clean_workspace_id = _trim(workspace_id)
     if not clean_user_id or not clean_workspace_id:
         return
-    row, state = _load_workspace_inbox_state_row(session=session, user_id=clean_user_id)
-    messages = [
-        item
-        for item in (state.get("messages") or [])
-        if _trim(item.get("workspace_id")) != clean_workspace_id
-    ]
-    reads = dict(state.get("reads") or {})
-    reads.pop(clean_workspace_id, None)
-    state["messages"] = messages
-    state["reads"] = reads
-    _save_workspace_inbox_state_row(row=row, state=state)
+    # Windows opened earlier in this transaction must be flushed to be deleted.
+    session.flush()
+    for model in (WorkspaceInboxVisibility, WorkspaceInboxRead):
+        session.execute(
+            delete(model).where(
+                model.user_id == clean_user_id,
+                model.workspace_id == clean_workspace_id,
+            )
+        )
+
+
+def _inbox_message_visible_to(user_id: str):
+    return exists().where(
+        WorkspaceInboxVisibility.user_id == user_id,
+        WorkspaceInboxVisibility.workspace_id == WorkspaceInboxMessage.workspace_id,
+        WorkspaceInboxVisibility.visible_from <= WorkspaceInboxMessage.posted_at,
+        or_(
+            WorkspaceInboxVisibility.visible_until.is_(None),
+            WorkspaceInboxVisibility.visible_until > WorkspaceInboxMessage.posted_at,
+        ),
+    )
+
+
+def _upsert_inbox_read(
+    *, session, user_id: str, workspace_id: str, reader_key: str, read_at: str
+) -> str:
+    row = session.scalars(
+        select(WorkspaceInboxRead).where(
+            WorkspaceInboxRead.user_id == user_id,
+            WorkspaceInboxRead.workspace_id == workspace_id,
+            WorkspaceInboxRead.reader_key == reader_key,
+        )
+    ).first()
+    if row is None:
+        session.add(
+            WorkspaceInboxRead(
+                user_id=user_id,
+                workspace_id=workspace_id,
+                reader_key=reader_key,
+                read_at=_parse_timestamp(read_at) or _utcnow(),
+            )
+        )
+        return read_at
+    resolved = (
+        _latest_timestamp(_iso_timestamp(_as_utc(row.read_at)), read_at) or read_at
+    )
+    row.read_at = _parse_timestamp(resolved) or _utcnow()
+    return resolved
+
+
+def _inbox_reads_for_user(
+    *, session, user_id: str, workspace_id: str | None = None
+) -> dict[str, dict[str, str]]:
+    statement = select(WorkspaceInboxRead).where(WorkspaceInboxRead.user_id == user_id)
+    if workspace_id:
+        statement = statement.where(WorkspaceInboxRead.workspace_id == workspace_id)
+    reads: dict[str, dict[str, str]] = {}
+    for row in session.scalars(statement).all():
+        reads.setdefault(row.workspace_id, {})[row.reader_key] = _iso_timestamp(
+            _as_utc(row.read_at)
+        )
+    return reads
+
+
+def _encode_inbox_cursor(row: WorkspaceInboxMessage) -> str:
+    payload = json.dumps(
+        {"c": _as_utc(row.created_at).isoformat(), "id": row.message_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_inbox_cursor(cursor: str) -> tuple[datetime, str]:
+    clean_cursor = _trim(cursor)
+    try:
+        raw = base64.urlsafe_b64decode(clean_cursor + "=" * (-len(clean_cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise WorkspaceValidationError("cursor is invalid.") from None
+    if not isinstance(payload, dict) or not _trim(payload.get("id")):
+        raise WorkspaceValidationError("cursor is invalid.")
+    created_at = _parse_timestamp(payload.get("c"))
+    if created_at is None:
+        raise WorkspaceValidationError("cursor is invalid.")
+    return created_at, _trim(payload.get("id"))
+
+
+def _import_legacy_inbox_messages(
+    *,
+    session,
+    state: dict[str, Any],
+    known_message_keys: set[tuple[str, str]],
+) -> None:
+    for message in state.get("messages") or []:
+        workspace_id = _trim(message.get("workspace_id"))
+        message_id = _trim(message.get("id"))
+        if (workspace_id, message_id) in known_message_keys:
+            continue
+        known_message_keys.add((workspace_id, message_id))
+        created_at = _parse_timestamp(message.get("created_at")) or _utcnow()
+        # Blob copies carry no server receipt time, so the message timestamp
+        # stands in for posted_at.
+        session.add(
+            WorkspaceInboxMessage(
+                workspace_id=workspace_id,
+                message_id=message_id,
+                sender_name=_normalize_name(message.get("sender_name"))
+                or "Unknown sender",
+                encrypted_body=_trim(message.get("encrypted_body")),
+                iv=_trim(message.get("iv")),
+                created_at=created_at,
+                posted_at=created_at,
+            )
+        )
+
+
+def _legacy_inbox_membership_periods(
+    timeline: list[tuple[str, datetime]], held_message_ids: set[str]
+) -> list[tuple[datetime, datetime]]:
+    # Sending copied a message into every current member's blob, so each
+    # unbroken run of held messages on the workspace timeline is a period the
+    # user was a member. A message they never received ends the run.
+    periods: list[tuple[datetime, datetime]] = []
+    run: tuple[datetime, datetime] | None = None
+    for message_id, posted_at in timeline:
+        if message_id in held_message_ids:
+            run = (run[0] if run else posted_at, posted_at)
+        elif run is not None:
+            periods.append(run)
+            run = None
+    if run is not None:
+        periods.append(run)
+    return periods
+
+
+def _import_legacy_inbox_access(
+    *,
+    session,
+    user_id: str,
+    state: dict[str, Any],
+    timelines: dict[str, list[tuple[str, datetime]]],
+) -> None:
+    held_by_workspace: dict[str, set[str]] = {}
+    for message in state.get("messages") or []:
+        held_by_workspace.setdefault(_trim(message.get("workspace_id")), set()).add(
+            _trim(message.get("id"))
+        )
+    for workspace_id, held_message_ids in held_by_workspace.items():
+        if workspace_id not in timelines:
+            timelines[workspace_id] = [
+                (message_id, _as_utc(posted_at))
+                for message_id, posted_at in session.execute(
+                    select(
+                        WorkspaceInboxMessage.message_id,
+                        WorkspaceInboxMessage.posted_at,
+                    )
+                    .where(WorkspaceInboxMessage.workspace_id == workspace_id)
+                    .order_by(
+                        WorkspaceInboxMessage.posted_at.asc(),
+                        WorkspaceInboxMessage.message_id.asc(),
+                    )
+                )
+            ]
+        windows = [
+            (_as_utc(window.visible_from), window.visible_until)
+            for window in session.scalars(
+                select(WorkspaceInboxVisibility).where(
+                    WorkspaceInboxVisibility.user_id == user_id,
+                    WorkspaceInboxVisibility.workspace_id == workspace_id,
+                )
+            ).all()
+        ]
+        # Existing windows, including an open one, keep their bounds; legacy
+        # history only gets closed windows of its own.
+        for first, last in _legacy_inbox_membership_periods(
+            timelines[workspace_id], held_message_ids
+        ):
+            if any(
+                visible_from <= first
+                and (visible_until is None or _as_utc(visible_until) > last)
+                for visible_from, visible_until in windows
+            ):
+                continue
+            session.add(
+                WorkspaceInboxVisibility(
+                    user_id=user_id,
+                    workspace_id=workspace_id,
+                    visible_from=first,
+                    visible_until=last + timedelta(microseconds=1),
+                )
+            )
+    for workspace_id, reader_map in (state.get("reads") or {}).items():
+        for reader_key, read_at in reader_map.items():
+            _upsert_inbox_read(
+                session=session,
+                user_id=user_id,
+                workspace_id=workspace_id,
+                reader_key=reader_key,
+                read_at=read_at,
+            )
+
+
+def _ensure_workspace_inbox_store(*, session) -> None:
+    # Inboxes used to be one JSON blob per user holding a copy of every
+    # message. Move any remaining blob content into the message tables once
+    # per process and database, then empty the blob.
+    bind_key = str(session.get_bind().url)
+    if bind_key in _INBOX_STORE_MIGRATED_BINDS:
+        return
+    _ensure_workspace_membership_index(session=session)
+    legacy_states: list[tuple[WorkspaceInboxStateCache, dict[str, Any]]] = []
+    for state_row in session.scalars(select(WorkspaceInboxStateCache)).all():
+        payload = (
+            state_row.payload_json if isinstance(state_row.payload_json, dict) else {}
+        )
+        state = normalize_workspace_inbox_state(payload)
+        if state["messages"] or state["reads"]:
+            legacy_states.append((state_row, state))
+    if legacy_states:
+        legacy_workspace_ids = {
+            _trim(message.get("workspace_id"))
+            for _, state in legacy_states
+            for message in state["messages"]
+        }
+        known_message_keys: set[tuple[str, str]] = {
+            (workspace_id, message_id)
+            for workspace_id, message_id in session.execute(
+                select(
+                    WorkspaceInboxMessage.workspace_id, WorkspaceInboxMessage.message_id
+                ).where(WorkspaceInboxMessage.workspace_id.in_(legacy_workspace_ids))
+            )
+        }
+        for _, state in legacy_states:
+            _import_legacy_inbox_messages(
+                session=session, state=state, known_message_keys=known_message_keys
+            )
+        # Every blob's messages are on the timeline before any access is
+        # derived from it.
+        session.flush()
+        timelines: dict[str, list[tuple[str, datetime]]] = {}
+        for state_row, state in legacy_states:
+            _import_legacy_inbox_access(
+                session=session,
+                user_id=state_row.user_id,
+                state=state,
+                timelines=timelines,
+            )
+            state_row.payload_json = {"messages": [], "reads": {}}
+        session.flush()
+    _INBOX_STORE_MIGRATED_BINDS.add(bind_key)
 
 
 def _workspace_index(state: dict[str, Any], workspace_id: str) -> int:
@@ -1129,59 +1534,28 @@ def _workspace_participant_user_ids(
     clean_workspace_id = _trim(workspace_id)
     if not clean_workspace_id:
         return []
-    state_rows = session.scalars(select(WorkspaceStateCache)).all()
-
-    participant_ids: list[str] = []
-    seen_ids: set[str] = set()
-    for state_row in state_rows:
-        row_user_id = _trim(state_row.user_id)
-        if not row_user_id or row_user_id in seen_ids:
-            continue
-        payload = (
-            state_row.payload_json
-            if isinstance(state_row.payload_json, dict)
-            else {}
-        )
-        state = normalize_workspace_state(payload)
-        workspace = _workspace_record_for_id(state, clean_workspace_id)
-        if workspace is None:
-            continue
-        role = _workspace_membership_role(workspace=workspace, user_id=row_user_id)
-        if role is None:
-            continue
-        seen_ids.add(row_user_id)
-        participant_ids.append(row_user_id)
-    return participant_ids
-
+    _ensure_workspace_membership_index(session=session)
+    return [
+        _trim(member_id)
+        for member_id in session.scalars(
+            select(WorkspaceMembership.user_id)
+            .where(WorkspaceMembership.workspace_id == clean_workspace_id)
+            .order_by(WorkspaceMembership.user_id)
+        ).all()
+        if _trim(member_id)
+    ]
 
-def get_workspace_access_snapshot(
-    *,
-    session,
-    workspace_id: str,
-    user_id: str,
-    include_removed_collaborator: bool = False,
-) -> dict[str, Any] | None:
-    clean_workspace_id = _trim(workspace_id)
-    clean_user_id = _trim(user_id)
-    if not clean_workspace_id or not clean_user_id:
-        return None
-    try:
-        _, _, workspace = _resolve_workspace_access_context(
-            session=session,
-            user_id=clean_user_id,
-            workspace_id=clean_workspace_id,
-            include_removed_collaborator=include_removed_collaborator,
-        )
-    except (WorkspaceNotFoundError, WorkspaceValidationError):
-        return None
 
+def _workspace_access_snapshot(
+    *, workspace: dict[str, Any], workspace_id: str, user_id: str
+) -> dict[str, Any]:
     participants = _normalize_participant_list(
         workspace.get("collaborators"),
-        workspace_id=clean_workspace_id,
+        workspace_id=workspace_id,
     )
     removed_participants = _normalize_participant_list(
         workspace.get("removed_collaborators"),
-        workspace_id=clean_workspace_id,
+        workspace_id=workspace_id,
     )
     removed_ids = set(_participant_ids(removed_participants))
     active_member_ids = [
@@ -1194,10 +1568,10 @@ def get_workspace_access_snapshot(
         active_member_ids.insert(0, owner_user_id)
     membership_role = _workspace_membership_role(
         workspace=workspace,
-        user_id=clean_user_id,
+        user_id=user_id,
     )
     return {
-        "workspace_id": clean_workspace_id,
+        "workspace_id": workspace_id,
         "workspace": workspace,
         "workspace_name": _normalize_name(workspace.get("name")) or WORKSPACE_FALLBACK_NAME,
         "owner_user_id": owner_user_id,
@@ -1205,13 +1579,75 @@ def get_workspace_access_snapshot(
         "membership_role": membership_role,
         "collaborator_role": _workspace_collaborator_role(
             workspace=workspace,
-            user_id=clean_user_id,
+            user_id=user_id,
         ),
         "active_member_ids": active_member_ids,
         "removed_member_ids": list(removed_ids),
     }
 
 
+def get_workspace_access_snapshot(
+    *,
+    session,
+    workspace_id: str,
+    user_id: str,
+    include_removed_collaborator: bool = False,
+) -> dict[str, Any] | None:
+    clean_workspace_id = _trim(workspace_id)
+    clean_user_id = _trim(user_id)
+    if not clean_workspace_id or not clean_user_id:
+        return None
+    try:
+        _, _, workspace = _resolve_workspace_access_context(
+            session=session,
+            user_id=clean_user_id,
+            workspace_id=clean_workspace_id,
+            include_removed_collaborator=include_removed_collaborator,
+        )
+    except (WorkspaceNotFoundError, WorkspaceValidationError):
+        return None
+    return _workspace_access_snapshot(
+        workspace=workspace,
+        workspace_id=clean_workspace_id,
+        user_id=clean_user_id,
+    )
+
+
+def list_workspace_access_snapshots(
+    *,
+    session,
+    user_id: str,
+    include_removed_collaborator: bool = False,
+) -> list[dict[str, Any]]:
+    """Return access snapshots for every workspace in the user's own state."""
+    clean_user_id = _trim(user_id)
+    if not clean_user_id or session.get(User, clean_user_id) is None:
+        return []
+    _, state = _load_workspace_state_row(session=session, user_id=clean_user_id)
+    snapshots: list[dict[str, Any]] = []
+    for workspace in state.get("workspaces") or []:
+        workspace_id = _trim(workspace.get("id"))
+        if not workspace_id:
+            continue
+        if _workspace_membership_role(
+            workspace=workspace, user_id=clean_user_id
+        ) is None and not (
+            include_removed_collaborator
+            and _workspace_is_removed_collaborator(
+                workspace=workspace, user_id=clean_user_id
+            )
+        ):
+            continue
+        snapshots.append(
+            _workspace_access_snapshot(
+                workspace=dict(workspace),
+                workspace_id=workspace_id,
+                user_id=clean_user_id,
+            )
+        )
+    return snapshots
+
+
 def _sync_workspace_collaborator_states(
     *,
     session,
@@ -1276,7 +1712,7 @@ def _sync_workspace_collaborator_states(
         if user_id not in collaborator_ids or is_removed_for_user:
             if index < 0:
                 if is_removed_for_user:
-                    _remove_workspace_from_inbox_state(
+                    _clear_workspace_inbox_history(
                         session=session,
                         user_id=user_id,
                         workspace_id=workspace_id,
@@ -1298,7 +1734,7 @@ def _sync_workspace_collaborator_states(
                         break
                 state["active_workspace_id"] = next_active
             _save_workspace_state_row(row=row, state=state)
-            _remove_workspace_from_inbox_state(
+            _clear_workspace_inbox_history(
                 session=session,
                 user_id=user_id,
                 workspace_id=workspace_id,
@@ -1748,6 +2184,7 @@ def _set_invitation_status_for_user(
         session.add(row)
     else:
         row.payload_json = state
+    _sync_workspace_membership_index(session=session, user_id=user_id, state=state)
 
     if updated_workspace is not None:
         if _trim(updated_workspace.get("owner_user_id")) == _trim(user_id):
@@ -1887,7 +2324,7 @@ def save_workspace_state(*, user_id: str, payload: dict[str, Any] | None) -> dic
     with session_scope() as session:
         _resolve_user_or_raise(session=session, user_id=user_id)
         row, _ = _load_workspace_state_row(session=session, user_id=user_id)
-        row.payload_json = normalized
+        _save_workspace_state_row(row=row, state=normalized)
         session.flush()
     return normalized
 
@@ -1896,21 +2333,63 @@ def get_workspace_inbox_state(*, user_id: str) -> dict[str, Any]:
     create_all_tables()
     with session_scope() as session:
         _resolve_user_or_raise(session=session, user_id=user_id)
-        _, state = _load_workspace_inbox_state_row(session=session, user_id=user_id)
-        return state
+        _ensure_workspace_inbox_store(session=session)
+        return {
+            "messages": _list_visible_inbox_messages(session=session, user_id=user_id),
+            "reads": _inbox_reads_for_user(session=session, user_id=user_id),
+        }
 
 
 def save_workspace_inbox_state(
     *, user_id: str, payload: dict[str, Any] | None
 ) -> dict[str, Any]:
+    """Append unseen messages and replace read markers from a full inbox state.
+
+    The message store is append-only, so messages missing from ``payload`` are
+    kept, and messages are only accepted for workspaces the user belongs to.
+    """
     normalized = normalize_workspace_inbox_state(payload)
     create_all_tables()
     with session_scope() as session:
         _resolve_user_or_raise(session=session, user_id=user_id)
-        row, _ = _load_workspace_inbox_state_row(session=session, user_id=user_id)
-        row.payload_json = normalized
+        _ensure_workspace_inbox_store(session=session)
+        member_workspace_ids = set(
+            session.scalars(
+                select(WorkspaceMembership.workspace_id).where(
+                    WorkspaceMembership.user_id == user_id
+                )
+            ).all()
+        )
+        for message in normalized["messages"]:
+            workspace_id = _trim(message.get("workspace_id"))
+            if workspace_id not in member_workspace_ids:
+                continue
+            if _inbox_message_exists(
+                session=session,
+                workspace_id=workspace_id,
+                message_id=_trim(message.get("id")),
+            ):
+                continue
+            _append_inbox_message(session=session, user_id=user_id, message=message)
         session.flush()
-    return normalized
+        session.execute(
+            delete(WorkspaceInboxRead).where(WorkspaceInboxRead.user_id == user_id)
+        )
+        for workspace_id, reader_map in normalized["reads"].items():
+            for reader_key, read_at in reader_map.items():
+                session.add(
+                    WorkspaceInboxRead(
+                        user_id=user_id,
+                        workspace_id=workspace_id,
+                        reader_key=reader_key,
+                        read_at=_parse_timestamp(read_at) or _utcnow(),
+                    )
+                )
+        session.flush()
+        return {
+            "messages": _list_visible_inbox_messages(session=session, user_id=user_id),
+            "reads": _inbox_reads_for_user(session=session, user_id=user_id),
+        }
 
 
 def list_workspace_records(*, user_id: str) -> dict[str, Any]:
@@ -2545,6 +3024,11 @@ def _accept_data_author_request(
     shared_roles[user_id] = collaborator_role
     asset.shared_with_user_ids = shared_ids
     asset.shared_with_roles_json = shared_roles
+    from research_os.services.data_planner_service import (
+        sync_library_asset_access_index,
+    )
+
+    sync_library_asset_access_index(session=session, asset=asset)
 
     state["author_requests"] = [
         item for item in (state.get("author_requests") or []) if _trim(item.get("id")) != clean_request_id
@@ -2702,23 +3186,13 @@ def accept_workspace_author_request(*, user_id: str, request_id: str) -> dict[st
 
         # On acceptance, inbox history becomes scoped to the new active membership
         # window for this collaborator.
-        inbox_row, inbox_state = _load_workspace_inbox_state_row(
-            session=session, user_id=user_id
+        _ensure_workspace_inbox_store(session=session)
+        _clear_workspace_inbox_history(
+            session=session, user_id=user_id, workspace_id=workspace_id
+        )
+        _open_inbox_visibility(
+            session=session, user_id=user_id, workspace_id=workspace_id
         )
-        inbox_messages = list(inbox_state.get("messages") or [])
-        filtered_messages = [
-            item
-            for item in inbox_messages
-            if _trim(item.get("workspace_id")) != workspace_id
-        ]
-        reads = dict(inbox_state.get("reads") or {})
-        had_reads = workspace_id in reads
-        if had_reads:
-            reads.pop(workspace_id, None)
-        if len(filtered_messages) != len(inbox_messages) or had_reads:
-            inbox_state["messages"] = filtered_messages
-            inbox_state["reads"] = reads
-            _save_workspace_inbox_state_row(row=inbox_row, state=inbox_state)
 
         inviter_user_id = _trim(request.get("source_inviter_user_id"))
         invitation_id = _trim(request.get("source_invitation_id"))
@@ -2840,10 +3314,82 @@ def decline_workspace_author_request(*, user_id: str, request_id: str) -> dict[s
         return {"success": True, "removed_request_id": clean_request_id}
 
 
+def _visible_inbox_messages_statement(*, user_id: str, workspace_id: str | None):
+    statement = select(WorkspaceInboxMessage).where(
+        _inbox_message_visible_to(user_id)
+    )
+    if workspace_id:
+        return statement.where(WorkspaceInboxMessage.workspace_id == workspace_id)
+    return statement.where(
+        WorkspaceInboxMessage.workspace_id.in_(
+            select(WorkspaceInboxVisibility.workspace_id).where(
+                WorkspaceInboxVisibility.user_id == user_id
+            )
+        )
+    )
+
+
+def _list_visible_inbox_messages(
+    *, session, user_id: str, workspace_id: str | None = None
+) -> list[dict[str, Any]]:
+    rows = session.scalars(
+        _visible_inbox_messages_statement(
+            user_id=user_id, workspace_id=workspace_id
+        ).order_by(
+            WorkspaceInboxMessage.created_at.asc(),
+            WorkspaceInboxMessage.message_id.asc(),
+        )
+    ).all()
+    return [_serialize_inbox_message(row) for row in rows]
+
+
+def _inbox_message_exists(*, session, workspace_id: str, message_id: str) -> bool:
+    return (
+        session.scalars(
+            select(WorkspaceInboxMessage.id).where(
+                WorkspaceInboxMessage.workspace_id == workspace_id,
+                WorkspaceInboxMessage.message_id == message_id,
+            )
+        ).first()
+        is not None
+    )
+
+
+def _append_inbox_message(
+    *, session, user_id: str, message: dict[str, Any]
+) -> WorkspaceInboxMessage:
+    workspace_id = _trim(message.get("workspace_id"))
+    # The sender always sees their own message, even if their membership
+    # window has not been recorded yet.
+    _open_inbox_visibility(session=session, user_id=user_id, workspace_id=workspace_id)
+    row = WorkspaceInboxMessage(
+        workspace_id=workspace_id,
+        message_id=_trim(message.get("id")),
+        sender_user_id=_trim(user_id) or None,
+        sender_name=_normalize_name(message.get("sender_name")) or "Unknown sender",
+        encrypted_body=_trim(message.get("encrypted_body")),
+        iv=_trim(message.get("iv")),
+        created_at=_parse_timestamp(message.get("created_at")) or _utcnow(),
+    )
+    session.add(row)
+    return row
+
+
 def list_workspace_inbox_messages(
-    *, user_id: str, workspace_id: str | None = None
+    *,
+    user_id: str,
+    workspace_id: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
 ) -> dict[str, Any]:
+    """List inbox messages visible to a user, oldest first.
+
+    Without ``limit`` or ``cursor`` every visible message is returned. With
+    them, the newest ``limit`` messages older than ``cursor`` are returned and
+    ``next_cursor`` points at the page before.
+    """
     clean_workspace_id = _trim(workspace_id)
+    clean_cursor = _trim(cursor)
     create_all_tables()
     with session_scope() as session:
         _resolve_user_or_raise(session=session, user_id=user_id)
@@ -2853,15 +3399,43 @@ def list_workspace_inbox_messages(
                 user_id=user_id,
                 workspace_id=clean_workspace_id,
             )
-        _, state = _load_workspace_inbox_state_row(session=session, user_id=user_id)
-        messages = list(state.get("messages") or [])
-        if clean_workspace_id:
-            messages = [
-                item
-                for item in messages
-                if _trim(item.get("workspace_id")) == clean_workspace_id
-            ]
-        return {"items": messages}
+        _ensure_workspace_inbox_store(session=session)
+        if limit is None and not clean_cursor:
+            return {
+                "items": _list_visible_inbox_messages(
+                    session=session,
+                    user_id=user_id,
+                    workspace_id=clean_workspace_id or None,
+                ),
+                "next_cursor": None,
+            }
+        page_size = max(1, min(WORKSPACE_INBOX_PAGE_SIZE_MAX, int(limit or 50)))
+        statement = _visible_inbox_messages_statement(
+            user_id=user_id, workspace_id=clean_workspace_id or None
+        )
+        if clean_cursor:
+            cursor_created_at, cursor_message_id = _decode_inbox_cursor(clean_cursor)
+            statement = statement.where(
+                or_(
+                    WorkspaceInboxMessage.created_at < cursor_created_at,
+                    and_(
+                        WorkspaceInboxMessage.created_at == cursor_created_at,
+                        WorkspaceInboxMessage.message_id < cursor_message_id,
+                    ),
+                )
+            )
+        rows = session.scalars(
+            statement.order_by(
+                WorkspaceInboxMessage.created_at.desc(),
+                WorkspaceInboxMessage.message_id.desc(),
+            ).limit(page_size + 1)
+        ).all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        return {
+            "items": [_serialize_inbox_message(row) for row in reversed(rows)],
+            "next_cursor": _encode_inbox_cursor(rows[-1]) if has_more else None,
+        }
 
 
 def create_workspace_inbox_message(
@@ -2883,10 +3457,7 @@ def create_workspace_inbox_message(
         if not sender_name:
             sender_name = _normalize_name(user.name) or "Unknown sender"
         sender_key = sender_name.casefold()
-        sender_role = _workspace_membership_role(
-            workspace=workspace,
-            user_display_name=_normalize_name(user.name),
-        )
+        sender_role = _workspace_membership_role(workspace=workspace, user_id=user_id)
         if sender_role is None:
             raise WorkspaceValidationError(
                 "Only workspace participants can send inbox messages."
@@ -2895,72 +3466,32 @@ def create_workspace_inbox_message(
             raise WorkspaceValidationError(
                 "Locked workspaces are read-only until unlocked."
             )
+        _ensure_workspace_inbox_store(session=session)
+        clean_workspace_id = _trim(message.get("workspace_id"))
         message["sender_name"] = sender_name
-        sender_inbox_row, sender_inbox_state = _load_workspace_inbox_state_row(
-            session=session, user_id=user_id
-        )
-        sender_existing_ids = {
-            _trim(item.get("id"))
-            for item in (sender_inbox_state.get("messages") or [])
-        }
-
-        participant_user_ids = _workspace_participant_user_ids(
-            session=session,
-            workspace_id=_trim(message.get("workspace_id")),
-        )
-        clean_user_id = _trim(user_id)
-        if clean_user_id and clean_user_id not in participant_user_ids:
-            participant_user_ids.append(clean_user_id)
-
-        base_message_id = _trim(message.get("id")) or f"msg-{uuid4().hex[:10]}"
-        while base_message_id in sender_existing_ids:
-            base_message_id = f"msg-{uuid4().hex[:10]}"
-        message["id"] = base_message_id
-        for participant_user_id in participant_user_ids:
-            row, state = (
-                (sender_inbox_row, sender_inbox_state)
-                if participant_user_id == clean_user_id
-                else _load_workspace_inbox_state_row(
-                    session=session, user_id=participant_user_id
-                )
-            )
-            messages = list(state.get("messages") or [])
-            existing_ids = {_trim(item.get("id")) for item in messages}
-            if base_message_id in existing_ids:
-                # Message already synced to this participant.
-                continue
-            messages.append(dict(message))
-            messages.sort(
-                key=lambda item: (
-                    _parse_timestamp(item.get("created_at"))
-                    or datetime(1970, 1, 1, tzinfo=timezone.utc)
-                )
+        message_id = _trim(message.get("id")) or f"msg-{uuid4().hex[:10]}"
+        while _inbox_message_exists(
+            session=session, workspace_id=clean_workspace_id, message_id=message_id
+        ):
+            message_id = f"msg-{uuid4().hex[:10]}"
+        message["id"] = message_id
+        _append_inbox_message(session=session, user_id=user_id, message=message)
+        if sender_key:
+            _upsert_inbox_read(
+                session=session,
+                user_id=user_id,
+                workspace_id=clean_workspace_id,
+                reader_key=sender_key,
+                read_at=message["created_at"],
             )
-            state["messages"] = messages
-
-            if participant_user_id == clean_user_id and sender_key:
-                reads = dict(state.get("reads") or {})
-                workspace_reads = dict(
-                    reads.get(_trim(message.get("workspace_id"))) or {}
-                )
-                existing_read_at = workspace_reads.get(sender_key)
-                resolved_read = _latest_timestamp(
-                    existing_read_at, message.get("created_at")
-                )
-                if resolved_read:
-                    workspace_reads[sender_key] = resolved_read
-                    reads[_trim(message.get("workspace_id"))] = workspace_reads
-                    state["reads"] = reads
-
-            _save_workspace_inbox_state_row(row=row, state=state)
         _append_owner_workspace_inbox_message_audit_entry(
             session=session,
-            workspace_id=_trim(message.get("workspace_id")),
+            workspace_id=clean_workspace_id,
             owner_name=_normalize_name(workspace.get("owner_name")),
             owner_user_id=_trim(workspace.get("owner_user_id")) or None,
             sender_user_id=_trim(user_id) or None,
             sender_name=sender_name,
-            message_id=_trim(message.get("id")),
+            message_id=message_id,
             created_at=_trim(message.get("created_at")),
             encrypted_body=_trim(message.get("encrypted_body")),
             iv=_trim(message.get("iv")),
@@ -2982,8 +3513,12 @@ def list_workspace_inbox_reads(
                 user_id=user_id,
                 workspace_id=clean_workspace_id,
             )
-        _, state = _load_workspace_inbox_state_row(session=session, user_id=user_id)
-        reads = dict(state.get("reads") or {})
+        _ensure_workspace_inbox_store(session=session)
+        reads = _inbox_reads_for_user(
+            session=session,
+            user_id=user_id,
+            workspace_id=clean_workspace_id or None,
+        )
         if clean_workspace_id:
             return {"reads": {clean_workspace_id: reads.get(clean_workspace_id) or {}}}
         return {"reads": reads}
@@ -3006,17 +3541,14 @@ def mark_workspace_inbox_read(*, user_id: str, payload: dict[str, Any]) -> dict[
             user_id=user_id,
             workspace_id=clean_workspace_id,
         )
-        row, state = _load_workspace_inbox_state_row(session=session, user_id=user_id)
-        reads = dict(state.get("reads") or {})
-        workspace_reads = dict(reads.get(clean_workspace_id) or {})
-        existing_read_at = workspace_reads.get(reader_key)
-        resolved = _latest_timestamp(existing_read_at, requested_read_at)
-        if not resolved:
-            resolved = requested_read_at
-        workspace_reads[reader_key] = resolved
-        reads[clean_workspace_id] = workspace_reads
-        state["reads"] = reads
-        _save_workspace_inbox_state_row(row=row, state=state)
+        _ensure_workspace_inbox_store(session=session)
+        resolved = _upsert_inbox_read(
+            session=session,
+            user_id=user_id,
+            workspace_id=clean_workspace_id,
+            reader_key=reader_key,
+            read_at=requested_read_at,
+        )
         session.flush()
         return {
             "workspace_id": clean_workspace_id,
@@ -3025,15 +3557,39 @@ def mark_workspace_inbox_read(*, user_id: str, payload: dict[str, Any]) -> dict[
         }
 
 
-def has_workspace_access(*, user_id: str, workspace_id: str) -> bool:
+def get_workspace_member_ids(*, workspace_id: str) -> frozenset[str]:
+    """Return ids of users with access to a workspace, cached for a short TTL.
+
+    Entries are dropped as soon as this process changes a membership; changes
+    made by other processes become visible after
+    ``WORKSPACE_ACCESS_CACHE_TTL_SECONDS``.
+    """
+    clean_workspace_id = _trim(workspace_id)
+    if not clean_workspace_id:
+        return frozenset()
+    ttl_seconds = _workspace_access_cache_ttl_seconds()
+    now = time.monotonic()
+    cache_key = (str(get_engine().url), clean_workspace_id)
+    if ttl_seconds > 0:
+        with _member_ids_cache_lock:
+            cached = _member_ids_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
     create_all_tables()
     with session_scope() as session:
-        try:
-            _resolve_workspace_access_context(
-                session=session,
-                user_id=user_id,
-                workspace_id=workspace_id,
+        member_ids = frozenset(
+            _workspace_participant_user_ids(
+                session=session, workspace_id=clean_workspace_id
             )
-            return True
-        except (WorkspaceValidationError, WorkspaceNotFoundError):
-            return False
+        )
+    if ttl_seconds > 0:
+        with _member_ids_cache_lock:
+            _member_ids_cache[cache_key] = (now + ttl_seconds, member_ids)
+    return member_ids
+
+
+def has_workspace_access(*, user_id: str, workspace_id: str) -> bool:
+    clean_user_id = _trim(user_id)
+    if not clean_user_id:
+        return False
+    return clean_user_id in get_workspace_member_ids(workspace_id=workspace_id)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from sqlalchemy import select
+
+import research_os.services.admin_service as admin_service
+from research_os.db import (
+    AdminUsageMonthlyRollup,
+    DataLibraryAsset,
+    GenerationJob,
+    Manuscript,
+    Project,
+    User,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
+from research_os.services.admin_service import (
+    get_admin_usage_costs,
+    list_admin_organisations,
+    list_admin_workspaces,
+    refresh_admin_usage_rollups,
+)
+
+
+def _seed_usage(tmp_path, monkeypatch) -> dict[str, object]:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'admin.db'}")
+    reset_database_state()
+    create_all_tables()
+    now = admin_service._utcnow()
+    previous_month = admin_service._month_start(now, months_ago=1) + timedelta(days=3)
+    older_month = admin_service._month_start(now, months_ago=3) + timedelta(days=3)
+    with session_scope() as session:
+        owner = User(email="Owner@Example.org", password_hash="x", name="Owner", role="admin")
+        member = User(email="member@example.org", password_hash="x", name="Member")
+        solo = User(email="solo@gmail.com", password_hash="x", name="Solo")
+        session.add_all([owner, member, solo])
+        session.flush()
+        projects = {
+            "org": Project(
+                owner_user_id=owner.id,
+                title="Cohort study",
+                target_journal="bmj",
+                workspace_id="lab-one",
+                collaborator_user_ids=[member.id],
+            ),
+            "solo": Project(
+                owner_user_id=solo.id, title="Solo paper", target_journal="bmj"
+            ),
+        }
+        session.add_all(projects.values())
+        session.flush()
+        manuscripts = {
+            key: Manuscript(project_id=project.id) for key, project in projects.items()
+        }
+        session.add_all(manuscripts.values())
+        session.flush()
+        for key, created_at, tokens, cost, status in (
+            ("org", now, 1_000, 2.0, "completed"),
+            ("org", now, 500, 1.0, "failed"),
+            ("org", previous_month, 300, 0.5, "completed"),
+            ("org", older_month, 700, 1.5, "completed"),
+            ("solo", now, 100, 0.25, "running"),
+        ):
+            session.add(
+                GenerationJob(
+                    project_id=projects[key].id,
+                    manuscript_id=manuscripts[key].id,
+                    status=status,
+                    pricing_model="gpt-4.1-mini",
+                    estimated_input_tokens=tokens,
+                    estimated_output_tokens_high=0,
+                    estimated_cost_usd_high=cost,
+                    created_at=created_at,
+                )
+            )
+        session.add(
+            DataLibraryAsset(
+                owner_user_id=member.id,
+                project_id=projects["org"].id,
+                filename="data.csv",
+                byte_size=2_048,
+                storage_path=str(tmp_path / "data.csv"),
+            )
+        )
+        owner_id = str(owner.id)
+    return {
+        "owner_id": owner_id,
+        "previous_key": admin_service._month_key(previous_month),
+        "older_key": admin_service._month_key(older_month),
+        "older_month": older_month,
+    }
+
+
+def test_organisations_aggregate_per_domain_and_page_in_domain_order(
+    monkeypatch, tmp_path
+) -> None:
+    seeded = _seed_usage(tmp_path, monkeypatch)
+
+    with session_scope() as session:
+        owner = session.get(User, seeded["owner_id"])
+        assert owner is not None and owner.email_domain == "example.org"
+
+    payload = list_admin_organisations(limit=1)
+
+    assert payload["total"] == 2
+    assert len(payload["items"]) == 1
+    organisation = payload["items"][0]
+    assert organisation["domain"] == "example.org"
+    assert organisation["member_count"] == 2
+    assert organisation["admin_count"] == 1
+    assert organisation["project_count"] == 1
+    assert organisation["workspace_count"] == 1
+    assert organisation["usage_tokens_current_month"] == 1_500
+    assert organisation["usage_tool_calls_current_month"] == 2
+    assert organisation["usage_tokens_previous_month"] == 300
+    assert organisation["cost_usd_current_month"] == 3.0
+    assert organisation["storage_bytes_current"] == 2_048
+    assert [item["month"] for item in organisation["monthly_usage_trend"]][1] == (
+        seeded["previous_key"]
+    )
+
+    second_page = list_admin_organisations(limit=1, offset=1)
+    assert [item["domain"] for item in second_page["items"]] == ["gmail.com"]
+    assert second_page["items"][0]["plan"] == "individual"
+    assert list_admin_organisations(query="gmail")["total"] == 1
+
+    workspaces = list_admin_workspaces(query="lab-one")
+    workspace = workspaces["items"][0]
+    assert workspace["member_count"] == 2
+    assert workspace["job_health"]["total_runs"] == 4
+    assert workspace["job_health"]["failed_runs_7d"] == 1
+    assert workspace["projects"][0]["last_run_status"] in {"completed", "failed"}
+
+
+def test_usage_costs_serve_closed_months_from_refreshed_rollups(
+    monkeypatch, tmp_path
+) -> None:
+    seeded = _seed_usage(tmp_path, monkeypatch)
+    enqueued: list[bool] = []
+    monkeypatch.setattr(
+        admin_service,
+        "_enqueue_admin_usage_rollup_refresh",
+        lambda: enqueued.append(True) or True,
+    )
+
+    payload = get_admin_usage_costs()
+
+    summary = payload["summary"]
+    assert summary["tokens_current_month"] == 1_600
+    assert summary["tool_calls_current_month"] == 3
+    assert summary["failed_runs_current_month"] == 1
+    assert summary["running_runs_current"] == 1
+    assert summary["storage_bytes_total"] == 2_048
+    assert payload["model_usage"][0]["model"] == "gpt-4.1-mini"
+    trend = {item["month"]: item for item in payload["monthly_trend"]}
+    assert len(trend) == admin_service.ADMIN_USAGE_TREND_MONTHS
+    assert trend[seeded["older_key"]]["tokens"] == 700
+    assert trend[seeded["previous_key"]]["tokens"] == 300
+    assert [item["domain"] for item in payload["organisation_usage"]] == [
+        "example.org",
+        "gmail.com",
+    ]
+    assert [item["email"] for item in payload["user_usage"]] == [
+        "Owner@Example.org",
+        "solo@gmail.com",
+        "member@example.org",
+    ]
+    assert [
+        item["email"] for item in get_admin_usage_costs(query="member")["user_usage"]
+    ] == ["member@example.org"]
+    assert enqueued == []
+
+    with session_scope() as session:
+        project_id, manuscript_id = session.execute(
+            select(GenerationJob.project_id, GenerationJob.manuscript_id).limit(1)
+        ).one()
+        session.add(
+            GenerationJob(
+                project_id=project_id,
+                manuscript_id=manuscript_id,
+                estimated_input_tokens=50,
+                created_at=seeded["older_month"],
+            )
+        )
+        for rollup in session.scalars(select(AdminUsageMonthlyRollup)):
+            rollup.computed_at = rollup.computed_at - timedelta(days=1)
+
+    stale = {item["month"]: item for item in get_admin_usage_costs()["monthly_trend"]}
+    assert stale[seeded["older_key"]]["tokens"] == 700
+    assert enqueued == [True]
+
+    refreshed = refresh_admin_usage_rollups()
+    assert seeded["older_key"] in refreshed["months"]
+    trend = {item["month"]: item for item in get_admin_usage_costs()["monthly_trend"]}
+    assert trend[seeded["older_key"]]["tokens"] == 750
+    assert trend[seeded["older_key"]]["tool_calls"] == 2
+
+
+def test_rollup_refresh_overwrites_rows_written_by_a_concurrent_build(
+    monkeypatch, tmp_path
+) -> None:
+    seeded = _seed_usage(tmp_path, monkeypatch)
+    older_month = admin_service._month_start(admin_service._utcnow(), months_ago=3)
+    with session_scope() as session:
+        # Rows a concurrent inline build committed first, plus a domain that no
+        # longer has usage in that month.
+        for domain, tokens in (("", 1), ("example.org", 1), ("gone.example", 9)):
+            session.add(
+                AdminUsageMonthlyRollup(
+                    month_start=older_month,
+                    domain=domain,
+                    tool_calls=1,
+                    tokens=tokens,
+                    cost_usd=0.0,
+                    computed_at=older_month,
+                )
+            )
+
+    refresh_admin_usage_rollups(month_starts=[older_month])
+    refresh_admin_usage_rollups(month_starts=[older_month])
+
+    with session_scope() as session:
+        rows = {
+            domain: tokens
+            for domain, tokens in session.execute(
+                select(AdminUsageMonthlyRollup.domain, AdminUsageMonthlyRollup.tokens)
+            ).all()
+        }
+    assert rows == {"": 700, "example.org": 700}
+    trend = {item["month"]: item for item in get_admin_usage_costs()["monthly_trend"]}
+    assert trend[seeded["older_key"]]["tokens"] == 700
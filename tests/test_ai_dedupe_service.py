@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select
+
+import research_os.services.ai_dedupe_service as ai_dedupe_service
+from research_os.db import (
+    Collaborator,
+    User,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
+from research_os.services.ai_dedupe_service import (
+    _DedupeProfile,
+    _generate_candidate_pairs,
+    auto_dedupe_collaborators,
+)
+from research_os.services.collaboration_service import parse_name_parts
+
+
+def _profile(
+    profile_id: str,
+    full_name: str,
+    *,
+    orcid: str = "",
+    institutions: tuple[str, ...] = (),
+) -> _DedupeProfile:
+    name_key = ai_dedupe_service._fold_name(full_name)
+    surname, given = parse_name_parts(name_key)
+    return _DedupeProfile(
+        id=profile_id,
+        summary=f"Name: {full_name}",
+        name_key=name_key,
+        surname=surname,
+        given=tuple(given),
+        orcid=orcid,
+        openalex="",
+        emails=frozenset(),
+        institutions=frozenset(institutions),
+        country="",
+        first_year=None,
+        last_year=None,
+    )
+
+
+def _synthetic_name(index: int) -> str:
+    consonants, vowels = "bdfgklmnprstvz", "aeiou"
+    letters = []
+    for _ in range(4):
+        index, consonant = divmod(index, len(consonants))
+        index, vowel = divmod(index, len(vowels))
+        letters.append(consonants[consonant] + vowels[vowel])
+    return f"{''.join(letters[:2]).title()} {''.join(letters[::-1]).title()}"
+
+
+def test_candidate_generation_finds_name_variants_without_all_pairs() -> None:
+    profiles = [
+        _profile(f"filler-{index}", _synthetic_name(index * 7919))
+        for index in range(1500)
+    ]
+    profiles.extend(
+        [
+            _profile("zia-full", "Zia Mehmood", institutions=("university of leeds",)),
+            _profile("zia-initial", "Z. Mehmood", institutions=("university of leeds",)),
+            _profile("zia-swapped", "Mehmood Zia"),
+            _profile("orcid-a", "Anna Smith", orcid="0000-0002-1825-0097"),
+            _profile("orcid-b", "Anna Smyth", orcid="0000-0001-5109-3700"),
+        ]
+    )
+
+    candidates, counts = _generate_candidate_pairs(profiles)
+    candidate_ids = {frozenset((a.id, b.id)) for _, a, b in candidates}
+
+    assert frozenset(("zia-full", "zia-initial")) in candidate_ids
+    assert frozenset(("zia-full", "zia-swapped")) in candidate_ids
+    assert frozenset(("orcid-a", "orcid-b")) not in candidate_ids
+    assert counts["conflicting_identity_pairs"] >= 1
+    assert counts["possible_pairs"] == len(profiles) * (len(profiles) - 1) // 2
+    assert counts["pairs_considered"] < counts["possible_pairs"] // 100
+    scores = [score for score, _, _ in candidates]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_auto_dedupe_sends_only_ambiguous_pairs_to_the_model(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'dedupe.db'}")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    reset_database_state()
+    create_all_tables()
+    with session_scope() as session:
+        user = User(email="dedupe@example.com", password_hash="test-hash", name="U")
+        session.add(user)
+        session.flush()
+        user_id = str(user.id)
+        for name, orcid in (
+            ("Zia Mehmood", None),
+            ("Z Mehmood", None),
+            ("Grace Hopper", "0000-0002-1825-0097"),
+            ("Grace Hopper", "0000-0002-1825-0097"),
+            ("Alan Turing", None),
+        ):
+            session.add(
+                Collaborator(
+                    owner_user_id=user_id,
+                    full_name=name,
+                    full_name_lower=name.lower(),
+                    orcid_id=orcid,
+                )
+            )
+
+    sent_batches: list[list[tuple[str, str, str]]] = []
+
+    def _fake_ask(_client, batch):
+        sent_batches.append(batch)
+        return [{"pair": 1, "is_duplicate": True, "confidence": 0.97}]
+
+    monkeypatch.setattr(ai_dedupe_service, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(ai_dedupe_service, "OpenAI", lambda **_: object(), raising=False)
+    monkeypatch.setattr(ai_dedupe_service, "_ask_ai_batch_duplicates", _fake_ask)
+
+    result = auto_dedupe_collaborators(user_id=user_id)
+
+    assert result["possible_pairs"] == 10
+    assert result["pairs_sent"] == 1
+    assert len(sent_batches) == 1
+    assert "Mehmood" in sent_batches[0][0][2]
+    assert result["merged_count"] == 1
+    with session_scope() as session:
+        remaining = session.scalar(
+            select(func.count())
+            .select_from(Collaborator)
+            .where(Collaborator.owner_user_id == user_id)
+        )
+    assert remaining == 4
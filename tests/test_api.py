@@ -1,5 +1,6 @@
 import base64
 from datetime import datetime, timezone
+import json
 import time
 from types import SimpleNamespace
 
@@ -14,6 +15,7 @@ from research_os.db import (
     reset_database_state,
     session_scope,
 )
+from research_os.services.grounded_draft_service import GroundedDraftGenerationError
 from research_os.services.persona_service import upsert_work
 
 
@@ -66,6 +68,14 @@ def _set_citation_state(monkeypatch) -> None:
     )
 
 
+def _parse_sse_events(body: str) -> list[tuple[str, dict]]:
+    events: list[tuple[str, dict]] = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
 def _auth_headers(token: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
@@ -2278,6 +2288,85 @@ def test_v1_generate_aawe_grounded_draft_persists_section_when_requested(
     )
 
 
+def test_v1_stream_aawe_grounded_draft_emits_deltas_then_result(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+
+    def _mock_stream(**kwargs):
+        assert kwargs["section"] == "results"
+        yield "progress", {"stage": "started", "section": "results", "pass_count": 1}
+        yield "delta", {"pass": "polish", "text": "Results text "}
+        yield "delta", {"pass": "polish", "text": "[E1]."}
+        yield "result", {
+            "section": "results",
+            "style_profile": "technical",
+            "generation_mode": "full",
+            "draft": "Results text [E1].",
+            "passes": [{"name": "polish", "content": "Results text [E1]."}],
+            "evidence_anchor_labels": [],
+            "citation_ids": [],
+            "unsupported_sentences": [],
+        }
+
+    monkeypatch.setattr(
+        "research_os.api.app.stream_grounded_section_draft", _mock_stream
+    )
+
+    with TestClient(app) as client:
+        headers = _register_user_and_headers(client, email="stream@example.com")
+        response = client.post(
+            "/v1/aawe/draft/grounded/stream",
+            headers=headers,
+            json={"section": "results", "notes_context": "Primary endpoint notes."},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse_events(response.text)
+    assert [name for name, _ in events] == ["progress", "delta", "delta", "result"]
+    assert "".join(data["text"] for name, data in events if name == "delta") == (
+        "Results text [E1]."
+    )
+    assert events[-1][1]["draft"] == "Results text [E1]."
+    assert events[-1][1]["persisted"] is False
+
+
+def test_v1_stream_aawe_grounded_draft_reports_generation_errors_as_events(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+
+    def _failing_stream(**_):
+        yield "progress", {"stage": "started", "section": "results", "pass_count": 3}
+        raise GroundedDraftGenerationError("Failed during pass 'skeleton'.")
+
+    monkeypatch.setattr(
+        "research_os.api.app.stream_grounded_section_draft", _failing_stream
+    )
+
+    with TestClient(app) as client:
+        headers = _register_user_and_headers(client, email="stream@example.com")
+        response = client.post(
+            "/v1/aawe/draft/grounded/stream",
+            headers=headers,
+            json={"section": "results", "notes_context": "Primary endpoint notes."},
+        )
+
+    assert response.status_code == 200
+    events = _parse_sse_events(response.text)
+    assert events[-1] == (
+        "error",
+        {
+            "error": {
+                "message": "OpenAI request failed",
+                "type": "openai_error",
+                "detail": "Failed during pass 'skeleton'.",
+            }
+        },
+    )
+
+
 def test_v1_synthesize_title_abstract_persists_to_manuscript(
     monkeypatch, tmp_path
 ) -> None:
@@ -3221,7 +3310,7 @@ def test_v1_generation_job_id_endpoints_enforce_owner_collaborator_access(
 ) -> None:
     _set_test_environment(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "research_os.services.generation_job_service._start_generation_thread",
+        "research_os.services.generation_job_service._dispatch_generation_job",
         lambda _: None,
     )
 
@@ -3326,7 +3415,7 @@ def test_v1_list_generation_jobs_returns_recent_jobs_for_manuscript(
 ) -> None:
     _set_test_environment(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "research_os.services.generation_job_service._start_generation_thread",
+        "research_os.services.generation_job_service._dispatch_generation_job",
         lambda _: None,
     )
 
@@ -3441,7 +3530,7 @@ def test_v1_generate_manuscript_returns_409_when_daily_budget_exceeded(
 ) -> None:
     _set_test_environment(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "research_os.services.generation_job_service._start_generation_thread",
+        "research_os.services.generation_job_service._dispatch_generation_job",
         lambda _: None,
     )
 
@@ -3486,7 +3575,7 @@ def test_v1_generate_manuscript_returns_409_when_job_already_active(
 ) -> None:
     _set_test_environment(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "research_os.services.generation_job_service._start_generation_thread",
+        "research_os.services.generation_job_service._dispatch_generation_job",
         lambda _: None,
     )
 
@@ -3530,7 +3619,7 @@ def test_v1_cancel_generation_job_marks_queued_job_cancelled(
 ) -> None:
     _set_test_environment(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "research_os.services.generation_job_service._start_generation_thread",
+        "research_os.services.generation_job_service._dispatch_generation_job",
         lambda _: None,
     )
 
@@ -7152,7 +7241,7 @@ def test_v1_persona_sync_jobs_metrics_flow(monkeypatch, tmp_path) -> None:
         },
     )
     monkeypatch.setattr(
-        "research_os.services.persona_sync_job_service._start_persona_sync_thread",
+        "research_os.services.persona_sync_job_service._dispatch_persona_sync_job",
         lambda job_id: sync_job_service._run_persona_sync_job(job_id),
     )
 
@@ -7347,6 +7436,13 @@ def test_v1_persona_metrics_embeddings_and_impact_flow(monkeypatch, tmp_path) ->
         context_response = client.get("/v1/persona/context", headers=headers)
         works_response = client.get("/v1/persona/works", headers=headers)
         journals_response = client.get("/v1/persona/journals", headers=headers)
+        similar_response = client.get(
+            f"/v1/persona/works/{works_response.json()[0]['id']}/similar",
+            headers=headers,
+        )
+        missing_similar_response = client.get(
+            "/v1/persona/works/missing-work/similar", headers=headers
+        )
 
     assert metrics_response.status_code == 200
     assert metrics_response.json()["provider_attribution"]["manual"] >= 1
@@ -7378,6 +7474,9 @@ def test_v1_persona_metrics_embeddings_and_impact_flow(monkeypatch, tmp_path) ->
     assert len(works_response.json()) == 2
     assert journals_response.status_code == 200
     assert len(journals_response.json()) == 2
+    assert similar_response.status_code == 200
+    assert len(similar_response.json()["items"]) == 1
+    assert missing_similar_response.status_code == 404
 
 
 def test_v1_persona_journals_refresh_route(monkeypatch, tmp_path) -> None:
@@ -7705,6 +7804,19 @@ def test_v1_collaboration_ai_tools_endpoints(monkeypatch, tmp_path) -> None:
         assert insights.json()["status"] == "draft"
         assert isinstance(insights.json()["insights"], list)
 
+        streamed_insights = client.post(
+            "/v1/account/collaboration/ai/insights/stream",
+            headers=headers,
+        )
+        assert streamed_insights.status_code == 200
+        assert streamed_insights.headers["content-type"].startswith(
+            "text/event-stream"
+        )
+        stream_events = _parse_sse_events(streamed_insights.text)
+        assert stream_events[0] == ("progress", {"stage": "started"})
+        assert stream_events[-1][0] == "result"
+        assert stream_events[-1][1]["insights"] == insights.json()["insights"]
+
         suggestions = client.post(
             "/v1/account/collaboration/ai/author-suggestions",
             headers=headers,
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+
+from sqlalchemy import func, select
+
+import research_os.services.api_telemetry_service as api_telemetry_service
+from research_os.db import (
+    ApiProviderUsageEvent,
+    ApiProviderUsageRollup,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
+from research_os.services.api_telemetry_service import (
+    flush_api_usage_events,
+    get_api_telemetry_sink_stats,
+    record_api_usage_event,
+    stop_api_telemetry_writer,
+    summarize_api_usage_for_admin,
+)
+
+
+def _discard_buffered_telemetry() -> None:
+    with api_telemetry_service._buffer_lock:
+        api_telemetry_service._event_buffer.clear()
+        api_telemetry_service._pending_rollups.clear()
+        for name in api_telemetry_service._sink_stats:
+            api_telemetry_service._sink_stats[name] = 0
+
+
+def _set_test_environment(monkeypatch, tmp_path) -> None:
+    # Job threads orphaned by earlier API tests can still be making provider
+    # calls; only events recorded by the test itself are buffered, and none of
+    # them may restart the writer.
+    test_thread = threading.current_thread()
+    buffer_event = api_telemetry_service._buffer_event
+    monkeypatch.setattr(
+        api_telemetry_service,
+        "_buffer_event",
+        lambda event: threading.current_thread() is test_thread
+        and buffer_event(event),
+    )
+    monkeypatch.setattr(api_telemetry_service, "_ensure_writer_started", lambda: None)
+    # Events recorded by earlier tests, and a writer thread they started, would
+    # otherwise flush into this test's database mid-assertion.
+    _discard_buffered_telemetry()
+    stop_api_telemetry_writer()
+    _discard_buffered_telemetry()
+    db_path = tmp_path / "research_os_test_api_telemetry.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{db_path}")
+    monkeypatch.setenv("API_TELEMETRY_FLUSH_INTERVAL_SECONDS", "300")
+    reset_database_state()
+    create_all_tables()
+
+
+def test_record_api_usage_event_buffers_until_bulk_flush(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    for index in range(3):
+        record_api_usage_event(
+            provider="OpenAlex",
+            operation="works_lookup",
+            duration_ms=100 + index,
+            success=index != 2,
+            status_code=200 if index != 2 else 503,
+            error_code=None if index != 2 else "http_503",
+        )
+    record_api_usage_event(
+        provider="openai", operation="responses", tokens_input=10, tokens_output=5
+    )
+
+    with session_scope() as session:
+        assert session.scalar(select(func.count(ApiProviderUsageEvent.id))) == 0
+
+    assert flush_api_usage_events() == 4
+    with session_scope() as session:
+        assert session.scalar(select(func.count(ApiProviderUsageEvent.id))) == 4
+        rollup = session.scalars(
+            select(ApiProviderUsageRollup).where(
+                ApiProviderUsageRollup.provider == "openalex"
+            )
+        ).one()
+        assert rollup.calls == 3
+        assert rollup.errors == 1
+        assert rollup.duration_ms_total == 303
+
+    record_api_usage_event(provider="openalex", operation="works_lookup")
+    flush_api_usage_events()
+
+    summary = summarize_api_usage_for_admin()
+    by_provider = {item["provider"]: item for item in summary["providers"]}
+    assert by_provider["openalex"]["calls_current_month"] == 4
+    assert by_provider["openalex"]["errors_current_month"] == 1
+    assert by_provider["openalex"]["recent_errors"][0]["error_code"] == "http_503"
+    assert by_provider["openai"]["tokens_current_month"] == 15
+    assert summary["summary"]["calls_current_month"] == 5
+
+
+def test_full_buffer_sheds_raw_events_but_keeps_exact_rollups(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv("API_TELEMETRY_BUFFER_SIZE", "10")
+    monkeypatch.setenv("API_TELEMETRY_PRESSURE_SAMPLE_RATE", "0")
+    before = get_api_telemetry_sink_stats()
+
+    for _ in range(20):
+        record_api_usage_event(provider="crossref", operation="works")
+    record_api_usage_event(provider="crossref", operation="works", success=False)
+
+    stats = get_api_telemetry_sink_stats()
+    assert stats["buffered"] == 6
+    assert stats["sampled_out"] - before["sampled_out"] == 15
+    assert stats["dropped"] - before["dropped"] == 0
+
+    flush_api_usage_events()
+    summary = summarize_api_usage_for_admin(query="crossref")
+    (item,) = summary["providers"]
+    assert item["calls_current_month"] == 21
+    assert item["errors_current_month"] == 1
+    with session_scope() as session:
+        assert session.scalar(select(func.count(ApiProviderUsageEvent.id))) == 6
+
+
+def test_rollup_flushes_increment_the_same_hour_without_losing_counts(
+    monkeypatch, tmp_path
+) -> None:
+    # A live writer thread left behind by another caller must not leak into
+    # the next test's database.
+    monkeypatch.setenv("API_TELEMETRY_SINK_MODE", "async")
+    monkeypatch.setenv("API_TELEMETRY_FLUSH_INTERVAL_SECONDS", "300")
+    monkeypatch.setenv(
+        "DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'leftover.db'}"
+    )
+    record_api_usage_event(provider="leftover", operation="works")
+    _set_test_environment(monkeypatch, tmp_path)
+    assert api_telemetry_service._writer_thread is None
+
+    for batch in range(3):
+        for _ in range(batch + 1):
+            record_api_usage_event(provider="orcid", operation="record")
+        flush_api_usage_events()
+
+    with session_scope() as session:
+        rollups = session.execute(
+            select(ApiProviderUsageRollup.provider, ApiProviderUsageRollup.calls)
+        ).all()
+    assert rollups == [("orcid", 6)]
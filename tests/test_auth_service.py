@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from datetime import datetime, timezone
+import hashlib
 
-from research_os.db import User, create_all_tables, reset_database_state, session_scope
+import pytest
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.orm import Session
+
+from research_os.db import (
+    AuthSession,
+    User,
+    create_all_tables,
+    get_engine,
+    reset_database_state,
+    session_scope,
+)
 from research_os.services.auth_service import (
+    AuthNotFoundError,
     complete_login_challenge,
     ensure_bootstrap_user,
+    flush_auth_session_touches,
+    get_user_by_session_token,
     login_user,
     register_user,
     start_login_challenge,
 )
+from research_os.services.security_service import password_hash_needs_rehash
 
 
 def _set_test_environment(monkeypatch, tmp_path) -> None:
@@ -204,3 +220,102 @@ def test_ensure_bootstrap_user_does_not_override_existing_name_by_default(
         user = session.get(User, user_id)
         assert user is not None
         assert str(user.name or "") == "Ciaran Grafton-Clarke"
+
+
+def test_session_token_lookup_is_cached_and_revalidated_across_processes(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    monkeypatch.setattr(
+        "research_os.services.publication_metrics_service.enqueue_publication_top_metrics_refresh",
+        lambda **kwargs: True,
+    )
+    monkeypatch.setattr(
+        "research_os.services.auth_service._reconcile_data_library_after_sign_in",
+        lambda **kwargs: None,
+    )
+    payload = register_user(
+        email="auth-session-cache@example.com",
+        password="StrongPassword123",
+        name="Auth Session Cache",
+    )
+    token = str(payload["session_token"])
+    user_id = str(payload["user"]["id"])
+    assert get_user_by_session_token(token)["role"] == "user"
+
+    statements: list[str] = []
+    engine = get_engine()
+
+    def _record_statement(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record_statement)
+    try:
+        assert get_user_by_session_token(token)["id"] == user_id
+    finally:
+        event.remove(engine, "before_cursor_execute", _record_statement)
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("SELECT")
+
+    assert flush_auth_session_touches() == 1
+    with session_scope() as session:
+        auth_session = session.scalars(
+            select(AuthSession).where(AuthSession.user_id == user_id)
+        ).one()
+        assert auth_session.last_seen_at is not None
+
+    # Writes from another API or worker process never reach this process's
+    # ORM events; the cached entry must still be rejected on the next lookup.
+    other_process = create_engine(str(engine.url))
+    try:
+        with Session(other_process) as session:
+            session.get(User, user_id).role = "admin"
+            session.commit()
+        assert get_user_by_session_token(token)["role"] == "admin"
+
+        with Session(other_process) as session:
+            session.execute(
+                update(AuthSession)
+                .where(AuthSession.user_id == user_id)
+                .values(revoked_at=datetime.now(timezone.utc))
+            )
+            session.commit()
+        with pytest.raises(AuthNotFoundError):
+            get_user_by_session_token(token)
+    finally:
+        other_process.dispose()
+
+
+def test_login_rehashes_legacy_password_hash_once(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    monkeypatch.setattr(
+        "research_os.services.publication_metrics_service.enqueue_publication_top_metrics_refresh",
+        lambda **kwargs: True,
+    )
+    monkeypatch.setattr(
+        "research_os.services.auth_service._reconcile_data_library_after_sign_in",
+        lambda **kwargs: None,
+    )
+    password = "LegacyPassword123"
+    payload = register_user(
+        email="auth-rehash@example.com", password=password, name="Auth Rehash"
+    )
+    user_id = str(payload["user"]["id"])
+    digest = hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), b"legacy-salt", 260000
+    )
+    legacy_hash = f"pbkdf2:sha256:260000$legacy-salt${digest.hex()}"
+    with session_scope() as session:
+        session.get(User, user_id).password_hash = legacy_hash
+
+    login_user(email="auth-rehash@example.com", password=password)
+    with session_scope() as session:
+        upgraded_hash = session.get(User, user_id).password_hash
+    assert upgraded_hash != legacy_hash
+    assert password_hash_needs_rehash(upgraded_hash) is False
+
+    login_user(email="auth-rehash@example.com", password=password)
+    with session_scope() as session:
+        assert session.get(User, user_id).password_hash == upgraded_hash
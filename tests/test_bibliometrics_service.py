@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from research_os.db import (
+    User,
+    Work,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
+from research_os.services.admin_service import list_admin_users
+from research_os.services.bibliometrics_service import (
+    citation_indices_for_portfolios,
+    g_index,
+    gini_coefficient,
+    h_index,
+    h_index_by_column,
+    normalize_rows_to_totals,
+    reconcile_rows_to_totals,
+    rolling_sums,
+    spread_yearly_counts,
+    top_share_pct_by_column,
+)
+
+
+def _set_test_environment(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    db_path = tmp_path / "research_os_bibliometrics.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{db_path}")
+    reset_database_state()
+
+
+def _reference_h_index(values: list[int]) -> int:
+    ordered = sorted([max(0, int(value)) for value in values], reverse=True)
+    h_value = 0
+    for index, value in enumerate(ordered, start=1):
+        if value < index:
+            break
+        h_value = index
+    return h_value
+
+
+def _reference_g_index(values: list[int]) -> int:
+    ordered = sorted([max(0, int(value)) for value in values], reverse=True)
+    cumulative = 0
+    g_value = 0
+    for index, value in enumerate(ordered, start=1):
+        cumulative += value
+        if cumulative < index * index:
+            break
+        g_value = index
+    return g_value
+
+
+def _reference_gini(values: list[float]) -> float:
+    clean = sorted(max(0.0, float(value)) for value in values)
+    n = len(clean)
+    total = float(sum(clean))
+    if n <= 0 or total <= 0.0:
+        return 0.0
+    weighted = 0.0
+    for index, value in enumerate(clean, start=1):
+        weighted += ((2 * index) - n - 1) * value
+    return round(max(0.0, min(1.0, weighted / (float(n) * total))), 4)
+
+
+def _reference_normalize(values: list[int], target: int) -> list[int]:
+    clean = [max(0, int(value)) for value in values]
+    total = sum(clean)
+    if total <= 0:
+        return [0 for _ in clean]
+    if total <= target:
+        return clean
+    scaled = [int(round((value / total) * target)) for value in clean]
+    diff = target - sum(scaled)
+    for index in range(len(scaled) - 1, -1, -1):
+        if diff > 0:
+            scaled[index] += 1
+            diff -= 1
+        elif diff < 0:
+            removable = min(scaled[index], -diff)
+            scaled[index] -= removable
+            diff += removable
+    return scaled
+
+
+def _reference_reconcile(
+    values: list[int], target: int, eligible: list[int]
+) -> list[int]:
+    clean = [max(0, int(value)) for value in values]
+    if target <= 0:
+        return [0 for _ in clean]
+    total = sum(clean)
+    if total > target:
+        return _reference_normalize(clean, target)
+    if total == target or not eligible:
+        return clean
+    base, extra = divmod(target - total, len(eligible))
+    for offset, index in enumerate(eligible):
+        clean[index] += base + (1 if offset < extra else 0)
+    return clean
+
+
+def test_single_portfolio_kernels_match_list_implementations() -> None:
+    rng = random.Random(7)
+    for _ in range(300):
+        values = [rng.randint(0, 120) for _ in range(rng.randint(0, 40))]
+        assert h_index(values) == _reference_h_index(values)
+        assert g_index(values) == _reference_g_index(values)
+        assert gini_coefficient(values) == _reference_gini(values)
+        floats = [rng.random() * 25 for _ in range(len(values))]
+        assert gini_coefficient(floats) == _reference_gini(floats)
+
+    assert h_index([]) == 0
+    assert h_index([None, -3, 5, 5.9]) == 2
+    assert gini_coefficient(["4", None, "bad", 4]) == 0.0
+
+
+def test_column_kernels_compute_every_month_in_one_call() -> None:
+    rng = random.Random(11)
+    matrix = np.asarray(
+        [[rng.randint(0, 60) for _ in range(12)] for _ in range(25)], dtype=np.int64
+    )
+
+    h_values = h_index_by_column(matrix)
+    shares = top_share_pct_by_column(matrix, top=3)
+
+    for column in range(12):
+        month = matrix[:, column].tolist()
+        ranked = sorted(month, reverse=True)
+        assert int(h_values[column]) == _reference_h_index(month)
+        assert round(float(shares[column]), 2) == round(
+            (sum(ranked[:3]) / sum(ranked)) * 100.0, 2
+        )
+    assert h_index_by_column(np.zeros((0, 12))).tolist() == [0] * 12
+
+
+def test_rolling_sums_and_row_reconciliation_match_list_implementations() -> None:
+    rng = random.Random(3)
+    series = [rng.randint(0, 30) for _ in range(24)]
+    assert rolling_sums(series, 12).tolist() == [
+        sum(series[max(0, index - 11) : index + 1]) for index in range(24)
+    ]
+
+    rows = [[rng.randint(0, 40) for _ in range(18)] for _ in range(200)]
+    targets = [rng.randint(0, 700) for _ in rows]
+    eligible = np.asarray(
+        [[rng.random() < 0.6 for _ in range(18)] for _ in rows], dtype=bool
+    )
+
+    normalized = normalize_rows_to_totals(rows, targets)
+    reconciled = reconcile_rows_to_totals(rows, targets, eligible=eligible)
+
+    for index, row in enumerate(rows):
+        assert normalized[index].tolist() == _reference_normalize(row, targets[index])
+        assert reconciled[index].tolist() == _reference_reconcile(
+            row, targets[index], np.nonzero(eligible[index])[0].tolist()
+        )
+
+
+def test_spread_yearly_counts_prorates_current_year_to_now() -> None:
+    now = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    month_starts = [
+        datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(days=31 * index)
+        for index in range(16)
+    ]
+    month_starts = [point.replace(day=1) for point in month_starts]
+
+    spread = spread_yearly_counts([{2025: 365, 2026: 90}, {}], month_starts, now=now)
+
+    assert spread.shape == (2, 16)
+    assert spread[0, :12].tolist() == [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    assert spread[0, 12:15].tolist() == [31, 28, 31]
+    assert int(spread[0, 15]) == 0
+    assert spread[1].tolist() == [0] * 16
+
+
+def test_citation_indices_for_portfolios_batches_users() -> None:
+    portfolios = {
+        "empty": [],
+        "small": [3, 0, 1],
+        "large": [50, 40, 12, 10, 9, 4, 4, 1, 0, 0, 0],
+    }
+
+    results = citation_indices_for_portfolios(portfolios)
+
+    assert results["empty"].works == 0
+    assert results["empty"].h_index == 0
+    assert results["empty"].gini_coefficient == 0.0
+    for key, values in portfolios.items():
+        assert results[key].works == len(values)
+        assert results[key].total_citations == sum(values)
+        assert results[key].h_index == _reference_h_index(values)
+        assert results[key].g_index == _reference_g_index(values)
+        assert results[key].i10_index == sum(1 for value in values if value >= 10)
+        assert results[key].gini_coefficient == _reference_gini(values)
+
+
+def test_admin_user_list_includes_citation_summary(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    with session_scope() as session:
+        author = User(email="author@example.com", password_hash="x", name="Author")
+        reader = User(email="reader@example.com", password_hash="x", name="Reader")
+        session.add_all([author, reader])
+        session.flush()
+        for index, citations in enumerate([12, 7, 3, 0]):
+            session.add(
+                Work(
+                    user_id=author.id,
+                    title=f"Work {index}",
+                    title_lower=f"work {index}",
+                    citations_total=citations,
+                )
+            )
+        author_id = str(author.id)
+        reader_id = str(reader.id)
+
+    items = {item["id"]: item for item in list_admin_users()["items"]}
+
+    assert items[author_id]["works_count"] == 4
+    assert items[author_id]["citations_total"] == 22
+    assert items[author_id]["h_index"] == 3
+    assert items[reader_id]["works_count"] == 0
+    assert items[reader_id]["h_index"] == 0
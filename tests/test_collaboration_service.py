@@ -6,10 +6,15 @@ import research_os.services.collaboration_service as collaboration_service
 from sqlalchemy import func, select
 
 from research_os.db import (
+    Author,
+    BackgroundJob,
     Collaborator,
+    CollaborationLandingCache,
+    CollaborationLandingRow,
     CollaborationMetric,
     User,
     Work,
+    WorkAuthorship,
     create_all_tables,
     reset_database_state,
     session_scope,
@@ -17,11 +22,15 @@ from research_os.db import (
 from research_os.services.collaboration_service import (
     CollaborationNotFoundError,
     CollaborationValidationError,
+    compute_collaboration_metrics,
     create_collaborator_for_user,
+    delete_collaborator_for_user,
     enqueue_collaboration_metrics_recompute,
+    get_collaboration_landing_for_user,
     get_collaboration_metrics_summary,
     get_collaborator_for_user,
     import_collaborators_from_openalex,
+    list_collaborator_shared_works_for_user,
     list_collaborators_for_user,
     run_collaboration_metrics_scheduler_tick,
     update_collaborator_for_user,
@@ -793,25 +802,20 @@ def test_lock_prevents_duplicate_enqueue(monkeypatch, tmp_path) -> None:
         row.computed_at = datetime.now(timezone.utc) - timedelta(days=2)
         session.flush()
 
-    class _DummyExecutor:
-        def __init__(self) -> None:
-            self.submits = 0
-
-        def submit(self, fn, *args, **kwargs):  # noqa: ANN001
-            self.submits += 1
-            return None
-
-    dummy = _DummyExecutor()
-    monkeypatch.setattr(
-        "research_os.services.collaboration_service._get_executor",
-        lambda: dummy,
-    )
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "external")
     monkeypatch.setenv("COLLAB_ANALYTICS_TTL_SECONDS", "60")
     first = enqueue_collaboration_metrics_recompute(user_id=user_id, force=True)
     second = enqueue_collaboration_metrics_recompute(user_id=user_id, force=True)
     assert first is True
     assert second is False
-    assert dummy.submits == 1
+    with session_scope() as session:
+        queued_jobs = session.scalars(
+            select(BackgroundJob).where(
+                BackgroundJob.kind
+                == collaboration_service.COLLABORATION_METRICS_JOB_KIND
+            )
+        ).all()
+    assert len(queued_jobs) == 1
 
 
 def test_failure_keeps_cached_and_sets_failed(monkeypatch, tmp_path) -> None:
@@ -954,22 +958,22 @@ def test_scheduler_tick_enqueues_due_users(monkeypatch, tmp_path) -> None:
 # ---------------------------------------------------------------------------
 
 def test_parse_name_parts():
-    from research_os.services.collaboration_service import _parse_name_parts
-
-    assert _parse_name_parts("Gareth Matthews") == ("matthews", ["gareth"])
-    assert _parse_name_parts("Gareth J. Matthews") == ("matthews", ["gareth", "j"])
-    assert _parse_name_parts("G. Matthews") == ("matthews", ["g"])
-    assert _parse_name_parts("G. J. Matthews") == ("matthews", ["g", "j"])
-    assert _parse_name_parts("Matthews, Gareth") == ("matthews", ["gareth"])
-    assert _parse_name_parts("Matthews, Gareth James") == ("matthews", ["gareth", "james"])
-    assert _parse_name_parts("") == ("", [])
-    assert _parse_name_parts("Madonna") == ("madonna", [])
+    from research_os.services.collaboration_service import parse_name_parts
+
+    assert parse_name_parts("Gareth Matthews") == ("matthews", ["gareth"])
+    assert parse_name_parts("Gareth J. Matthews") == ("matthews", ["gareth", "j"])
+    assert parse_name_parts("G. Matthews") == ("matthews", ["g"])
+    assert parse_name_parts("G. J. Matthews") == ("matthews", ["g", "j"])
+    assert parse_name_parts("Matthews, Gareth") == ("matthews", ["gareth"])
+    assert parse_name_parts("Matthews, Gareth James") == ("matthews", ["gareth", "james"])
+    assert parse_name_parts("") == ("", [])
+    assert parse_name_parts("Madonna") == ("madonna", [])
     # Compound surnames with particles
-    assert _parse_name_parts("Rob J. van der Geest") == ("van der geest", ["rob", "j"])
-    assert _parse_name_parts("van der Geest R") == ("van der geest", ["r"])
-    assert _parse_name_parts("van der Geest, R.") == ("van der geest", ["r"])
-    assert _parse_name_parts("Maria de la Cruz") == ("de la cruz", ["maria"])
-    assert _parse_name_parts("de la Cruz M") == ("de la cruz", ["m"])
+    assert parse_name_parts("Rob J. van der Geest") == ("van der geest", ["rob", "j"])
+    assert parse_name_parts("van der Geest R") == ("van der geest", ["r"])
+    assert parse_name_parts("van der Geest, R.") == ("van der geest", ["r"])
+    assert parse_name_parts("Maria de la Cruz") == ("de la cruz", ["maria"])
+    assert parse_name_parts("de la Cruz M") == ("de la cruz", ["m"])
 
 
 def test_name_initial_compatible_positive():
@@ -1220,3 +1224,160 @@ def test_no_institution_does_not_merge_different_full_first_names(monkeypatch, t
         f"Expected 2 separate collaborators but got {result['total']}: "
         + ", ".join(item["full_name"] for item in result["items"])
     )
+
+
+def _landing_rows_computed_at(user_id: str) -> dict[str, datetime]:
+    with session_scope() as session:
+        rows = session.scalars(
+            select(CollaborationLandingRow).where(
+                CollaborationLandingRow.owner_user_id == user_id
+            )
+        ).all()
+        return {str(row.collaborator_id): row.computed_at for row in rows}
+
+
+def test_landing_rows_page_in_sql_and_refresh_only_touched_groups(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user(email="landing-rows@example.com")
+    monkeypatch.setattr(
+        "research_os.services.collaboration_service.enqueue_collaboration_metrics_recompute",
+        lambda **_: True,
+    )
+    created = {
+        name: create_collaborator_for_user(
+            user_id=user_id,
+            payload={"full_name": name, "primary_institution": institution},
+        )
+        for name, institution in (
+            ("Chloe Park", "University of Oxford"),
+            ("Alice Swift", "University of Leeds"),
+            ("Gareth Matthews", "Norfolk and Norwich University Hospitals"),
+            ("Brian Cole", "Imperial College London"),
+        )
+    }
+
+    first_page = list_collaborators_for_user(user_id=user_id, page=1, page_size=3)
+    second_page = list_collaborators_for_user(user_id=user_id, page=2, page_size=3)
+    assert first_page["total"] == 4
+    assert first_page["has_more"] is True
+    assert [item["full_name"] for item in first_page["items"]] == [
+        "Alice Swift",
+        "Brian Cole",
+        "Chloe Park",
+    ]
+    assert [item["full_name"] for item in second_page["items"]] == [
+        "Gareth Matthews"
+    ]
+    assert second_page["has_more"] is False
+    searched = list_collaborators_for_user(user_id=user_id, query="  LEEDS ")
+    assert [item["full_name"] for item in searched["items"]] == ["Alice Swift"]
+    assert list_collaborators_for_user(user_id=user_id, query="50%")["total"] == 0
+
+    # A record written outside the CRUD hooks (e.g. an import) is picked up by
+    # the next incremental refresh and merged into the group it links to.
+    with session_scope() as session:
+        session.add(
+            Collaborator(
+                owner_user_id=user_id,
+                full_name="Gareth J. Matthews",
+                full_name_lower="gareth j. matthews",
+                primary_institution="Norfolk and Norwich University Hospitals",
+                research_domains=[],
+            )
+        )
+    before = _landing_rows_computed_at(user_id)
+    update_collaborator_for_user(
+        user_id=user_id,
+        collaborator_id=created["Brian Cole"]["id"],
+        payload={"full_name": "Brian Coleman"},
+    )
+    after = _landing_rows_computed_at(user_id)
+    for name in ("Alice Swift", "Chloe Park"):
+        assert after[created[name]["id"]] == before[created[name]["id"]]
+
+    listing = list_collaborators_for_user(user_id=user_id, sort="name")
+    assert listing["total"] == 4
+    names = [item["full_name"] for item in listing["items"]]
+    assert "Brian Coleman" in names
+    matthews = next(
+        item for item in listing["items"] if "Matthews" in item["full_name"]
+    )
+    assert matthews["duplicate_count"] == 2
+
+    delete_collaborator_for_user(
+        user_id=user_id,
+        collaborator_id=created["Gareth Matthews"]["id"],
+    )
+    landing = get_collaboration_landing_for_user(user_id=user_id)
+    assert landing["summary"]["total_collaborators"] == 4
+    matthews = next(
+        item
+        for item in landing["listing"]["items"]
+        if "Matthews" in item["full_name"]
+    )
+    assert matthews["full_name"] == "Gareth J. Matthews"
+    assert matthews["duplicate_count"] == 1
+
+
+def test_landing_shared_works_are_stored_per_collaborator(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user(email="landing-shared-works@example.com")
+    with session_scope() as session:
+        alice = Collaborator(
+            owner_user_id=user_id,
+            full_name="Alice Swift",
+            full_name_lower="alice swift",
+            primary_institution="University of Leeds",
+            research_domains=[],
+        )
+        brian = Collaborator(
+            owner_user_id=user_id,
+            full_name="Brian Cole",
+            full_name_lower="brian cole",
+            primary_institution="Imperial College London",
+            research_domains=[],
+        )
+        author = Author(canonical_name="Alice Swift", canonical_name_lower="alice swift")
+        older = Work(user_id=user_id, title="Older trial", title_lower="older trial", year=2019)
+        newer = Work(user_id=user_id, title="Newer cohort", title_lower="newer cohort", year=2024)
+        session.add_all([alice, brian, author, older, newer])
+        session.flush()
+        session.add_all(
+            [
+                WorkAuthorship(work_id=older.id, author_id=author.id, is_user=False),
+                WorkAuthorship(work_id=newer.id, author_id=author.id, is_user=False),
+            ]
+        )
+        # Caches written before the landing rows existed are rebuilt on read.
+        session.add(
+            CollaborationLandingCache(
+                owner_user_id=user_id,
+                payload_json={"summary": {}, "listing": {"items": []}},
+            )
+        )
+        alice_id, brian_id = str(alice.id), str(brian.id)
+
+    assert list_collaborators_for_user(user_id=user_id)["total"] == 2
+    compute_collaboration_metrics(user_id=user_id)
+
+    landing = get_collaboration_landing_for_user(
+        user_id=user_id,
+        sort="coauthored",
+        page_size=1,
+        include_shared_works=True,
+    )
+    assert [item["id"] for item in landing["listing"]["items"]] == [alice_id]
+    assert landing["listing"]["items"][0]["metrics"]["coauthored_works_count"] == 2
+    assert list(landing["sharedWorksByCollaboratorId"]) == [alice_id]
+    assert [
+        item["title"] for item in landing["sharedWorksByCollaboratorId"][alice_id]
+    ] == ["Newer cohort", "Older trial"]
+    assert list_collaborator_shared_works_for_user(
+        user_id=user_id, collaborator_id=brian_id
+    ) == {"items": []}
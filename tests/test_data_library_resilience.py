@@ -649,3 +649,65 @@ def test_list_library_assets_claims_stale_owner_rows_even_with_other_valid_owner
         refreshed = session.get(DataLibraryAsset, stale_asset_id)
         assert refreshed is not None
         assert str(refreshed.owner_user_id or "") == requesting_user_id
+
+
+def test_list_library_assets_filters_in_sql_and_pages_with_keyset_cursor(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    owner_id = _create_user(email="cursor-owner@example.com", name="Cursor Owner")
+    viewer_id = _create_user(email="cursor-viewer@example.com", name="Vera Viewer")
+    asset_ids = upload_library_assets(
+        files=[
+            ("alpha.csv", "text/csv", b"a\n1\n"),
+            ("bravo.csv", "text/csv", b"b\n2\n"),
+            ("charlie.csv", "text/csv", b"c\n3\n"),
+        ],
+        project_id=None,
+        user_id=owner_id,
+    )
+    shared_asset_id = asset_ids[1]
+    with session_scope() as session:
+        asset = session.get(DataLibraryAsset, shared_asset_id)
+        assert asset is not None
+        # Written directly, so the access index is backfilled on first listing.
+        asset.shared_with_user_ids = [viewer_id]
+        asset.shared_with_roles_json = {viewer_id: "viewer"}
+
+    viewer_payload = list_library_assets(user_id=viewer_id)
+    assert [item["id"] for item in viewer_payload["items"]] == [shared_asset_id]
+    assert viewer_payload["items"][0]["current_user_role"] == "viewer"
+    assert [
+        item["id"]
+        for item in list_library_assets(user_id=viewer_id, ownership="owned")["items"]
+    ] == []
+    assert [
+        item["id"]
+        for item in list_library_assets(user_id=owner_id, ownership="shared_by_me")[
+            "items"
+        ]
+    ] == [shared_asset_id]
+    assert [
+        item["id"]
+        for item in list_library_assets(user_id=owner_id, query="vera")["items"]
+    ] == [shared_asset_id]
+
+    first_page = list_library_assets(
+        user_id=owner_id, sort_by="filename", sort_direction="asc", page_size=2
+    )
+    assert [item["filename"] for item in first_page["items"]] == [
+        "alpha.csv",
+        "bravo.csv",
+    ]
+    assert first_page["total"] == 3
+    assert first_page["has_more"] is True
+    second_page = list_library_assets(
+        user_id=owner_id,
+        sort_by="filename",
+        sort_direction="asc",
+        page_size=2,
+        cursor=first_page["next_cursor"],
+    )
+    assert [item["filename"] for item in second_page["items"]] == ["charlie.csv"]
+    assert second_page["has_more"] is False
+    assert second_page["next_cursor"] is None
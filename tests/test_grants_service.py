@@ -202,7 +202,7 @@ def test_list_openalex_grants_for_person_aggregates_and_enriches(monkeypatch) ->
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -300,7 +300,7 @@ def test_list_openalex_grants_for_person_filters_published_under_with_owner(
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -390,7 +390,7 @@ def test_list_openalex_grants_for_person_does_not_match_first_initial_only(
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -476,7 +476,7 @@ def test_list_openalex_grants_for_person_uses_award_id_fallback_for_details(
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -500,7 +500,7 @@ def test_list_openalex_grants_for_person_returns_empty_when_author_not_found(
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -628,7 +628,7 @@ def test_list_openalex_grants_for_person_includes_external_sources(
     }
 
     monkeypatch.setattr(
-        "research_os.services.grants_service.httpx.Client",
+        "research_os.services.grants_service.provider_client",
         lambda timeout: _FakeClient(responses),
     )
 
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import httpx
+
+import research_os.clients.http_client as http_client
+from research_os.clients.http_client import (
+    get_http_client_stats,
+    provider_client,
+    resolve_provider,
+)
+
+
+def _install_transport(monkeypatch, handler) -> httpx.Client:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "_shared_client", client)
+    http_client.reset_http_client_stats()
+    return client
+
+
+def test_provider_clients_share_one_pool_and_record_host_metrics(monkeypatch) -> None:
+    seen_headers: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("x-test"))
+        return httpx.Response(200, json={"ok": True})
+
+    shared = _install_transport(monkeypatch, _handler)
+    monkeypatch.setenv("HTTP_RATE_LIMIT_OPENALEX_PER_SECOND", "0")
+
+    with provider_client(timeout=5.0, headers={"x-test": "a"}) as client:
+        assert client.get("https://api.openalex.org/works").json() == {"ok": True}
+    with provider_client(timeout=5.0) as client:
+        client.get("https://api.openalex.org/works", headers={"x-test": "b"})
+        client.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi")
+
+    assert http_client._get_shared_client() is shared
+    assert not shared.is_closed
+    assert seen_headers == ["a", "b", None]
+
+    stats = get_http_client_stats()
+    by_host = {row["host"]: row for row in stats["hosts"]}
+    assert by_host["api.openalex.org"]["provider"] == "openalex"
+    assert by_host["api.openalex.org"]["requests"] == 2
+    assert by_host["eutils.ncbi.nlm.nih.gov"]["provider"] == "pubmed"
+    assert by_host["eutils.ncbi.nlm.nih.gov"]["last_status_code"] == 200
+
+
+def test_request_with_retry_honours_retry_after_and_gives_up(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) < 3:
+            return httpx.Response(429, headers={"retry-after": "0"})
+        return httpx.Response(200, text="done")
+
+    _install_transport(monkeypatch, _handler)
+    monkeypatch.setenv("HTTP_RATE_LIMIT_CROSSREF_PER_SECOND", "0")
+
+    response = provider_client().request_with_retry(
+        "GET", "https://api.crossref.org/works", retries=3, backoff_seconds=0
+    )
+    assert response.status_code == 200
+    assert len(calls) == 3
+    (row,) = get_http_client_stats()["hosts"]
+    assert row["retries"] == 2
+    assert row["http_errors"] == 2
+
+    calls.clear()
+    response = provider_client().request_with_retry(
+        "GET", "https://api.crossref.org/works", retries=0, backoff_seconds=0
+    )
+    assert response.status_code == 429
+    assert len(calls) == 1
+
+
+def test_provider_rate_limits_follow_polite_pool_defaults(monkeypatch) -> None:
+    monkeypatch.delenv("HTTP_RATE_LIMIT_OPENALEX_PER_SECOND", raising=False)
+    monkeypatch.delenv("HTTP_RATE_LIMIT_PUBMED_PER_SECOND", raising=False)
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    assert http_client._provider_rate_limit("openalex") == 10.0
+    assert http_client._provider_rate_limit("pubmed") == 3.0
+    monkeypatch.setenv("NCBI_API_KEY", "key")
+    assert http_client._provider_rate_limit("pubmed") == 10.0
+    assert http_client._provider_rate_limit("example.org") == 0.0
+    assert resolve_provider("https://api.openalex.org/works") == (
+        "openalex",
+        "api.openalex.org",
+    )
+
+    limiter = http_client._RateLimiter(20.0)
+    waits = [limiter.acquire() for _ in range(21)]
+    assert all(wait == 0.0 for wait in waits[:20])
+    assert waits[20] > 0.0
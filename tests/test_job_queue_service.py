@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+import research_os.services.job_queue_service as job_queue_service
+from research_os.db import (
+    BackgroundJob,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
+from research_os.services.job_queue_service import (
+    JOB_LANE_BULK,
+    JOB_LANE_INTERACTIVE,
+    JobWorkerPool,
+    enqueue_job,
+    get_job_queue_stats,
+    recover_expired_jobs,
+    register_job_kind,
+)
+
+
+def _set_test_environment(monkeypatch, tmp_path) -> None:
+    db_path = tmp_path / "research_os_test_job_queue.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{db_path}")
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "external")
+    monkeypatch.setenv("JOB_QUEUE_RETRY_BACKOFF_SECONDS", "0")
+    reset_database_state()
+    create_all_tables()
+
+
+def _jobs_for_kind(kind: str) -> list[BackgroundJob]:
+    with session_scope() as session:
+        rows = session.scalars(
+            select(BackgroundJob)
+            .where(BackgroundJob.kind == kind)
+            .order_by(BackgroundJob.enqueued_at.asc())
+        ).all()
+        for row in rows:
+            session.expunge(row)
+        return list(rows)
+
+
+def test_enqueue_dedupes_active_jobs_and_inline_mode_runs_handler(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    seen: list[dict] = []
+    register_job_kind("test.inline", lambda payload: seen.append(payload))
+
+    assert enqueue_job(kind="test.inline", payload={"n": 1}, dedupe_key="u1") is True
+    assert enqueue_job(kind="test.inline", payload={"n": 2}, dedupe_key="u1") is False
+    assert seen == []
+
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "inline")
+    assert enqueue_job(kind="test.inline", payload={"n": 3}, dedupe_key="u2") is True
+    assert seen == [{"n": 3}]
+
+    statuses = sorted(job.status for job in _jobs_for_kind("test.inline"))
+    assert statuses == ["completed", "queued"]
+
+
+def test_active_dedupe_key_is_unique_across_concurrent_enqueues(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    register_job_kind("test.race", lambda payload: None)
+    now = datetime.now(timezone.utc)
+
+    def _raw_job(status: str) -> BackgroundJob:
+        return BackgroundJob(
+            kind="test.race",
+            status=status,
+            dedupe_key="u1",
+            payload_json={},
+            available_at=now,
+            enqueued_at=now,
+        )
+
+    # Another process inserted the active job between our check and insert.
+    with session_scope() as session:
+        session.add(_raw_job("running"))
+    assert enqueue_job(kind="test.race", payload={"n": 1}, dedupe_key="u1") is False
+    with pytest.raises(IntegrityError):
+        with session_scope() as session:
+            session.add(_raw_job("queued"))
+
+    with session_scope() as session:
+        session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.kind == "test.race")
+            .values(status="completed")
+        )
+    assert enqueue_job(kind="test.race", payload={"n": 2}, dedupe_key="u1") is True
+    assert enqueue_job(kind="test.race", payload={"n": 3}) is True
+    assert enqueue_job(kind="test.race", payload={"n": 4}) is True
+    statuses = sorted(job.status for job in _jobs_for_kind("test.race"))
+    assert statuses == ["completed", "queued", "queued", "queued"]
+
+
+def test_worker_pool_respects_per_kind_limits_and_lane_priority(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    register_job_kind("test.limited", lambda payload: None, max_concurrency=1)
+    register_job_kind("test.lanes", lambda payload: None, max_concurrency=4)
+
+    for index in range(3):
+        enqueue_job(kind="test.limited", payload={"n": index})
+    enqueue_job(kind="test.lanes", payload={"lane": "bulk"}, lane=JOB_LANE_BULK)
+    enqueue_job(
+        kind="test.lanes", payload={"lane": "interactive"}, lane=JOB_LANE_INTERACTIVE
+    )
+
+    claimed = job_queue_service._claim_jobs(
+        worker_id="worker-a",
+        kinds=["test.limited", "test.lanes"],
+        slots=10,
+    )
+    claimed_limited = [job for job in claimed if job.kind == "test.limited"]
+    claimed_lanes = [job for job in claimed if job.kind == "test.lanes"]
+    assert len(claimed_limited) == 1
+    assert [job.lane for job in claimed_lanes] == [JOB_LANE_INTERACTIVE, JOB_LANE_BULK]
+
+    # A second worker cannot exceed the global per-kind limit.
+    again = job_queue_service._claim_jobs(
+        worker_id="worker-b", kinds=["test.limited"], slots=10
+    )
+    assert again == []
+
+
+def test_failed_handler_is_retried_until_max_attempts(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    calls: list[int] = []
+
+    def _boom(payload: dict) -> None:
+        calls.append(1)
+        raise RuntimeError("upstream failure")
+
+    register_job_kind("test.retry", _boom, max_attempts=2)
+    enqueue_job(kind="test.retry")
+    pool = JobWorkerPool(kinds={"test.retry"}, max_workers=1)
+    try:
+        for _ in range(2):
+            for job in job_queue_service._claim_jobs(
+                worker_id=pool.worker_id, kinds=["test.retry"], slots=1
+            ):
+                job_queue_service._execute_claimed_job(
+                    worker_id=pool.worker_id, job=job
+                )
+    finally:
+        pool.stop()
+
+    assert len(calls) == 2
+    (job,) = _jobs_for_kind("test.retry")
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert "upstream failure" in str(job.last_error)
+
+
+def test_recover_expired_jobs_requeues_crashed_work(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    register_job_kind("test.recover", lambda payload: None, max_attempts=2)
+    enqueue_job(kind="test.recover")
+    claimed = job_queue_service._claim_jobs(
+        worker_id="crashed-worker", kinds=["test.recover"], slots=1
+    )
+    assert len(claimed) == 1
+
+    with session_scope() as session:
+        row = session.get(BackgroundJob, claimed[0].id)
+        row.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+
+    result = recover_expired_jobs()
+    assert result["requeued"] == 1
+    (job,) = _jobs_for_kind("test.recover")
+    assert job.status == "queued"
+    assert job.worker_id is None
+
+    # The late finish from the crashed worker must not clobber the requeued row.
+    job_queue_service._finish_job(
+        worker_id="crashed-worker", job=claimed[0], error=None
+    )
+    (job,) = _jobs_for_kind("test.recover")
+    assert job.status == "queued"
+
+
+def test_job_queue_stats_report_depth_wait_and_run_time(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    register_job_kind("test.stats", lambda payload: None)
+    enqueue_job(kind="test.stats")
+    enqueue_job(kind="test.stats")
+    for job in job_queue_service._claim_jobs(
+        worker_id="worker-stats", kinds=["test.stats"], slots=1
+    ):
+        job_queue_service._execute_claimed_job(worker_id="worker-stats", job=job)
+
+    stats = get_job_queue_stats()
+    item = next(row for row in stats["kinds"] if row["kind"] == "test.stats")
+    assert item["queued"] == 1
+    assert item["running"] == 0
+    assert item["completed_recent"] == 1
+    assert item["avg_wait_seconds"] is not None
+    assert item["avg_run_seconds"] is not None
+    assert item["oldest_queued_age_seconds"] is not None
+    assert stats["worker_mode"] == "external"
@@ -84,7 +84,7 @@ def test_openalex_provider_matches_with_pmid(monkeypatch) -> None:
         )
     }
     monkeypatch.setattr(
-        "research_os.services.metrics_provider_service.httpx.Client",
+        "research_os.services.metrics_provider_service.provider_client",
         lambda timeout=12.0: _FakeClient(responses),
     )
 
@@ -122,7 +122,7 @@ def test_semantic_scholar_provider_matches_with_pmid(monkeypatch) -> None:
         )
     }
     monkeypatch.setattr(
-        "research_os.services.metrics_provider_service.httpx.Client",
+        "research_os.services.metrics_provider_service.provider_client",
         lambda timeout=12.0: _FakeClient(responses),
     )
 
@@ -157,7 +157,7 @@ def test_semantic_scholar_provider_sends_configured_api_key(monkeypatch) -> None
         )
     }
     monkeypatch.setattr(
-        "research_os.services.metrics_provider_service.httpx.Client",
+        "research_os.services.metrics_provider_service.provider_client",
         lambda timeout=12.0: _FakeClient(responses, captured_headers),
     )
 
@@ -201,7 +201,7 @@ def test_openalex_provider_extracts_abstract_from_inverted_index(monkeypatch) ->
         )
     }
     monkeypatch.setattr(
-        "research_os.services.metrics_provider_service.httpx.Client",
+        "research_os.services.metrics_provider_service.provider_client",
         lambda timeout=12.0: _FakeClient(responses),
     )
 
@@ -233,7 +233,7 @@ def test_semantic_scholar_provider_returns_abstract(monkeypatch) -> None:
         )
     }
     monkeypatch.setattr(
-        "research_os.services.metrics_provider_service.httpx.Client",
+        "research_os.services.metrics_provider_service.provider_client",
         lambda timeout=12.0: _FakeClient(responses),
     )
 
@@ -132,7 +132,7 @@ def test_open_access_discovery_uploads_pdf_and_reuses_existing_asset(
         ),
     }
     monkeypatch.setattr(
-        "research_os.services.open_access_service.httpx.Client",
+        "research_os.services.open_access_service.provider_client",
         lambda timeout=20.0, follow_redirects=True: _FakeClient(responses),
     )
 
@@ -177,7 +177,7 @@ def test_open_access_discovery_returns_no_match_when_lookup_fails(
         )
     }
     monkeypatch.setattr(
-        "research_os.services.open_access_service.httpx.Client",
+        "research_os.services.open_access_service.provider_client",
         lambda timeout=20.0, follow_redirects=True: _FakeClient(responses),
     )
 
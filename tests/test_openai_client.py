@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import research_os.clients.openai_client as openai_client
+from research_os.clients.openai_client import (
+    create_response,
+    get_client,
+    run_llm_calls_concurrently,
+)
+
+
+def test_get_client_is_reused_until_the_api_key_changes(monkeypatch) -> None:
+    monkeypatch.setattr(openai_client, "_shared_client", None)
+    monkeypatch.setattr(openai_client, "_shared_client_key", None)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-one")
+    first = get_client()
+    assert get_client() is first
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-two")
+    second = get_client()
+    assert second is not first
+    assert get_client() is second
+    openai_client.close_openai_client()
+
+
+def test_concurrent_llm_calls_overlap_within_the_global_cap(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_MAX_CONCURRENT_REQUESTS", "2")
+    monkeypatch.setenv("OPENAI_TOKENS_PER_MINUTE", "0")
+    monkeypatch.setattr(openai_client, "_token_budgets", {})
+    monkeypatch.setattr(openai_client, "record_api_usage_event", lambda **kwargs: None)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def _create(**kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return SimpleNamespace(output_text=kwargs["input"], usage=None)
+
+    fake_client = SimpleNamespace(responses=SimpleNamespace(create=_create))
+    monkeypatch.setattr(openai_client, "get_client", lambda: fake_client)
+
+    calls = [
+        (lambda index=index: create_response(model="m", input=f"t{index}").output_text)
+        for index in range(6)
+    ]
+    started = time.perf_counter()
+    results = run_llm_calls_concurrently(calls)
+    elapsed = time.perf_counter() - started
+
+    assert results == [f"t{index}" for index in range(6)]
+    assert active["peak"] == 2
+    assert elapsed < 0.05 * 6
+
+
+def test_model_token_budget_delays_calls_beyond_the_minute_allowance(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_TOKENS_PER_MINUTE_GPT_TEST", "6000")
+    monkeypatch.setattr(openai_client, "_token_budgets", {})
+    budget = openai_client._get_token_budget("gpt-test")
+    assert budget is not None
+    assert openai_client._get_token_budget("other-model") is None
+
+    assert budget.acquire(5990) == 0.0
+    waited = budget.acquire(20)
+    assert 0.05 < waited < 1.0
+    budget.adjust(-6000)
+    assert budget.acquire(6000) == 0.0
+
+
+def test_stream_response_yields_deltas_and_records_usage_on_completion(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_TOKENS_PER_MINUTE", "0")
+    monkeypatch.setattr(openai_client, "_token_budgets", {})
+    recorded: list[dict] = []
+    monkeypatch.setattr(
+        openai_client, "record_api_usage_event", lambda **kwargs: recorded.append(kwargs)
+    )
+    usage = SimpleNamespace(input_tokens=12, output_tokens=3)
+    events = [
+        SimpleNamespace(type="response.created"),
+        SimpleNamespace(type="response.output_text.delta", delta="Hel"),
+        SimpleNamespace(type="response.output_text.delta", delta="lo"),
+        SimpleNamespace(type="response.completed", response=SimpleNamespace(usage=usage)),
+    ]
+    requests: list[dict] = []
+
+    def _create(**kwargs):
+        requests.append(kwargs)
+        return iter(events)
+
+    fake_client = SimpleNamespace(responses=SimpleNamespace(create=_create))
+    monkeypatch.setattr(openai_client, "get_client", lambda: fake_client)
+
+    stream = openai_client.ask_gpt_stream("Say hello", model="m")
+    assert next(stream) == "Hel"
+    assert recorded == []
+    assert list(stream) == ["lo"]
+
+    assert requests[0]["stream"] is True
+    assert len(recorded) == 1
+    assert recorded[0]["operation"] == "responses.stream"
+    assert recorded[0]["success"] is True
+    assert recorded[0]["tokens_input"] == 12
+    assert recorded[0]["tokens_output"] == 3
+    assert "first_token_ms" in recorded[0]["metadata"]
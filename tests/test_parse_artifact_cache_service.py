@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+
+import research_os.services.publication_console_service as publication_console_service
+from research_os.services.parse_artifact_cache_service import (
+    cached_parse_artifact,
+    get_parse_cache_stats,
+    parse_artifact_scope,
+    reset_parse_cache_stats,
+)
+
+
+def _set_test_environment(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("PUBLICATION_PARSE_CACHE_ROOT", str(tmp_path / "parse-cache"))
+    monkeypatch.delenv("PUBLICATION_PARSE_CACHE_ENABLED", raising=False)
+    reset_parse_cache_stats()
+
+
+def test_cached_parse_artifact_is_shared_by_pdf_bytes_and_parser_version(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    calls: list[str] = []
+
+    def _build(label: str):
+        def _inner() -> dict[str, str]:
+            calls.append(label)
+            return {"label": label}
+
+        return _inner
+
+    pdf = b"%PDF-1.7 shared open access copy"
+    assert cached_parse_artifact(artifact="tei", content=pdf, build=_build("a")) == {
+        "label": "a"
+    }
+    assert calls == ["a"]
+
+    with parse_artifact_scope(parser_version="v1"):
+        first = cached_parse_artifact(artifact="tei", content=pdf, build=_build("b"))
+        second = cached_parse_artifact(
+            artifact="tei", content=bytes(pdf), build=_build("c")
+        )
+        other_variant = cached_parse_artifact(
+            artifact="tei", content=pdf, variant={"coords": "p"}, build=_build("d")
+        )
+    with parse_artifact_scope(parser_version="v2"):
+        bumped = cached_parse_artifact(artifact="tei", content=pdf, build=_build("e"))
+
+    assert first == second == {"label": "b"}
+    assert other_variant == {"label": "d"}
+    assert bumped == {"label": "e"}
+    assert calls == ["a", "b", "d", "e"]
+    assert get_parse_cache_stats()["hits"] == 1
+
+    with parse_artifact_scope(parser_version="v1", refresh=True):
+        refreshed = cached_parse_artifact(artifact="tei", content=pdf, build=_build("f"))
+    with parse_artifact_scope(parser_version="v1"):
+        reread = cached_parse_artifact(artifact="tei", content=pdf, build=_build("g"))
+
+    assert refreshed == reread == {"label": "f"}
+    assert calls == ["a", "b", "d", "e", "f"]
+
+
+def test_cached_parse_artifact_skips_empty_results_and_evicts_lru(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv("PUBLICATION_PARSE_CACHE_MAX_MB", "16")
+    calls: list[int] = []
+
+    def _empty() -> list[dict]:
+        calls.append(1)
+        return []
+
+    with parse_artifact_scope(parser_version="v1"):
+        for _ in range(2):
+            cached_parse_artifact(
+                artifact="tables", content=b"pdf", build=_empty, skip_empty=True
+            )
+        assert len(calls) == 2
+
+        blob = "x" * (6 * 1024 * 1024)
+        for index in range(3):
+            cached_parse_artifact(
+                artifact="tei", content=f"pdf-{index}".encode(), build=lambda: blob
+            )
+            if index == 1:
+                # Touch the first entry so the second becomes least recently used.
+                cached_parse_artifact(
+                    artifact="tei", content=b"pdf-0", build=lambda: "rebuilt"
+                )
+
+    stats = get_parse_cache_stats()
+    assert stats["evictions"] >= 1
+    remaining = sum(len(files) for _, _, files in os.walk(tmp_path / "parse-cache"))
+    assert remaining == 2
+    with parse_artifact_scope(parser_version="v1"):
+        assert (
+            cached_parse_artifact(artifact="tei", content=b"pdf-0", build=lambda: "")
+            == blob
+        )
+
+
+def test_structured_paper_stages_reuse_cached_grobid_tei(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    requests: list[str] = []
+
+    def _fake_request(**kwargs) -> str:
+        requests.append(kwargs["tei_coordinates"])
+        return "<TEI/>"
+
+    monkeypatch.setattr(
+        publication_console_service,
+        "_request_grobid_fulltext_tei_uncached",
+        _fake_request,
+    )
+    with parse_artifact_scope(parser_version="v1"):
+        for _ in range(2):
+            publication_console_service._request_grobid_fulltext_tei(
+                content=b"%PDF-1.7", file_name="a.pdf"
+            )
+        publication_console_service._request_grobid_fulltext_tei(
+            content=b"%PDF-1.7",
+            file_name="b.pdf",
+            tei_coordinates="head,p,s,ref,biblStruct",
+            include_raw_affiliations=False,
+        )
+
+    assert requests == [
+        "head,p,s,ref,biblStruct,formula,figure,table",
+        "head,p,s,ref,biblStruct",
+    ]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import operator
+import os
+
+import research_os.services.parse_worker_pool_service as parse_worker_pool_service
+from research_os.services.parse_worker_pool_service import (
+    map_parse_tasks,
+    parse_process_scope,
+    run_parse_task,
+    shutdown_parse_process_pool,
+)
+
+
+def test_parse_tasks_run_inline_outside_scope_or_when_disabled(monkeypatch) -> None:
+    monkeypatch.setenv("PUB_PARSE_PROCESS_WORKERS", "2")
+    assert run_parse_task(os.getpid) == os.getpid()
+    assert parse_worker_pool_service._pool is None
+
+    monkeypatch.setenv("PUB_PARSE_PROCESS_WORKERS", "0")
+    with parse_process_scope():
+        assert map_parse_tasks(operator.mul, [(2, 3), (4, 5)]) == [6, 20]
+        assert run_parse_task(os.getpid) == os.getpid()
+    assert parse_worker_pool_service._pool is None
+
+
+def test_parse_tasks_fan_out_to_worker_processes_in_order(monkeypatch) -> None:
+    monkeypatch.setenv("PUB_PARSE_PROCESS_WORKERS", "2")
+    try:
+        with parse_process_scope():
+            assert map_parse_tasks(
+                operator.mul, [(index, 2) for index in range(6)]
+            ) == [
+                0,
+                2,
+                4,
+                6,
+                8,
+                10,
+            ]
+            assert run_parse_task(os.getpid) != os.getpid()
+    finally:
+        shutdown_parse_process_pool()
+    assert parse_worker_pool_service._pool is None
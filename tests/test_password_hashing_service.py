@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+import research_os.services.password_hashing_service as password_hashing_service
+from research_os.services.password_hashing_service import (
+    PasswordHashingOverloadedError,
+    hash_password_offloaded,
+    shutdown_password_hash_pool,
+    verify_password_offloaded,
+)
+
+
+def test_password_hashing_rejects_instead_of_queueing_when_saturated(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("AUTH_PASSWORD_HASH_WORKERS", "0")
+    monkeypatch.setenv("AUTH_PASSWORD_HASH_MAX_PENDING", "1")
+    stored_hash = hash_password_offloaded("StrongPassword123")
+
+    with password_hashing_service._password_hash_slot():
+        with pytest.raises(PasswordHashingOverloadedError):
+            verify_password_offloaded("StrongPassword123", stored_hash)
+
+    assert verify_password_offloaded("StrongPassword123", stored_hash) is True
+    assert password_hashing_service._pending == 0
+    assert password_hashing_service._pool is None
+
+
+def test_password_hashing_runs_in_worker_processes(monkeypatch) -> None:
+    monkeypatch.setenv("AUTH_PASSWORD_HASH_WORKERS", "1")
+    try:
+        stored_hash = hash_password_offloaded("StrongPassword123")
+        assert password_hashing_service._pool is not None
+        assert verify_password_offloaded("StrongPassword123", stored_hash) is True
+        assert verify_password_offloaded("WrongPassword123", stored_hash) is False
+    finally:
+        shutdown_password_hash_pool()
+    assert password_hashing_service._pool is None
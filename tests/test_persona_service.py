@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+import hashlib
+import math
 
+from sqlalchemy import event, func, select
+
+import research_os.services.persona_service as persona_service
 from research_os.db import (
+    Embedding,
     JournalProfile,
     MetricsSnapshot,
     User,
     Work,
+    WorkAuthorship,
     create_all_tables,
+    get_engine,
     reset_database_state,
     session_scope,
 )
 from research_os.services.persona_service import (
+    find_similar_works,
+    generate_embeddings,
     list_journals,
     list_works,
     sync_metrics,
     upsert_work,
+    upsert_works,
 )
 
 
@@ -903,3 +913,210 @@ def test_sync_metrics_reuses_pending_journal_profile_for_shared_source(
             )
         ).all()
         assert len(profiles) == 1
+
+
+def _seed_user_with_titles(*, email: str, titles: list[str]) -> tuple[str, list[str]]:
+    with session_scope() as session:
+        user = User(email=email, password_hash="test-hash", name="Embedding User")
+        session.add(user)
+        session.flush()
+        work_ids: list[str] = []
+        for title in titles:
+            work = Work(
+                user_id=user.id,
+                title=title,
+                title_lower=title.lower(),
+                year=2024,
+                work_type="journal-article",
+                venue_name="Journal",
+                publisher="Publisher",
+                url="https://example.org",
+                provenance="manual",
+            )
+            session.add(work)
+            session.flush()
+            work_ids.append(str(work.id))
+        return str(user.id), work_ids
+
+
+def test_generate_embeddings_batches_requests_and_stores_float32_blobs(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv("PERSONA_EMBEDDING_BATCH_SIZE", "2")
+    create_all_tables()
+    user_id, work_ids = _seed_user_with_titles(
+        email="embeddings-batch@example.com",
+        titles=["Cardiac imaging", "Cardiac outcomes", "Renal outcomes"],
+    )
+    batches: list[list[str]] = []
+
+    class _Item:
+        def __init__(self, index: int, embedding: list[float]) -> None:
+            self.index = index
+            self.embedding = embedding
+
+    class _Embeddings:
+        def create(self, *, model: str, input: list[str]):
+            batches.append(list(input))
+            data = [_Item(i, [float(i + 1), 0.5, 0.25]) for i in range(len(input))]
+
+            class _Response:
+                pass
+
+            response = _Response()
+            response.data = list(reversed(data))
+            return response
+
+    class _Client:
+        embeddings = _Embeddings()
+
+    monkeypatch.setattr(persona_service, "get_client", lambda: _Client())
+
+    payload = generate_embeddings(user_id=user_id, model_name="test-embedding")
+
+    assert payload["generated_embeddings"] == 3
+    assert payload["model_name"] == "test-embedding"
+    assert [len(batch) for batch in batches] == [2, 1]
+    with session_scope() as session:
+        rows = session.scalars(select(Embedding)).all()
+        assert len(rows) == 3
+        for row in rows:
+            assert row.embedding_vector == []
+            assert row.dimensions == 3
+            assert len(row.embedding_blob) == 3 * 4
+
+    generate_embeddings(user_id=user_id, model_name="test-embedding")
+    with session_scope() as session:
+        assert len(session.scalars(select(Embedding)).all()) == 3
+
+
+def test_find_similar_works_ranks_by_cosine_similarity(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id, work_ids = _seed_user_with_titles(
+        email="embeddings-similar@example.com",
+        titles=[
+            "Cardiac magnetic resonance imaging outcomes",
+            "Cardiac magnetic resonance imaging in heart failure",
+            "Soil microbiome diversity",
+        ],
+    )
+
+    def _no_client():
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(persona_service, "get_client", _no_client)
+    payload = generate_embeddings(user_id=user_id)
+    assert payload["model_name"] == "local-hash-1"
+
+    similar = find_similar_works(user_id=user_id, work_id=work_ids[0], limit=5)
+    assert similar["model_name"] == "local-hash-1"
+    assert [item["work_id"] for item in similar["items"]] == [
+        work_ids[1],
+        work_ids[2],
+    ]
+    assert similar["items"][0]["score"] > similar["items"][1]["score"]
+
+    with session_scope() as session:
+        legacy = session.scalars(
+            select(Embedding).where(Embedding.work_id == work_ids[2])
+        ).one()
+        legacy.embedding_vector = persona_service._embedding_array(legacy).tolist()
+        legacy.embedding_blob = None
+    persona_service.invalidate_work_embedding_index(user_id=user_id)
+    reread = find_similar_works(user_id=user_id, work_id=work_ids[0], limit=5)
+    assert [item["work_id"] for item in reread["items"]] == [work_ids[1], work_ids[2]]
+
+
+def test_local_embeddings_match_per_token_local_hash_vectors() -> None:
+    def _reference(text: str, size: int = 96) -> list[float]:
+        vector = [0.0] * size
+        for token in persona_service.TOKEN_PATTERN.findall(text):
+            digest = hashlib.sha256(token.lower().encode("utf-8")).digest()
+            for index in range(size):
+                vector[index] += digest[index % len(digest)] / 255.0
+        norm = math.sqrt(sum(value * value for value in vector))
+        return vector if norm == 0 else [value / norm for value in vector]
+
+    texts = [
+        "Cardiac MRI strain in heart failure",
+        "heart HEART failure, failure; outcomes",
+        "",
+        "Deep learning for 4D-flow MRI",
+    ]
+    vectors = persona_service._local_embeddings(texts)
+    assert vectors.shape == (4, 96)
+    assert vectors.tolist() == [_reference(text) for text in texts]
+    assert persona_service._local_embedding(texts[0]) == _reference(texts[0])
+
+
+def test_upsert_works_resolves_batch_with_set_based_queries(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+
+    with session_scope() as session:
+        user = User(
+            email="persona-batch-upsert@example.com",
+            password_hash="test-hash",
+            name="Batch User",
+        )
+        session.add(user)
+        session.flush()
+        user_id = str(user.id)
+
+    def _payload(index: int, *, authors: list[str]) -> dict[str, object]:
+        return {
+            "title": f"Batch work {index}",
+            "year": 2020,
+            "doi": f"10.1000/batch-{index}",
+            "work_type": "journal-article",
+            "venue_name": "Heart",
+            "authors": [{"name": name, "orcid_id": ""} for name in authors],
+        }
+
+    works = [
+        _payload(index, authors=["Batch User", f"Coauthor {index}", "Shared Author"])
+        for index in range(40)
+    ]
+    works.append(dict(works[0], title="Batch work 0 (corrected)"))
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(get_engine(), "before_cursor_execute", _count)
+    try:
+        with session_scope() as session:
+            records = upsert_works(
+                user_id=user_id, works=works, provenance="orcid", session=session
+            )
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", _count)
+
+    assert len(records) == 41
+    assert records[-1]["id"] == records[0]["id"]
+    assert records[0]["title"] == "Batch work 0"
+    assert records[-1]["title"] == "Batch work 0 (corrected)"
+    assert len(statements) < 15
+
+    works[1] = _payload(1, authors=["Shared Author", "Batch User"])
+    with session_scope() as session:
+        upsert_works(
+            user_id=user_id, works=works[:2], provenance="orcid", session=session
+        )
+        links = session.scalars(
+            select(WorkAuthorship)
+            .where(WorkAuthorship.work_id == records[1]["id"])
+            .order_by(WorkAuthorship.author_order)
+        ).all()
+        assert [(link.author.canonical_name, link.is_user) for link in links] == [
+            ("Shared Author", False),
+            ("Batch User", True),
+        ]
+        assert (
+            session.scalar(select(func.count(Work.id)).where(Work.user_id == user_id))
+            == 40
+        )
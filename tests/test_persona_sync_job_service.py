@@ -66,7 +66,7 @@ def test_enqueue_metrics_sync_job_completes_and_stores_result(
         },
     )
     monkeypatch.setattr(
-        "research_os.services.persona_sync_job_service._start_persona_sync_thread",
+        "research_os.services.persona_sync_job_service._dispatch_persona_sync_job",
         lambda job_id: job_service._run_persona_sync_job(job_id),
     )
 
@@ -93,7 +93,7 @@ def test_enqueue_persona_sync_job_conflicts_when_active_job_exists(
 
     # Keep first job queued to simulate an active in-flight job.
     monkeypatch.setattr(
-        "research_os.services.persona_sync_job_service._start_persona_sync_thread",
+        "research_os.services.persona_sync_job_service._dispatch_persona_sync_job",
         lambda job_id: None,
     )
 
@@ -134,7 +134,7 @@ def test_enqueue_persona_sync_job_expires_stale_running_job(
         stale_job_id = str(stale_job.id)
 
     monkeypatch.setattr(
-        "research_os.services.persona_sync_job_service._start_persona_sync_thread",
+        "research_os.services.persona_sync_job_service._dispatch_persona_sync_job",
         lambda job_id: None,
     )
 
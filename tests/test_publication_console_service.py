@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 from io import BytesIO
 import tarfile
@@ -26,6 +27,7 @@ from research_os.db import (
     reset_database_state,
     session_scope,
 )
+from research_os.services.job_queue_service import registered_job_kinds
 
 
 def _set_test_environment(monkeypatch, tmp_path) -> None:
@@ -176,8 +178,13 @@ def test_publication_paper_model_endpoint_returns_structured_reader_payload(
     _set_test_environment(monkeypatch, tmp_path)
     create_all_tables()
 
-    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, fn):  # noqa: ANN001
-        fn(user_id=user_id, publication_id=publication_id)
+    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, options=None):  # noqa: ANN001
+        publication_console_service._run_background_job(
+            kind=kind,
+            user_id=user_id,
+            publication_id=publication_id,
+            options=options,
+        )
         return True
 
     monkeypatch.setattr(
@@ -1930,8 +1937,13 @@ def test_publication_paper_model_endpoint_fails_when_grobid_is_unavailable(
     _set_test_environment(monkeypatch, tmp_path)
     create_all_tables()
 
-    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, fn):  # noqa: ANN001
-        fn(user_id=user_id, publication_id=publication_id)
+    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, options=None):  # noqa: ANN001
+        publication_console_service._run_background_job(
+            kind=kind,
+            user_id=user_id,
+            publication_id=publication_id,
+            options=options,
+        )
         return True
 
     monkeypatch.setattr(
@@ -5379,8 +5391,13 @@ def test_publication_paper_model_auto_links_oa_pdf_for_reader(
     _set_test_environment(monkeypatch, tmp_path)
     create_all_tables()
 
-    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, fn):  # noqa: ANN001
-        fn(user_id=user_id, publication_id=publication_id)
+    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, options=None):  # noqa: ANN001
+        publication_console_service._run_background_job(
+            kind=kind,
+            user_id=user_id,
+            publication_id=publication_id,
+            options=options,
+        )
         return True
 
     monkeypatch.setattr(
@@ -5504,8 +5521,13 @@ def test_publication_paper_model_auto_links_oa_pdf_when_only_non_pdf_files_exist
     _set_test_environment(monkeypatch, tmp_path)
     create_all_tables()
 
-    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, fn):  # noqa: ANN001
-        fn(user_id=user_id, publication_id=publication_id)
+    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, options=None):  # noqa: ANN001
+        publication_console_service._run_background_job(
+            kind=kind,
+            user_id=user_id,
+            publication_id=publication_id,
+            options=options,
+        )
         return True
 
     monkeypatch.setattr(
@@ -5775,8 +5797,13 @@ def test_authors_hydration_enqueues_and_persists(monkeypatch, tmp_path) -> None:
         },
     )
 
-    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, fn):  # noqa: ANN001
-        fn(user_id=user_id, publication_id=publication_id)
+    def _immediate_submit(*, kind: str, user_id: str, publication_id: str, options=None):  # noqa: ANN001
+        publication_console_service._run_background_job(
+            kind=kind,
+            user_id=user_id,
+            publication_id=publication_id,
+            options=options,
+        )
         return True
 
     monkeypatch.setattr(
@@ -6136,6 +6163,73 @@ def test_publication_file_download_restores_extension_for_legacy_filename(
         assert "filename*=UTF-8''Grafton-Clarke%20%282024%29.pdf" in disposition
 
 
+def test_publication_file_content_route_supports_range_and_etag(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+
+    with TestClient(app) as client:
+        owner_id, token = _register(client, email="file-range@example.com")
+
+        with session_scope() as session:
+            work = Work(
+                user_id=owner_id,
+                title="Range reader work",
+                title_lower="range reader work",
+                year=2026,
+                doi="10.1000/range-reader-work",
+                work_type="journal-article",
+                venue_name="Reader Journal",
+                publisher="Reader Publisher",
+                abstract="Abstract",
+                keywords=[],
+                url="",
+                authors_json=[{"name": "Alice Example"}],
+                provenance="manual",
+            )
+            session.add(work)
+            session.flush()
+            work_id = str(work.id)
+
+        payload_bytes = b"%PDF-1.7 " + bytes(range(256)) * 16
+        upload_response = client.post(
+            f"/v1/publications/{work_id}/files/upload",
+            headers=_auth_headers(token),
+            json={
+                "filename": "reader.pdf",
+                "mime_type": "application/pdf",
+                "content_base64": base64.b64encode(payload_bytes).decode("ascii"),
+            },
+        )
+        assert upload_response.status_code == 200
+        file_id = str(upload_response.json()["id"])
+        content_url = f"/v1/publications/{work_id}/files/{file_id}/content"
+
+        full_response = client.get(content_url, headers=_auth_headers(token))
+        assert full_response.status_code == 200
+        assert full_response.content == payload_bytes
+        assert full_response.headers.get("accept-ranges") == "bytes"
+        etag = str(full_response.headers.get("etag") or "")
+        assert etag == f'"{hashlib.sha256(payload_bytes).hexdigest()}"'
+
+        range_response = client.get(
+            content_url, headers={**_auth_headers(token), "Range": "bytes=9-72"}
+        )
+        assert range_response.status_code == 206
+        assert range_response.content == payload_bytes[9:73]
+        assert range_response.headers.get("content-range") == (
+            f"bytes 9-72/{len(payload_bytes)}"
+        )
+
+        cached_response = client.get(
+            content_url, headers={**_auth_headers(token), "If-None-Match": etag}
+        )
+        assert cached_response.status_code == 304
+        assert cached_response.content == b""
+        assert cached_response.headers.get("etag") == etag
+
+
 def test_publication_file_content_route_proxies_open_access_pdf(
     monkeypatch, tmp_path
 ) -> None:
@@ -8017,3 +8111,10 @@ def test_content_cleanup_preserves_figure_references() -> None:
     text = "Figure 1 shows the distribution of cardiac biomarkers across all study groups."
     result = _publication_paper_content_cleanup(text)
     assert "Figure 1 shows" in result
+
+
+def test_publication_console_job_kinds_are_not_retried() -> None:
+    kinds = registered_job_kinds()
+    for kind in publication_console_service._BACKGROUND_JOB_RUNNERS:
+        spec = kinds[f"{publication_console_service.BACKGROUND_JOB_KIND_PREFIX}{kind}"]
+        assert spec.max_attempts == 1
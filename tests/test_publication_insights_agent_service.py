@@ -34,6 +34,7 @@ def _set_test_environment(monkeypatch, tmp_path) -> None:
     monkeypatch.setenv("PUB_ANALYTICS_TTL_SECONDS", "60")
     api_module._AUTH_RATE_LIMIT_EVENTS.clear()
     publication_insights_agent_service._reset_publication_insights_availability_cache()
+    publication_insights_agent_service.reset_publication_insights_draft_cache_stats()
     reset_database_state()
 
 
@@ -516,6 +517,84 @@ def test_generate_publication_insights_agent_draft_raises_when_openai_fails(
         )
 
 
+def test_generate_publication_insights_agent_draft_serves_cached_draft_for_same_evidence(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user("pub-agent-cache@example.com")
+    _seed_publications_for_user(user_id=user_id)
+    compute_publication_top_metrics(user_id=user_id)
+    calls: list[dict] = []
+
+    def _fake_create_response(**kwargs):  # noqa: ANN003
+        calls.append(kwargs)
+        return SimpleNamespace(output_text=_mock_citation_openai_output())
+
+    monkeypatch.setattr(
+        publication_insights_agent_service, "create_response", _fake_create_response
+    )
+
+    first = publication_insights_agent_service.generate_publication_insights_agent_draft(
+        user_id=user_id, window_id="3y"
+    )
+    compute_publication_top_metrics(user_id=user_id)
+    second = publication_insights_agent_service.generate_publication_insights_agent_draft(
+        user_id=user_id, window_id="3y"
+    )
+    publication_insights_agent_service.generate_publication_insights_agent_draft(
+        user_id=user_id, window_id="3y", ui_context="Citation drivers panel"
+    )
+
+    assert len(calls) == 2
+    assert first["provenance"]["cache"]["status"] == "miss"
+    assert second["provenance"]["cache"]["status"] == "hit"
+    assert second["sections"] == first["sections"]
+    assert second["provenance"]["generated_at"] == first["provenance"]["generated_at"]
+    stats = publication_insights_agent_service.get_publication_insights_draft_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stores"] == 2
+    assert stats["entries"] == 1
+
+
+def test_generate_publication_insights_agent_draft_serves_stale_draft_and_revalidates(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv("PUBLICATION_INSIGHTS_DRAFT_CACHE_FRESH_SECONDS", "0")
+    create_all_tables()
+    user_id = _seed_user("pub-agent-stale@example.com")
+    _seed_publications_for_user(user_id=user_id)
+    compute_publication_top_metrics(user_id=user_id)
+    enqueued: list[dict] = []
+    monkeypatch.setattr(
+        publication_insights_agent_service,
+        "create_response",
+        lambda **kwargs: SimpleNamespace(output_text=_mock_citation_openai_output()),
+    )
+    monkeypatch.setattr(
+        publication_insights_agent_service,
+        "enqueue_job",
+        lambda **kwargs: enqueued.append(kwargs) or True,
+    )
+
+    publication_insights_agent_service.generate_publication_insights_agent_draft(
+        user_id=user_id, window_id="1y"
+    )
+    stale = publication_insights_agent_service.generate_publication_insights_agent_draft(
+        user_id=user_id, window_id="1y"
+    )
+
+    assert stale["provenance"]["cache"]["status"] == "stale"
+    assert len(enqueued) == 1
+    assert enqueued[0]["kind"] == "publication_insights_draft_refresh"
+    assert enqueued[0]["payload"]["user_id"] == user_id
+    stats = publication_insights_agent_service.get_publication_insights_draft_cache_stats()
+    assert stats["stale_hits"] == 1
+    assert stats["revalidations_enqueued"] == 1
+
+
 def test_generate_publication_insights_agent_draft_raises_when_openai_response_is_incomplete(
     monkeypatch, tmp_path
 ) -> None:
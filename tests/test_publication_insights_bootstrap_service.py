@@ -51,8 +51,8 @@ def test_import_openalex_works_direct_uses_local_transformers(
         },
     )
     monkeypatch.setattr(
-        "research_os.services.orcid_service._upsert_imported_orcid_work",
-        lambda **_: {"id": "work-local-1"},
+        "research_os.services.publication_insights_bootstrap_service.upsert_works",
+        lambda **_: [{"id": "work-local-1"}],
     )
     monkeypatch.setattr(
         "research_os.services.publication_insights_bootstrap_service.recompute_collaborator_edges",
@@ -8,6 +8,7 @@ from sqlalchemy import select
 import research_os.services.publication_metrics_service as publication_metrics_service
 from research_os.api.app import app
 from research_os.db import (
+    BackgroundJob,
     Collaborator,
     CollaboratorAffiliation,
     MetricsSnapshot,
@@ -44,8 +45,6 @@ def _set_test_environment(monkeypatch, tmp_path) -> None:
     monkeypatch.setenv("PUB_ANALYTICS_MAX_CONCURRENT_JOBS", "2")
     api_module._AUTH_RATE_LIMIT_EVENTS.clear()
     reset_database_state()
-    publication_metrics_service._inflight_users.clear()
-    publication_metrics_service._executor = None
 
 
 def _seed_user_with_metrics(*, email: str) -> str:
@@ -860,22 +859,19 @@ def test_lock_prevents_duplicate_enqueue(monkeypatch, tmp_path) -> None:
         row.status = "READY"
         session.flush()
 
-    class _DummyExecutor:
-        def __init__(self) -> None:
-            self.submits = 0
-
-        def submit(self, fn, *args, **kwargs):  # noqa: ANN001
-            self.submits += 1
-            return None
-
-    dummy = _DummyExecutor()
-    monkeypatch.setattr(publication_metrics_service, "_get_executor", lambda: dummy)
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "external")
 
     first = enqueue_publication_top_metrics_refresh(user_id=user_id, force=True)
     second = enqueue_publication_top_metrics_refresh(user_id=user_id, force=True)
     assert first is True
     assert second is False
-    assert dummy.submits == 1
+    with session_scope() as session:
+        queued_jobs = session.scalars(
+            select(BackgroundJob).where(
+                BackgroundJob.kind == publication_metrics_service.TOP_METRICS_JOB_KIND
+            )
+        ).all()
+    assert len(queued_jobs) == 1
 
 
 def test_publications_metrics_api_response_contract(monkeypatch, tmp_path) -> None:
@@ -1103,14 +1099,7 @@ def test_refresh_endpoint_returns_status(monkeypatch, tmp_path) -> None:
         row.status = "READY"
         session.flush()
 
-    class _ImmediateExecutor:
-        def submit(self, fn, *args, **kwargs):  # noqa: ANN001
-            fn(*args, **kwargs)
-            return None
-
-    monkeypatch.setattr(
-        publication_metrics_service, "_get_executor", lambda: _ImmediateExecutor()
-    )
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "inline")
     payload = publication_metrics_service.trigger_publication_top_metrics_refresh(
         user_id=user_id
     )
@@ -1230,3 +1219,139 @@ def test_total_publications_drilldown_contract_windows_and_series(
     first_point = points[0]
     assert isinstance(first_point, dict)
     assert "period_start" in first_point and "period_end" in first_point
+
+
+def test_field_percentile_histogram_matches_sorted_cohort_helpers() -> None:
+    histogram = [[0, 4], [1, 3], [3, 2], [10, 1]]
+    values = sorted(key for key, count in histogram for _ in range(count))
+    keys, cumulative = publication_metrics_service._histogram_cumulative(histogram)
+
+    for citations in (0, 1, 2, 3, 10, 50):
+        assert publication_metrics_service._histogram_percentile_rank(
+            keys=keys, cumulative=cumulative, citations=citations
+        ) == publication_metrics_service._empirical_percentile_rank(values, citations)
+    for threshold in publication_metrics_service.FIELD_PERCENTILE_THRESHOLDS:
+        assert publication_metrics_service._histogram_percentile_cutoff(
+            keys=keys, cumulative=cumulative, percentile=float(threshold)
+        ) == publication_metrics_service._percentile_cutoff(values, float(threshold))
+
+
+def test_field_percentile_rows_batch_lookups_and_cache_histograms(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user_with_metrics(email="field-percentile@example.com")
+    requests: list[dict[str, object]] = []
+
+    def _fake_openalex(*, url: str, params: dict[str, object]) -> dict[str, object]:
+        requests.append(dict(params))
+        if "group_by" in params:
+            return {
+                "meta": {"count": 200, "next_cursor": None},
+                "group_by": [
+                    {"key": "0", "count": 100},
+                    {"key": "5", "count": 60},
+                    {"key": "20", "count": 40},
+                ],
+            }
+        assert str(params["filter"]).startswith("openalex:")
+        return {
+            "results": [
+                {
+                    "id": f"https://openalex.org/W{index}",
+                    "publication_year": 2022,
+                    "primary_topic": {
+                        "field": {
+                            "id": "https://openalex.org/fields/27",
+                            "display_name": "Medicine",
+                        }
+                    },
+                }
+                for index in (1, 2, 3)
+            ]
+        }
+
+    monkeypatch.setattr(
+        publication_metrics_service, "_openalex_request_with_retry", _fake_openalex
+    )
+    rows = [
+        {"openalex_work_id": "W1", "year": 2022, "citations_lifetime": 5},
+        {"openalex_work_id": "W2", "year": 2022, "citations_lifetime": 20},
+        {"openalex_work_id": "W3", "year": 2021, "citations_lifetime": 0},
+    ]
+    now = datetime.now(timezone.utc)
+    with session_scope() as session:
+        resolved = publication_metrics_service._resolve_field_percentile_rows(
+            session, user_id=user_id, now=now, per_work_rows=rows, mailto=None
+        )
+
+    # One batched work lookup plus one histogram per (field, year) cohort.
+    assert len(requests) == 3
+    assert [item["percentile_rank"] for item in resolved] == [65.0, 90.0, 25.0]
+    assert resolved[0]["cohort"]["total_results"] == 200
+    assert resolved[0]["cohort"]["cutoffs"]["90"] == 20
+
+    requests.clear()
+    with session_scope() as session:
+        cached = publication_metrics_service._resolve_field_percentile_rows(
+            session, user_id=user_id, now=now, per_work_rows=rows, mailto=None
+        )
+    assert [params.get("group_by") for params in requests] == [None]
+    assert [item["percentile_rank"] for item in cached] == [65.0, 90.0, 25.0]
+
+
+def test_work_aggregates_only_recompute_works_with_new_snapshots(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user_with_metrics(email="metrics-incremental@example.com")
+    rebuilt_work_counts: list[int] = []
+    original_payload_builder = publication_metrics_service._work_aggregate_payload
+
+    def _counting_payload_builder(rows):
+        rebuilt_work_counts.append(1)
+        return original_payload_builder(rows)
+
+    monkeypatch.setattr(
+        publication_metrics_service,
+        "_work_aggregate_payload",
+        _counting_payload_builder,
+    )
+    computed_at = datetime.now(timezone.utc)
+
+    def _build() -> dict[str, object]:
+        with session_scope() as session:
+            return publication_metrics_service._build_payload(
+                session, user_id=user_id, computed_at=computed_at
+            )
+
+    first = _build()
+    assert len(rebuilt_work_counts) == 2
+    assert _build() == first
+    assert len(rebuilt_work_counts) == 2
+
+    with session_scope() as session:
+        work_a = session.scalars(select(Work).where(Work.title == "Work A")).one()
+        session.add(
+            MetricsSnapshot(
+                work_id=str(work_a.id),
+                provider="openalex",
+                citations_count=40,
+                influential_citations=None,
+                altmetric_score=None,
+                metric_payload={"match_method": "doi"},
+                captured_at=computed_at - timedelta(days=1),
+            )
+        )
+    incremental = _build()
+    assert len(rebuilt_work_counts) == 3
+    assert _tile(incremental, "total_citations")["value"] == 52
+
+    with session_scope() as session:
+        for row in session.scalars(
+            select(publication_metrics_service.PublicationMetricWorkAggregate)
+        ).all():
+            session.delete(row)
+    assert _build() == incremental
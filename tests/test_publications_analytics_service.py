@@ -3,9 +3,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from sqlalchemy import select
+
 import research_os.services.publications_analytics_service as analytics_service
 from research_os.db import (
+    BackgroundJob,
     MetricsSnapshot,
+    PublicationCitationRollup,
+    PublicationCitationSeriesPoint,
     PublicationMetric,
     User,
     Work,
@@ -271,25 +276,19 @@ def test_lock_prevents_duplicate_enqueue(monkeypatch, tmp_path) -> None:
         row.status = "READY"
         session.flush()
 
-    class _DummyExecutor:
-        def __init__(self) -> None:
-            self.submits = 0
-
-        def submit(self, fn, *args, **kwargs):  # noqa: ANN001
-            self.submits += 1
-            return None
-
-    dummy = _DummyExecutor()
-    monkeypatch.setattr(
-        "research_os.services.publications_analytics_service._get_executor",
-        lambda: dummy,
-    )
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "external")
 
     first = enqueue_publications_analytics_recompute(user_id=user_id, force=True)
     second = enqueue_publications_analytics_recompute(user_id=user_id, force=True)
     assert first is True
     assert second is False
-    assert dummy.submits == 1
+    with session_scope() as session:
+        queued_jobs = session.scalars(
+            select(BackgroundJob).where(
+                BackgroundJob.kind == analytics_service.ANALYTICS_JOB_KIND
+            )
+        ).all()
+    assert len(queued_jobs) == 1
 
 
 def test_failure_keeps_cached_payload_and_sets_failed(monkeypatch, tmp_path) -> None:
@@ -299,15 +298,7 @@ def test_failure_keeps_cached_payload_and_sets_failed(monkeypatch, tmp_path) ->
     cached = compute_publications_analytics(user_id=user_id)
     cached_total = int(cached["summary"]["total_citations"])
 
-    class _ImmediateExecutor:
-        def submit(self, fn, *args, **kwargs):  # noqa: ANN001
-            fn(*args, **kwargs)
-            return None
-
-    monkeypatch.setattr(
-        "research_os.services.publications_analytics_service._get_executor",
-        lambda: _ImmediateExecutor(),
-    )
+    monkeypatch.setenv("JOB_QUEUE_WORKER_MODE", "inline")
     monkeypatch.setattr(
         "research_os.services.publications_analytics_service.compute_publications_analytics",
         lambda **kwargs: (_ for _ in ()).throw(RuntimeError("upstream failure")),
@@ -410,3 +401,112 @@ def test_scheduler_registers_interval_job(monkeypatch, tmp_path) -> None:
     )
     assert captured["job_kwargs"]["trigger"] == "interval"
     assert captured["job_kwargs"]["hours"] == 6
+
+
+def test_citation_series_merges_only_new_snapshots(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    user_id = _seed_user_with_metrics()
+    computed_at = datetime.now(timezone.utc)
+
+    def _compute() -> dict[str, Any]:
+        with session_scope() as session:
+            return analytics_service._compute_payload(
+                session, user_id=user_id, computed_at=computed_at
+            )
+
+    first = _compute()
+    with session_scope() as session:
+        rollup = session.scalars(select(PublicationCitationRollup)).one()
+        assert rollup.snapshots_count == 4
+        assert rollup.series_points_count == 4
+        assert analytics_service.sync_citation_series(session, user_id=user_id) == 0
+        work_a = session.scalars(select(Work).where(Work.title == "Work A")).one()
+        recent = session.scalars(
+            select(MetricsSnapshot).where(
+                MetricsSnapshot.work_id == work_a.id,
+                MetricsSnapshot.citations_count == 15,
+            )
+        ).one()
+        session.add(
+            MetricsSnapshot(
+                work_id=str(work_a.id),
+                provider="openalex",
+                citations_count=20,
+                influential_citations=None,
+                altmetric_score=None,
+                metric_payload={},
+                captured_at=_coerce_utc(recent.captured_at) + timedelta(seconds=1),
+            )
+        )
+        session.flush()
+        assert analytics_service.sync_citation_series(session, user_id=user_id) == 1
+        points = session.scalars(
+            select(PublicationCitationSeriesPoint).where(
+                PublicationCitationSeriesPoint.work_id == work_a.id
+            )
+        ).all()
+        assert len(points) == 2
+        merged = max(points, key=lambda item: _coerce_utc(item.captured_at))
+        assert merged.citations_count == 20
+        assert merged.snapshots_merged == 2
+
+    incremental = _compute()
+    assert first["summary"]["total_citations"] == 27
+    assert incremental["summary"]["total_citations"] == 32
+
+    with session_scope() as session:
+        for row in session.scalars(select(PublicationCitationSeriesPoint)).all():
+            session.delete(row)
+        session.delete(session.scalars(select(PublicationCitationRollup)).one())
+    assert _compute() == incremental
+
+
+def test_citation_series_reads_snapshots_earlier_in_cutoff_month(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    computed_at = datetime(2026, 6, 20, tzinfo=timezone.utc)
+    with session_scope() as session:
+        user = User(
+            email="analytics-series-cutoff@example.com",
+            password_hash="test-hash",
+            name="Analytics Series",
+        )
+        session.add(user)
+        session.flush()
+        user_id = str(user.id)
+        work = Work(
+            user_id=user_id,
+            title="Series cutoff work",
+            title_lower="series cutoff work",
+            year=2020,
+            work_type="journal-article",
+            provenance="manual",
+            user_edited=False,
+        )
+        session.add(work)
+        session.flush()
+        for citations, captured_at in (
+            (10, datetime(2025, 6, 5, tzinfo=timezone.utc)),
+            (14, datetime(2025, 6, 25, tzinfo=timezone.utc)),
+            (30, datetime(2026, 6, 10, tzinfo=timezone.utc)),
+        ):
+            session.add(
+                MetricsSnapshot(
+                    work_id=str(work.id),
+                    provider="openalex",
+                    citations_count=citations,
+                    metric_payload={},
+                    captured_at=captured_at,
+                )
+            )
+
+    with session_scope() as session:
+        payload = analytics_service._compute_payload(
+            session, user_id=user_id, computed_at=computed_at
+        )
+        assert len(session.scalars(select(PublicationCitationSeriesPoint)).all()) == 2
+    assert payload["summary"]["citations_last_12_months"] == 20
+    assert payload["summary"]["citations_previous_12_months"] == 10
@@ -5,6 +5,7 @@ import hashlib
 
 from research_os.services.security_service import (
     hash_password,
+    password_hash_needs_rehash,
     password_hash_supported,
     verify_password,
 )
@@ -46,3 +47,17 @@ def test_password_hash_supported_flags_supported_and_unsupported_formats() -> No
     assert password_hash_supported(hash_password("LegacyCompatPass123")) is True
     assert password_hash_supported("pbkdf2:sha256:260000$salt$deadbeef") is True
     assert password_hash_supported("bcrypt$12$abc") is False
+
+
+def test_password_hash_needs_rehash_only_for_legacy_or_outdated_hashes() -> None:
+    assert password_hash_needs_rehash(hash_password("LegacyCompatPass123")) is False
+    digest = hashlib.pbkdf2_hmac(
+        "sha256", b"LegacyCompatPass123", b"legacy-salt-value", 260000
+    )
+    digest_b64 = base64.b64encode(digest).decode("utf-8")
+    assert password_hash_needs_rehash(
+        f"pbkdf2_sha256$260000$legacy-salt-value${digest_b64}"
+    )
+    assert password_hash_needs_rehash(
+        f"pbkdf2:sha256:260000$legacy-salt-value${digest.hex()}"
+    )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from research_os.services.workspace_realtime_service import WorkspaceRealtimeHub
+
+
+class _FakeSocket:
+    def __init__(self, *, delay_seconds: float = 0.0, block: bool = False) -> None:
+        self.delay_seconds = delay_seconds
+        self.block = block
+        self.received: list[dict[str, Any]] = []
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, data: Any) -> None:
+        if self.block:
+            await asyncio.Event().wait()
+        if self.delay_seconds:
+            await asyncio.sleep(self.delay_seconds)
+        self.received.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.close_code = code
+
+
+class _LoopbackBackend:
+    """Shared in-test bus standing in for PostgreSQL LISTEN/NOTIFY."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[Any] = []
+
+    def view(self) -> "_LoopbackBackendView":
+        return _LoopbackBackendView(self)
+
+
+class _LoopbackBackendView:
+    def __init__(self, bus: _LoopbackBackend) -> None:
+        self._bus = bus
+
+    async def start(self, deliver) -> None:
+        self._bus.subscribers.append(deliver)
+
+    async def publish(self, envelope: dict[str, Any]) -> None:
+        for deliver in list(self._bus.subscribers):
+            await deliver(envelope)
+
+    async def stop(self) -> None:
+        return None
+
+
+async def _drain(sockets: list[_FakeSocket], expected: int) -> None:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if all(len(socket.received) >= expected for socket in sockets):
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_realtime_hub_fans_out_to_thousands_and_evicts_slow_consumers() -> None:
+    loader_threads: set[int] = set()
+    members = frozenset(f"user-{index}" for index in range(2500))
+
+    def _load_member_ids(workspace_id: str) -> frozenset[str]:
+        loader_threads.add(threading.get_ident())
+        return members
+
+    async def _run() -> None:
+        loop_thread = threading.get_ident()
+        hub = WorkspaceRealtimeHub(
+            member_ids_loader=_load_member_ids,
+            send_queue_size=4,
+            send_timeout_seconds=0.2,
+        )
+        await hub.start()
+        fast = [_FakeSocket() for _ in range(2400)]
+        slow = [_FakeSocket(block=True) for _ in range(100)]
+        intruder = _FakeSocket()
+        for index, socket in enumerate(fast + slow):
+            await hub.connect(
+                workspace_id="ws-load", websocket=socket, user_id=f"user-{index}"
+            )
+        await hub.connect(
+            workspace_id="ws-load", websocket=intruder, user_id="outsider"
+        )
+
+        started = time.perf_counter()
+        for sequence in range(6):
+            await hub.broadcast(workspace_id="ws-load", payload={"seq": sequence})
+        broadcast_seconds = time.perf_counter() - started
+        await _drain(fast, 6)
+        await asyncio.sleep(0.05)
+
+        assert broadcast_seconds < 2.0
+        assert all(
+            [item["seq"] for item in socket.received] == list(range(6))
+            for socket in fast
+        )
+        assert all(socket.close_code == 1013 for socket in slow)
+        assert intruder.close_code == 1008
+        assert intruder.received == []
+        assert hub.connection_count == len(fast)
+        assert hub.stats["evicted_slow"] == len(slow)
+        assert loop_thread not in loader_threads
+        await hub.stop()
+        assert hub.connection_count == 0
+
+    asyncio.run(_run())
+
+
+def test_realtime_hub_relays_between_processes_without_echo() -> None:
+    bus = _LoopbackBackend()
+
+    async def _run() -> None:
+        hub_a = WorkspaceRealtimeHub(
+            backend=bus.view(), member_ids_loader=lambda _: frozenset({"a", "b"})
+        )
+        hub_b = WorkspaceRealtimeHub(
+            backend=bus.view(), member_ids_loader=lambda _: frozenset({"a", "b"})
+        )
+        await hub_a.start()
+        await hub_b.start()
+        socket_a = _FakeSocket()
+        socket_a_peer = _FakeSocket()
+        socket_b = _FakeSocket()
+        await hub_a.connect(workspace_id="ws-1", websocket=socket_a, user_id="a")
+        await hub_a.connect(workspace_id="ws-1", websocket=socket_a_peer, user_id="a")
+        await hub_b.connect(workspace_id="ws-1", websocket=socket_b, user_id="b")
+
+        await hub_a.broadcast(
+            workspace_id="ws-1", payload={"type": "typing"}, exclude=socket_a
+        )
+        await _drain([socket_a_peer, socket_b], 1)
+        await asyncio.sleep(0.02)
+
+        assert socket_a.received == []
+        assert socket_a_peer.received == [{"type": "typing"}]
+        assert socket_b.received == [{"type": "typing"}]
+        assert await hub_b.has_access(user_id="b", workspace_id="ws-1") is True
+        assert await hub_b.has_access(user_id="c", workspace_id="ws-1") is False
+        await hub_a.stop()
+        await hub_b.stop()
+
+    asyncio.run(_run())
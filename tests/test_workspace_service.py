@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from research_os.db import User, create_all_tables, reset_database_state, session_scope
+import research_os.services.workspace_service as workspace_service
+from research_os.db import (
+    User,
+    WorkspaceInboxStateCache,
+    create_all_tables,
+    reset_database_state,
+    session_scope,
+)
 from research_os.services.workspace_service import (
     WorkspaceNotFoundError,
     WorkspaceValidationError,
     accept_workspace_author_request,
+    create_workspace_inbox_message,
     create_workspace_invitation,
     create_workspace_record,
+    get_workspace_member_ids,
+    has_workspace_access,
     list_workspace_inbox_messages,
     list_workspace_inbox_reads,
     list_workspace_author_requests,
@@ -504,3 +514,242 @@ def test_removed_collaborator_loses_workspace_and_cannot_receive_further_updates
         pass
     else:
         raise AssertionError("Expected removed collaborator workspace mutation to be rejected.")
+
+
+def test_workspace_membership_index_tracks_accept_and_removal(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv("WORKSPACE_ACCESS_CACHE_TTL_SECONDS", "300")
+    create_all_tables()
+    owner_id = _seed_user(email="workspace-owner-index@example.com", name="Workspace Owner")
+    invitee_id = _seed_user(email="workspace-index@example.com", name="Indexed Collaborator")
+
+    workspace = create_workspace_record(
+        user_id=owner_id,
+        payload={"name": "Workspace Membership Index", "owner_name": "Workspace Owner"},
+    )
+    assert get_workspace_member_ids(workspace_id=workspace["id"]) == {owner_id}
+    assert has_workspace_access(user_id=invitee_id, workspace_id=workspace["id"]) is False
+
+    invitation = create_workspace_invitation(
+        user_id=owner_id,
+        payload={
+            "workspace_id": workspace["id"],
+            "invitee_user_id": invitee_id,
+            "role": "editor",
+        },
+    )
+    pending_request = next(
+        item
+        for item in list_workspace_author_requests(user_id=invitee_id)["items"]
+        if item["source_invitation_id"] == invitation["id"]
+    )
+    accept_workspace_author_request(user_id=invitee_id, request_id=pending_request["id"])
+    assert get_workspace_member_ids(workspace_id=workspace["id"]) == {owner_id, invitee_id}
+    assert has_workspace_access(user_id=invitee_id, workspace_id=workspace["id"]) is True
+
+    owner_workspace = _workspace_by_id(owner_id, workspace["id"])
+    removed_participant = next(
+        item for item in owner_workspace["collaborators"] if item["user_id"] == invitee_id
+    )
+    update_workspace_record(
+        user_id=owner_id,
+        workspace_id=workspace["id"],
+        patch={"removed_collaborators": [removed_participant]},
+    )
+    # The cached member set is dropped on change rather than waiting out the TTL.
+    assert has_workspace_access(user_id=invitee_id, workspace_id=workspace["id"]) is False
+    assert has_workspace_access(user_id=owner_id, workspace_id=workspace["id"]) is True
+
+
+def _accept_workspace_invitation(*, owner_id: str, invitee_id: str, workspace_id: str) -> None:
+    invitation = create_workspace_invitation(
+        user_id=owner_id,
+        payload={"workspace_id": workspace_id, "invitee_user_id": invitee_id, "role": "editor"},
+    )
+    pending_request = next(
+        item
+        for item in list_workspace_author_requests(user_id=invitee_id)["items"]
+        if item["source_invitation_id"] == invitation["id"]
+    )
+    accept_workspace_author_request(user_id=invitee_id, request_id=pending_request["id"])
+
+
+def _post_inbox_message(*, user_id: str, workspace_id: str, message_id: str, created_at: str) -> None:
+    create_workspace_inbox_message(
+        user_id=user_id,
+        payload={
+            "id": message_id,
+            "workspace_id": workspace_id,
+            "sender_name": "Workspace Owner",
+            "encrypted_body": f"ciphertext-{message_id}",
+            "iv": f"iv-{message_id}",
+            "created_at": created_at,
+        },
+    )
+
+
+def _inbox_message_ids(user_id: str, workspace_id: str) -> list[str]:
+    items = list_workspace_inbox_messages(user_id=user_id, workspace_id=workspace_id)["items"]
+    return [item["id"] for item in items]
+
+
+def test_workspace_inbox_store_scopes_history_to_membership_and_pages_by_cursor(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    owner_id = _seed_user(email="workspace-owner-inbox@example.com", name="Workspace Owner")
+    invitee_id = _seed_user(email="workspace-inbox@example.com", name="Inbox Collaborator")
+    workspace = create_workspace_record(
+        user_id=owner_id,
+        payload={"name": "Workspace Inbox Store", "owner_name": "Workspace Owner"},
+    )
+    workspace_id = workspace["id"]
+    _accept_workspace_invitation(owner_id=owner_id, invitee_id=invitee_id, workspace_id=workspace_id)
+
+    _post_inbox_message(
+        user_id=owner_id, workspace_id=workspace_id, message_id="msg-1", created_at="2026-02-26T09:00:00Z"
+    )
+    assert _inbox_message_ids(invitee_id, workspace_id) == ["msg-1"]
+    assert list_workspace_inbox_reads(user_id=owner_id, workspace_id=workspace_id) == {
+        "reads": {workspace_id: {"workspace owner": "2026-02-26T09:00:00Z"}}
+    }
+
+    owner_workspace = _workspace_by_id(owner_id, workspace_id)
+    removed_participant = next(
+        item for item in owner_workspace["collaborators"] if item["user_id"] == invitee_id
+    )
+    update_workspace_record(
+        user_id=owner_id,
+        workspace_id=workspace_id,
+        patch={"removed_collaborators": [removed_participant]},
+    )
+    _post_inbox_message(
+        user_id=owner_id, workspace_id=workspace_id, message_id="msg-2", created_at="2026-02-26T10:00:00Z"
+    )
+    _accept_workspace_invitation(owner_id=owner_id, invitee_id=invitee_id, workspace_id=workspace_id)
+    # Re-accepting starts a fresh history window for the collaborator.
+    assert _inbox_message_ids(invitee_id, workspace_id) == []
+    for index, created_at in enumerate(
+        ["2026-02-26T11:00:00Z", "2026-02-26T12:00:00Z", "2026-02-26T12:00:00Z"], start=3
+    ):
+        _post_inbox_message(
+            user_id=owner_id,
+            workspace_id=workspace_id,
+            message_id=f"msg-{index}",
+            created_at=created_at,
+        )
+    assert _inbox_message_ids(invitee_id, workspace_id) == ["msg-3", "msg-4", "msg-5"]
+    assert _inbox_message_ids(owner_id, workspace_id) == ["msg-1", "msg-2", "msg-3", "msg-4", "msg-5"]
+
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        page = list_workspace_inbox_messages(
+            user_id=owner_id, workspace_id=workspace_id, limit=2, cursor=cursor
+        )
+        pages.append([item["id"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == [["msg-4", "msg-5"], ["msg-2", "msg-3"], ["msg-1"]]
+
+
+def test_workspace_inbox_store_migrates_legacy_inbox_blobs(monkeypatch, tmp_path) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    owner_id = _seed_user(email="workspace-owner-legacy@example.com", name="Workspace Owner")
+    workspace = create_workspace_record(
+        user_id=owner_id,
+        payload={"name": "Workspace Legacy Inbox", "owner_name": "Workspace Owner"},
+    )
+    legacy_message = {
+        "id": "msg-legacy",
+        "workspace_id": workspace["id"],
+        "sender_name": "Workspace Owner",
+        "encrypted_body": "ciphertext-legacy",
+        "iv": "iv-legacy",
+        "created_at": "2026-01-05T08:00:00Z",
+    }
+    with session_scope() as session:
+        session.add(
+            WorkspaceInboxStateCache(
+                user_id=owner_id,
+                payload_json={
+                    "messages": [legacy_message],
+                    "reads": {workspace["id"]: {"workspace owner": "2026-01-05T08:00:00Z"}},
+                },
+            )
+        )
+
+    assert list_workspace_inbox_messages(user_id=owner_id, workspace_id=workspace["id"])[
+        "items"
+    ] == [legacy_message]
+    assert list_workspace_inbox_reads(user_id=owner_id)["reads"] == {
+        workspace["id"]: {"workspace owner": "2026-01-05T08:00:00Z"}
+    }
+    with session_scope() as session:
+        blob = session.query(WorkspaceInboxStateCache).filter_by(user_id=owner_id).one()
+        assert blob.payload_json == {"messages": [], "reads": {}}
+
+
+def test_legacy_inbox_import_keeps_history_gaps_for_re_added_collaborators(
+    monkeypatch, tmp_path
+) -> None:
+    _set_test_environment(monkeypatch, tmp_path)
+    create_all_tables()
+    owner_id = _seed_user(email="workspace-owner-gap@example.com", name="Workspace Owner")
+    invitee_id = _seed_user(email="workspace-gap@example.com", name="Gap Collaborator")
+    workspace = create_workspace_record(
+        user_id=owner_id,
+        payload={"name": "Workspace Legacy Gap", "owner_name": "Workspace Owner"},
+    )
+    workspace_id = workspace["id"]
+
+    def _legacy_message(message_id: str, created_at: str) -> dict:
+        return {
+            "id": message_id,
+            "workspace_id": workspace_id,
+            "sender_name": "Workspace Owner",
+            "encrypted_body": f"ciphertext-{message_id}",
+            "iv": f"iv-{message_id}",
+            "created_at": created_at,
+        }
+
+    _accept_workspace_invitation(
+        owner_id=owner_id, invitee_id=invitee_id, workspace_id=workspace_id
+    )
+    before = _legacy_message("msg-before", "2026-01-05T08:00:00Z")
+    removed = _legacy_message("msg-while-removed", "2026-01-06T08:00:00Z")
+    after = _legacy_message("msg-after", "2026-01-07T08:00:00Z")
+    # The collaborator was removed on 6 January and re-added later, so their
+    # blob never received the message sent in between.
+    with session_scope() as session:
+        session.add_all(
+            [
+                WorkspaceInboxStateCache(
+                    user_id=owner_id,
+                    payload_json={"messages": [before, removed, after], "reads": {}},
+                ),
+                WorkspaceInboxStateCache(
+                    user_id=invitee_id,
+                    payload_json={"messages": [before, after], "reads": {}},
+                ),
+            ]
+        )
+    # A process started after the blobs were written runs the import.
+    monkeypatch.setattr(workspace_service, "_INBOX_STORE_MIGRATED_BINDS", set())
+
+    assert _inbox_message_ids(owner_id, workspace_id) == [
+        "msg-before",
+        "msg-while-removed",
+        "msg-after",
+    ]
+    assert _inbox_message_ids(invitee_id, workspace_id) == ["msg-before", "msg-after"]
+    _post_inbox_message(
+        user_id=owner_id,
+        workspace_id=workspace_id,
+        message_id="msg-live",
+        created_at="2026-10-16T09:00:00Z",
+    )
+    assert _inbox_message_ids(invitee_id, workspace_id)[-1] == "msg-live"